@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Content-addressed cache of AI review responses.
+
+A workflow re-run on a push that did not touch the student's task sends the
+very same prompt again. Responses are stored under a key derived from the
+model, the temperature and a hash of the full packed prompt (instructions and
+student files), so such re-runs are answered from disk without spending
+model quota, while any change to the prompt or files produces a new key.
+
+- Entries expire after a TTL (default 7 days, `AI_CACHE_TTL_HOURS`); expired
+  files are removed when new entries are written.
+- Identical requests in flight are coalesced: the first caller takes a lock
+  file next to the entry and calls the model; other processes using the same
+  cache directory wait for its result instead of sending a duplicate request.
+  If the owner fails (or its lock goes stale), the next waiter takes over.
+- Only successful responses are cached.
+
+The directory defaults to `.cache/ai_responses` in the repository root
+(`AI_CACHE_DIR` overrides it); in CI it is persisted with actions/cache.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+# A lock older than this belongs to a crashed or hung run.
+LOCK_TIMEOUT_SECONDS = 300.0
+POLL_SECONDS = 0.5
+
+
+def cache_key(payload: dict) -> str:
+    """Key of a chat completions payload: model, temperature and a hash of the messages."""
+    messages = json.dumps(payload.get('messages', []), ensure_ascii=False, sort_keys=True)
+    prompt_hash = hashlib.sha256(messages.encode('utf-8')).hexdigest()
+    identity = json.dumps([payload.get('model'), payload.get('temperature'), prompt_hash])
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:40]
+
+
+def default_cache_dir(root: Path) -> Path:
+    return Path(os.environ.get('AI_CACHE_DIR') or root / '.cache' / 'ai_responses')
+
+
+def default_ttl() -> float:
+    hours = os.environ.get('AI_CACHE_TTL_HOURS')
+    return float(hours) * 3600 if hours else DEFAULT_TTL_SECONDS
+
+
+class ResponseCache:
+    """Model responses on disk, one JSON file per key."""
+
+    def __init__(self, cache_dir: Path, ttl: float = DEFAULT_TTL_SECONDS, lock_timeout: float = LOCK_TIMEOUT_SECONDS,
+                 poll: float = POLL_SECONDS, clock: Callable[[], float] = time.time,
+                 sleep: Callable[[float], None] = time.sleep) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.poll = poll
+        self.clock = clock
+        self.sleep = sleep
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.json'
+
+    def _lock_path(self, key: str) -> Path:
+        return self.cache_dir / f'{key}.lock'
+
+    def get(self, key: str) -> dict | None:
+        """Entry {'text', 'model', 'created'} if present and not expired."""
+        try:
+            entry = json.loads(self._path(key).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if self.clock() - entry.get('created', 0) > self.ttl:
+            return None
+        return entry
+
+    def put(self, key: str, text: str, model: str | None = None) -> None:
+        entry = {'text': text, 'model': model, 'created': self.clock()}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_name, self._path(key))
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self) -> int:
+        """Remove expired entries; returns how many were removed."""
+        removed = 0
+        now = self.clock()
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                created = json.loads(path.read_text(encoding='utf-8')).get('created', 0)
+            except (OSError, ValueError):
+                created = 0
+            if now - created > self.ttl:
+                try:
+                    path.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def _try_lock(self, key: str) -> bool:
+        lock = self._lock_path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd = os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                stale = time.time() - lock.stat().st_mtime > self.lock_timeout
+            except OSError:
+                return False
+            if stale:
+                lock.unlink(missing_ok=True)
+            return False
+        except OSError:
+            # Read-only or unusable directory: do not coalesce, just call.
+            return True
+        os.write(fd, str(os.getpid()).encode('ascii'))
+        os.close(fd)
+        return True
+
+    def fetch(self, key: str, call: Callable[[], tuple[bool, str]], model: str | None = None) -> tuple[bool, str, str]:
+        """Cached text for `key`, or the result of `call()` (stored if successful).
+
+        `call` returns (ok, text). Returns (ok, text, source) where source is
+        'cache', 'coalesced' (another run computed it meanwhile) or 'model'.
+        """
+        waited = False
+        while True:
+            entry = self.get(key)
+            if entry is not None:
+                return True, entry['text'], 'coalesced' if waited else 'cache'
+            if self._try_lock(key):
+                break
+            waited = True
+            self.sleep(self.poll)
+
+        try:
+            ok, text = call()
+            if ok:
+                self.put(key, text, model)
+            return ok, text, 'model'
+        finally:
+            self._lock_path(key).unlink(missing_ok=True)
@@ -11,17 +11,14 @@ Behavior:
 
 This script is intentionally small and dependency-free.
 """
-import csv
 import json
 import os
 import sys
 import logging
 from datetime import datetime
 
-try:
-    import requests
-except ImportError:
-    requests = None
+from github_api import GitHubAPIError, get_client
+from students_registry import load_registry, parse_codeowners
 
 
 REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -31,20 +28,11 @@ CHECK_RESULT_PATH = os.environ.get('CHECK_RESULT_PATH', os.path.join(REPO_ROOT,
 
 
 def read_codeowners(repo_root):
-    codeowners = set()
     path = os.path.join(repo_root, '.github', 'CODEOWNERS')
     if not os.path.exists(path):
-        return codeowners
+        return set()
     with open(path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
-            parts = line.split()
-            for p in parts[1:]:
-                if p.startswith('@'):
-                    codeowners.add(p.lstrip('@').lower())
-    return codeowners
+        return set(parse_codeowners(f.read()))
 
 
 LOG = logging.getLogger('check_student_directory')
@@ -55,24 +43,13 @@ LOG.addHandler(handler)
 
 
 def load_students_map(csv_path):
-    mapping = {}
     if not os.path.exists(csv_path):
         LOG.error("students.csv not found at %s", csv_path)
-        return mapping
-    # Read file but skip any leading empty lines which would confuse DictReader
-    with open(csv_path, newline='', encoding='utf-8') as f:
-        # collect non-empty lines to ensure the first line is the header
-        lines = [line for line in f if line.strip()]
-    if not lines:
+        return {}
+    registry = load_registry(csv_path)
+    if not registry.header:
         LOG.error('students.csv is empty or contains only blank lines: %s', csv_path)
-        return mapping
-    reader = csv.DictReader(lines)
-    for row in reader:
-        gh = (row.get('Github Username') or '').strip()
-        directory = (row.get('Directory') or '').strip()
-        if gh:
-            mapping[gh.lower()] = directory
-    return mapping
+    return registry.directory_map()
 
 
 def load_event(event_path):
@@ -140,68 +117,18 @@ def get_changed_files_from_event(event_or_pr):
     return files
 
 
-def _parse_next_link(link_header):
-    if not link_header:
-        return None
-    parts = link_header.split(',')
-    for part in parts:
-        section = part.strip()
-        if not section.endswith('rel="next"'):
-            continue
-        url_part = section.split(';')[0].strip()
-        if url_part.startswith('<') and url_part.endswith('>'):
-            return url_part[1:-1]
-    return None
-
-
 def fetch_changed_files_via_api(pr):
-    token = os.environ.get('GITHUB_TOKEN')
     url = pr.get('url')
     if not url:
         LOG.error('PR URL not available; cannot query files')
         return []
 
-    headers = {'Accept': 'application/vnd.github+json'}
-    if token:
-        headers['Authorization'] = f'token {token}'
-
-    files = []
-    next_url = f"{url}/files?per_page=100"
-
-    while next_url:
-        if requests is not None:
-            resp = requests.get(next_url, headers=headers, timeout=30)
-            status = resp.status_code
-            data = resp.json() if status == 200 else None
-            link_header = resp.headers.get('Link')
-            error_text = resp.text if status != 200 else ''
-        else:
-            import urllib.request
-
-            req = urllib.request.Request(next_url, headers=headers)
-            try:
-                with urllib.request.urlopen(req, timeout=30) as http_resp:
-                    status = http_resp.status
-                    raw = http_resp.read().decode('utf-8')
-                    data = json.loads(raw) if status == 200 else None
-                    link_header = http_resp.headers.get('Link')
-                    error_text = raw if status != 200 else ''
-            except Exception as exc:
-                LOG.error('Failed to fetch PR files via urllib: %s', exc)
-                return files
-
-        if status != 200 or data is None:
-            LOG.error('Failed to fetch PR files via API: %s %s', status, error_text)
-            return files
-
-        for item in data:
-            filename = item.get('filename')
-            if filename:
-                files.append(filename)
-
-        next_url = _parse_next_link(link_header)
-
-    return files
+    try:
+        items = get_client().paginate(f"{url}/files")
+    except GitHubAPIError as exc:
+        LOG.error('Failed to fetch PR files via API: %s', exc)
+        return []
+    return [item['filename'] for item in items if item.get('filename')]
 
 
 def normalize_path(p):
@@ -21,6 +21,8 @@ except Exception:
     print('requests not installed')
     sys.exit(1)
 
+from github_api import GitHubAPIError, get_client
+
 
 LOG = logging.getLogger('comment_and_label')
 LOG.setLevel(logging.INFO)
@@ -48,12 +50,11 @@ AI_DEFAULT_NOTICE = 'Прежде чем применять предложенн
 
 
 def get_issue_comments(repo: str, pr_number: str, headers: dict) -> List[dict]:
-    url = f'https://api.github.com/repos/{repo}/issues/{pr_number}/comments'
-    r = requests.get(url, headers=headers)
-    if r.status_code != 200:
-        LOG.warning('Failed to fetch comments: %s %s', r.status_code, r.text)
+    try:
+        return get_client(headers=headers).paginate(f'/repos/{repo}/issues/{pr_number}/comments')
+    except GitHubAPIError as e:
+        LOG.warning('Failed to fetch comments: %s', e)
         return []
-    return r.json()
 
 
 def get_issue_labels(repo: str, pr_number: str, headers: dict) -> List[str]:
@@ -24,6 +24,8 @@ from typing import Any
 
 import requests
 
+from github_api import GitHubAPIError, get_client
+
 
 COMMENT_MARKER = "<!-- it-normocontrol-task03 -->"
 
@@ -37,12 +39,11 @@ def _read_json(path: Path) -> Any:
 def _get_issue_comments(repo: str, pr_number: str, headers: dict[str, str]) -> list[dict[str, Any]]:
     """Fetch PR issue comments."""
 
-    url = f"https://api.github.com/repos/{repo}/issues/{pr_number}/comments"
-    response = requests.get(url, headers=headers, timeout=30)
-    if response.status_code != 200:
-        print(f"Failed to fetch comments: {response.status_code} {response.text}")
+    try:
+        return get_client(headers=headers).paginate(f"/repos/{repo}/issues/{pr_number}/comments")
+    except GitHubAPIError as exc:
+        print(f"Failed to fetch comments: {exc}")
         return []
-    return response.json()
 
 
 def _post_comment(repo: str, pr_number: str, headers: dict[str, str], body: str) -> None:
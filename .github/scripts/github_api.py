@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+"""Small GitHub REST API client shared by the `.github/scripts`.
+
+Stdlib only (http.client), so every workflow step can use it without extra
+dependencies. Compared to one `urllib.request.urlopen` per call it:
+- keeps connections alive (one per host and thread) between requests;
+- sends conditional GETs: responses with an ETag are stored on disk and
+  revalidated with `If-None-Match`; a `304 Not Modified` is served from the
+  cache and does not count against the rate limit. The cache lives in
+  `GITHUB_API_CACHE_DIR` (default: a directory in the system temp dir, i.e.
+  shared by the steps of one job);
+- fetches the remaining pages of a list concurrently once the `Link`
+  header tells the last page, and follows `rel="next"` otherwise;
+- waits and retries on rate limits (`Retry-After`, `X-RateLimit-Reset`),
+  on 5xx responses and on dropped connections, with exponential backoff.
+
+Usage:
+    client = get_client(token=os.environ.get("GITHUB_TOKEN"))
+    files = client.paginate(f"/repos/{repo}/pulls/{number}/files")
+    pr = client.get_json(f"/repos/{repo}/pulls/{number}")
+"""
+
+from __future__ import annotations
+
+import hashlib
+import http.client
+import json
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+from urllib.parse import parse_qs, urlencode, urlsplit, urlunsplit
+
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_WORKERS = 4
+# Never sleep longer than this on a rate limit; fail instead.
+MAX_RATE_LIMIT_WAIT = 120.0
+
+_RETRY_STATUSES = (500, 502, 503, 504)
+
+
+class GitHubAPIError(RuntimeError):
+    """A request failed (HTTP error after retries or a network error)."""
+
+    def __init__(self, status: int | None, url: str, message: str) -> None:
+        super().__init__(f"HTTP {status} {url}: {message}" if status else f"{url}: {message}")
+        self.status = status
+        self.url = url
+
+
+@dataclass(frozen=True)
+class GitHubResponse:
+    """Response of one request; header names are lower-case."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    from_cache: bool = False
+
+    def json(self) -> Any:
+        return json.loads(self.body or b"null")
+
+    @property
+    def links(self) -> dict[str, str]:
+        """`Link` header as {rel: url}."""
+
+        return parse_link_header(self.headers.get("link"))
+
+
+def parse_link_header(link_header: str | None) -> dict[str, str]:
+    """Parse a `Link` header (`<url>; rel="next", ...`) into {rel: url}."""
+
+    links: dict[str, str] = {}
+    for part in (link_header or "").split(","):
+        url_part, _, params = part.strip().partition(";")
+        url_part = url_part.strip()
+        if not (url_part.startswith("<") and url_part.endswith(">")):
+            continue
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "rel":
+                for rel in value.strip('"').split():
+                    links[rel] = url_part[1:-1]
+    return links
+
+
+def _with_query(url: str, **params: Any) -> str:
+    """Return url with query parameters set (existing ones are replaced)."""
+
+    parts = urlsplit(url)
+    query = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+    query.update({name: str(value) for name, value in params.items()})
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class ETagCache:
+    """On-disk store of GET responses that carry an ETag, one JSON file per URL."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = Path(cache_dir)
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, etag: str, response: GitHubResponse) -> None:
+        entry = {"etag": etag, "headers": response.headers, "body": response.body.decode("utf-8", errors="replace")}
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_name, self._path(key))
+        except OSError:
+            pass
+
+
+def default_cache_dir() -> Path:
+    """ETag cache directory (`GITHUB_API_CACHE_DIR` or one in the system temp dir)."""
+
+    return Path(os.environ.get("GITHUB_API_CACHE_DIR") or Path(tempfile.gettempdir()) / "github_api_cache")
+
+
+@dataclass
+class RequestStats:
+    """Counters of a client, for logs and tests."""
+
+    requests: int = 0
+    not_modified: int = 0
+    retries: int = 0
+    connections: int = 0
+
+
+class GitHubClient:
+    """GitHub REST client with keep-alive connections, ETag cache and concurrent pagination.
+
+    Safe to use from several threads: each thread gets its own connections.
+    """
+
+    def __init__(
+        self,
+        token: str | None = None,
+        api_url: str = DEFAULT_API_URL,
+        headers: dict[str, str] | None = None,
+        cache_dir: Path | None = None,
+        use_cache: bool = True,
+        timeout: float = DEFAULT_TIMEOUT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.api_url = api_url.rstrip("/")
+        self.headers = {"Accept": "application/vnd.github+json", "User-Agent": "students-ci"}
+        if token:
+            self.headers["Authorization"] = f"Bearer {token}"
+        self.headers.update(headers or {})
+        self.cache = ETagCache(cache_dir or default_cache_dir()) if use_cache else None
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.max_workers = max_workers
+        self.sleep = sleep
+        self.stats = RequestStats()
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        # Cached responses are per credentials: another token may see other data.
+        self._identity = hashlib.sha256(self.headers.get("Authorization", "").encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> "GitHubClient":
+        """Client for `GITHUB_TOKEN` and `GITHUB_API_URL` (set by GitHub Actions)."""
+
+        return cls(os.environ.get("GITHUB_TOKEN"), os.environ.get("GITHUB_API_URL") or DEFAULT_API_URL, **kwargs)
+
+    def close(self) -> None:
+        """Close the connections of the calling thread.
+
+        Connections of `paginate`'s worker threads are closed by `paginate`.
+        """
+
+        for connection in getattr(self._local, "connections", {}).values():
+            connection.close()
+        self._local.connections = {}
+
+    # Requests -----------------------------------------------------------
+
+    def url(self, path: str, params: dict[str, Any] | None = None) -> str:
+        """Absolute URL of an API path (absolute URLs are kept)."""
+
+        url = path if path.startswith(("http://", "https://")) else f"{self.api_url}/{path.lstrip('/')}"
+        return _with_query(url, **params) if params else url
+
+    def _count(self, **increments: int) -> None:
+        with self._stats_lock:
+            for name, value in increments.items():
+                setattr(self.stats, name, getattr(self.stats, name) + value)
+
+    def _connection(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        connections = getattr(self._local, "connections", None)
+        if connections is None:
+            connections = self._local.connections = {}
+        connection = connections.get((scheme, netloc))
+        if connection is None:
+            factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            connection = connections[(scheme, netloc)] = factory(netloc, timeout=self.timeout)
+            self._count(connections=1)
+        return connection
+
+    def _send(self, method: str, url: str, body: bytes | None, headers: dict[str, str]) -> GitHubResponse:
+        """One HTTP exchange; a connection dropped by the server is reopened once."""
+
+        parts = urlsplit(url)
+        target = urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        for attempt in (1, 2):
+            connection = self._connection(parts.scheme, parts.netloc)
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                connection.close()
+                self._local.connections.pop((parts.scheme, parts.netloc), None)
+                if attempt == 2:
+                    raise
+                continue
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                self._local.connections.pop((parts.scheme, parts.netloc), None)
+                raise
+            self._count(requests=1)
+            if response.getheader("connection", "").lower() == "close":
+                connection.close()
+                self._local.connections.pop((parts.scheme, parts.netloc), None)
+            return GitHubResponse(response.status, {name.lower(): value for name, value in response.getheaders()}, data)
+        raise AssertionError("unreachable")
+
+    def _retry_delay(self, response: GitHubResponse, attempt: int) -> float | None:
+        """Seconds to wait before retrying a response, or None if it is final."""
+
+        headers = response.headers
+        if response.status in (403, 429) and ("retry-after" in headers or headers.get("x-ratelimit-remaining") == "0"):
+            if "retry-after" in headers:
+                try:
+                    return float(headers["retry-after"])
+                except ValueError:
+                    pass
+            try:
+                return max(0.0, float(headers["x-ratelimit-reset"]) - time.time()) + 1
+            except (KeyError, ValueError):
+                return 60.0
+        if response.status in _RETRY_STATUSES:
+            return float(2 ** attempt)
+        return None
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json_body: Any = None,
+        headers: dict[str, str] | None = None,
+    ) -> GitHubResponse:
+        """Send a request with retries; raise GitHubAPIError on 4xx/5xx.
+
+        GETs are revalidated against the ETag cache; a 304 returns the cached
+        response with `from_cache=True`.
+        """
+
+        url = self.url(path, params)
+        request_headers = {**self.headers, **(headers or {})}
+        body = None
+        if json_body is not None:
+            body = json.dumps(json_body).encode("utf-8")
+            request_headers["Content-Type"] = "application/json"
+
+        cache_key = cached = None
+        if method == "GET" and self.cache is not None:
+            cache_key = hashlib.sha256(f"{self._identity} {url}".encode("utf-8")).hexdigest()
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                request_headers["If-None-Match"] = cached["etag"]
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._send(method, url, body, request_headers)
+            except (OSError, http.client.HTTPException) as exc:
+                if attempt == self.max_retries:
+                    raise GitHubAPIError(None, url, f"{type(exc).__name__}: {exc}") from exc
+                self._count(retries=1)
+                self.sleep(float(2 ** attempt))
+                continue
+
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt == self.max_retries:
+                break
+            if delay > MAX_RATE_LIMIT_WAIT:
+                raise GitHubAPIError(response.status, url, f"rate limited for {delay:.0f} s")
+            self._count(retries=1)
+            self.sleep(delay)
+
+        if response.status == 304 and cached is not None:
+            self._count(not_modified=1)
+            return GitHubResponse(200, cached["headers"], cached["body"].encode("utf-8"), from_cache=True)
+        if response.status >= 400:
+            message = response.body.decode("utf-8", errors="replace")[:500]
+            raise GitHubAPIError(response.status, url, message)
+        if cache_key is not None and "etag" in response.headers:
+            self.cache.put(cache_key, response.headers["etag"], response)
+        return response
+
+    def get(self, path: str, params: dict[str, Any] | None = None) -> GitHubResponse:
+        return self.request("GET", path, params)
+
+    def get_json(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        return self.get(path, params).json()
+
+    def paginate(self, path: str, params: dict[str, Any] | None = None, per_page: int = 100) -> list:
+        """All items of a list endpoint, in order.
+
+        When the first page links to the last one, the pages in between are
+        fetched concurrently; otherwise `rel="next"` is followed page by page.
+        """
+
+        first = self.get(path, {**(params or {}), "per_page": per_page})
+        items = list(first.json() or [])
+        links = first.links
+
+        last = links.get("last")
+        last_page = parse_qs(urlsplit(last).query).get("page", [""])[-1] if last else ""
+        if last_page.isdigit() and int(last_page) > 1:
+            urls = [_with_query(last, page=page) for page in range(2, int(last_page) + 1)]
+            # Keep-alive connections of the worker threads, closed once the pool has finished.
+            worker_connections: dict[int, dict] = {}
+
+            def get_page(url: str) -> GitHubResponse:
+                try:
+                    return self.get(url)
+                finally:
+                    worker_connections[threading.get_ident()] = getattr(self._local, "connections", {})
+
+            try:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(urls))) as pool:
+                    for response in pool.map(get_page, urls):
+                        items.extend(response.json() or [])
+            finally:
+                for connections in worker_connections.values():
+                    for connection in connections.values():
+                        connection.close()
+            return items
+
+        next_url = links.get("next")
+        while next_url:
+            response = self.get(next_url)
+            items.extend(response.json() or [])
+            next_url = response.links.get("next")
+        return items
+
+
+_CLIENTS: dict[tuple, GitHubClient] = {}
+_CLIENTS_LOCK = threading.Lock()
+
+
+def get_client(token: str | None = None, headers: dict[str, str] | None = None, **kwargs: Any) -> GitHubClient:
+    """Shared client per credentials, so a script reuses its connections across calls.
+
+    Args:
+        token: API token (default: `GITHUB_TOKEN`)
+        headers: Extra default headers (e.g. an existing `Authorization`)
+        **kwargs: Other GitHubClient arguments, used when the client is created
+    """
+
+    token = token if token is not None else os.environ.get("GITHUB_TOKEN")
+    key = (token, tuple(sorted((headers or {}).items())))
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            api_url = kwargs.pop("api_url", None) or os.environ.get("GITHUB_API_URL") or DEFAULT_API_URL
+            client = _CLIENTS[key] = GitHubClient(token, api_url, headers=headers, **kwargs)
+        return client
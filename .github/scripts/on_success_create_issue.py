@@ -24,6 +24,8 @@ import re
 import urllib.request
 import urllib.error
 
+from github_api import GitHubAPIError, get_client
+
 
 LOG = logging.getLogger('on_success_create_issue')
 LOG.setLevel(logging.INFO)
@@ -33,34 +35,12 @@ LOG.addHandler(handler)
 
 
 def get_pr_changed_files(repo: str, pr_number: str, headers: dict) -> List[str]:
-    url = f'https://api.github.com/repos/{repo}/pulls/{pr_number}/files?per_page=100'
-    files = []
-    while url:
-        req = urllib.request.Request(url, headers=headers, method='GET')
-        try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                if resp.status != 200:
-                    LOG.warning('Failed to fetch PR files: %s', resp.status)
-                    break
-                body = resp.read().decode('utf-8')
-                data = json.loads(body)
-                for item in data:
-                    name = item.get('filename')
-                    if name:
-                        files.append(name)
-                link = resp.headers.get('Link', '')
-                next_url = None
-                for part in link.split(','):
-                    part = part.strip()
-                    if part.endswith('rel="next"'):
-                        m = re.match(r'<([^>]+)>;\s*rel="next"', part)
-                        if m:
-                            next_url = m.group(1)
-                url = next_url
-        except urllib.error.HTTPError as e:
-            LOG.warning('Failed to fetch PR files: %s %s', e.code, e.read().decode('utf-8', 'ignore'))
-            break
-    return files
+    try:
+        items = get_client(headers=headers).paginate(f'/repos/{repo}/pulls/{pr_number}/files')
+    except GitHubAPIError as e:
+        LOG.warning('Failed to fetch PR files: %s', e)
+        return []
+    return [item['filename'] for item in items if item.get('filename')]
 
 
 def add_label(repo: str, pr_number: str, headers: dict, label: str) -> int:
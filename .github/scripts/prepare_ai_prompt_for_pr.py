@@ -31,6 +31,8 @@ from typing import Iterable
 import urllib.request
 import urllib.error
 
+from github_api import GitHubAPIError, get_client
+
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -49,40 +51,17 @@ def build_headers(token: str | None) -> dict[str, str]:
 
 
 def fetch_pr(repo: str, pr_number: int, token: str | None) -> dict:
-    url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
-    req = urllib.request.Request(url, headers=build_headers(token), method="GET")
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-            return json.loads(raw)
-    except urllib.error.HTTPError as exc:
-        msg = exc.read().decode("utf-8", errors="replace") if getattr(exc, "fp", None) else str(exc)
-        raise RuntimeError(f"Failed to fetch PR #{pr_number}: HTTP {exc.code} {msg}") from exc
+        return get_client(token).get_json(f"/repos/{repo}/pulls/{pr_number}")
+    except GitHubAPIError as exc:
+        raise RuntimeError(f"Failed to fetch PR #{pr_number}: {exc}") from exc
 
 
 def fetch_pr_files(repo: str, pr_number: int, token: str | None) -> list[dict]:
-    files: list[dict] = []
-    page = 1
-    while True:
-        url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}/files"
-        full = f"{url}?page={page}&per_page=100"
-        req = urllib.request.Request(full, headers=build_headers(token), method="GET")
-        try:
-            with urllib.request.urlopen(req, timeout=30) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
-                batch = json.loads(raw)
-        except urllib.error.HTTPError as exc:
-            msg = exc.read().decode("utf-8", errors="replace") if getattr(exc, "fp", None) else str(exc)
-            raise RuntimeError(
-                f"Failed to fetch files for PR #{pr_number}: HTTP {exc.code} {msg}"
-            ) from exc
-        if not batch:
-            break
-        files.extend(batch)
-        if len(batch) < 100:
-            break
-        page += 1
-    return files
+    try:
+        return get_client(token).paginate(f"/repos/{repo}/pulls/{pr_number}/files")
+    except GitHubAPIError as exc:
+        raise RuntimeError(f"Failed to fetch files for PR #{pr_number}: {exc}") from exc
 
 
 def post_pr_comment(repo: str, pr_number: int, token: str | None, body: str) -> None:
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Prebuilt lookup index for AI prompt preparation.
+
+prepare_AI_prompt.py needs, per student, a variant block from the variants
+file and two H2 sections of the course README. Searching the markdown with a
+regex per call makes preparing prompts for a whole group quadratic. Instead
+`parse_markdown()` walks each file once and records every H2 section and every
+`## Вариант NN — Title` block. (Students come from students_registry.py.)
+
+It is serialized to a JSON cache file that is rebuilt when any source file
+changes (mtime or size), and memoized per process.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+
+INDEX_VERSION = 2
+
+_H2_RE = re.compile(r'^##\s+')
+_VARIANT_RE = re.compile(r'^##\s+Вариант\s+(\d+)\s+—\s+(.+?)\s*$')
+
+
+def _section_key(title: str) -> str:
+    return title.strip().casefold()
+
+
+def parse_markdown(text: str) -> tuple[dict[str, str], dict[str, list[str]]]:
+    """H2 sections {title key: body} and variants {number: [title, body]} of a markdown text.
+
+    A body runs until the next H2 heading and is stripped; the first heading
+    wins when a title repeats.
+    """
+    sections: dict[str, str] = {}
+    variants: dict[str, list[str]] = {}
+    section: str | None = None
+    variant: tuple[str, str] | None = None
+    body: list[str] = []
+
+    def close() -> None:
+        text = '\n'.join(body).strip()
+        if section is not None:
+            sections.setdefault(section, text)
+        if variant is not None:
+            variants.setdefault(variant[0], [variant[1], text])
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not _H2_RE.match(stripped):
+            body.append(line)
+            continue
+        close()
+        body = []
+        section = _section_key(_H2_RE.sub('', stripped, count=1))
+        match = _VARIANT_RE.match(stripped)
+        variant = (str(int(match.group(1))), match.group(2).strip()) if match else None
+    close()
+    return sections, variants
+
+
+@dataclass
+class PromptIndex:
+    """Everything prompt preparation looks up, keyed for O(1) access."""
+
+    readme_sections: dict[str, str] = field(default_factory=dict)
+    variants: dict[str, list[str]] = field(default_factory=dict)
+    sources: dict[str, list[int]] = field(default_factory=dict)
+    version: int = INDEX_VERSION
+
+    def section(self, header: str) -> str:
+        return self.readme_sections.get(_section_key(header), '')
+
+    def variant_block(self, variant: str | None) -> tuple[str, str]:
+        """(title, block) of a variant number, ('', '') if unknown."""
+        try:
+            entry = self.variants.get(str(int(str(variant).strip())))
+        except (TypeError, ValueError):
+            return '', ''
+        return (entry[0], entry[1]) if entry else ('', '')
+
+
+def source_signature(paths: list[Path]) -> dict[str, list[int]]:
+    """(mtime_ns, size) per source path; missing files are [0, -1]."""
+    signature = {}
+    for path in paths:
+        try:
+            st = path.stat()
+            signature[str(path)] = [st.st_mtime_ns, st.st_size]
+        except OSError:
+            signature[str(path)] = [0, -1]
+    return signature
+
+
+def build_index(readme_path: Path, variants_path: Path) -> PromptIndex:
+    def read(path: Path) -> str:
+        return path.read_text(encoding='utf-8') if path.exists() else ''
+
+    readme_sections, _ = parse_markdown(read(readme_path))
+    _, variants = parse_markdown(read(variants_path))
+    return PromptIndex(readme_sections=readme_sections, variants=variants,
+                       sources=source_signature([readme_path, variants_path]))
+
+
+_MEMO: dict[str, PromptIndex] = {}
+
+
+def load_index(readme_path: Path, variants_path: Path, cache_path: Path | None = None) -> PromptIndex:
+    """Index of the sources, from memory or `cache_path` while they are unchanged."""
+    signature = source_signature([readme_path, variants_path])
+    memo_key = json.dumps(signature, sort_keys=True)
+    index = _MEMO.get(memo_key)
+    if index is not None:
+        return index
+
+    if cache_path is not None:
+        try:
+            data = json.loads(cache_path.read_text(encoding='utf-8'))
+            if data.get('version') == INDEX_VERSION and data.get('sources') == signature:
+                index = PromptIndex(**data)
+        except (OSError, ValueError, TypeError):
+            index = None
+
+    if index is None:
+        index = build_index(readme_path, variants_path)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(asdict(index), f, ensure_ascii=False)
+                os.replace(tmp_name, cache_path)
+            except OSError:
+                pass
+
+    _MEMO[memo_key] = index
+    return index
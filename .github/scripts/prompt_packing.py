@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""Pack student files into an AI review prompt under a token budget.
+
+Taking files in `os.walk` order fills the prompt with lockfiles, build output
+and tests while the modules that matter get cut. Packing instead:
+- ranks every file by path (`file_priority`): entry points, READMEs, models,
+  routes/controllers/services first; tests and config later; lockfiles,
+  generated, minified and vendored files last;
+- estimates tokens per file (`estimate_tokens`, no tokenizer needed);
+- drops exact and near-identical copies (same lines up to whitespace),
+  keeping the higher-ranked path;
+- cuts files over a per-file cap (a sixth of the budget by default), so one
+  huge file cannot crowd out several core modules;
+- chooses the files with a 0/1 knapsack over the budget, where a file is
+  worth its tokens weighted by priority (twice as much per 10 points) and
+  costs its tokens plus its header.
+
+Selected files are returned in rank order, so the most important ones come
+first in the prompt.
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+
+
+DEFAULT_TOKEN_BUDGET = 12000
+# Knapsack granularity in tokens: the DP table has budget / unit columns.
+BUDGET_UNIT = 25
+# Prompt tokens per file besides its content (the "## path" header, separators).
+FILE_OVERHEAD_TOKENS = 12
+# Entry points deeper than this (e.g. barrel index.ts files) rank as plain sources.
+ENTRY_POINT_MAX_DEPTH = 3
+# Two files are near-identical when this share of their distinct lines match.
+NEAR_DUPLICATE_SIMILARITY = 0.9
+
+ENTRY_POINT_STEMS = {'main', 'index', 'app', 'server', 'manage', 'program', 'application', 'wsgi', 'asgi'}
+CORE_DIRS = {'models', 'model', 'entities', 'schemas', 'routes', 'router', 'routers', 'controllers', 'controller',
+             'api', 'services', 'service', 'handlers', 'views', 'pages', 'components', 'store', 'db', 'migrations'}
+TEST_DIRS = {'test', 'tests', '__tests__', 'spec', 'specs', 'e2e'}
+GENERATED_DIRS = {'vendor', 'vendors', 'third_party', 'node_modules', 'dist', 'build', 'out', 'coverage',
+                  '.next', '.nuxt', '__pycache__', 'target', 'bin', 'obj'}
+# Generated directories spanning several path segments (matched anywhere in the parent path).
+GENERATED_DIR_PATHS = ('public/assets',)
+LOCKFILES = {'package-lock.json', 'yarn.lock', 'pnpm-lock.yaml', 'poetry.lock', 'pipfile.lock', 'composer.lock',
+             'cargo.lock', 'gemfile.lock', 'go.sum', 'bun.lockb'}
+CONFIG_NAMES = {'package.json', 'requirements.txt', 'pyproject.toml', 'dockerfile', 'docker-compose.yml',
+                'docker-compose.yaml', '.env.example', 'tsconfig.json', 'vite.config.js', 'vite.config.ts',
+                'webpack.config.js', 'pom.xml', 'build.gradle', 'go.mod', 'cargo.toml'}
+SOURCE_EXTS = {'.py', '.js', '.ts', '.tsx', '.jsx', '.java', '.c', '.cpp', '.h', '.hpp', '.rs', '.go', '.cs',
+               '.php', '.rb', '.kt', '.vue', '.svelte', '.sql', '.html', '.css', '.scss'}
+
+_TEST_NAME_RE = re.compile(r'(^test_|_test\.|\.test\.|\.spec\.)')
+_GENERATED_NAME_RE = re.compile(r'(\.min\.(js|css)$|\.map$|\.bundle\.js$|\.generated\.|\.pb\.go$|_pb2\.py$)')
+
+
+def file_priority(rel_path: str) -> int:
+    """Rank of a file for the prompt, 0 (useless) .. 100 (read it first)."""
+    path = PurePosixPath(rel_path.lower())
+    name, parts = path.name, set(path.parts[:-1])
+    parent = '/' + '/'.join(path.parts[:-1]) + '/'
+
+    if (name in LOCKFILES or _GENERATED_NAME_RE.search(name) or parts & GENERATED_DIRS
+            or any(f'/{prefix}/' in parent for prefix in GENERATED_DIR_PATHS)):
+        return 5
+    if name.startswith('readme'):
+        return 90 if len(path.parts) <= 2 else 70
+    if path.stem in ENTRY_POINT_STEMS and path.suffix in SOURCE_EXTS and len(path.parts) <= ENTRY_POINT_MAX_DEPTH:
+        return 85
+    if parts & TEST_DIRS or _TEST_NAME_RE.search(name):
+        return 30
+    if parts & CORE_DIRS and path.suffix in SOURCE_EXTS:
+        return 80
+    if name in CONFIG_NAMES:
+        return 50
+    if path.suffix in SOURCE_EXTS:
+        return 65
+    if path.suffix in ('.md', '.txt'):
+        return 45
+    return 35
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count: ~4 characters per token for ASCII, ~2 for other scripts."""
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return max(1, (len(text) - non_ascii) // 4 + non_ascii // 2)
+
+
+def _line_set(text: str) -> frozenset[str]:
+    return frozenset(line for line in (' '.join(raw.split()) for raw in text.splitlines()) if line)
+
+
+@dataclass
+class Candidate:
+    name: str
+    content: str
+    priority: int = 0
+    tokens: int = 0
+    truncated: bool = False
+    lines: frozenset[str] = field(default_factory=frozenset, repr=False)
+
+    @property
+    def value(self) -> float:
+        # Each 10 points of priority double the worth of a token.
+        return self.tokens * 2 ** (self.priority / 10)
+
+    @property
+    def cost(self) -> int:
+        return self.tokens + FILE_OVERHEAD_TOKENS + len(self.name) // 4
+
+
+@dataclass
+class PackResult:
+    files: list[dict]
+    tokens: int
+    skipped: list[str] = field(default_factory=list)
+    duplicates: list[str] = field(default_factory=list)
+
+
+def _drop_duplicates(candidates: list[Candidate]) -> tuple[list[Candidate], list[str]]:
+    """Keep the first (highest-ranked) of identical or near-identical files."""
+    kept: list[Candidate] = []
+    duplicates: list[str] = []
+    seen_digests: set[str] = set()
+    for cand in candidates:
+        digest = hashlib.blake2b('\n'.join(sorted(cand.lines)).encode('utf-8'), digest_size=16).hexdigest()
+        if digest in seen_digests:
+            duplicates.append(cand.name)
+            continue
+        near = False
+        if len(cand.lines) >= 5:
+            for other in kept:
+                smaller, larger = sorted((len(cand.lines), len(other.lines)))
+                if smaller < NEAR_DUPLICATE_SIMILARITY * larger:
+                    continue
+                if len(cand.lines & other.lines) >= NEAR_DUPLICATE_SIMILARITY * len(cand.lines | other.lines):
+                    near = True
+                    break
+        if near:
+            duplicates.append(cand.name)
+            continue
+        seen_digests.add(digest)
+        kept.append(cand)
+    return kept, duplicates
+
+
+def _knapsack(candidates: list[Candidate], budget: int) -> list[Candidate]:
+    """0/1 knapsack maximizing total value with costs rounded up to BUDGET_UNIT."""
+    capacity = budget // BUDGET_UNIT
+    costs = [-(-cand.cost // BUDGET_UNIT) for cand in candidates]
+    best = [0.0] * (capacity + 1)
+    # taken[i] holds the capacities at which item i improved the table.
+    taken: list[bytearray] = []
+    for cand, cost in zip(candidates, costs):
+        row = bytearray(capacity + 1)
+        if cost <= capacity:
+            for cap in range(capacity, cost - 1, -1):
+                value = best[cap - cost] + cand.value
+                if value > best[cap]:
+                    best[cap] = value
+                    row[cap] = 1
+        taken.append(row)
+
+    chosen: list[Candidate] = []
+    cap = capacity
+    for index in range(len(candidates) - 1, -1, -1):
+        if taken[index][cap]:
+            chosen.append(candidates[index])
+            cap -= costs[index]
+    return chosen
+
+
+def pack_files(files: list[dict], token_budget: int = DEFAULT_TOKEN_BUDGET, max_files: int | None = None,
+               max_tokens_per_file: int | None = None) -> PackResult:
+    """Select files ({'name', 'content'}) for a prompt within `token_budget` tokens.
+
+    Files over `max_tokens_per_file` (default: a sixth of the budget) are cut
+    and marked as truncated rather than dropped.
+    """
+    per_file = max_tokens_per_file or max(BUDGET_UNIT, token_budget // 6)
+    candidates: list[Candidate] = []
+    for item in files:
+        content = item['content']
+        tokens = estimate_tokens(content)
+        truncated = False
+        if tokens > per_file:
+            content = content[:max(1, len(content) * per_file // tokens)] + '\n... (truncated)'
+            tokens = estimate_tokens(content)
+            truncated = True
+        candidates.append(Candidate(item['name'], content, file_priority(item['name']), tokens, truncated,
+                                    _line_set(content)))
+
+    candidates.sort(key=lambda cand: (-cand.priority, cand.name))
+    candidates, duplicates = _drop_duplicates(candidates)
+    chosen = {id(cand) for cand in _knapsack(candidates, token_budget)}
+
+    selected = [cand for cand in candidates if id(cand) in chosen]
+    if max_files is not None and len(selected) > max_files:
+        keep = {id(cand) for cand in sorted(selected, key=lambda cand: -cand.value)[:max_files]}
+        selected = [cand for cand in selected if id(cand) in keep]
+    selected_ids = {id(cand) for cand in selected}
+    return PackResult(
+        files=[{'name': cand.name, 'content': cand.content} for cand in selected],
+        tokens=sum(cand.cost for cand in selected),
+        skipped=[cand.name for cand in candidates if id(cand) not in selected_ids],
+        duplicates=duplicates,
+    )
@@ -4,30 +4,57 @@
 Usage:
   python .github/scripts/run_ai_check.py --student NameLatin --task task_XX --prompt-file ai_prompt.txt --out ai_response.md
 
+Batch mode (a whole group, several requests in flight):
+  python .github/scripts/run_ai_check.py --batch --task task_03 --concurrency 6 --out-dir ai_reviews
+  python .github/scripts/run_ai_check.py --batch --pairs-file pairs.txt   # lines: "NameLatin task_XX"
+
 Env:
   GITHUB_TOKEN: GitHub token with access to Models API
     MODEL: Optional, defaults to gpt5-mini
 
 This script:
   - Reads the prepared prompt text
-  - Reads student files (text only) under students/NameLatin/task_XX
+  - Reads student files (text only) under students/NameLatin/task_XX and packs the
+    most relevant ones into a token budget (prompt_packing.py, --token-budget or
+    AI_PROMPT_TOKEN_BUDGET)
   - Calls GitHub Models chat completions endpoint
   - Writes the AI response to the output file
+
+In batch mode the pairs come from --pairs/--pairs-file or, with only --task, from
+every student in students/students.csv that has the task folder. Prompts are built
+per student with prepare_AI_prompt.build_prompt() unless --prompt-file is given.
+Calls run on asyncio with at most --concurrency requests in flight, 429/5xx and
+network errors are retried with backoff (Retry-After is honoured), and every
+response is written to --out-dir as soon as it arrives, plus batch_summary.json.
+MODELS_ENDPOINT (or --endpoint) overrides the model endpoint, e.g. for a local mock.
+
+Successful responses are cached by model, temperature and prompt hash
+(ai_response_cache.py), so a re-run with unchanged sources does not call the
+model again; --no-cache disables it.
 """
 from __future__ import annotations
 
 import argparse
+import asyncio
 import os
 import sys
 import json
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import re
 import urllib.request
 import urllib.error
 
+from ai_response_cache import ResponseCache, cache_key, default_cache_dir, default_ttl
+from prompt_packing import DEFAULT_TOKEN_BUDGET, PackResult, pack_files
+from students_registry import load_registry
+
 
 ROOT = Path(__file__).resolve().parents[2]
 
+DEFAULT_ENDPOINT = 'https://models.inference.ai.azure.com/v1/chat/completions'
+
 TEXT_EXTS = {
     '.txt', '.md', '.html', '.css', '.js', '.ts', '.tsx', '.jsx', '.json', '.yml', '.yaml', '.xml', '.ini', '.cfg', '.py', '.java', '.c', '.cpp', '.h', '.hpp', '.rs', '.go', '.sh', '.bat', '.ps1'
 }
@@ -50,14 +77,18 @@ def is_text_file(p: Path) -> bool:
         return False
 
 
-def collect_files(student: str, task_folder: str, limit_files: int = 50, limit_bytes_per_file: int = 15000) -> list[dict]:
+MAX_SCANNED_FILES = 2000
+
+
+def scan_files(student: str, task_folder: str, limit_bytes_per_file: int = 15000) -> list[dict]:
+    """Every text file under students/<student>/<task_folder>, in path order."""
     base = ROOT / 'students' / student / task_folder
     result: list[dict] = []
     if not base.exists():
         return result
     for root, dirs, files in os.walk(base):
-        dirs[:] = [d for d in dirs if d not in IGNORE_DIRS]
-        for name in files:
+        dirs[:] = sorted(d for d in dirs if d not in IGNORE_DIRS)
+        for name in sorted(files):
             p = Path(root) / name
             rel = p.relative_to(base).as_posix()
             if not is_text_file(p):
@@ -67,18 +98,332 @@ def collect_files(student: str, task_folder: str, limit_files: int = 50, limit_b
             except Exception:
                 continue
             result.append({'name': rel, 'content': content})
-            if len(result) >= limit_files:
+            if len(result) >= MAX_SCANNED_FILES:
                 return result
     return result
 
 
+def pack_student_files(student: str, task_folder: str, token_budget: int | None = None, limit_files: int = 50,
+                       limit_bytes_per_file: int = 15000) -> PackResult:
+    """Best files of a student's task for the prompt, within the token budget (see prompt_packing)."""
+    budget = token_budget or int(os.environ.get('AI_PROMPT_TOKEN_BUDGET') or DEFAULT_TOKEN_BUDGET)
+    return pack_files(scan_files(student, task_folder, limit_bytes_per_file), budget, max_files=limit_files)
+
+
+def collect_files(student: str, task_folder: str, limit_files: int = 50, limit_bytes_per_file: int = 15000,
+                  token_budget: int | None = None) -> list[dict]:
+    return pack_student_files(student, task_folder, token_budget, limit_files, limit_bytes_per_file).files
+
+
+def normalize_task(task: str) -> str | None:
+    """'task_1', '1' or '01' -> 'task_01' (None if there is no number)."""
+    m = re.search(r'(\d+)', task)
+    return f'task_{int(m.group(1)):02d}' if m else None
+
+
+def build_combined_prompt(prompt_text: str, files: list[dict]) -> str:
+    return prompt_text + '\n\nStudent files (text only):\n' + '\n\n'.join(
+        [f"## {f['name']}\n{f['content']}" for f in files]
+    )
+
+
+def build_payload(model: str, combined: str) -> dict:
+    return {
+        'model': model,
+        'messages': [
+            {'role': 'user', 'content': combined}
+        ],
+        'temperature': 0.3,
+    }
+
+
+def build_headers(token: str) -> dict[str, str]:
+    return {
+        'Authorization': f'Bearer {token}',
+        'Content-Type': 'application/json',
+        'Accept': 'application/json',
+    }
+
+
+def call_model(endpoint: str, headers: dict[str, str], payload: dict, timeout: float = 120) -> tuple[int, str, dict[str, str]]:
+    """POST the payload; returns (status, body, headers). Network errors are raised."""
+    data = json.dumps(payload).encode('utf-8')
+    req = urllib.request.Request(endpoint, headers=headers, data=data, method='POST')
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            return resp.status, resp.read().decode('utf-8'), dict(resp.headers)
+    except urllib.error.HTTPError as exc:
+        body = exc.read().decode('utf-8', errors='replace') if exc.fp else str(exc)
+        return exc.code, body, dict(exc.headers or {})
+
+
+def format_error(status: int, resp_text: str, endpoint: str, model: str, files_count: int, debug: bool = False) -> str:
+    """Contents of the output file when the model call was answered with an error."""
+    detail = resp_text
+    try:
+        j = json.loads(resp_text)
+        msg = j.get('error') or j.get('message') or j
+        detail = json.dumps(msg, ensure_ascii=False)
+    except Exception:
+        pass
+    remediation = ''
+    if status in (401, 403):
+        remediation = (
+            'Remediation: The token used lacks the models permission. Create a PAT with models:read, store as GH_MODELS_TOKEN, and re-run.'
+        )
+    diagnostic = {
+        'status': status,
+        'detail': detail[:2000],
+        'endpoint': endpoint,
+        'model': model,
+        'files_count': files_count,
+        'latency_seconds': None,
+        'debug': debug
+    }
+    if remediation:
+        diagnostic['remediation'] = remediation
+    return 'Error invoking model:\n' + json.dumps(diagnostic, ensure_ascii=False, indent=2)
+
+
+def extract_text(resp_text: str) -> str:
+    data = json.loads(resp_text)
+    return data.get('choices', [{}])[0].get('message', {}).get('content') or 'No response'
+
+
+# Batch mode -------------------------------------------------------------
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def retry_delay(status: int | None, headers: dict[str, str], attempt: int, backoff: float) -> float:
+    """Seconds to wait before the next attempt (Retry-After wins over exponential backoff)."""
+    for name, value in headers.items():
+        if name.lower() == 'retry-after':
+            try:
+                return float(value)
+            except ValueError:
+                break
+    return backoff * (2 ** attempt)
+
+
+def students_from_csv(task_folder: str, csv_path: Path | None = None) -> list[tuple[str, str]]:
+    """(student, task) pairs for every student in students.csv that has the task folder."""
+    registry = load_registry(csv_path or ROOT / 'students' / 'students.csv')
+    pairs = []
+    for record in registry.students:
+        student = record.dir_name or record.name_latin
+        if student and (ROOT / 'students' / student / task_folder).is_dir():
+            pairs.append((student, task_folder))
+    return pairs
+
+
+def read_pairs(lines: list[str]) -> list[tuple[str, str]]:
+    """Parse 'Student task' or 'Student:task' entries (blank lines and # comments are skipped)."""
+    pairs = []
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        student, _, task = line.replace(':', ' ').replace(',', ' ').partition(' ')
+        task_folder = normalize_task(task)
+        student = re.sub(r'[^A-Za-z0-9_-]', '', student)
+        if not student or not task_folder:
+            raise ValueError(f'Invalid student/task entry: {line!r}')
+        pairs.append((student, task_folder))
+    return pairs
+
+
+async def review_batch(
+    pairs: list[tuple[str, str]],
+    prompt_for,
+    token: str,
+    model: str,
+    endpoint: str,
+    out_dir: Path,
+    concurrency: int = 4,
+    retries: int = 3,
+    backoff: float = 2.0,
+    timeout: float = 120,
+    token_budget: int | None = None,
+    cache: ResponseCache | None = None,
+    on_done=None,
+) -> list[dict]:
+    """Review student/task pairs with at most `concurrency` model calls in flight.
+
+    `prompt_for(student, task_folder)` returns the prompt text. Each response is
+    written to `out_dir/<student>_<task>.md` as soon as it arrives (errors in
+    the single-run format), and `on_done(record)` is called for it.
+    Prompts found in `cache` are not sent again, and pairs with the same prompt
+    share one call. A pair that cannot be reviewed at all (unreadable files, a
+    200 response that is not the expected JSON) is recorded as failed, with the
+    error in its output file and record; the other pairs still run.
+    Returns one record per pair, in completion order.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+    in_flight: dict[str, asyncio.Future] = {}
+    headers = build_headers(token)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    def prepare(student: str, task_folder: str) -> tuple[dict, int]:
+        files = collect_files(student, task_folder, token_budget=token_budget)
+        return build_payload(model, build_combined_prompt(prompt_for(student, task_folder), files)), len(files)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        async def call(payload: dict, files_count: int, record: dict) -> tuple[int | None, str]:
+            """Model call with retries; returns (status, output file text)."""
+            status, text, resp_headers = None, '', {}
+            async with semaphore:
+                for attempt in range(retries + 1):
+                    record['attempts'] = attempt + 1
+                    try:
+                        status, text, resp_headers = await loop.run_in_executor(
+                            pool, call_model, endpoint, headers, payload, timeout)
+                    except Exception as e:
+                        status, text, resp_headers = None, str(e), {}
+                    if status == 200 or (status is not None and status not in RETRY_STATUSES) or attempt == retries:
+                        break
+                    await asyncio.sleep(retry_delay(status, resp_headers, attempt, backoff))
+            if status == 200:
+                try:
+                    return status, extract_text(text)
+                except (ValueError, AttributeError, IndexError, TypeError) as e:
+                    raise ValueError(f'Unexpected models API response: {text[:500]!r}') from e
+            if status is None:
+                return status, 'Error calling models API: ' + text
+            return status, format_error(status, text, endpoint, model, files_count)
+
+        async def answer(student: str, task_folder: str, record: dict) -> tuple[int | None, str, int]:
+            """(status, output file text, files count) from the cache, a shared call or the model."""
+            payload, files_count = await loop.run_in_executor(pool, prepare, student, task_folder)
+            key = cache_key(payload)
+            entry = cache.get(key) if cache is not None else None
+            if entry is not None:
+                record['source'] = 'cache'
+                return 200, entry['text'], files_count
+            if key in in_flight:
+                # Same prompt as a pair already being reviewed: share its answer.
+                record['source'] = 'coalesced'
+                status, output = await asyncio.shield(in_flight[key])
+                return status, output, files_count
+            in_flight[key] = future = loop.create_future()
+            try:
+                status, output = await call(payload, files_count, record)
+                if status == 200 and cache is not None:
+                    await loop.run_in_executor(pool, cache.put, key, output, model)
+                future.set_result((status, output))
+            except BaseException as exc:
+                future.set_exception(exc)
+                future.exception()  # pairs sharing the call still get it; no "never retrieved" warning
+                raise
+            finally:
+                del in_flight[key]
+            return status, output, files_count
+
+        async def review(student: str, task_folder: str) -> dict:
+            record = {'student': student, 'task': task_folder, 'attempts': 0, 'source': 'model'}
+            started = time.monotonic()
+            try:
+                status, output, files_count = await answer(student, task_folder, record)
+            except Exception as e:
+                # A broken pair (unreadable files, malformed response) is recorded
+                # as failed; the rest of the batch goes on.
+                status, output, files_count = None, f'Error reviewing {student}/{task_folder}: {e}', 0
+                record['error'] = str(e)
+
+            out_path = out_dir / f'{student}_{task_folder}.md'
+            out_path.write_text(output, encoding='utf-8')
+            record.update({
+                'status': status,
+                'ok': status == 200,
+                'files_count': files_count,
+                'output': out_path.as_posix(),
+                'seconds': round(time.monotonic() - started, 2),
+            })
+            if on_done is not None:
+                on_done(record)
+            return record
+
+        tasks = [asyncio.create_task(review(student, task_folder)) for student, task_folder in pairs]
+        return [await task for task in asyncio.as_completed(tasks)]
+
+
+def response_cache(args) -> ResponseCache | None:
+    if args.no_cache:
+        return None
+    ttl = args.cache_ttl_hours * 3600 if args.cache_ttl_hours is not None else default_ttl()
+    return ResponseCache(default_cache_dir(ROOT), ttl)
+
+
+def run_batch(args, ap: argparse.ArgumentParser, token: str, model: str, endpoint: str) -> int:
+    if args.pairs_file:
+        pairs = read_pairs(Path(args.pairs_file).read_text(encoding='utf-8').splitlines())
+    elif args.pairs:
+        pairs = read_pairs(args.pairs)
+    elif args.task:
+        task_folder = normalize_task(args.task)
+        if not task_folder:
+            ap.error('Invalid task format, expected a number')
+        pairs = students_from_csv(task_folder)
+    else:
+        ap.error('--batch needs --pairs, --pairs-file or --task (all students from students.csv)')
+    if not pairs:
+        print('No student/task pairs to review', file=sys.stderr)
+        return 0
+
+    if args.prompt_file:
+        prompt_text = Path(args.prompt_file).read_text(encoding='utf-8')
+
+        def prompt_for(student: str, task_folder: str) -> str:
+            return prompt_text
+    else:
+        from prepare_AI_prompt import build_prompt as prompt_for
+
+    total = len(pairs)
+    done = 0
+
+    def report(record: dict) -> None:
+        nonlocal done
+        done += 1
+        state = 'ok' if record['ok'] else f"failed ({record['status']})"
+        if record['source'] != 'model':
+            state += f" ({record['source']})"
+        print(f"[{done}/{total}] {record['student']}/{record['task']}: {state} in {record['seconds']}s -> {record['output']}")
+
+    out_dir = Path(args.out_dir)
+    print(f'Reviewing {total} student/task pairs with model {model}, concurrency={args.concurrency}')
+    records = asyncio.run(review_batch(
+        pairs, prompt_for, token, model, endpoint, out_dir,
+        concurrency=args.concurrency, retries=args.retries, token_budget=args.token_budget,
+        cache=response_cache(args), on_done=report,
+    ))
+    failed = [r for r in records if not r['ok']]
+    summary = {'model': model, 'total': total, 'failed': len(failed), 'results': records}
+    (out_dir / 'batch_summary.json').write_text(json.dumps(summary, ensure_ascii=False, indent=2), encoding='utf-8')
+    print(f'Done: {total - len(failed)} ok, {len(failed)} failed')
+    return 1 if failed else 0
+
+
 def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser(description='Run AI check (GitHub Models)')
-    ap.add_argument('--student', required=True)
-    ap.add_argument('--task', required=True, help='task folder name like task_01 or task_1 or 01')
-    ap.add_argument('--prompt-file', required=True)
+    ap.add_argument('--student')
+    ap.add_argument('--task', help='task folder name like task_01 or task_1 or 01')
+    ap.add_argument('--prompt-file', help='Prompt text (required for a single student; optional with --batch)')
     ap.add_argument('--out', default='ai_response.md')
     ap.add_argument('--debug', action='store_true', help='Enable verbose debug output')
+    ap.add_argument('--token-budget', type=int, default=None,
+                    help=f'Token budget for student files (default: AI_PROMPT_TOKEN_BUDGET or {DEFAULT_TOKEN_BUDGET})')
+    ap.add_argument('--no-cache', action='store_true', help='Always call the model (do not read or store cached responses)')
+    ap.add_argument('--cache-ttl-hours', type=float, default=None,
+                    help='Lifetime of cached responses (default: AI_CACHE_TTL_HOURS or 7 days)')
+    ap.add_argument('--endpoint', default=os.environ.get('MODELS_ENDPOINT', DEFAULT_ENDPOINT))
+    batch = ap.add_argument_group('batch mode')
+    batch.add_argument('--batch', action='store_true', help='Review many students concurrently')
+    batch.add_argument('--pairs', nargs='+', metavar='STUDENT:TASK', help='Student/task pairs to review')
+    batch.add_argument('--pairs-file', help="File with one 'Student task' pair per line")
+    batch.add_argument('--out-dir', default='ai_reviews', help='Directory for <Student>_<task>.md outputs')
+    batch.add_argument('--concurrency', type=int, default=int(os.environ.get('AI_CONCURRENCY', '4')))
+    batch.add_argument('--retries', type=int, default=3, help='Retries on 429/5xx and network errors')
     args = ap.parse_args(argv)
 
     token = os.environ.get('GITHUB_TOKEN')
@@ -87,6 +432,14 @@ def main(argv: list[str] | None = None) -> int:
         return 2
     model = os.environ.get('MODEL', 'gpt5-mini')
     debug = args.debug or os.environ.get('DEBUG') == '1'
+    endpoint = args.endpoint
+
+    if args.batch:
+        if args.concurrency < 1:
+            ap.error('--concurrency must be at least 1')
+        return run_batch(args, ap, token, model, endpoint)
+    if not (args.student and args.task and args.prompt_file):
+        ap.error('--student, --task and --prompt-file are required (or use --batch)')
 
     def dbg(msg: str):
         if debug:
@@ -97,11 +450,10 @@ def main(argv: list[str] | None = None) -> int:
         print('Invalid student name after sanitization', file=sys.stderr)
         return 2
 
-    m = re.search(r'(\d+)', args.task)
-    if not m:
+    task_folder = normalize_task(args.task)
+    if not task_folder:
         print('Invalid task format, expected a number', file=sys.stderr)
         return 2
-    task_folder = f'task_{int(m.group(1)):02d}'
 
     prompt_path = Path(args.prompt_file)
     if not prompt_path.exists():
@@ -109,91 +461,60 @@ def main(argv: list[str] | None = None) -> int:
         return 2
     prompt_text = prompt_path.read_text(encoding='utf-8')
 
-    files = collect_files(student_clean, task_folder)
+    packed = pack_student_files(student_clean, task_folder, args.token_budget)
+    files = packed.files
     if not files:
         print(f'Warning: no files collected under students/{student_clean}/{task_folder}', file=sys.stderr)
     else:
-        dbg(f'Collected {len(files)} files (showing up to first 5 names): ' + ', '.join(f["name"] for f in files[:5]))
+        dbg(f'Packed {len(files)} files (~{packed.tokens} tokens, showing up to first 5 names): ' + ', '.join(f["name"] for f in files[:5]))
+        if packed.skipped or packed.duplicates:
+            dbg(f'Left out {len(packed.skipped)} files over the budget and {len(packed.duplicates)} duplicates: '
+                + ', '.join((packed.skipped + packed.duplicates)[:10]))
 
-    combined = prompt_text + '\n\nStudent files (text only):\n' + '\n\n'.join(
-        [f"## {f['name']}\n{f['content']}" for f in files]
-    )
+    combined = build_combined_prompt(prompt_text, files)
     dbg(f'Combined prompt size: {len(combined)} characters')
     if debug and len(combined) > 50000:
         dbg('Warning: very large prompt may be truncated or rejected by model API')
 
-    endpoint = 'https://models.inference.ai.azure.com/v1/chat/completions'
-    payload = {
-        'model': model,
-        'messages': [
-            {'role': 'user', 'content': combined}
-        ],
-        'temperature': 0.3,
-    }
-    headers = {
-        'Authorization': f'Bearer {token}',
-        'Content-Type': 'application/json',
-        'Accept': 'application/json',
-    }
+    payload = build_payload(model, combined)
+    headers = build_headers(token)
 
-    try:
-        print(f'Calling model {model} with {len(files)} files, prompt length={len(combined)}')
-        if debug:
-            redacted_headers = {k: ('***' if k.lower() == 'authorization' else v) for k, v in headers.items()}
-            dbg('Request headers: ' + json.dumps(redacted_headers))
-            dbg('Payload keys: ' + ','.join(payload.keys()))
-            dbg('Messages count: ' + str(len(payload.get('messages', []))))
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(endpoint, headers=headers, data=data, method='POST')
-        with urllib.request.urlopen(req, timeout=120) as resp:
-            status = resp.status
-            resp_text = resp.read().decode('utf-8')
-            resp_headers = resp.headers
-    except Exception as e:
-        Path(args.out).write_text('Error calling models API: ' + str(e), encoding='utf-8')
-        return 1
-
-    if status != 200:
-        detail = resp_text
+    def call() -> tuple[bool, str]:
         try:
-            j = json.loads(resp_text)
-            msg = j.get('error') or j.get('message') or j
-            detail = json.dumps(msg, ensure_ascii=False)
-        except Exception:
-            pass
-        latency = None
-        remediation = ''
-        if resp.status_code in (401, 403):
-            remediation = (
-                'Remediation: The token used lacks the models permission. Create a PAT with models:read, store as GH_MODELS_TOKEN, and re-run.'
-            )
-        diagnostic = {
-            'status': resp.status_code,
-            'detail': detail[:2000],
-            'endpoint': endpoint,
-            'model': model,
-            'files_count': len(files),
-            'latency_seconds': latency,
-            'debug': debug
-        }
-        if remediation:
-            diagnostic['remediation'] = remediation
+            print(f'Calling model {model} with {len(files)} files, prompt length={len(combined)}')
+            if debug:
+                redacted_headers = {k: ('***' if k.lower() == 'authorization' else v) for k, v in headers.items()}
+                dbg('Request headers: ' + json.dumps(redacted_headers))
+                dbg('Payload keys: ' + ','.join(payload.keys()))
+                dbg('Messages count: ' + str(len(payload.get('messages', []))))
+            status, resp_text, _ = call_model(endpoint, headers, payload)
+        except Exception as e:
+            return False, 'Error calling models API: ' + str(e)
+
+        if status != 200:
+            if debug:
+                dbg('Response status: ' + str(status))
+                dbg('Raw response (truncated 500 chars): ' + resp_text[:500])
+            return False, format_error(status, resp_text, endpoint, model, len(files), debug)
+
         if debug:
-            dbg('Response status: ' + str(status))
-            dbg('Raw response (truncated 500 chars): ' + resp_text[:500])
-        Path(args.out).write_text('Error invoking model:\n' + json.dumps(diagnostic, ensure_ascii=False, indent=2), encoding='utf-8')
-        return 1
+            data = json.loads(resp_text)
+            dbg('Parsed JSON keys: ' + ','.join(data.keys()))
+            dbg('Choices length: ' + str(len(data.get('choices', []))))
+        return True, extract_text(resp_text)
 
-    data = json.loads(resp_text)
-    if debug:
-        dbg('Parsed JSON keys: ' + ','.join(data.keys()))
-        dbg('Choices length: ' + str(len(data.get('choices', []))))
-    text = data.get('choices', [{}])[0].get('message', {}).get('content') or 'No response'
+    cache = response_cache(args)
+    if cache is None:
+        ok, text = call()
+    else:
+        key = cache_key(payload)
+        ok, text, source = cache.fetch(key, call, model)
+        if source != 'model':
+            print(f'Using {source} response for model {model} (cache key {key[:12]})')
     Path(args.out).write_text(text, encoding='utf-8')
-    if debug:
+    if debug and ok:
         dbg('Wrote AI response with length ' + str(len(text)))
-    return 0
-
+    return 0 if ok else 1
 
 if __name__ == '__main__':
     raise SystemExit(main())
@@ -7,8 +7,11 @@ It:
 - Maps GitHub username -> student directory via `students/students.csv`.
 - Ensures the PR changes include the target file:
     `students/<Student>/task_03/Пояснительная_записка.docx`
-- Runs `scripts/standards_verification/check_it_docx.py` for that single file.
-- Collects generated markdown reports from `normocontrol_reports/`.
+- Runs `scripts/standards_verification/check_it_docx.py --incremental` for that
+  single file: only the rules whose inputs changed since the previous run of
+  the file are evaluated again (state in `normocontrol_reports/.cache`).
+- Collects generated markdown reports and new/fixed issue diffs from
+  `normocontrol_reports/`.
 - Writes a ready-to-post PR comment body to `.github/it_normocontrol_comment.md`.
 - Writes a machine-readable result to `.github/it_normocontrol_result.json`.
 
@@ -19,16 +22,17 @@ Exit codes:
 
 from __future__ import annotations
 
-import csv
 import json
 import os
 import re
 import subprocess
 import sys
-import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
 
+from github_api import GitHubAPIError, get_client
+from students_registry import load_registry
+
 
 COMMENT_MARKER = "<!-- it-normocontrol-task03 -->"
 MAX_COMMENT_LEN = 64000
@@ -44,6 +48,7 @@ class CheckRun:
     report_text: str
     stdout: str
     stderr: str
+    changes: dict | None = None
 
 
 def _repo_root() -> Path:
@@ -61,19 +66,9 @@ def _students_csv_path(root: Path) -> Path:
 def _load_students_map(csv_path: Path) -> dict[str, str]:
     """Load mapping GitHub Username -> Directory from students.csv."""
 
-    mapping: dict[str, str] = {}
     if not csv_path.exists():
-        return mapping
-
-    with csv_path.open(newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
-        for row in reader:
-            username = (row.get("Github Username") or "").strip()
-            directory = (row.get("Directory") or "").strip()
-            if username:
-                mapping[username.lower()] = directory
-
-    return mapping
+        return {}
+    return load_registry(csv_path).directory_map()
 
 
 def _load_event(event_path: Path) -> dict | None:
@@ -122,59 +117,19 @@ def _get_pr_info(event: dict) -> dict | None:
 
 
 def _fetch_pr_json(repo: str, pr_number: str, token: str | None) -> dict | None:
-    """Fetch PR JSON from GitHub API (stdlib-only)."""
-
-    api_url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}"
-    request = urllib.request.Request(api_url)
-    if token:
-        request.add_header("Authorization", f"token {token}")
-    request.add_header("Accept", "application/vnd.github+json")
+    """Fetch PR JSON from GitHub API."""
 
     try:
-        with urllib.request.urlopen(request, timeout=30) as response:
-            return json.load(response)
-    except Exception:
-        return None
-
-
-def _parse_next_link(link_header: str | None) -> str | None:
-    """Parse Link header and return URL for rel=next."""
-
-    if not link_header:
+        return get_client(token).get_json(f"/repos/{repo}/pulls/{pr_number}")
+    except (GitHubAPIError, ValueError):
         return None
-    for part in link_header.split(","):
-        section = part.strip()
-        if not section.endswith('rel="next"'):
-            continue
-        url_part = section.split(";", 1)[0].strip()
-        if url_part.startswith("<") and url_part.endswith(">"):
-            return url_part[1:-1]
-    return None
 
 
 def _fetch_changed_files(repo: str, pr_number: str, token: str | None) -> list[str]:
     """Fetch list of changed files for PR using GitHub API."""
 
-    url = f"https://api.github.com/repos/{repo}/pulls/{pr_number}/files?per_page=100"
-    headers = {"Accept": "application/vnd.github+json"}
-    if token:
-        headers["Authorization"] = f"token {token}"
-
-    files: list[str] = []
-    next_url: str | None = url
-
-    while next_url:
-        request = urllib.request.Request(next_url, headers=headers)
-        with urllib.request.urlopen(request, timeout=30) as response:
-            data = json.loads(response.read().decode("utf-8"))
-            link_header = response.headers.get("Link")
-        for item in data:
-            filename = item.get("filename")
-            if filename:
-                files.append(filename)
-        next_url = _parse_next_link(link_header)
-
-    return files
+    items = get_client(token).paginate(f"/repos/{repo}/pulls/{pr_number}/files")
+    return [item["filename"] for item in items if item.get("filename")]
 
 
 def _normalize_path(path: str) -> str:
@@ -226,9 +181,10 @@ def _run_checker(root: Path, docx_path: Path) -> CheckRun:
     reports_dir.mkdir(parents=True, exist_ok=True)
 
     before = set(reports_dir.glob("it_normocontrol_report_*.md"))
+    changes_before = set(reports_dir.glob("it_normocontrol_changes_*.json"))
 
     proc = subprocess.run(
-        [sys.executable, str(checker), str(docx_path)],
+        [sys.executable, str(checker), str(docx_path), "--incremental"],
         cwd=str(root),
         text=True,
         capture_output=True,
@@ -237,6 +193,14 @@ def _run_checker(root: Path, docx_path: Path) -> CheckRun:
     after = set(reports_dir.glob("it_normocontrol_report_*.md"))
     report_path = _detect_new_report(before, after)
 
+    changes = None
+    changes_path = _detect_new_report(changes_before, set(reports_dir.glob("it_normocontrol_changes_*.json")))
+    if changes_path is not None:
+        try:
+            changes = json.loads(_read_text(changes_path))
+        except ValueError:
+            changes = None
+
     report_text = ""
     if report_path and report_path.exists():
         report_text = _read_text(report_path)
@@ -259,9 +223,35 @@ def _run_checker(root: Path, docx_path: Path) -> CheckRun:
         report_text=report_text,
         stdout=proc.stdout,
         stderr=proc.stderr,
+        changes=changes,
     )
 
 
+def _format_changes(run: CheckRun) -> list[str]:
+    """Format new/fixed issues since the previous check of a document (empty on a first check)."""
+
+    changes = run.changes
+    if not changes or not changes.get("previous"):
+        return []
+
+    new_issues = changes.get("new_issues") or []
+    fixed_issues = changes.get("fixed_issues") or []
+    lines = [
+        f"#### Изменения с прошлой проверки: `{run.docx_path.as_posix()}`",
+        "",
+        f"Новые замечания: **{len(new_issues)}**, исправлено: **{len(fixed_issues)}** "
+        f"(изменено блоков: {changes.get('blocks_changed', 0)} из {changes.get('blocks_total', 0)})",
+        "",
+    ]
+    for issue in new_issues:
+        icon = "❌" if issue.get("severity") == "error" else "⚠️"
+        lines.append(f"- {icon} {issue.get('description', '')}")
+    for issue in fixed_issues:
+        lines.append(f"- ✅ ~~{issue.get('description', '')}~~")
+    lines.append("")
+    return lines
+
+
 def _format_comment(runs: list[CheckRun]) -> tuple[str, int]:
     """Build a PR comment body and return (body, exit_code)."""
 
@@ -290,6 +280,9 @@ def _format_comment(runs: list[CheckRun]) -> tuple[str, int]:
 
     lines.append("")
 
+    for run in runs:
+        lines.extend(_format_changes(run))
+
     for run in runs:
         rel = run.docx_path.as_posix()
         title = f"Report: {rel}"
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""Shared registry of students (`students/students.csv`) and code owners (`.github/CODEOWNERS`).
+
+The CI scripts, prompt preparation and the generators in `scripts/` all need
+the same lookups ("which directory belongs to this GitHub user?", "which
+variant does this student have?"). The registry parses both sources once into
+typed records and hash indexes:
+
+- `by_github`: lower-cased GitHub username -> Student
+- `by_directory`: directory name (e.g. `IvanovIvan`) -> Student
+- `by_name_latin`: NameLatin -> Student
+- `by_variant`: variant number -> [Student, ...]
+
+Normalization is the same for every caller: cells are stripped, a UTF-8 BOM
+and blank lines are ignored, and the first row wins when a key repeats.
+
+The parsed registry is pickled to `.cache/students_registry.pickle` under a
+key made of the sources' content hashes, and memoized per process, so every
+workflow step after the first one starts without parsing.
+
+Usage (scripts outside `.github/scripts` add that directory to sys.path):
+    registry = load_registry()
+    student = registry.by_github.get(login.lower())
+"""
+from __future__ import annotations
+
+import csv
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+
+# Bump when Student/StudentsRegistry change, so old pickles are ignored.
+REGISTRY_VERSION = 1
+
+ROOT = Path(__file__).resolve().parents[2]
+STUDENTS_CSV = ROOT / 'students' / 'students.csv'
+CODEOWNERS = ROOT / '.github' / 'CODEOWNERS'
+CACHE_PATH = ROOT / '.cache' / 'students_registry.pickle'
+
+
+@dataclass(frozen=True, slots=True)
+class Student:
+    """One row of students.csv."""
+
+    variant: int | None
+    group: str
+    number: str
+    sub: str
+    name: str
+    name_latin: str
+    directory: str  # as written in the CSV, e.g. ./students/IvanovIvan
+    github: str
+    variant_label: str = ''  # the "Вариант" cell as written
+
+    @property
+    def dir_name(self) -> str:
+        """Last part of the directory (the student's folder name)."""
+        return PurePosixPath(self.directory.replace('\\', '/')).name
+
+    @property
+    def github_key(self) -> str:
+        return self.github.lower()
+
+
+@dataclass(slots=True)
+class StudentsRegistry:
+    header: list[str] = field(default_factory=list)
+    # Raw CSV rows after the header (cells as written), for table generation.
+    rows: list[list[str]] = field(default_factory=list)
+    students: list[Student] = field(default_factory=list)
+    codeowners: frozenset[str] = frozenset()
+    by_github: dict[str, Student] = field(default_factory=dict)
+    by_directory: dict[str, Student] = field(default_factory=dict)
+    by_name_latin: dict[str, Student] = field(default_factory=dict)
+    by_variant: dict[int, list[Student]] = field(default_factory=dict)
+    key: str = ''
+    version: int = REGISTRY_VERSION
+
+    def find(self, name: str) -> Student | None:
+        """Student by directory name, NameLatin or GitHub username."""
+        return self.by_directory.get(name) or self.by_name_latin.get(name) or self.by_github.get(name.lower())
+
+    def directory_map(self) -> dict[str, str]:
+        """Lower-cased GitHub username -> directory as written in the CSV.
+
+        A username listed twice maps to its last row, as in the scripts'
+        own CSV parsing this replaced (`by_github`/`find` keep the first).
+        """
+        return {student.github_key: student.directory for student in self.students if student.github}
+
+    def records(self) -> list[dict]:
+        """Rows as dicts keyed by the header (like csv.DictReader)."""
+        return [dict(zip(self.header, row + [''] * (len(self.header) - len(row)))) for row in self.rows]
+
+
+def _cell(row: dict, *names: str) -> str:
+    for name in names:
+        value = row.get(name)
+        if value:
+            return value.strip()
+    return ''
+
+
+def _student(row: dict) -> Student:
+    label = _cell(row, 'Вариант', 'Variant', 'Вариант ')
+    return Student(
+        variant=int(label) if label.isdigit() else None,
+        group=_cell(row, 'Group'),
+        number=_cell(row, '№'),
+        sub=_cell(row, 'sub'),
+        name=_cell(row, 'Name'),
+        name_latin=_cell(row, 'NameLatin'),
+        directory=_cell(row, 'Directory'),
+        github=_cell(row, 'Github Username'),
+        variant_label=label,
+    )
+
+
+def parse_codeowners(text: str) -> frozenset[str]:
+    """Lower-cased owner logins (without `@`) of all CODEOWNERS rules."""
+    owners = set()
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
+        owners.update(p.lstrip('@').lower() for p in line.split()[1:] if p.startswith('@'))
+    return frozenset(owners)
+
+
+def build_registry(csv_text: str, codeowners_text: str = '', key: str = '') -> StudentsRegistry:
+    registry = StudentsRegistry(codeowners=parse_codeowners(codeowners_text), key=key)
+    table = [row for row in csv.reader(io.StringIO(csv_text.lstrip('\ufeff'))) if any(cell.strip() for cell in row)]
+    if not table:
+        return registry
+    registry.header, registry.rows = table[0], table[1:]
+
+    for row in registry.records():
+        student = _student(row)
+        registry.students.append(student)
+        if student.github:
+            registry.by_github.setdefault(student.github_key, student)
+        if student.dir_name:
+            registry.by_directory.setdefault(student.dir_name, student)
+        if student.name_latin:
+            registry.by_name_latin.setdefault(student.name_latin, student)
+        if student.variant is not None:
+            registry.by_variant.setdefault(student.variant, []).append(student)
+    return registry
+
+
+def _read_bytes(path: Path) -> bytes:
+    try:
+        return path.read_bytes()
+    except OSError:
+        return b''
+
+
+_MEMO: dict[str, StudentsRegistry] = {}
+
+
+def load_registry(csv_path: Path | str | None = None, codeowners_path: Path | str | None = None,
+                  cache_path: Path | bool | None = True) -> StudentsRegistry:
+    """Registry of the sources (default: this repository's), reusing the memo or pickle when unchanged.
+
+    Missing files give an empty registry (or no code owners). With
+    `cache_path=True` only this repository's own sources are pickled (to
+    CACHE_PATH), so registries of other files never land in its cache; a path
+    pickles there, and False/None disables the pickle.
+    """
+    csv_path = Path(csv_path or STUDENTS_CSV).resolve()
+    codeowners_path = Path(codeowners_path or CODEOWNERS).resolve()
+    if cache_path is True:
+        cache_path = CACHE_PATH if (csv_path, codeowners_path) == (STUDENTS_CSV, CODEOWNERS) else None
+    elif not cache_path:
+        cache_path = None
+    csv_bytes = _read_bytes(csv_path)
+    codeowners_bytes = _read_bytes(codeowners_path)
+    digest = hashlib.sha256()
+    for data in (str(REGISTRY_VERSION).encode('ascii'), csv_bytes, codeowners_bytes):
+        digest.update(hashlib.sha256(data).digest())
+    key = digest.hexdigest()
+
+    registry = _MEMO.get(key)
+    if registry is not None:
+        return registry
+
+    if cache_path is not None:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+            if isinstance(cached, StudentsRegistry) and cached.key == key:
+                registry = cached
+        except Exception:
+            registry = None
+
+    if registry is None:
+        registry = build_registry(csv_bytes.decode('utf-8', errors='replace'),
+                                  codeowners_bytes.decode('utf-8', errors='replace'), key)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(registry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_name, cache_path)
+            except OSError:
+                pass
+
+    _MEMO[key] = registry
+    return registry
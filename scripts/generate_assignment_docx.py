@@ -11,6 +11,11 @@ Design notes
   It contains fixed labels (e.g. "1. Тема проекта") and empty table cells.
 - Editing WordprocessingML reliably requires a docx library.
   We use `python-docx` to edit table cells while preserving formatting.
+- The template is parsed once (per worker process): labels are resolved to
+  target cells up front, each student gets a deep copy of the XML tree, and
+  only `word/document.xml` is serialized and compressed per student. Entries carry a fixed
+  timestamp and unchanged files are not rewritten, so reruns are idempotent.
+  `--jobs N` spreads the cohort across N processes.
 
 Assumptions (can be adjusted)
 - We fill these fields if found in the template:
@@ -24,26 +29,21 @@ If your template uses different wording, run with --dry-run to see what cells we
 from __future__ import annotations
 
 import argparse
-import csv
+import copy
 import dataclasses
 import datetime as dt
+import io
 import os
 import re
 import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / ".github" / "scripts"))
 
-@dataclasses.dataclass(frozen=True)
-class Student:
-    variant: Optional[int]
-    group: str
-    number: str
-    sub: str
-    name: str
-    name_latin: str
-    directory: str
-    github: str
+from students_registry import Student, load_registry  # noqa: E402
 
 
 @dataclasses.dataclass(frozen=True)
@@ -54,24 +54,7 @@ class Variant:
 
 
 def _read_students(csv_path: Path) -> List[Student]:
-    with csv_path.open("r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
-        students: List[Student] = []
-        for row in reader:
-            v = (row.get("Вариант") or "").strip()
-            variant_num = int(v) if v.isdigit() else None
-            students.append(
-                Student(
-                    variant=variant_num,
-                    group=(row.get("Group") or "").strip(),
-                    number=(row.get("№") or "").strip(),
-                    sub=(row.get("sub") or "").strip(),
-                    name=(row.get("Name") or "").strip(),
-                    name_latin=(row.get("NameLatin") or "").strip(),
-                    directory=(row.get("Directory") or "").strip(),
-                    github=(row.get("Github Username") or "").strip(),
-                )
-            )
+    students = load_registry(csv_path).students
     # The file contains duplicates (likely repeated blocks). Keep first unique by (group, number, name).
     seen = set()
     uniq: List[Student] = []
@@ -120,9 +103,11 @@ def _ensure_python_docx():
         )
 
 
-def _set_cell_text(cell, text: str) -> None:
-    # python-docx: setting cell.text clears runs; acceptable for our use.
-    cell.text = text
+# Labels looked up in the template; the cell to the right of each one is filled.
+LABELS = ("Тема проекта", "Постановка задачи", "Дата выдачи", "ФИО", "груп")
+
+# Fixed ZIP entry timestamp, so regenerating the same assignment gives the same bytes.
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
 
 
 def _find_cells_containing(doc, needle: str) -> List[Tuple[int, int, int]]:
@@ -137,60 +122,143 @@ def _find_cells_containing(doc, needle: str) -> List[Tuple[int, int, int]]:
     return hits
 
 
-def _fill_doc_template(template_path: Path, out_path: Path, student: Student, variant: Variant, issued_date: Optional[str], dry_run: bool) -> None:
-    _ensure_python_docx()
-    from docx import Document  # type: ignore
-
-    doc = Document(str(template_path))
-
-    # Strategy:
-    # 1) Fill project topic: the cell that contains "1. Тема проекта" -> fill the next cell to the right if exists.
-    # 2) Fill task statement: the cell that contains "1.Постановка задачи" -> fill the next cell to the right if exists.
-    # 3) Fill issue date: the cell containing "Дата выдачи" -> fill the next cell to the right.
-
-    actions = []
-
-    def fill_next_to_label(label_substr: str, value: str) -> None:
-        hits = _find_cells_containing(doc, label_substr)
-        if not hits:
-            actions.append(f"label-not-found: {label_substr}")
-            return
-        # Use first occurrence
-        ti, ri, ci = hits[0]
-        tbl = doc.tables[ti]
-        row = tbl.rows[ri]
-        if ci + 1 >= len(row.cells):
-            actions.append(f"no-right-cell: {label_substr}")
-            return
-        target = row.cells[ci + 1]
-        if dry_run:
-            actions.append(f"would-fill [{label_substr}] -> (table {ti} row {ri} col {ci+1})")
-        else:
-            _set_cell_text(target, value)
-            actions.append(f"filled [{label_substr}] -> (table {ti} row {ri} col {ci+1})")
+def _element_path(root, element) -> Tuple[int, ...]:
+    """Child indexes leading from root to element (valid in any deep copy of root)."""
+    path = []
+    while element is not root:
+        parent = element.getparent()
+        path.append(parent.index(element))
+        element = parent
+    return tuple(reversed(path))
 
-    topic = f"{variant.title_line}"
-    fill_next_to_label("Тема проекта", topic)
 
-    # Full task text: keep markdown-ish bulleting; Word will keep it as plain text.
-    task_text = variant.body_markdown
-    fill_next_to_label("Постановка задачи", task_text)
+def _resolve(root, path: Tuple[int, ...]):
+    for i in path:
+        root = root[i]
+    return root
+
 
+def _field_values(student: Student, variant: Variant, issued_date: Optional[str]) -> List[Tuple[str, str]]:
+    """(label, value) pairs to fill, in order."""
+    # Full task text: keep markdown-ish bulleting; Word will keep it as plain text.
+    values = [("Тема проекта", variant.title_line), ("Постановка задачи", variant.body_markdown)]
     if issued_date:
-        fill_next_to_label("Дата выдачи", issued_date)
+        values.append(("Дата выдачи", issued_date))
+    # Student name / group are filled only if the template contains such cues.
+    values += [("ФИО", student.name), ("груп", student.group)]
+    return values
+
+
+class AssignmentTemplate:
+    """The template parsed once: its other ZIP parts, the document XML tree and a label -> target cell map.
+
+    Every assignment is a deep copy of the parsed tree with the target cells
+    filled, appended to the template's other parts (content unchanged).
+    """
+
+    def __init__(self, template_path: Path):
+        _ensure_python_docx()
+        from docx import Document  # type: ignore
+
+        doc = Document(str(template_path))
+        self.root = doc.element
+        self.document_name = doc.part.partname.lstrip("/")
+        # All other parts are compressed once; each assignment appends only its document part.
+        base = io.BytesIO()
+        with zipfile.ZipFile(template_path) as src, zipfile.ZipFile(base, "w", zipfile.ZIP_DEFLATED) as dst:
+            for info in src.infolist():
+                if info.filename != self.document_name:
+                    dst.writestr(zipfile.ZipInfo(info.filename, date_time=ZIP_DATE_TIME), src.read(info),
+                                 zipfile.ZIP_DEFLATED)
+        self.base_zip = base.getvalue()
+
+        # label -> (path of the cell to fill or None, action text)
+        self.targets: dict[str, Tuple[Optional[Tuple[int, ...]], str]] = {}
+        for label in LABELS:
+            hits = _find_cells_containing(doc, label)
+            if not hits:
+                self.targets[label] = (None, f"label-not-found: {label}")
+                continue
+            # Use first occurrence
+            ti, ri, ci = hits[0]
+            cells = doc.tables[ti].rows[ri].cells
+            if ci + 1 >= len(cells):
+                self.targets[label] = (None, f"no-right-cell: {label}")
+                continue
+            self.targets[label] = (_element_path(self.root, cells[ci + 1]._tc), f"(table {ti} row {ri} col {ci+1})")
+
+    def render(self, values: List[Tuple[str, str]], dry_run: bool = False) -> Tuple[Optional[bytes], List[str]]:
+        """(.docx bytes or None for a dry run, actions) for the given (label, value) pairs."""
+        from docx.opc.oxml import serialize_part_xml  # type: ignore
+        from docx.table import _Cell  # type: ignore
+
+        root = None if dry_run else copy.deepcopy(self.root)
+        actions = []
+        for label, value in values:
+            path, where = self.targets[label]
+            if path is None:
+                actions.append(where)
+            elif dry_run:
+                actions.append(f"would-fill [{label}] -> {where}")
+            else:
+                # python-docx: setting cell.text clears runs; acceptable for our use.
+                _Cell(_resolve(root, path), None).text = value
+                actions.append(f"filled [{label}] -> {where}")
+        if dry_run:
+            return None, actions
+
+        buf = io.BytesIO(self.base_zip)
+        with zipfile.ZipFile(buf, "a", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr(zipfile.ZipInfo(self.document_name, date_time=ZIP_DATE_TIME), serialize_part_xml(root),
+                        zipfile.ZIP_DEFLATED)
+        return buf.getvalue(), actions
+
+
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    """Write data atomically unless the file already holds it; True if written."""
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
 
-    # Try to fill student name / group if template contains such cues.
-    # We look for cells containing these words and fill right neighbor.
-    fill_next_to_label("ФИО", student.name)
-    fill_next_to_label("груп", student.group)
 
-    if dry_run:
-        # Don't write output, just report
-        print(f"[dry-run] {student.name} ({student.group}) variant {variant.number:02d}: {', '.join(actions)}")
-        return
+_TEMPLATE: Optional[AssignmentTemplate] = None
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    doc.save(str(out_path))
+
+def _init_worker(template_path: Path) -> None:
+    global _TEMPLATE
+    _TEMPLATE = AssignmentTemplate(template_path)
+
+
+def _render_job(job: Tuple[Path, Student, Variant, Optional[str], bool]) -> Tuple[Path, List[str], bool]:
+    """Fill the worker's template for one student: (out_path, actions, written)."""
+    out_path, student, variant, issued_date, dry_run = job
+    data, actions = _TEMPLATE.render(_field_values(student, variant, issued_date), dry_run)
+    return out_path, actions, data is not None and _write_if_changed(out_path, data)
+
+
+def generate_assignments(
+    template_path: Path,
+    jobs: List[Tuple[Path, Student, Variant, Optional[str], bool]],
+    workers: int = 1,
+) -> List[Tuple[Path, List[str], bool]]:
+    """Render all jobs `(out_path, student, variant, issued_date, dry_run)`, in order.
+
+    The template is parsed once per process; with `workers > 1` the jobs fan
+    out across a process pool.
+    """
+    workers = max(1, min(workers, len(jobs)))
+    if workers == 1:
+        _init_worker(template_path)
+        return [_render_job(job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(template_path,)) as pool:
+        return list(pool.map(_render_job, jobs, chunksize=max(1, len(jobs) // (workers * 4))))
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -213,6 +281,12 @@ def main(argv: Optional[List[str]] = None) -> int:
         help="Generate docs only for one student (substring match against NameLatin or Name)",
     )
     ap.add_argument("--dry-run", action="store_true")
+    ap.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for generation (default: CPU count)",
+    )
     args = ap.parse_args(argv)
 
     # Workspace layout here is not a single monorepo; we assume:
@@ -254,6 +328,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             if needle in (s.name_latin or "").lower() or needle in (s.name or "").lower()
         ]
 
+    jobs = []
     for s in students:
         if not s.variant:
             continue
@@ -264,15 +339,16 @@ def main(argv: Optional[List[str]] = None) -> int:
 
         safe_name = re.sub(r"[^A-Za-zА-Яа-я0-9._-]+", "_", s.name_latin or s.name)
         out_path = out_dir / f"{s.group}_{s.number}_{safe_name}_variant_{s.variant:02d}.docx"
+        jobs.append((out_path, s, v, args.issued_date, args.dry_run))
 
-        _fill_doc_template(
-            template_path=template_path,
-            out_path=out_path,
-            student=s,
-            variant=v,
-            issued_date=args.issued_date,
-            dry_run=args.dry_run,
-        )
+    results = generate_assignments(template_path, jobs, workers=args.jobs)
+
+    if args.dry_run:
+        for (_, s, v, _, _), (_, actions, _) in zip(jobs, results):
+            print(f"[dry-run] {s.name} ({s.group}) variant {v.number:02d}: {', '.join(actions)}")
+    else:
+        written = sum(1 for _, _, changed in results if changed)
+        print(f"Generated {len(results)} documents ({written} changed, {len(results) - written} unchanged).")
 
     if not args.dry_run:
         print(f"Done. Output folder: {out_dir}")
@@ -3,26 +3,156 @@
 Generate Markdown table from students/students.csv and insert into README.md
 between markers <!-- STUDENTS_TABLE_START --> and <!-- STUDENTS_TABLE_END -->.
 
-Usage: python scripts/generate_students_table.py
+Usage: python scripts/generate_students_table.py [--full]
+
+Runs are incremental: a manifest in .cache/ remembers the hash of every CSV row
+with its rendered table line. Unchanged rows reuse their line without touching
+the student directory, README.md is only rewritten when the text changes, and
+when neither the CSV, README.md nor this script changed the run stops right
+away. `--full` re-renders every row (and recreates missing student READMEs).
 """
-import csv
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import tempfile
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / ".github" / "scripts"))
+
+from students_registry import load_registry  # noqa: E402
+
 ROOT = Path(__file__).resolve().parents[1]
 CSV_PATH = ROOT / "students" / "students.csv"
 README = ROOT / "README.md"
 STUDENTS_DIR = ROOT / "students"
+MANIFEST_PATH = ROOT / ".cache" / "students_table.json"
+
+# Bump when the manifest layout changes.
+MANIFEST_VERSION = 1
 
 START_MARKER = "<!-- STUDENTS_TABLE_START -->"
 END_MARKER = "<!-- STUDENTS_TABLE_END -->"
 
 def read_csv(path):
-    with path.open(newline='', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        rows = [r for r in reader]
-    return rows
+    registry = load_registry(path)
+    return [registry.header] + registry.rows if registry.header else []
+
+def _sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def _read_bytes(path):
+    try:
+        return path.read_bytes()
+    except OSError:
+        return b''
+
+
+def generator_digest():
+    """Hash of this script, so cached lines are dropped when rendering changes."""
+    return _sha256(f"{MANIFEST_VERSION}:".encode() + Path(__file__).read_bytes())
+
 
-def make_md_table(rows):
+def row_key(header, row, generator):
+    return _sha256(json.dumps([generator, header, row], ensure_ascii=False).encode('utf-8'))
+
+
+def find_columns(header):
+    """Indexes of the Github Username, Directory and NameLatin columns (or None)."""
+    # find index of Github Username column (case-insensitive)
+    gh_idx = None
+    for idx, h in enumerate(header):
+        if h and h.strip().lower() in ('github username', 'github_username', 'github'):
+            gh_idx = idx
+            break
+    # find index of Directory and NameLatin columns
+    dir_idx = None
+    name_latin_idx = None
+    for idx, h in enumerate(header):
+        if h and h.strip().lower() in ('directory', 'dir'):
+            dir_idx = idx
+        if h and h.strip().lower() == 'namelatin':
+            name_latin_idx = idx
+    return gh_idx, dir_idx, name_latin_idx
+
+
+def esc(cell):
+    # sanitize pipes in cells
+    return cell.replace('|', '\\|') if cell is not None else ''
+
+
+def write_student_readme(name_latin):
+    """Create students/{name_latin}/README.md unless it already has the right content."""
+    readme_path = STUDENTS_DIR / name_latin / 'README.md'
+    content = f"[dir](./students/{name_latin})\n"
+    try:
+        if readme_path.read_text(encoding='utf-8') == content:
+            return
+    except (OSError, UnicodeDecodeError):
+        pass
+    try:
+        readme_path.parent.mkdir(parents=True, exist_ok=True)
+        readme_path.write_text(content, encoding='utf-8')
+    except Exception as e:
+        print(f"Warning: could not create directory or README for {name_latin}: {e}")
+
+
+def render_row(r, expected_cols, columns):
+    """Markdown line of one CSV row; creates the student's README as a side effect."""
+    gh_idx, dir_idx, name_latin_idx = columns
+    # normalize row length: pad with empty strings or truncate
+    if len(r) < expected_cols:
+        r = r + [''] * (expected_cols - len(r))
+    elif len(r) > expected_cols:
+        r = r[:expected_cols]
+    row = [esc(c) for c in r]
+    # render github username as link if present
+    if gh_idx is not None and gh_idx < len(row):
+        uname = row[gh_idx].strip()
+        if uname:
+            if '](' in uname and uname.count('](') >= 1:
+                uname_clean = uname
+            else:
+                uname_clean = uname.replace('[', '').replace(']', '').strip()
+                if uname_clean.startswith('http') or 'github.com/' in uname_clean:
+                    parts = uname_clean.split('github.com/')
+                    uname_clean = parts[-1].rstrip('/').strip()
+                if uname_clean.startswith('@'):
+                    uname_clean = uname_clean[1:]
+                m = re.match(r"^([A-Za-z0-9\-]+)", uname_clean)
+                if m:
+                    uname_clean = m.group(1)
+                uname_clean = f"[{uname_clean}](https://github.com/{uname_clean})"
+            row[gh_idx] = uname_clean
+    # ensure Directory column points to ./students/{NameLatin} and create per-student README
+    if name_latin_idx is not None and name_latin_idx < len(row):
+        name_latin = row[name_latin_idx].strip()
+    else:
+        name_latin = ''
+
+    if dir_idx is not None and dir_idx < len(row):
+        if name_latin:
+            rel_path = f"./students/{name_latin}"
+        else:
+            rel_path = row[dir_idx].strip() or ''
+        if name_latin:
+            write_student_readme(name_latin)
+        if rel_path:
+            row[dir_idx] = f"[dir]({rel_path})"
+
+    return '| ' + ' | '.join(row) + ' |'
+
+
+def make_md_table(rows, cached=None, rendered=None):
+    """Markdown table of the CSV rows.
+
+    `cached` maps row keys (see row_key) to lines of a previous run; those rows
+    are reused without rendering. Every line of this table is stored in
+    `rendered` under its key, if given.
+    """
     if not rows:
         return ""
     header = rows[0]
@@ -39,96 +169,80 @@ def make_md_table(rows):
             print(f"  line {lineno}: {cols} columns")
         if len(bad_rows) > 20:
             print(f"  ... and {len(bad_rows)-20} more")
-    # sanitize pipes in cells
-    def esc(cell):
-        return cell.replace('|', '\\|') if cell is not None else ''
     # header
     out = []
     out.append('| ' + ' | '.join(esc(c) for c in header) + ' |')
     out.append('| ' + ' | '.join('---' for _ in header) + ' |')
 
-    # find index of Github Username column (case-insensitive)
-    gh_idx = None
-    for idx, h in enumerate(header):
-        if h and h.strip().lower() in ('github username', 'github_username', 'github'):
-            gh_idx = idx
-            break
-    # find index of Directory and NameLatin columns
-    dir_idx = None
-    name_latin_idx = None
-    for idx, h in enumerate(header):
-        if h and h.strip().lower() in ('directory', 'dir'):
-            dir_idx = idx
-        if h and h.strip().lower() == 'namelatin':
-            name_latin_idx = idx
-
+    columns = find_columns(header)
+    generator = generator_digest()
+    cached = cached or {}
     for r in body:
-        # normalize row length: pad with empty strings or truncate
-        if len(r) < expected_cols:
-            r = r + [''] * (expected_cols - len(r))
-        elif len(r) > expected_cols:
-            r = r[:expected_cols]
-        row = [esc(c) for c in r]
-        # render github username as link if present
-        if gh_idx is not None and gh_idx < len(row):
-            uname = row[gh_idx].strip()
-            if uname:
-                if '](' in uname and uname.count('](') >= 1:
-                    uname_clean = uname
-                else:
-                    uname_clean = uname.replace('[', '').replace(']', '').strip()
-                    if uname_clean.startswith('http') or 'github.com/' in uname_clean:
-                        parts = uname_clean.split('github.com/')
-                        uname_clean = parts[-1].rstrip('/').strip()
-                    if uname_clean.startswith('@'):
-                        uname_clean = uname_clean[1:]
-                    import re
-                    m = re.match(r"^([A-Za-z0-9\-]+)", uname_clean)
-                    if m:
-                        uname_clean = m.group(1)
-                    uname_clean = f"[{uname_clean}](https://github.com/{uname_clean})"
-                row[gh_idx] = uname_clean
-        # ensure Directory column points to ./students/{NameLatin} and create per-student README
-        if name_latin_idx is not None and name_latin_idx < len(row):
-            name_latin = row[name_latin_idx].strip()
-        else:
-            name_latin = ''
-
-        if dir_idx is not None and dir_idx < len(row):
-            if name_latin:
-                rel_path = f"./students/{name_latin}"
-            else:
-                rel_path = row[dir_idx].strip() or ''
-            if name_latin:
-                student_dir = STUDENTS_DIR / name_latin
-                try:
-                    student_dir.mkdir(parents=True, exist_ok=True)
-                    readme_path = student_dir / 'README.md'
-                    readme_path.write_text(f"[dir](./students/{name_latin})\n", encoding='utf-8')
-                except Exception as e:
-                    print(f"Warning: could not create directory or README for {name_latin}: {e}")
-            if rel_path:
-                row[dir_idx] = f"[dir]({rel_path})"
-
-        out.append('| ' + ' | '.join(row) + ' |')
+        key = row_key(header, r, generator)
+        line = cached.get(key)
+        if line is None:
+            line = render_row(r, expected_cols, columns)
+        if rendered is not None:
+            rendered[key] = line
+        out.append(line)
     return '\n'.join(out)
 
 
-def main():
-    rows = read_csv(CSV_PATH)
-    table_md = make_md_table(rows)
-
-    readme_text = README.read_text(encoding='utf-8')
-
+def insert_table(readme_text, table_md):
     if START_MARKER in readme_text and END_MARKER in readme_text:
         before, rest = readme_text.split(START_MARKER, 1)
         _, after = rest.split(END_MARKER, 1)
-        new_content = before + START_MARKER + '\n\n' + table_md + '\n\n' + END_MARKER + after
+        return before + START_MARKER + '\n\n' + table_md + '\n\n' + END_MARKER + after
+    return readme_text + '\n\n' + START_MARKER + '\n\n' + table_md + '\n\n' + END_MARKER + '\n'
+
+
+def load_manifest(path):
+    try:
+        manifest = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) and manifest.get('version') == MANIFEST_VERSION else {}
+
+
+def save_manifest(path, manifest):
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_name, path)
+    except OSError as e:
+        print(f"Warning: could not write manifest {path}: {e}")
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    ap.add_argument('--full', action='store_true', help='Re-render every row, ignoring the manifest')
+    args = ap.parse_args(argv)
+
+    csv_bytes = _read_bytes(CSV_PATH)
+    readme_bytes = README.read_bytes()
+    sources = {'csv': _sha256(csv_bytes), 'readme': _sha256(readme_bytes), 'generator': generator_digest()}
+    manifest = {} if args.full else load_manifest(MANIFEST_PATH)
+    if manifest.get('sources') == sources:
+        print(f"{README} is up to date with {CSV_PATH}")
+        return
+
+    rows = read_csv(CSV_PATH)
+    rendered = {}
+    table_md = make_md_table(rows, cached=manifest.get('rows'), rendered=rendered)
+
+    readme_text = readme_bytes.decode('utf-8')
+    new_content = insert_table(readme_text, table_md)
+    reused = len(set(rendered) & set(manifest.get('rows') or {}))
+    if new_content != readme_text:
+        README.write_text(new_content, encoding='utf-8')
+        print(f"Updated {README} with table from {CSV_PATH} ({len(rendered) - reused} rows rendered, {reused} reused)")
     else:
-        new_content = readme_text + '\n\n' + START_MARKER + '\n\n' + table_md + '\n\n' + END_MARKER + '\n'
+        print(f"{README} already has the table from {CSV_PATH} ({len(rendered) - reused} rows rendered, {reused} reused)")
 
-    README.write_text(new_content, encoding='utf-8')
-    print(f"Updated {README} with table from {CSV_PATH}")
+    sources['readme'] = _sha256(README.read_bytes())
+    save_manifest(MANIFEST_PATH, {'version': MANIFEST_VERSION, 'sources': sources, 'rows': rendered})
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,398 @@
+"""Throughput benchmark of check_it_docx on a synthetic corpus.
+
+Generates explanatory notes of several sizes (see `tests/helpers/docx_corpus.py`),
+measures for each of them:
+- parse time: one streaming pass over `word/document.xml` without checks;
+- check time: `run_checks` with every rule (best of N runs);
+- per-rule time: one run with `CheckProfiler`;
+- memory: peak RSS growth of a fresh process checking the document,
+
+and compares the results with the last run recorded in
+`benchmark_baseline.json`. Times are scaled by a calibration loop (lxml
+parsing of a fixed XML), so a baseline recorded on another machine is still
+meaningful; differences within the tolerance are ignored, and a run that
+looks slower is measured again before a regression is reported.
+
+Usage:
+    python scripts/standards_verification/benchmark_check_it_docx.py
+    python scripts/standards_verification/benchmark_check_it_docx.py --pages 10 100 500 --update-baseline
+
+Exit codes:
+- 0: no regressions (or baseline updated, or the baseline is for another
+  checker version and was not compared)
+- 1: a checker regression beyond the tolerance
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+
+from lxml import etree
+
+# Importing check_it_docx puts the repository root on sys.path (for tests.helpers).
+from check_it_docx import CHECKER_VERSION, DEFAULT_PROFILE, available_profiles, load_profile, run_checks
+
+from tests.helpers.check_profiler import STREAM_RULE, CheckProfiler, peak_rss_kb
+from tests.helpers.docx_corpus import GENERATOR_VERSION, CorpusSpec, ensure_corpus
+from tests.helpers.ooxml_stream import stream_document
+from tests.helpers.report import NormocontrolReport
+
+
+DEFAULT_PAGES = (10, 100, 500)
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_RETRIES = 2
+BASELINE_PATH = Path(__file__).with_name("benchmark_baseline.json")
+CORPUS_DIR = Path(tempfile.gettempdir()) / "normocontrol_benchmark_corpus"
+
+# Differences below these are noise, whatever the tolerance says: repeated
+# best-of-5 runs of unchanged code on a shared runner differ by up to ~10 ms.
+_MIN_TIME_DIFF_S = 0.02
+_MIN_RSS_DIFF_KB = 8 * 1024
+
+# Calibration document: paragraphs with a few runs, close to what the checker streams.
+_CALIBRATION_PARAGRAPHS = 20000
+
+
+def _best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Return the fastest wall time of `repeat` calls."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Time a fixed lxml workload; the ratio between machines scales baselines."""
+
+    w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    paragraph = f'<w:p><w:pPr><w:ind w:firstLine="709"/></w:pPr>{"<w:r><w:t>текст абзаца</w:t></w:r>" * 3}</w:p>'
+    xml = f'<w:document xmlns:w="{w}"><w:body>{paragraph * _CALIBRATION_PARAGRAPHS}</w:body></w:document>'.encode()
+
+    def workload() -> None:
+        root = etree.fromstring(xml)
+        for element in root.iter(f"{{{w}}}t"):
+            element.text.upper()
+
+    return _best_of(repeat, workload)
+
+
+def _process_peak_rss_kb() -> int | None:
+    """Peak RSS of this process image in KiB.
+
+    ru_maxrss survives exec, so a spawned child would report the parent's peak;
+    Linux resets VmHWM on exec, use it when available.
+    """
+
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return peak_rss_kb()
+
+
+def _rss_growth_of_check(docx_path: Path, checklist: str) -> int | None:
+    """Peak RSS growth (KiB) of checking one document; runs in a fresh process."""
+
+    config = load_profile(checklist)
+    before = _process_peak_rss_kb()
+    run_checks(docx_path, NormocontrolReport(), config)
+    after = _process_peak_rss_kb()
+    return None if before is None or after is None else after - before
+
+
+def benchmark_document(
+    docx_path: Path,
+    spec: CorpusSpec,
+    checklist: str = DEFAULT_PROFILE,
+    repeat: int = DEFAULT_REPEAT,
+    measure_memory: bool = True,
+) -> dict:
+    """Measure parse, check, per-rule time and memory of one corpus document.
+
+    Args:
+        docx_path: Generated document.
+        spec: Spec the document was generated from.
+        checklist: Checklist profile name.
+        repeat: Runs per measurement (the fastest one is kept).
+        measure_memory: Check the document in a fresh process to get its peak RSS.
+
+    Returns:
+        JSON-serializable result (times in seconds, memory in KiB).
+    """
+
+    config = load_profile(checklist)
+    parse_s = _best_of(repeat, lambda: stream_document(docx_path, []))
+    check_s = _best_of(repeat, lambda: run_checks(docx_path, NormocontrolReport(), config))
+
+    profiler = CheckProfiler()
+    run_checks(docx_path, NormocontrolReport(), config, profiler=profiler)
+    rules = {timing.rule: timing.wall_s for timing in profiler.timings}
+    nodes = max((timing.nodes for timing in profiler.timings if timing.rule == STREAM_RULE), default=0)
+
+    rss_growth_kb = None
+    if measure_memory:
+        # A spawned process starts from a clean heap, so its RSS high-water mark
+        # belongs to this document only.
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            rss_growth_kb = pool.submit(_rss_growth_of_check, docx_path, checklist).result()
+
+    return {
+        "pages": spec.pages,
+        "document": docx_path.name,
+        "size_bytes": docx_path.stat().st_size,
+        "nodes": nodes,
+        "parse_s": parse_s,
+        "check_s": check_s,
+        "pages_per_s": spec.pages / check_s if check_s else None,
+        "rules": rules,
+        "rss_growth_kb": rss_growth_kb,
+    }
+
+
+def run_benchmark(
+    corpus_dir: Path,
+    pages: tuple[int, ...] = DEFAULT_PAGES,
+    checklist: str = DEFAULT_PROFILE,
+    repeat: int = DEFAULT_REPEAT,
+    measure_memory: bool = True,
+) -> dict:
+    """Benchmark the checker on a corpus of the given sizes (generated if missing).
+
+    Returns:
+        Run record: environment, calibration time and results keyed by page count.
+    """
+
+    specs = [CorpusSpec(count) for count in pages]
+    paths = ensure_corpus(corpus_dir, specs)
+    # Load drifts during a run: calibrate between documents and keep the
+    # fastest sample, like the check times themselves.
+    calibration = [calibrate()]
+    documents = {}
+    for spec, path in zip(specs, paths):
+        documents[str(spec.pages)] = benchmark_document(path, spec, checklist, repeat, measure_memory)
+        calibration.append(calibrate())
+    return {
+        "date": datetime.now().isoformat(timespec="seconds"),
+        "checker_version": CHECKER_VERSION,
+        "generator_version": GENERATOR_VERSION,
+        "checklist": checklist,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "calibration_s": min(calibration),
+        "documents": documents,
+    }
+
+
+def remeasure_checks(run: dict, corpus_dir: Path, repeat: int = DEFAULT_REPEAT) -> None:
+    """Time the run's checks and calibration again, keeping the fastest values.
+
+    Documents are read from `corpus_dir`; per-rule times and memory are kept
+    as measured.
+    """
+
+    config = load_profile(run["checklist"])
+    calibration = [run["calibration_s"], calibrate()]
+    for result in run["documents"].values():
+        docx_path = corpus_dir / result["document"]
+        check_s = _best_of(repeat, lambda: run_checks(docx_path, NormocontrolReport(), config))
+        calibration.append(calibrate())
+        if check_s < result["check_s"]:
+            result["check_s"] = check_s
+            result["pages_per_s"] = result["pages"] / check_s
+    run["calibration_s"] = min(calibration)
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> list[dict]:
+    """Return recorded runs, oldest first (empty if there is no baseline yet)."""
+
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("runs", [])
+
+
+def append_baseline(run: dict, path: Path = BASELINE_PATH) -> None:
+    """Record a run as the new baseline, keeping the previous ones as history."""
+
+    runs = load_baseline(path) + [run]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"runs": runs}, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+
+
+def _rule_changes(result: dict, baseline: dict, scale: float, limit: int = 3) -> str:
+    """Rules whose time grew the most (for regression messages)."""
+
+    growth = []
+    for rule, seconds in result.get("rules", {}).items():
+        before = baseline.get("rules", {}).get(rule)
+        if before is not None:
+            growth.append((seconds - before * scale, rule, before * scale, seconds))
+    growth.sort(reverse=True)
+    return ", ".join(
+        f"{rule} {before * 1000:.1f} → {after * 1000:.1f} мс" for diff, rule, before, after in growth[:limit] if diff > 0
+    )
+
+
+def baseline_mismatch(run: dict, baseline: dict) -> str | None:
+    """Why a run is not comparable with a baseline (None if it is).
+
+    A baseline recorded by another checker version, corpus generator or
+    checklist measured different work, so its times are not a reference.
+    """
+
+    for key in ("checker_version", "generator_version", "checklist"):
+        if run.get(key) != baseline.get(key):
+            return f"{key} {baseline.get(key)!r} in the baseline, {run.get(key)!r} now"
+    return None
+
+
+def find_regressions(run: dict, baseline: dict, tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """Compare a run with a baseline run.
+
+    Check times are compared after scaling the baseline by the calibration
+    ratio; memory is compared as is. Parse time is reported but not gated:
+    it is part of the check time, and on small documents it is a few tens of
+    milliseconds, where scheduler noise alone exceeds the tolerance. Only
+    sizes present in both runs are compared.
+
+    Returns:
+        Human-readable regressions (empty if none).
+    """
+
+    scale = run["calibration_s"] / baseline["calibration_s"] if baseline.get("calibration_s") else 1.0
+    regressions = []
+    for pages, result in run["documents"].items():
+        before = baseline["documents"].get(pages)
+        if before is None:
+            continue
+        expected = before["check_s"] * scale
+        actual = result["check_s"]
+        if actual > expected * (1 + tolerance) and actual - expected > _MIN_TIME_DIFF_S:
+            message = f"{pages} стр.: проверка {actual * 1000:.1f} мс вместо {expected * 1000:.1f} мс " \
+                      f"(×{actual / expected:.2f})"
+            changes = _rule_changes(result, before, scale)
+            regressions.append(f"{message}; {changes}" if changes else message)
+
+        rss, rss_before = result.get("rss_growth_kb"), before.get("rss_growth_kb")
+        if rss is not None and rss_before is not None:
+            if rss > rss_before * (1 + tolerance) and rss - rss_before > _MIN_RSS_DIFF_KB:
+                regressions.append(
+                    f"{pages} стр.: память +{rss / 1024:.1f} МБ вместо +{rss_before / 1024:.1f} МБ"
+                )
+    return regressions
+
+
+def confirmed_regressions(
+    run: dict,
+    baseline: dict,
+    corpus_dir: Path,
+    tolerance: float = DEFAULT_TOLERANCE,
+    repeat: int = DEFAULT_REPEAT,
+    retries: int = DEFAULT_RETRIES,
+) -> list[str]:
+    """Regressions that persist when the run is measured again.
+
+    Wall time on a shared machine drifts by tens of percent for seconds at a
+    time. A run that looks slower is re-measured up to `retries` times (see
+    `remeasure_checks`), and a slowdown is reported only if the best times
+    are still beyond the tolerance.
+    """
+
+    regressions = find_regressions(run, baseline, tolerance)
+    for _ in range(retries):
+        if not regressions:
+            break
+        remeasure_checks(run, corpus_dir, repeat)
+        regressions = find_regressions(run, baseline, tolerance)
+    return regressions
+
+
+def format_run(run: dict) -> str:
+    """Markdown table of a run's results."""
+
+    lines = [
+        "| Страниц | Размер, КБ | Разбор, мс | Проверка, мс | Стр./с | Самое медленное правило | Память, МБ |",
+        "| ---: | ---: | ---: | ---: | ---: | --- | ---: |",
+    ]
+    for pages, result in run["documents"].items():
+        rules = {rule: s for rule, s in result["rules"].items() if rule != STREAM_RULE}
+        slowest = max(rules, key=rules.get) if rules else "—"
+        rss = result.get("rss_growth_kb")
+        lines.append(
+            f"| {pages} | {result['size_bytes'] / 1024:.0f} | {result['parse_s'] * 1000:.1f} | "
+            f"{result['check_s'] * 1000:.1f} | {result['pages_per_s']:.0f} | "
+            f"{slowest} ({rules.get(slowest, 0) * 1000:.1f} мс) | "
+            f"{'—' if rss is None else f'{rss / 1024:.1f}'} |"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entrypoint."""
+
+    parser = argparse.ArgumentParser(description="Benchmark check_it_docx on a synthetic corpus")
+    parser.add_argument("--pages", type=int, nargs="+", default=list(DEFAULT_PAGES), help="Document sizes in pages")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs per measurement (best is kept)")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed slowdown/memory growth relative to the baseline (0.25 = 25%%)",
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline history (JSON)")
+    parser.add_argument(
+        "--corpus-dir",
+        type=Path,
+        default=CORPUS_DIR,
+        help=f"Where generated documents are kept between runs (default: {CORPUS_DIR})",
+    )
+    parser.add_argument("--checklist", default=DEFAULT_PROFILE, choices=available_profiles(), help="Checklist profile")
+    parser.add_argument("--update-baseline", action="store_true", help="Record this run as the new baseline")
+    args = parser.parse_args(argv)
+
+    run = run_benchmark(args.corpus_dir, tuple(args.pages), args.checklist, args.repeat)
+    print(format_run(run))
+
+    if args.update_baseline:
+        append_baseline(run, args.baseline)
+        print(f"✓ Baseline: {args.baseline}")
+        return 0
+
+    history = load_baseline(args.baseline)
+    if not history:
+        print(f"No baseline yet: run with --update-baseline to record one in {args.baseline}")
+        return 0
+
+    mismatch = baseline_mismatch(run, history[-1])
+    if mismatch:
+        print(f"⚠ Not comparing with the baseline of {history[-1]['date']}: {mismatch}")
+        print(f"  Record a new one with --update-baseline in {args.baseline}")
+        return 0
+
+    regressions = confirmed_regressions(run, history[-1], args.corpus_dir, args.tolerance, args.repeat)
+    for regression in regressions:
+        print(f"❌ {regression}")
+    if not regressions:
+        print(f"✓ No regressions against the baseline of {history[-1]['date']}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
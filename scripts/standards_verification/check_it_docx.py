@@ -1,9 +1,13 @@
 """CLI checker for IT normocontrol requirements (short checklist).
 
 This script is intended as a lightweight alternative to running pytest.
-It validates a single .docx file using the hybrid approach:
-- OOXML (ZIP + XML) for strict page setup and low-level formatting checks
-- python-docx for high-level structure checks
+It validates a single .docx file in one streaming pass over
+`word/document.xml` (see `tests/helpers/ooxml_stream.py`): every paragraph,
+run and section is fed to the registered check visitors (page setup,
+paragraph formatting, fonts, structure, references, captions, embedded
+images), so the document is parsed once and memory stays flat on large files.
+With `--incremental` only the rules whose inputs changed since the previous
+run of the same file are evaluated again (see `tests/helpers/incremental.py`).
 
 Default target: tests/ПЗ.docx
 
@@ -14,13 +18,82 @@ Exit codes:
 
 from __future__ import annotations
 
+import argparse
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+import posixpath
 import re
 import sys
+import zipfile
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
-from docx import Document
+
+def _resolve_repo_root() -> Path:
+    """Resolve repository root from script location."""
+
+    # scripts/standards_verification/check_it_docx.py -> repo root is 2 levels up
+    return Path(__file__).resolve().parents[2]
+
+
+def _ensure_tests_helpers_on_syspath(repo_root: Path) -> None:
+    """Ensure the repository root is on sys.path.
+
+    When executing this script directly, Python puts the script directory on
+    `sys.path[0]`, not the repository root. Adding repo root enables imports
+    like `tests.helpers.*`.
+    """
+
+    if str(repo_root) not in sys.path:
+        sys.path.insert(0, str(repo_root))
+
+
+_ensure_tests_helpers_on_syspath(_resolve_repo_root())
+
+from tests.helpers.check_profiler import CheckProfiler, rule_name  # noqa: E402
+from tests.helpers.document_text import DocumentText, TextMatcher  # noqa: E402
+from tests.helpers.incremental import (  # noqa: E402
+    BlockFingerprints,
+    DeferredEnd,
+    DocumentChanges,
+    DocumentState,
+    StateStore,
+    diff_issues,
+    facet_key,
+    part_facets,
+    part_fingerprints,
+    text_facet,
+)
+from tests.helpers.ooxml_media import DrawingIndex, ImagePlacement, MediaInfo, inspect_media  # noqa: E402
+from tests.helpers.ooxml_pagination import (  # noqa: E402
+    SectionReferences,
+    analyze_pagination,
+    get_relationship_targets,
+    get_section_references,
+)
+from tests.helpers.ooxml_stream import DocumentVisitor, stream_document  # noqa: E402
+from tests.helpers.ooxml_styles import StyleResolver, get_run_paragraph_style  # noqa: E402
+from tests.helpers.ooxml_utils import (  # noqa: E402
+    DocumentIndex,
+    cm_to_twips,
+    get_heading_style_levels,
+    get_run_text,
+    get_section_margins,
+    get_section_page_size,
+    get_styles_xml,
+    half_points_to_pt,
+    mm_to_twips,
+    pt_to_half_points,
+    twips_to_cm,
+    twips_to_mm,
+)
+from tests.helpers.paragraph_metrics import ParagraphMetrics  # noqa: E402
+from tests.helpers.result_cache import ResultCache, file_sha256, make_cache_key  # noqa: E402
 
 
 @dataclass(frozen=True)
@@ -46,9 +119,58 @@ class ItNormocontrolConfig:
     first_line_indent_cm: float
     line_spacing_expected: float
 
+    page_number_part: str  # "header" or "footer"
+    page_number_alignment: str  # "left" or "right"
+    title_page_number_hidden: bool
+
     required_sections_in_order: list[str]
 
 
+# Checklist patterns, compiled once at import.
+_NUMBER = r"(\d+(?:[\.,]\d+)?)"
+
+# Example: "Поля (мм): левое 23, правое 10, верхнее 20, нижнее 15."
+_MARGINS_RE = re.compile(
+    rf"Поля\s*\(мм\)\s*:\s*левое\s*{_NUMBER}\s*,\s*"
+    rf"правое\s*{_NUMBER}\s*,\s*"
+    rf"верхнее\s*{_NUMBER}\s*,\s*"
+    rf"нижнее\s*{_NUMBER}",
+    re.IGNORECASE,
+)
+
+# Example: "Шрифт: Times New Roman 14 pt; межстрочный интервал 1.0."
+_FONT_RE = re.compile(
+    rf"Шрифт\s*:\s*([A-Za-z ]+?)\s*{_NUMBER}\s*pt\s*;\s*"
+    rf"межстрочный\s+интервал\s*{_NUMBER}",
+    re.IGNORECASE,
+)
+
+# Example: "Внутри таблиц/подрисуночных подписей/на рисунках: 12 pt."
+_INLINE_OBJECTS_RE = re.compile(
+    rf"Внутри\s+таблиц/подрисуночных\s+подписей/на\s+рисунках\s*:\s*{_NUMBER}\s*pt",
+    re.IGNORECASE,
+)
+
+# Example: "Абзац: 12,5 мм."
+_INDENT_RE = re.compile(rf"Абзац\s*:\s*{_NUMBER}\s*мм", re.IGNORECASE)
+
+# Example: "Нумерация страниц: сквозная; номер страницы в правом верхнем углу."
+_PAGE_NUMBER_RE = re.compile(
+    r"номер\s+страницы\s+в\s+(правом|левом)\s+(верхнем|нижнем)\s+углу",
+    re.IGNORECASE,
+)
+
+# Example: "Титульный лист входит в нумерацию, но номер на нем не печатается."
+_TITLE_PAGE_NUMBER_HIDDEN_RE = re.compile(r"номер\s+на\s+н[её]м\s+не\s+печатается", re.IGNORECASE)
+
+# In the checklist the structure is provided as a numbered list.
+_STRUCTURE_BLOCK_RE = re.compile(
+    r"##\s*2\)\s*Структура\s+пояснительной\s+записки(.*?)(?:\n##\s*3\)|\Z)",
+    re.IGNORECASE | re.DOTALL,
+)
+_STRUCTURE_ITEM_RE = re.compile(r"\s*\d+\)\s*(.+?)\s*$")
+
+
 def _read_text_file(path: Path) -> str:
     """Read a UTF-8 text file."""
 
@@ -61,14 +183,11 @@ def _parse_float_ru(value: str) -> float:
     return float(value.strip().replace(",", "."))
 
 
-def load_it_normocontrol_config(standards_md_path: Path) -> ItNormocontrolConfig:
-    """Load IT normocontrol requirements from the markdown checklist.
-
-    The repository contains multiple standards; for the IT profile we treat
-    `standars_control_it_short.md` as the single source of truth.
+def parse_it_normocontrol_config(text: str) -> ItNormocontrolConfig:
+    """Parse IT normocontrol requirements from checklist markdown text.
 
     Args:
-        standards_md_path: Path to `standars_control_it_short.md`.
+        text: Contents of a checklist markdown file.
 
     Returns:
         Parsed configuration.
@@ -77,18 +196,8 @@ def load_it_normocontrol_config(standards_md_path: Path) -> ItNormocontrolConfig
         ValueError: If required values cannot be parsed.
     """
 
-    text = _read_text_file(standards_md_path)
-
     # 1) Margins
-    # Example: "Поля (мм): левое 23, правое 10, верхнее 20, нижнее 15."
-    margins_match = re.search(
-        r"Поля\s*\(мм\)\s*:\s*левое\s*(\d+(?:[\.,]\d+)?)\s*,\s*"
-        r"правое\s*(\d+(?:[\.,]\d+)?)\s*,\s*"
-        r"верхнее\s*(\d+(?:[\.,]\d+)?)\s*,\s*"
-        r"нижнее\s*(\d+(?:[\.,]\d+)?)",
-        text,
-        flags=re.IGNORECASE,
-    )
+    margins_match = _MARGINS_RE.search(text)
     if not margins_match:
         raise ValueError("Не удалось распарсить поля страницы из чек-листа")
 
@@ -98,13 +207,7 @@ def load_it_normocontrol_config(standards_md_path: Path) -> ItNormocontrolConfig
     margins_bottom_mm = _parse_float_ru(margins_match.group(4))
 
     # 2) Font and line spacing
-    # Example: "Шрифт: Times New Roman 14 pt; межстрочный интервал 1.0."
-    font_match = re.search(
-        r"Шрифт\s*:\s*([A-Za-z ]+?)\s*(\d+(?:[\.,]\d+)?)\s*pt\s*;\s*"
-        r"межстрочный\s+интервал\s*(\d+(?:[\.,]\d+)?)",
-        text,
-        flags=re.IGNORECASE,
-    )
+    font_match = _FONT_RE.search(text)
     if not font_match:
         raise ValueError("Не удалось распарсить шрифт/интервал из чек-листа")
 
@@ -113,42 +216,35 @@ def load_it_normocontrol_config(standards_md_path: Path) -> ItNormocontrolConfig
     line_spacing_expected = _parse_float_ru(font_match.group(3))
 
     # 3) Font size inside tables/captions/figures
-    # Example: "Внутри таблиц/подрисуночных подписей/на рисунках: 12 pt."
-    inline_objects_match = re.search(
-        r"Внутри\s+таблиц/подрисуночных\s+подписей/на\s+рисунках\s*:\s*"
-        r"(\d+(?:[\.,]\d+)?)\s*pt",
-        text,
-        flags=re.IGNORECASE,
-    )
+    inline_objects_match = _INLINE_OBJECTS_RE.search(text)
     if not inline_objects_match:
         raise ValueError("Не удалось распарсить кегль для таблиц/подписей/рисунков")
     inline_objects_font_size_pt = _parse_float_ru(inline_objects_match.group(1))
 
     # 4) Paragraph first-line indent
-    # Example: "Абзац: 12,5 мм."
-    indent_match = re.search(
-        r"Абзац\s*:\s*(\d+(?:[\.,]\d+)?)\s*мм",
-        text,
-        flags=re.IGNORECASE,
-    )
+    indent_match = _INDENT_RE.search(text)
     if not indent_match:
         raise ValueError("Не удалось распарсить абзацный отступ")
     first_line_indent_mm = _parse_float_ru(indent_match.group(1))
     first_line_indent_cm = first_line_indent_mm / 10.0
 
-    # 5) Required document structure order
-    # In the checklist it is provided as a numbered list.
-    structure_block = re.search(
-        r"##\s*2\)\s*Структура\s+пояснительной\s+записки(.*?)(?:\n##\s*3\)|\Z)",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    # 5) Page number position
+    page_number_match = _PAGE_NUMBER_RE.search(text)
+    if not page_number_match:
+        raise ValueError("Не удалось распарсить положение номера страницы")
+    page_number_alignment = "right" if page_number_match.group(1).lower() == "правом" else "left"
+    page_number_part = "header" if page_number_match.group(2).lower() == "верхнем" else "footer"
+
+    title_page_number_hidden = bool(_TITLE_PAGE_NUMBER_HIDDEN_RE.search(text))
+
+    # 6) Required document structure order
+    structure_block = _STRUCTURE_BLOCK_RE.search(text)
     if not structure_block:
         raise ValueError("Не удалось найти блок структуры документа")
 
     required_sections_in_order: list[str] = []
     for line in structure_block.group(1).splitlines():
-        item_match = re.match(r"\s*\d+\)\s*(.+?)\s*$", line)
+        item_match = _STRUCTURE_ITEM_RE.match(line)
         if item_match:
             required_sections_in_order.append(item_match.group(1).strip())
 
@@ -169,528 +265,1422 @@ def load_it_normocontrol_config(standards_md_path: Path) -> ItNormocontrolConfig
         inline_objects_font_size_pt=inline_objects_font_size_pt,
         first_line_indent_cm=first_line_indent_cm,
         line_spacing_expected=line_spacing_expected,
+        page_number_part=page_number_part,
+        page_number_alignment=page_number_alignment,
+        title_page_number_hidden=title_page_number_hidden,
         required_sections_in_order=required_sections_in_order,
     )
 
 
-def _ensure_tests_helpers_on_syspath(repo_root: Path) -> None:
-    """Ensure the repository root is on sys.path.
+def load_it_normocontrol_config(standards_md_path: Path) -> ItNormocontrolConfig:
+    """Load IT normocontrol requirements from the markdown checklist.
 
-    When executing this script directly, Python puts the script directory on
-    `sys.path[0]`, not the repository root. Adding repo root enables imports
-    like `tests.helpers.*`.
+    The repository contains multiple standards; for the IT profile we treat
+    `standars_control_it_short.md` as the single source of truth.
+
+    Args:
+        standards_md_path: Path to `standars_control_it_short.md`.
+
+    Returns:
+        Parsed configuration.
+
+    Raises:
+        ValueError: If required values cannot be parsed.
     """
 
-    if str(repo_root) not in sys.path:
-        sys.path.insert(0, str(repo_root))
+    return parse_it_normocontrol_config(_read_text_file(standards_md_path))
 
 
-def _resolve_repo_root() -> Path:
-    """Resolve repository root from script location."""
+# Checklist profiles ---------------------------------------------------------
+#
+# Every `standars_control_<name>.md` next to this script is a profile named
+# `<name>`. A parsed profile is serialized next to its markdown as
+# `.standars_control_<name>.compiled.json`, keyed by the source mtime/size and
+# SHA-256, so later runs (and every batch worker) skip the regex parsing.
 
-    # scripts/standards_verification/check_it_docx.py -> repo root is 2 levels up
-    return Path(__file__).resolve().parents[2]
+DEFAULT_PROFILE = "it_short"
+_PROFILE_PREFIX = "standars_control_"
 
+# Bump when ItNormocontrolConfig or the parser changes, to invalidate compiled profiles.
+_COMPILED_PROFILE_VERSION = 1
 
-def _extract_all_text(doc: Document) -> str:
-    """Extract joined plain text from a Word document."""
+# In-process memo: profile name -> (source mtime_ns, size, config).
+_LOADED_PROFILES: dict[str, tuple[int, int, ItNormocontrolConfig]] = {}
 
-    return "\n".join(p.text for p in doc.paragraphs)
 
+def _standards_dir() -> Path:
+    """Return the directory with checklist markdown files."""
 
-def _find_section_positions(text: str, section_titles: list[str]) -> dict[str, int]:
-    """Find first occurrence positions of section titles in text.
+    return _resolve_repo_root() / "scripts" / "standards_verification"
 
-    Returns:
-        A dict of title -> index in text (0-based). Missing titles are omitted.
+
+def available_profiles() -> list[str]:
+    """Return names of the checklist profiles found next to this script."""
+
+    paths = _standards_dir().glob(f"{_PROFILE_PREFIX}*.md")
+    return sorted(path.stem[len(_PROFILE_PREFIX):] for path in paths)
+
+
+def profile_path(name: str) -> Path:
+    """Return the checklist markdown of a profile.
+
+    Raises:
+        ValueError: If there is no such profile.
     """
 
-    lower_text = text.lower()
-    positions: dict[str, int] = {}
+    path = _standards_dir() / f"{_PROFILE_PREFIX}{name}.md"
+    if not path.is_file():
+        available = ", ".join(available_profiles())
+        raise ValueError(f"Неизвестный профиль чек-листа: {name} (доступны: {available})")
+    return path
 
-    for title in section_titles:
-        index = lower_text.find(title.lower())
-        if index != -1:
-            positions[title] = index
 
-    return positions
+def _compiled_profile_path(md_path: Path) -> Path:
+    """Return the path of the serialized profile for a checklist markdown."""
 
+    return md_path.with_name(f".{md_path.stem}.compiled.json")
 
-def _check_page_setup(doc_name: str, doc_xml, report, config: ItNormocontrolConfig) -> None:
-    """Check page size and margins using OOXML."""
 
-    from tests.helpers.ooxml_utils import (
-        get_page_margins,
-        get_page_size,
-        mm_to_twips,
-        twips_to_mm,
-    )
+def _read_compiled_profile(compiled_path: Path) -> dict | None:
+    """Read a serialized profile; None if missing, corrupt or outdated."""
 
-    margins = get_page_margins(doc_xml)
-    if not margins:
-        report.add_issue(
-            doc_name,
-            "page_setup",
-            "error",
-            "Поля страницы не найдены",
-            expected="Поля должны быть заданы",
-            actual="Поля отсутствуют",
-            location="Разметка страницы → Поля",
-        )
-    else:
-        expected = {
-            "left": config.margins_left_mm,
-            "right": config.margins_right_mm,
-            "top": config.margins_top_mm,
-            "bottom": config.margins_bottom_mm,
+    try:
+        data = json.loads(compiled_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != _COMPILED_PROFILE_VERSION:
+        return None
+    return data
+
+
+def _write_compiled_profile(compiled_path: Path, data: dict) -> None:
+    """Write a serialized profile atomically; a read-only checkout is not an error."""
+
+    tmp_path = compiled_path.with_name(f"{compiled_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp_path, compiled_path)
+    except OSError:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def load_profile(name: str = DEFAULT_PROFILE) -> ItNormocontrolConfig:
+    """Load a checklist profile, reusing its compiled form when still valid.
+
+    The compiled file is trusted when the source mtime and size match; if
+    only the mtime differs (e.g. a fresh checkout), the source SHA-256 decides.
+    Otherwise the markdown is parsed and the compiled file is rewritten.
+
+    Args:
+        name: Profile name (see `available_profiles()`).
+
+    Returns:
+        Parsed configuration.
+
+    Raises:
+        ValueError: If the profile is unknown or cannot be parsed.
+    """
+
+    md_path = profile_path(name)
+    stat = md_path.stat()
+
+    loaded = _LOADED_PROFILES.get(name)
+    if loaded is not None and loaded[:2] == (stat.st_mtime_ns, stat.st_size):
+        return loaded[2]
+
+    compiled_path = _compiled_profile_path(md_path)
+    data = _read_compiled_profile(compiled_path)
+    config: ItNormocontrolConfig | None = None
+
+    if data is not None and data.get("size") == stat.st_size:
+        if data.get("mtime_ns") == stat.st_mtime_ns or data.get("sha256") == file_sha256(md_path):
+            try:
+                config = ItNormocontrolConfig(**data["config"])
+            except (KeyError, TypeError):
+                config = None
+
+    if config is None:
+        config = load_it_normocontrol_config(md_path)
+        data = {
+            "version": _COMPILED_PROFILE_VERSION,
+            "sha256": file_sha256(md_path),
+            "config": dataclasses.asdict(config),
         }
-        tolerance_mm = 1.5
-        tolerance_twips = mm_to_twips(tolerance_mm)
 
-        for key, expected_mm in expected.items():
-            if key not in margins:
+    if data.get("mtime_ns") != stat.st_mtime_ns or data.get("size") != stat.st_size:
+        data.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        _write_compiled_profile(compiled_path, data)
+
+    _LOADED_PROFILES[name] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+
+# Part of the result-cache key: bump whenever a check changes what it reports,
+# so results cached by an older checker are not replayed.
+CHECKER_VERSION = "5"
+
+# Minimal share of text (by characters) that must use the main font.
+_MAIN_FONT_MIN_SHARE = 0.5
+
+# Maximal share of text (by characters) with sizes other than main/inline ones.
+_NONSTANDARD_SIZE_MAX_SHARE = 0.5
+
+# How many non-empty lines after the sources heading are scanned for numbering.
+_SOURCES_LOOKAHEAD_LINES = 79
+
+# Images larger than this (uncompressed) bloat the document.
+_MEDIA_MAX_BYTES = 2 * 1024 * 1024
+
+# Images shown at a lower resolution than a screen's (stretched beyond their
+# natural size) look blurry in print.
+_MEDIA_MIN_DPI = 90.0
+
+_SOURCES_TITLE = "список использованных источников"
+_TITLE_PREFIX = "title:"
+_NUMBERED_SOURCE_RE = re.compile(r"^\d+\s+")
+_FIGURE_CAPTION_RE = re.compile(r"^рисунок\s+\d+(?:\.\d+)?\s*[—–-]\s+.+$", re.IGNORECASE)
+_TABLE_CAPTION_RE = re.compile(r"^таблица\s+\d+(?:\.\d+)?\s*[—–-]\s+.+$", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=8)
+def _text_matcher_for(titles: tuple[str, ...]) -> TextMatcher:
+    """Build the matcher for all text rules: section titles, citations, caption prefixes."""
+
+    literals = {f"{_TITLE_PREFIX}{i}": title for i, title in enumerate(titles)}
+    literals.update(sources=_SOURCES_TITLE, figure="рисунок", table="таблица")
+    return TextMatcher(literals=literals, patterns={"citation": r"\[(\d+)\]"}, pattern_starts="[")
+
+
+def _text_matcher(config: ItNormocontrolConfig) -> TextMatcher:
+    """Return the shared text matcher for a checklist configuration."""
+
+    return _text_matcher_for(tuple(config.required_sections_in_order))
+
+
+class _Check(DocumentVisitor):
+    """Base class for check visitors: collects state while streaming, reports in `end()`."""
+
+    # Facets of the document the findings depend on (see `run_checks_incremental`);
+    # an incremental run evaluates the rule again only if one of them changed.
+    inputs: tuple[str, ...] = ("package",)
+    # Package facets a per-block memo depends on; rules that set it implement `use_memo()`.
+    memo_inputs: tuple[str, ...] = ()
+
+    def __init__(
+        self, docx_path: Path, doc_name: str, report, config: ItNormocontrolConfig,
+        index: DocumentIndex, text: DocumentText,
+    ) -> None:
+        self.docx_path = docx_path
+        self.doc_name = doc_name
+        self.report = report
+        self.config = config
+        # Paragraph positions and headings; filled while the document is streamed.
+        self.index = index
+        # Body paragraph texts; complete by the time `end()` is called.
+        self.text = text
+
+
+class _PageSetupCheck(_Check):
+    """Check page size and margins of the final section using OOXML."""
+
+    inputs = ("sections",)
+
+    def __init__(
+        self, docx_path: Path, doc_name: str, report, config: ItNormocontrolConfig,
+        index: DocumentIndex, text: DocumentText,
+    ) -> None:
+        super().__init__(docx_path, doc_name, report, config, index, text)
+        self.margins: dict[str, int] | None = None
+        self.page_size: dict | None = None
+
+    def on_section(self, sect_pr) -> None:
+        # The last w:sectPr in the document describes the main page setup.
+        self.margins = get_section_margins(sect_pr)
+        self.page_size = get_section_page_size(sect_pr)
+
+    def end(self) -> None:
+        doc_name, report, config = self.doc_name, self.report, self.config
+        margins = self.margins
+
+        if not margins:
+            report.add_issue(
+                doc_name,
+                "page_setup",
+                "error",
+                "Поля страницы не найдены",
+                expected="Поля должны быть заданы",
+                actual="Поля отсутствуют",
+                location="Разметка страницы → Поля",
+            )
+        else:
+            expected = {
+                "left": config.margins_left_mm,
+                "right": config.margins_right_mm,
+                "top": config.margins_top_mm,
+                "bottom": config.margins_bottom_mm,
+            }
+            tolerance_mm = 1.5
+            tolerance_twips = mm_to_twips(tolerance_mm)
+
+            for key, expected_mm in expected.items():
+                if key not in margins:
+                    report.add_issue(
+                        doc_name,
+                        "page_setup",
+                        "error",
+                        f"Поле '{key}' не задано",
+                        expected=f"{expected_mm} мм",
+                        actual="не задано",
+                        location="Разметка страницы → Поля",
+                    )
+                    continue
+
+                actual_twips = margins[key]
+                expected_twips = mm_to_twips(expected_mm)
+                diff_twips = abs(actual_twips - expected_twips)
+
+                if diff_twips > tolerance_twips:
+                    report.add_issue(
+                        doc_name,
+                        "page_setup",
+                        "error",
+                        f"Некорректное поле '{key}'",
+                        expected=f"{expected_mm} мм",
+                        actual=f"{twips_to_mm(actual_twips):.1f} мм",
+                        location="Разметка страницы → Поля → Настраиваемые поля",
+                    )
+
+        page_size = self.page_size
+        if not page_size:
+            report.add_issue(
+                doc_name,
+                "page_setup",
+                "warning",
+                "Размер страницы не найден",
+                expected="A4 (210×297 мм)",
+                actual="не найден",
+            )
+        else:
+            a4_width_twips = mm_to_twips(config.page_width_mm)
+            a4_height_twips = mm_to_twips(config.page_height_mm)
+            tolerance = mm_to_twips(5)
+
+            width_diff = abs(page_size["width"] - a4_width_twips)
+            height_diff = abs(page_size["height"] - a4_height_twips)
+
+            if width_diff > tolerance or height_diff > tolerance:
                 report.add_issue(
                     doc_name,
                     "page_setup",
-                    "error",
-                    f"Поле '{key}' не задано",
-                    expected=f"{expected_mm} мм",
-                    actual="не задано",
-                    location="Разметка страницы → Поля",
+                    "warning",
+                    "Размер страницы не соответствует A4",
+                    expected="210×297 мм",
+                    actual=f"{twips_to_mm(page_size['width']):.0f}×{twips_to_mm(page_size['height']):.0f} мм",
                 )
-                continue
 
-            actual_twips = margins[key]
-            expected_twips = mm_to_twips(expected_mm)
-            diff_twips = abs(actual_twips - expected_twips)
 
-            if diff_twips > tolerance_twips:
-                report.add_issue(
-                    doc_name,
-                    "page_setup",
+class _ParagraphFormattingCheck(_Check):
+    """Check indentation and line spacing using OOXML (best-effort).
+
+    Paragraph values are collected into columnar `ParagraphMetrics` while
+    streaming; the rules run over the columns in `end()`.
+    """
+
+    inputs = ("blocks", "styles")
+
+    def __init__(
+        self, docx_path: Path, doc_name: str, report, config: ItNormocontrolConfig,
+        index: DocumentIndex, text: DocumentText,
+    ) -> None:
+        super().__init__(docx_path, doc_name, report, config, index, text)
+        self.metrics = ParagraphMetrics()
+
+    def on_paragraph(self, paragraph, index: int, text: str | None) -> None:
+        self.metrics.add(paragraph, index, text)
+
+    def end(self) -> None:
+        metrics = self.metrics
+
+        # Indent: 12.5 mm (1.25 cm), tolerance 1 mm
+        invalid_indents = metrics.indent_deviations(
+            cm_to_twips(self.config.first_line_indent_cm), tolerance=cm_to_twips(0.1)
+        )
+        if invalid_indents:
+            examples = ", ".join(f"{twips_to_cm(twips):.2f} см" for _, twips in invalid_indents[:5])
+            self.report.add_issue(
+                self.doc_name,
+                "paragraphs",
+                "warning",
+                f"Найдены некорректные отступы первой строки ({len(invalid_indents)} шт.)",
+                expected=f"{self.config.first_line_indent_cm:.2f} см",
+                actual=examples,
+                location=_format_locations(self.index, [position for position, _ in invalid_indents]),
+            )
+
+        # Line spacing: 1.0 usually corresponds to w:spacing line=240 with lineRule=auto
+        # (240 = single, 360 = 1.5, 480 = double)
+        paragraphs_with_spacing = metrics.count_spacing()
+        if paragraphs_with_spacing:
+            invalid_spacing = metrics.spacing_deviations(220, 260)
+            ratio = len(invalid_spacing) / paragraphs_with_spacing
+            if ratio > 0.8:
+                self.report.add_issue(
+                    self.doc_name,
+                    "paragraphs",
+                    "warning",
+                    "Много параграфов с явно заданным некорректным интервалом",
+                    expected="1.0 (одинарный)",
+                    actual=f"{len(invalid_spacing)} из {paragraphs_with_spacing}",
+                    location=f"Начиная с: {self.index.describe(invalid_spacing[0])}",
+                )
+
+
+class _FontCheck(_Check):
+    """Check effective fonts and sizes of the whole document.
+
+    Every run is classified by its effective font/size (direct formatting
+    over character style, paragraph style and document defaults, see
+    `tests/helpers/ooxml_styles.py`). Histograms are weighted by the number
+    of characters, so empty and drawing-only runs do not count.
+
+    With a memo (`use_memo`, incremental runs) the runs of a body-level block
+    are classified together in `on_block()`, and the histograms of blocks
+    whose fingerprint is unchanged are taken from the previous run.
+    """
+
+    inputs = ("blocks", "styles", "theme")
+    memo_inputs = ("styles", "theme")
+
+    def __init__(
+        self, docx_path: Path, doc_name: str, report, config: ItNormocontrolConfig,
+        index: DocumentIndex, text: DocumentText,
+    ) -> None:
+        super().__init__(docx_path, doc_name, report, config, index, text)
+        self.resolver = StyleResolver.from_docx(docx_path)
+        self.font_chars: Counter[str] = Counter()
+        self.size_chars: Counter[int] = Counter()
+        self._fingerprints: BlockFingerprints | None = None
+        self._previous_memo: dict[str, list] = {}
+        self._memo: dict[str, list] = {}
+        self._pending: list = []
+
+    def use_memo(self, fingerprints: BlockFingerprints, previous: dict[str, list]) -> dict[str, list]:
+        """Reuse block histograms of the previous run; return the memo filled by this run.
+
+        Memo values are `[{font: chars}, {size: chars}]` (JSON-friendly: sizes as strings).
+        """
+
+        self._fingerprints = fingerprints
+        self._previous_memo = previous
+        return self._memo
+
+    def on_run(self, run, index: int) -> None:
+        if self._fingerprints is not None:
+            self._pending.append(run)
+        else:
+            self._count_run(run, self.font_chars, self.size_chars)
+
+    def on_block(self, block, index: int) -> None:
+        if not self._pending:
+            return
+        runs, self._pending = self._pending, []
+
+        # Runs outside of any block (e.g. in a body-level w:customXml) are not memoized.
+        first = runs[0]
+        if first is not block and not any(ancestor is block for ancestor in first.iterancestors()):
+            for run in runs:
+                self._count_run(run, self.font_chars, self.size_chars)
+            return
+
+        digest = self._fingerprints.current
+        counts = self._memo.get(digest) or self._previous_memo.get(digest)
+        if counts is None:
+            fonts: Counter[str] = Counter()
+            sizes: Counter[int] = Counter()
+            for run in runs:
+                self._count_run(run, fonts, sizes)
+            counts = [dict(fonts), {str(size): chars for size, chars in sizes.items()}]
+        self._memo[digest] = counts
+        self.font_chars.update(counts[0])
+        self.size_chars.update({int(size): chars for size, chars in counts[1].items()})
+
+    def _count_run(self, run, font_chars: Counter, size_chars: Counter) -> None:
+        chars = len(get_run_text(run))
+        if not chars:
+            return
+
+        props = self.resolver.resolve_run(run, get_run_paragraph_style(run))
+        # Cyrillic text is rendered with the hAnsi font.
+        font_name = props.get("hAnsi") or props.get("ascii")
+        if font_name:
+            font_chars[font_name] += chars
+        if "sz" in props:
+            size_chars[props["sz"]] += chars
+
+    def end(self) -> None:
+        config = self.config
+
+        total_font_chars = sum(self.font_chars.values())
+        if total_font_chars:
+            main_share = self.font_chars[config.main_font_name] / total_font_chars
+            if main_share < _MAIN_FONT_MIN_SHARE:
+                self.report.add_issue(
+                    self.doc_name,
+                    "fonts",
                     "error",
-                    f"Некорректное поле '{key}'",
-                    expected=f"{expected_mm} мм",
-                    actual=f"{twips_to_mm(actual_twips):.1f} мм",
-                    location="Разметка страницы → Поля → Настраиваемые поля",
+                    f"Основной текст набран не шрифтом {config.main_font_name}",
+                    expected=f"{config.main_font_name} (не менее {_MAIN_FONT_MIN_SHARE:.0%} текста)",
+                    actual=_format_histogram(self.font_chars, total_font_chars)[:200],
                 )
 
-    page_size = get_page_size(doc_xml)
-    if not page_size:
-        report.add_issue(
-            doc_name,
-            "page_setup",
-            "warning",
-            "Размер страницы не найден",
-            expected="A4 (210×297 мм)",
-            actual="не найден",
-        )
-    else:
-        a4_width_twips = mm_to_twips(config.page_width_mm)
-        a4_height_twips = mm_to_twips(config.page_height_mm)
-        tolerance = mm_to_twips(5)
+        total_size_chars = sum(self.size_chars.values())
+        if total_size_chars:
+            size_main = pt_to_half_points(config.main_font_size_pt)
+            size_table = pt_to_half_points(config.inline_objects_font_size_pt)
+
+            allowed = {size_main, size_table}
+            nonstandard = Counter({size: chars for size, chars in self.size_chars.items() if size not in allowed})
+            ratio = sum(nonstandard.values()) / total_size_chars
+
+            if ratio > _NONSTANDARD_SIZE_MAX_SHARE:
+                by_pt = Counter({f"{half_points_to_pt(size):g}pt": chars for size, chars in nonstandard.items()})
+                self.report.add_issue(
+                    self.doc_name,
+                    "fonts",
+                    "warning",
+                    "Много текста с нестандартным размером шрифта",
+                    expected=(
+                        f"{int(config.main_font_size_pt)}pt (основной) или "
+                        f"{int(config.inline_objects_font_size_pt)}pt (таблицы/подписи/рисунки)"
+                    ),
+                    actual=f"{ratio:.0%} текста (пример: {_format_histogram(by_pt, total_size_chars)})",
+                )
 
-        width_diff = abs(page_size["width"] - a4_width_twips)
-        height_diff = abs(page_size["height"] - a4_height_twips)
 
-        if width_diff > tolerance or height_diff > tolerance:
-            report.add_issue(
-                doc_name,
-                "page_setup",
+def _format_locations(index: DocumentIndex, positions: list[int], limit: int = 3) -> str:
+    """Describe the first paragraph positions as 'Параграф N, раздел «X»; ...'."""
+
+    location = "; ".join(index.describe(position) for position in positions[:limit])
+    if len(positions) > limit:
+        location += f" (и ещё {len(positions) - limit})"
+    return location
+
+
+def _format_histogram(counts: Counter, total: int, limit: int = 5) -> str:
+    """Format the most common entries of a character histogram as percentages."""
+
+    return ", ".join(f"{name} {chars / total:.0%}" for name, chars in counts.most_common(limit))
+
+
+class _PageNumberingCheck(_Check):
+    """Check PAGE fields in the headers/footers each section actually uses (no render).
+
+    Section references are collected while streaming; `end()` resolves them
+    through the document relationships and parses only the referenced parts
+    (see `tests/helpers/ooxml_pagination.py`).
+    """
+
+    inputs = ("sections", "headers", "rels", "styles")
+
+    def __init__(
+        self, docx_path: Path, doc_name: str, report, config: ItNormocontrolConfig,
+        index: DocumentIndex, text: DocumentText,
+    ) -> None:
+        super().__init__(docx_path, doc_name, report, config, index, text)
+        self.sections: list[SectionReferences] = []
+
+    def on_section(self, sect_pr) -> None:
+        self.sections.append(get_section_references(sect_pr))
+
+    def end(self) -> None:
+        config = self.config
+
+        if not any(refs.header or refs.footer for refs in self.sections):
+            self.report.add_issue(
+                self.doc_name,
+                "pagination",
                 "warning",
-                "Размер страницы не соответствует A4",
-                expected="210×297 мм",
-                actual=f"{twips_to_mm(page_size['width']):.0f}×{twips_to_mm(page_size['height']):.0f} мм",
+                "Колонтитулы не найдены (секции не ссылаются на header/footer) — не удалось проверить нумерацию страниц",
             )
+            return
+
+        sections = analyze_pagination(self.docx_path, self.sections)
+        expected_position = _format_page_number_position(config.page_number_part, config.page_number_alignment)
 
+        numbered = [section for section in sections if section.numbered]
+        if not numbered:
+            self.report.add_issue(
+                self.doc_name,
+                "pagination",
+                "warning",
+                "Не найдено поле PAGE в колонтитулах (не удалось подтвердить нумерацию страниц)",
+                expected=f"Поле PAGE: {expected_position}",
+                actual="PAGE не найден",
+            )
+            return
+
+        misplaced = [
+            section
+            for section in numbered
+            if not any(
+                field.kind == config.page_number_part and field.alignment == config.page_number_alignment
+                for field in section.fields
+            )
+        ]
+        if misplaced:
+            positions = sorted({
+                _format_page_number_position(field.kind, field.alignment)
+                for section in misplaced
+                for field in section.fields
+            })
+            self.report.add_issue(
+                self.doc_name,
+                "pagination",
+                "warning",
+                "Номер страницы расположен не там, где требуется",
+                expected=expected_position,
+                actual="; ".join(positions),
+                location="Секции: " + ", ".join(str(section.index + 1) for section in misplaced),
+            )
 
-def _check_paragraph_formatting(doc_name: str, doc_xml, report, config: ItNormocontrolConfig) -> None:
-    """Check indentation and line spacing using OOXML (best-effort)."""
+        first = sections[0]
+        if config.title_page_number_hidden and first.first_page_numbered:
+            self.report.add_issue(
+                self.doc_name,
+                "pagination",
+                "warning",
+                "Номер страницы печатается на титульном листе",
+                expected="Титульный лист без номера (особый колонтитул первой страницы)",
+                actual="поле PAGE в " + ", ".join(sorted({field.part for field in first.first_page_fields})),
+                location="Секция 1, первая страница",
+            )
 
-    from tests.helpers.ooxml_utils import (
-        NS,
-        cm_to_twips,
-        get_paragraph_properties,
-        twips_to_cm,
-    )
 
-    paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
+_PAGE_NUMBER_PARTS = {"header": "верхний колонтитул", "footer": "нижний колонтитул"}
+_PAGE_NUMBER_ALIGNMENTS = {"left": "слева", "center": "по центру", "right": "справа"}
 
-    # Indent: 12.5 mm (1.25 cm)
-    expected_indent = cm_to_twips(config.first_line_indent_cm)
-    tolerance = cm_to_twips(0.1)  # 1mm
 
-    invalid_indents: list[float] = []
-    for p in paragraphs:
-        props = get_paragraph_properties(p)
-        first_line_raw = props.get("ind", {}).get("firstLine")
-        if not first_line_raw:
-            continue
+def _format_page_number_position(part: str, alignment: str) -> str:
+    """Describe a page number position, e.g. 'верхний колонтитул, справа'."""
 
-        try:
-            first_line = int(round(float(first_line_raw)))
-        except (TypeError, ValueError):
-            continue
+    return f"{_PAGE_NUMBER_PARTS.get(part, part)}, {_PAGE_NUMBER_ALIGNMENTS.get(alignment, alignment)}"
 
-        if abs(first_line - expected_indent) > tolerance:
-            invalid_indents.append(twips_to_cm(first_line))
 
-    if invalid_indents:
-        examples = ", ".join(f"{cm:.2f} см" for cm in invalid_indents[:5])
-        report.add_issue(
-            doc_name,
-            "paragraphs",
-            "warning",
-            f"Найдены некорректные отступы первой строки ({len(invalid_indents)} шт.)",
-            expected=f"{config.first_line_indent_cm:.2f} см",
-            actual=examples,
-        )
+class _StructureCheck(_Check):
+    """Check required sections and their order using plain text search.
 
-    # Line spacing: 1.0 usually corresponds to w:spacing line=240 with lineRule=auto
-    paragraphs_with_spacing = doc_xml.xpath(".//w:p[w:pPr/w:spacing]", namespaces=NS)
+    The exact list/order is sourced from the IT checklist markdown. A title's
+    position is its first occurrence in the body text joined with newlines.
+    """
 
-    invalid_spacing = 0
-    for p in paragraphs_with_spacing:
-        props = get_paragraph_properties(p)
-        spacing = props.get("spacing")
-        if not spacing:
-            continue
+    inputs = ("text",)
+
+    def end(self) -> None:
+        required_in_order = list(self.config.required_sections_in_order)
+        positions: dict[str, int] = {}
+        for name, _, match in self.text.hits(_text_matcher(self.config)):
+            if name.startswith(_TITLE_PREFIX):
+                title = required_in_order[int(name[len(_TITLE_PREFIX):])]
+                positions.setdefault(title, match.start())
+
+        missing = [title for title in required_in_order if title not in positions]
+        if missing:
+            self.report.add_issue(
+                self.doc_name,
+                "structure",
+                "error",
+                "Не найдены обязательные разделы",
+                expected=", ".join(required_in_order),
+                actual=", ".join(missing),
+            )
+            return
+
+        ordered_titles = sorted(positions.items(), key=lambda item: item[1])
+        ordered_names = [name for name, _ in ordered_titles]
+        if ordered_names != required_in_order:
+            self.report.add_issue(
+                self.doc_name,
+                "structure",
+                "warning",
+                "Порядок разделов отличается от рекомендуемого",
+                expected=" → ".join(required_in_order),
+                actual=" → ".join(ordered_names),
+            )
 
-        line = spacing.get("line")
-        line_rule = spacing.get("lineRule")
-        if not line or line_rule != "auto":
-            continue
 
-        try:
-            line_val = int(line)
-        except (TypeError, ValueError):
-            continue
+class _ReferencesCheck(_Check):
+    """Check that bracketed references exist and sources section looks numbered."""
 
-        # 240 = single, 360 = 1.5, 480 = double
-        if not (220 <= line_val <= 260):
-            invalid_spacing += 1
+    inputs = ("text",)
+
+    def end(self) -> None:
+        matcher = _text_matcher(self.config)
+        paragraphs = self.text.paragraphs
+        max_citation: int | None = None
+        sources_at: int | None = None
+
+        for name, i, match in self.text.hits(matcher):
+            if name == "citation":
+                value = int(matcher.value(name, match))
+                if max_citation is None or value > max_citation:
+                    max_citation = value
+            elif name == "sources" and sources_at is None:
+                if paragraphs[i].strip().lower() == _SOURCES_TITLE:
+                    sources_at = i
+
+        if max_citation is None:
+            self.report.add_issue(
+                self.doc_name,
+                "references",
+                "warning",
+                "Не найдены ссылки вида [N] в тексте",
+                expected="Ссылки в квадратных скобках (например: [8])",
+                actual="не найдено",
+            )
+            return
+
+        if sources_at is None:
+            self.report.add_issue(
+                self.doc_name,
+                "references",
+                "error",
+                "Есть ссылки [N], но не найден раздел 'Список использованных источников'",
+                expected="Раздел со списком источников",
+                actual="не найден",
+            )
+            return
 
-    if paragraphs_with_spacing:
-        ratio = invalid_spacing / len(paragraphs_with_spacing)
-        if ratio > 0.8:
-            report.add_issue(
-                doc_name,
-                "paragraphs",
+        # Heuristic: count numbered lines among the first non-empty lines after the heading.
+        lines_seen = 0
+        numbered = 0
+        for paragraph in paragraphs[sources_at + 1:]:
+            if lines_seen >= _SOURCES_LOOKAHEAD_LINES:
+                break
+            line = paragraph.strip()
+            if not line:
+                continue
+            lines_seen += 1
+            if _NUMBERED_SOURCE_RE.match(line):
+                numbered += 1
+
+        if not numbered:
+            self.report.add_issue(
+                self.doc_name,
+                "references",
                 "warning",
-                "Много параграфов с явно заданным некорректным интервалом",
-                expected="1.0 (одинарный)",
-                actual=f"{invalid_spacing} из {len(paragraphs_with_spacing)}",
+                "В разделе источников не найдены строки, начинающиеся с номера",
+                expected="Нумерация арабскими цифрами без точки (например: 1 ...)",
+                actual="не найдено",
             )
+            return
 
+        if max_citation > numbered:
+            self.report.add_issue(
+                self.doc_name,
+                "references",
+                "warning",
+                "Максимальный номер ссылки больше числа найденных источников",
+                expected=f"Источников ≥ {max_citation}",
+                actual=f"Найдено источников (эвристика): {numbered}",
+            )
 
-def _check_fonts(doc_name: str, doc_xml, report, config: ItNormocontrolConfig) -> None:
-    """Check that explicit font settings use Times New Roman and sizes 14/12pt."""
 
-    from tests.helpers.ooxml_utils import (
-        NS,
-        get_run_properties,
-        pt_to_half_points,
-    )
+class _CaptionsCheck(_Check):
+    """Check basic caption formats for figures and tables (best-effort)."""
 
-    runs = doc_xml.xpath(".//w:r", namespaces=NS)
-    fonts_used: set[str] = set()
-    sizes: list[int] = []
+    inputs = ("text",)
 
-    for run in runs[:250]:
-        props = get_run_properties(run)
+    def end(self) -> None:
+        text = self.text
+        bad: dict[str, list[int]] = {"figure": [], "table": []}
+        for name, i, match in text.hits(_text_matcher(self.config)):
+            if name not in bad or not text.at_paragraph_start(i, match.start()):
+                continue
+            line = text.paragraphs[i].strip()
+            caption_re = _FIGURE_CAPTION_RE if name == "figure" else _TABLE_CAPTION_RE
+            if not caption_re.match(line) or line.endswith("."):
+                bad[name].append(text.positions[i])
+
+        if bad["figure"]:
+            self.report.add_issue(
+                self.doc_name,
+                "figures",
+                "warning",
+                "Найдены подписи рисунков с нарушением формата",
+                expected="Рисунок N – Название (без точки в конце)",
+                actual=f"проблемных подписей: {len(bad['figure'])}",
+                location=_format_locations(self.index, bad["figure"]),
+            )
 
-        r_fonts = props.get("rFonts")
-        if r_fonts:
-            for key in ("ascii", "hAnsi", "cs"):
-                font_name = r_fonts.get(key)
-                if font_name:
-                    fonts_used.add(font_name)
+        if bad["table"]:
+            self.report.add_issue(
+                self.doc_name,
+                "tables",
+                "warning",
+                "Найдены названия таблиц с нарушением формата",
+                expected="Таблица N – Название (без точки в конце)",
+                actual=f"проблемных названий: {len(bad['table'])}",
+                location=_format_locations(self.index, bad["table"]),
+            )
 
-        if "sz" in props:
-            sizes.append(int(props["sz"]))
 
-    if fonts_used and config.main_font_name not in fonts_used:
-        report.add_issue(
-            doc_name,
-            "fonts",
-            "error",
-            "Times New Roman не найден среди явно заданных шрифтов",
-            expected=config.main_font_name,
-            actual=", ".join(sorted(fonts_used))[:200],
-        )
+class _MediaCheck(_Check):
+    """Check embedded images: file size and resolution at the size shown.
 
-    if sizes:
-        size_main = pt_to_half_points(config.main_font_size_pt)
-        size_table = pt_to_half_points(config.inline_objects_font_size_pt)
+    Images are located while streaming (`DrawingIndex`, with their captions);
+    `end()` reads only the ZIP directory and image headers of `word/media`
+    (see `tests/helpers/ooxml_media.py`), never the image data.
+    """
 
-        allowed = {size_main, size_table}
-        nonstandard = [s for s in sizes if s not in allowed]
-        ratio = len(nonstandard) / len(sizes)
+    inputs = ("blocks", "rels", "media")
+
+    def __init__(
+        self, docx_path: Path, doc_name: str, report, config: ItNormocontrolConfig,
+        index: DocumentIndex, text: DocumentText,
+    ) -> None:
+        super().__init__(docx_path, doc_name, report, config, index, text)
+        self.drawings = DrawingIndex()
+
+    def on_run(self, run, index: int) -> None:
+        self.drawings.on_run(run, index)
+
+    def on_paragraph(self, paragraph, index: int, text: str | None) -> None:
+        self.drawings.on_paragraph(paragraph, index, text)
+
+    def end(self) -> None:
+        placements = self.drawings.placements
+        if not placements:
+            return
+        with zipfile.ZipFile(self.docx_path, "r") as archive:
+            targets = get_relationship_targets(archive)
+            media = inspect_media(archive)
+
+        oversized: dict[str, tuple[ImagePlacement, MediaInfo]] = {}
+        low_resolution: list[tuple[ImagePlacement, MediaInfo, float]] = []
+        for placement in placements:
+            info = media.get(targets.get(placement.rel_id, ""))
+            if info is None:
+                continue
+            if info.size_bytes > _MEDIA_MAX_BYTES:
+                oversized.setdefault(info.name, (placement, info))
+            dpi = placement.effective_dpi(info)
+            if dpi is not None and dpi < _MEDIA_MIN_DPI:
+                low_resolution.append((placement, info, dpi))
+
+        if oversized:
+            total = sum(info.size_bytes for _, info in oversized.values())
+            self.report.add_issue(
+                self.doc_name,
+                "figures",
+                "warning",
+                "Найдены слишком большие файлы изображений",
+                expected=f"Не более {_MEDIA_MAX_BYTES / 2**20:.0f} МБ на изображение (сжатие, обрезка)",
+                actual=f"изображений: {len(oversized)}, всего {total / 2**20:.1f} МБ",
+                location=self._format_images(
+                    [(placement, info, f"{info.size_bytes / 2**20:.1f} МБ") for placement, info in oversized.values()]
+                ),
+            )
 
-        if ratio > 0.5:
-            report.add_issue(
-                doc_name,
-                "fonts",
+        if low_resolution:
+            self.report.add_issue(
+                self.doc_name,
+                "figures",
                 "warning",
-                "Много runs с нестандартным явно заданным размером шрифта",
-                expected=(
-                    f"{int(config.main_font_size_pt)}pt (основной) или "
-                    f"{int(config.inline_objects_font_size_pt)}pt (таблицы/подписи/рисунки)"
+                "Найдены изображения с низким разрешением",
+                expected=f"Не менее {_MEDIA_MIN_DPI:.0f} dpi в размере на странице (не растягивать)",
+                actual=(
+                    f"изображений: {len(low_resolution)}, "
+                    f"минимум {min(dpi for _, _, dpi in low_resolution):.0f} dpi"
+                ),
+                location=self._format_images(
+                    [
+                        (placement, info, f"{info.width_px}×{info.height_px} px, {dpi:.0f} dpi")
+                        for placement, info, dpi in low_resolution
+                    ]
                 ),
-                actual=f"{len(nonstandard)} из {len(sizes)} (пример: {nonstandard[:5]})",
             )
 
+    def _format_images(self, images: list[tuple[ImagePlacement, MediaInfo, str]], limit: int = 3) -> str:
+        """Describe the first images by caption (or paragraph) and file."""
+
+        parts = []
+        for placement, info, details in images[:limit]:
+            if placement.caption:
+                where = placement.caption if len(placement.caption) <= 60 else placement.caption[:59] + "…"
+            else:
+                where = self.index.describe(placement.paragraph)
+            parts.append(f"{where} ({posixpath.basename(info.name)}, {details})")
+        location = "; ".join(parts)
+        if len(images) > limit:
+            location += f" (и ещё {len(images) - limit})"
+        return location
+
+
+# Registered checks, in the order their issues appear in the report.
+CHECK_VISITORS: tuple[type[_Check], ...] = (
+    _PageSetupCheck,
+    _ParagraphFormattingCheck,
+    _FontCheck,
+    _PageNumberingCheck,
+    _StructureCheck,
+    _ReferencesCheck,
+    _CaptionsCheck,
+    _MediaCheck,
+)
+
+
+def run_checks(
+    docx_path: Path,
+    report,
+    config: ItNormocontrolConfig,
+    doc_name: str | None = None,
+    profiler: CheckProfiler | None = None,
+) -> None:
+    """Run all registered checks for one document in a single streaming pass.
 
-def _check_page_numbering(docx_path: Path, doc_name: str, report) -> None:
-    """Check presence of PAGE field in any header XML (best-effort, no render)."""
+    Args:
+        docx_path: Path to a .docx file.
+        report: `NormocontrolReport` to add issues to.
+        config: Parsed IT checklist configuration.
+        doc_name: Name used for the document in the report (default: file name).
+        profiler: Record per-rule wall time, XML nodes and peak RSS (opt-in).
+    """
 
-    import zipfile
+    doc_name = doc_name or docx_path.name
+    report.add_document(doc_name)
 
-    has_page_field = False
+    if profiler is None:
+        _stream_checks(docx_path, report, config, doc_name)
+        return
+    with profiler.document(doc_name) as wrap:
+        _stream_checks(docx_path, report, config, doc_name, wrap)
 
-    with zipfile.ZipFile(docx_path, "r") as archive:
-        header_files = [name for name in archive.namelist() if name.startswith("word/header") and name.endswith(".xml")]
-        for header in header_files:
-            content = archive.read(header)
-            # A robust XML parse is possible, but this heuristic is enough for a quick check.
-            # PAGE field usually appears as instrText containing 'PAGE'.
-            if b"PAGE" in content.upper():
-                has_page_field = True
-                break
 
-    if not header_files:
-        report.add_issue(
-            doc_name,
-            "pagination",
-            "warning",
-            "Колонтитулы не найдены (header*.xml отсутствуют) — не удалось проверить нумерацию страниц",
-        )
-        return
+def _stream_checks(docx_path: Path, report, config: ItNormocontrolConfig, doc_name: str, wrap=None) -> None:
+    """Build the check visitors for one document and stream it once (`wrap`: see `CheckProfiler.document`)."""
 
-    if not has_page_field:
-        report.add_issue(
-            doc_name,
-            "pagination",
-            "warning",
-            "Не найдено поле PAGE в колонтитулах (не удалось подтвердить нумерацию страниц)",
-            expected="Поле PAGE в правом верхнем углу",
-            actual="PAGE не найден",
-        )
+    index = DocumentIndex(get_heading_style_levels(get_styles_xml(docx_path)))
+    text = DocumentText(index)
+    visitors = [text] + [check(docx_path, doc_name, report, config, index, text) for check in CHECK_VISITORS]
+    if wrap is not None:
+        visitors = wrap(visitors)
+    stream_document(docx_path, visitors, index=index)
 
 
-def _check_structure(doc_name: str, doc: Document, report) -> None:
-    """Check required sections and their order using plain text search.
+def config_fingerprint(config: ItNormocontrolConfig) -> str:
+    """Return a stable hash of a parsed checklist configuration."""
+
+    payload = json.dumps(dataclasses.asdict(config), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _cache_dir(report_dir: Path) -> Path:
+    """Return the result-cache directory inside the reports directory."""
 
-    The exact list/order is sourced from the IT checklist markdown.
+    return report_dir / ".cache"
+
+
+def run_checks_cached(
+    docx_path: Path,
+    report,
+    config: ItNormocontrolConfig,
+    doc_name: str | None = None,
+    cache: ResultCache | None = None,
+) -> bool:
+    """Run checks for one document, replaying a cached result when possible.
+
+    The cache key combines SHA-256 of the .docx bytes, the checklist
+    configuration and `CHECKER_VERSION`. Cached issues are stored without the
+    document name, so the same entry serves single and batch runs.
+
+    Returns:
+        True on a cache hit, False if the document was checked.
     """
 
-    required_in_order = list(getattr(report, "_required_sections_in_order", []))
-    if not required_in_order:
-        # Fallback: keep previous behavior if config wiring is missing.
-        required_in_order = [
-            "Задание",
-            "Реферат",
-            "Оглавление",
-            "Введение",
-            "Заключение",
-            "Список использованных источников",
-            "Приложения",
-        ]
+    if cache is None:
+        run_checks(docx_path, report, config, doc_name=doc_name)
+        return False
 
-    text = _extract_all_text(doc)
-    positions = _find_section_positions(text, required_in_order)
+    from tests.helpers.report import NormocontrolReport
 
-    missing = [title for title in required_in_order if title not in positions]
-    if missing:
-        report.add_issue(
-            doc_name,
-            "structure",
-            "error",
-            "Не найдены обязательные разделы",
-            expected=", ".join(required_in_order),
-            actual=", ".join(missing),
-        )
-        return
+    doc_name = doc_name or docx_path.name
+    key = make_cache_key(file_sha256(docx_path), config_fingerprint(config), CHECKER_VERSION)
+    cached = cache.get(key)
+    hit = cached is not None
 
-    ordered_titles = sorted(positions.items(), key=lambda item: item[1])
-    ordered_names = [name for name, _ in ordered_titles]
-    if ordered_names != required_in_order:
-        report.add_issue(
-            doc_name,
-            "structure",
-            "warning",
-            "Порядок разделов отличается от рекомендуемого",
-            expected=" → ".join(required_in_order),
-            actual=" → ".join(ordered_names),
-        )
+    if not hit:
+        fresh = NormocontrolReport()
+        run_checks(docx_path, fresh, config, doc_name=doc_name)
+        cached = [_issue_fields(issue) for issue in fresh.issues]
+        cache.put(key, cached)
 
+    report.add_document(doc_name)
+    for issue in cached:
+        report.add_issue(doc_name, **issue)
+    return hit
 
-def _check_references(doc_name: str, doc: Document, report) -> None:
-    """Check that bracketed references exist and sources section looks numbered."""
 
-    text = _extract_all_text(doc)
+def _issue_fields(issue) -> dict:
+    """Serialize an issue without the document name (cache and state entries)."""
 
-    citations = re.findall(r"\[(\d+)\]", text)
-    if not citations:
-        report.add_issue(
-            doc_name,
-            "references",
-            "warning",
-            "Не найдены ссылки вида [N] в тексте",
-            expected="Ссылки в квадратных скобках (например: [8])",
-            actual="не найдено",
-        )
-        return
+    return {name: value for name, value in dataclasses.asdict(issue).items() if name != "document"}
 
-    max_citation = max(int(n) for n in citations)
 
-    # Heuristic: find the sources section and count numbered lines after it.
-    lower_lines = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
-    sources_index = None
-    for i, line in enumerate(lower_lines):
-        if line.lower() == "список использованных источников":
-            sources_index = i
-            break
+def _state_dir(report_dir: Path) -> Path:
+    """Return the directory of incremental-run states inside the result cache."""
 
-    if sources_index is None:
-        report.add_issue(
-            doc_name,
-            "references",
-            "error",
-            "Есть ссылки [N], но не найден раздел 'Список использованных источников'",
-            expected="Раздел со списком источников",
-            actual="не найден",
-        )
-        return
+    return _cache_dir(report_dir) / "incremental"
 
-    sources_lines = lower_lines[sources_index + 1 : sources_index + 80]
-    numbered = [line for line in sources_lines if re.match(r"^\d+\s+", line)]
 
-    if not numbered:
-        report.add_issue(
-            doc_name,
-            "references",
-            "warning",
-            "В разделе источников не найдены строки, начинающиеся с номера",
-            expected="Нумерация арабскими цифрами без точки (например: 1 ...)",
-            actual="не найдено",
-        )
-        return
+def run_checks_incremental(
+    docx_path: Path,
+    report,
+    config: ItNormocontrolConfig,
+    store: StateStore,
+    doc_name: str | None = None,
+) -> DocumentChanges:
+    """Run checks for one document, reusing what did not change since its previous run.
 
-    if max_citation > len(numbered):
-        report.add_issue(
-            doc_name,
-            "references",
-            "warning",
-            "Максимальный номер ссылки больше числа найденных источников",
-            expected=f"Источников ≥ {max_citation}",
-            actual=f"Найдено источников (эвристика): {len(numbered)}",
-        )
+    The state of the previous run is kept per resolved file path in `store`
+    (see `tests/helpers/incremental.py`). If no package part changed, the
+    previous issues are replayed without parsing. Otherwise the document is
+    streamed once with block fingerprints: `_FontCheck` reuses the histograms
+    of unchanged blocks, and a rule whose input facets (`_Check.inputs`) are
+    unchanged keeps its previous issues instead of running `end()`.
 
+    Returns:
+        Changes against the previous run: rules evaluated again, new and fixed issues.
+    """
 
-def _check_captions(doc_name: str, doc: Document, report) -> None:
-    """Check basic caption formats for figures and tables (best-effort)."""
+    from tests.helpers.report import NormocontrolReport
 
-    figure_re = re.compile(r"^рисунок\s+\d+(?:\.\d+)?\s*[—–-]\s+.+$", re.IGNORECASE)
-    table_re = re.compile(r"^таблица\s+\d+(?:\.\d+)?\s*[—–-]\s+.+$", re.IGNORECASE)
+    doc_name = doc_name or docx_path.name
+    checker = make_cache_key(config_fingerprint(config), CHECKER_VERSION)
+    state_name = str(docx_path.resolve())
+    previous = store.load(state_name)
+    reusable = previous if previous is not None and previous.checker == checker else None
+    parts = part_facets(part_fingerprints(docx_path))
+    rules_checked: list[str] = []
 
-    bad_figures = 0
-    bad_tables = 0
+    if reusable is not None and reusable.package == parts["package"]:
+        state = reusable
+    else:
+        fresh = NormocontrolReport()
+        index = DocumentIndex(get_heading_style_levels(get_styles_xml(docx_path)))
+        text = DocumentText(index)
+        fingerprints = BlockFingerprints()
+        checks = [check(docx_path, doc_name, fresh, config, index, text) for check in CHECK_VISITORS]
+
+        state = DocumentState(checker, parts["package"])
+        for check in checks:
+            if check.memo_inputs:
+                name, key = rule_name(check), facet_key(parts, check.memo_inputs)
+                previous_memo = reusable.memo(name, key) if reusable is not None else {}
+                state.memos[name] = {"key": key, "blocks": check.use_memo(fingerprints, previous_memo)}
+
+        stream_document(docx_path, [text, fingerprints] + [DeferredEnd(check) for check in checks], index=index)
+
+        facets = {**parts, **fingerprints.facets(), "text": text_facet(text)}
+        state.blocks = fingerprints.blocks
+        for check in checks:
+            name, key = rule_name(check), facet_key(facets, check.inputs)
+            issues = reusable.rule(name, key) if reusable is not None else None
+            if issues is None:
+                start = len(fresh.issues)
+                check.end()
+                issues = [_issue_fields(issue) for issue in fresh.issues[start:]]
+                rules_checked.append(name)
+            state.rules[name] = {"key": key, "issues": issues}
+        store.save(state_name, state)
 
-    for p in doc.paragraphs:
-        line = p.text.strip()
-        if not line:
-            continue
+    report.add_document(doc_name)
+    for issue in state.issues:
+        report.add_issue(doc_name, **issue)
+
+    changes = DocumentChanges(
+        doc_name,
+        previous=previous is not None,
+        blocks_total=len(state.blocks),
+        rules_checked=rules_checked,
+        rules_reused=[name for name in state.rules if name not in rules_checked],
+    )
+    if previous is not None:
+        known = set(previous.blocks)
+        changes.blocks_changed = sum(1 for block in state.blocks if block not in known)
+        changes.new_issues, changes.fixed_issues = diff_issues(previous.issues, state.issues)
+    return changes
 
-        if line.lower().startswith("рисунок"):
-            if not figure_re.match(line) or line.endswith("."):
-                bad_figures += 1
 
-        if line.lower().startswith("таблица"):
-            if not table_re.match(line) or line.endswith("."):
-                bad_tables += 1
+def _new_report_path(report_dir: Path, prefix: str) -> Path:
+    """Create report_dir and return a timestamped markdown path inside it."""
 
-    if bad_figures:
-        report.add_issue(
-            doc_name,
-            "figures",
-            "warning",
-            "Найдены подписи рисунков с нарушением формата",
-            expected="Рисунок N – Название (без точки в конце)",
-            actual=f"проблемных подписей: {bad_figures}",
-        )
+    report_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return report_dir / f"{prefix}_{timestamp}.md"
+
+
+def _write_profile(profiler: CheckProfiler, report_path: Path) -> Path:
+    """Append the profile to the markdown report and write it as a JSON side file."""
+
+    with open(report_path, "a", encoding="utf-8") as f:
+        f.write("\n\n" + profiler.to_markdown())
+    profile_path = report_path.with_name(
+        report_path.name.replace("it_normocontrol_report_", "it_normocontrol_profile_")
+    ).with_suffix(".json")
+    profiler.to_json(profile_path)
+    return profile_path
 
-    if bad_tables:
-        report.add_issue(
-            doc_name,
-            "tables",
-            "warning",
-            "Найдены названия таблиц с нарушением формата",
-            expected="Таблица N – Название (без точки в конце)",
-            actual=f"проблемных названий: {bad_tables}",
-        )
 
+def _write_changes(changes: DocumentChanges, report_path: Path) -> Path:
+    """Append the changes section to the markdown report and write it as a JSON side file."""
 
-def check_it_docx(docx_path: Path, report_dir: Path) -> int:
+    with open(report_path, "a", encoding="utf-8") as f:
+        f.write("\n\n" + changes.to_markdown())
+    changes_path = report_path.with_name(
+        report_path.name.replace("it_normocontrol_report_", "it_normocontrol_changes_")
+    ).with_suffix(".json")
+    changes_path.write_text(json.dumps(changes.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+    return changes_path
+
+
+def check_it_docx(
+    docx_path: Path,
+    report_dir: Path,
+    use_cache: bool = True,
+    checklist: str = DEFAULT_PROFILE,
+    profile_checks: bool = False,
+    incremental: bool = False,
+) -> int:
     """Run IT short checklist checks and write a markdown report.
 
     Args:
         docx_path: Path to a .docx file.
         report_dir: Directory where a markdown report will be saved.
+        use_cache: Reuse/store results in `report_dir/.cache`.
+        checklist: Checklist profile name.
+        profile_checks: Time every rule; the cache is not read so all rules run.
+        incremental: Re-check only what changed since the previous run of this
+            file and report new/fixed issues (state in `report_dir/.cache/incremental`).
+            Requires `use_cache` and excludes `profile_checks`.
 
     Returns:
         Exit code (0 if no errors, 1 otherwise).
-    """
 
-    repo_root = _resolve_repo_root()
-    _ensure_tests_helpers_on_syspath(repo_root)
+    Raises:
+        ValueError: If `incremental` is combined with `use_cache=False` or `profile_checks`.
+    """
 
-    from tests.helpers.ooxml_utils import get_document_xml
     from tests.helpers.report import NormocontrolReport
 
-    standards_md = repo_root / "scripts" / "standards_verification" / "standars_control_it_short.md"
-    config = load_it_normocontrol_config(standards_md)
+    config = load_profile(checklist)
 
     report = NormocontrolReport()
-    # Pass required sections through the report instance without changing its public API.
-    # (This keeps changes localized to this script.)
-    setattr(report, "_required_sections_in_order", config.required_sections_in_order)
-    doc_name = docx_path.name
-    report.add_document(doc_name)
-
-    doc_xml = get_document_xml(docx_path)
-    doc = Document(docx_path)
-
-    _check_page_setup(doc_name, doc_xml, report, config)
-    _check_paragraph_formatting(doc_name, doc_xml, report, config)
-    _check_fonts(doc_name, doc_xml, report, config)
-    _check_page_numbering(docx_path, doc_name, report)
-    _check_structure(doc_name, doc, report)
-    _check_references(doc_name, doc, report)
-    _check_captions(doc_name, doc, report)
+    profiler = CheckProfiler() if profile_checks else None
+    changes: DocumentChanges | None = None
+    hit = False
+    if incremental and (profiler is not None or not use_cache):
+        raise ValueError("incremental checks need the cache and cannot be profiled")
+    if profiler is not None:
+        run_checks(docx_path, report, config, profiler=profiler)
+    elif incremental:
+        store = StateStore(_state_dir(report_dir))
+        changes = run_checks_incremental(docx_path, report, config, store)
+    else:
+        cache = ResultCache(_cache_dir(report_dir)) if use_cache else None
+        hit = run_checks_cached(docx_path, report, config, cache=cache)
 
-    report_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_path = report_dir / f"it_normocontrol_report_{timestamp}.md"
+    report_path = _new_report_path(report_dir, "it_normocontrol_report")
     report.to_markdown(report_path)
 
     summary = report.generate_summary()
+    if hit:
+        print("Cache: hit (document and checklist unchanged)")
     print(f"✓ Report: {report_path}")
+    if profiler is not None:
+        print(f"✓ Profile: {_write_profile(profiler, report_path)}")
+    if changes is not None:
+        print(f"✓ Changes: {_write_changes(changes, report_path)}")
+        if changes.previous:
+            print(
+                f"Changes: {len(changes.new_issues)} new, {len(changes.fixed_issues)} fixed "
+                f"(rules re-checked: {len(changes.rules_checked)}/{len(CHECK_VISITORS)})"
+            )
     print(f"Checked: {summary['total_documents']} document(s)")
     print(f"Issues: {summary['total_issues']} (errors={summary['errors']}, warnings={summary['warnings']})")
 
     return 1 if report.has_errors() else 0
 
 
-def main() -> int:
+# Batch mode ---------------------------------------------------------------
+
+TARGET_DOCX_NAME = "Пояснительная_записка.docx"
+
+# Parsed checklist, result cache and profiling flag, set up once per worker process by `_init_batch_worker`.
+_WORKER_CONFIG: ItNormocontrolConfig | None = None
+_WORKER_CACHE: ResultCache | None = None
+_WORKER_PROFILE = False
+
+
+def find_batch_documents(directory: Path) -> list[Path]:
+    """Find explanatory notes under a directory.
+
+    Looks for `<Student>/task_03/Пояснительная_записка.docx` first; if the
+    directory has no such layout, every `Пояснительная_записка.docx` below it
+    is used. Word lock files (`~$...`) are skipped.
+    """
+
+    found = sorted(directory.glob(f"*/task_03/{TARGET_DOCX_NAME}"))
+    if not found:
+        found = sorted(directory.rglob(TARGET_DOCX_NAME))
+    return [path for path in found if path.is_file() and not path.name.startswith("~$")]
+
+
+def _batch_doc_name(docx_path: Path, base_dir: Path) -> str:
+    """Return a unique, readable document name relative to the batch directory."""
+
+    try:
+        return docx_path.resolve().relative_to(base_dir.resolve()).as_posix()
+    except ValueError:
+        return docx_path.as_posix()
+
+
+def _student_from_doc_name(doc_name: str) -> str:
+    """Return the student directory name (`<Student>/task_03/...` -> `<Student>`)."""
+
+    parts = doc_name.split("/")
+    return parts[0] if len(parts) > 1 else doc_name
+
+
+def _init_batch_worker(checklist: str, cache_dir: Path | None, profile_checks: bool = False) -> None:
+    """Process-pool initializer: load the compiled checklist profile once per worker."""
+
+    global _WORKER_CONFIG, _WORKER_CACHE, _WORKER_PROFILE
+    _WORKER_CONFIG = load_profile(checklist)
+    _WORKER_CACHE = ResultCache(cache_dir) if cache_dir is not None else None
+    _WORKER_PROFILE = profile_checks
+
+
+def _check_in_worker(docx_path: Path, doc_name: str) -> tuple[list, bool, list]:
+    """Check a single document inside a worker; return (issues, cache_hit, timing records)."""
+
+    from tests.helpers.report import NormocontrolReport
+
+    report = NormocontrolReport()
+    profiler = CheckProfiler() if _WORKER_PROFILE else None
+    hit = False
+    try:
+        if profiler is not None:
+            run_checks(docx_path, report, _WORKER_CONFIG, doc_name=doc_name, profiler=profiler)
+        else:
+            hit = run_checks_cached(docx_path, report, _WORKER_CONFIG, doc_name=doc_name, cache=_WORKER_CACHE)
+    except Exception as exc:  # broken zip/XML must not abort the whole batch
+        report.add_issue(
+            doc_name,
+            "document",
+            "error",
+            "Не удалось прочитать документ",
+            expected="Корректный .docx (Office Open XML)",
+            actual=f"{type(exc).__name__}: {exc}"[:200],
+        )
+    return report.issues, hit, profiler.to_records() if profiler is not None else []
+
+
+def _format_batch_summary(counts: dict[str, tuple[int, int]], doc_names: list[str]) -> str:
+    """Build a per-student markdown summary table from (errors, warnings) per document."""
+
+    lines = [
+        "| Студент | Документ | Ошибки | Предупреждения | Статус |",
+        "| --- | --- | --- | --- | --- |",
+    ]
+    for doc_name in doc_names:
+        errors, warnings = counts.get(doc_name, (0, 0))
+        status = "❌" if errors else "✅"
+        lines.append(f"| {_student_from_doc_name(doc_name)} | `{doc_name}` | {errors} | {warnings} | {status} |")
+    return "\n".join(lines)
+
+
+def check_it_docx_batch(
+    docx_paths: list[Path],
+    report_dir: Path,
+    base_dir: Path,
+    jobs: int | None = None,
+    use_cache: bool = True,
+    checklist: str = DEFAULT_PROFILE,
+    profile_checks: bool = False,
+) -> int:
+    """Check many documents in parallel and write one merged report.
+
+    Documents are fanned out to a process pool; each worker parses the
+    checklist once (pool initializer) and then streams its documents. While
+    the batch runs, every finished document is appended to
+    `it_normocontrol_report_*.jsonl` (see `JsonlReportWriter`) and only its
+    error/warning counts are kept, so memory does not grow with the cohort.
+    Afterwards the markdown report is written in stable path order, reading
+    one document's issues back from the JSONL file at a time; the totals,
+    the per-student summary table and the exit code come from the counts.
+
+    Args:
+        docx_paths: Documents to check.
+        report_dir: Directory where reports will be saved.
+        base_dir: Directory document names are made relative to.
+        jobs: Worker processes (default: CPU count).
+        use_cache: Reuse/store results in `report_dir/.cache`.
+        checklist: Checklist profile name.
+        profile_checks: Time every rule on every document (cache is not read);
+            the report gets an aggregate table across documents.
+
+    Returns:
+        Exit code (0 if no errors in any document, 1 otherwise).
+    """
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    from tests.helpers.report import JsonlReportReader, JsonlReportWriter, write_markdown
+
+    if not docx_paths:
+        print("ERROR: No documents to check")
+        return 1
+
+    # Compile the profile once here, so workers only read the serialized form.
+    load_profile(checklist)
+
+    report_path = _new_report_path(report_dir, "it_normocontrol_report")
+    jsonl_path = report_path.with_suffix(".jsonl")
+    print(f"Streaming results to: {jsonl_path}")
+
+    doc_names = {path: _batch_doc_name(path, base_dir) for path in docx_paths}
+    counts: dict[str, tuple[int, int]] = {}
+    profiler = CheckProfiler() if profile_checks else None
+
+    # Largest files first, so the slowest document starts right away.
+    ordered = sorted(docx_paths, key=lambda path: path.stat().st_size, reverse=True)
+    max_workers = max(1, min(jobs or os.cpu_count() or 1, len(ordered)))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_batch_worker,
+        initargs=(checklist, _cache_dir(report_dir) if use_cache else None, profile_checks),
+    ) as pool, JsonlReportWriter(jsonl_path) as sink:
+        futures = {pool.submit(_check_in_worker, path, doc_names[path]): path for path in ordered}
+        for future in as_completed(futures):
+            doc_name = doc_names[futures[future]]
+            issues, hit, timings = future.result()
+            if profiler is not None:
+                profiler.extend(timings)
+            suffix = ", cached" if hit else ""
+            print(f"  checked {doc_name} ({len(issues)} issue(s){suffix})")
+
+            sink.add_document(doc_name)
+            for issue in issues:
+                sink.write_issue(issue)
+            sink.end_document(doc_name)
+            counts[doc_name] = (
+                sum(1 for issue in issues if issue.severity == "error"),
+                sum(1 for issue in issues if issue.severity == "warning"),
+            )
+
+    # Sections are read back from the JSONL one document at a time.
+    names_in_order = sorted(counts)
+    documents = JsonlReportReader(jsonl_path).iter_documents(names_in_order)
+    write_markdown(report_path, sink.timestamp, sink.summary.to_dict(), documents)
+    errors = sum(doc_errors for doc_errors, _ in counts.values())
+    warnings = sum(doc_warnings for _, doc_warnings in counts.values())
+
+    summary_table = _format_batch_summary(counts, names_in_order)
+    summary_path = report_path.with_name(report_path.name.replace("it_normocontrol_report_", "it_normocontrol_summary_"))
+    summary_path.write_text("# Сводка нормоконтроля по студентам\n\n" + summary_table + "\n", encoding="utf-8")
+
+    print(summary_table)
+    print(f"✓ Report: {report_path}")
+    print(f"✓ Summary: {summary_path}")
+    print(f"✓ JSONL: {jsonl_path}")
+    if profiler is not None:
+        # Workers finish in any order; keep the profile in report order.
+        profiler.timings.sort(key=lambda timing: timing.document)
+        print(f"✓ Profile: {_write_profile(profiler, report_path)}")
+    print(f"Checked: {len(counts)} document(s) with {max_workers} worker(s)")
+    print(f"Issues: {sink.summary.total_issues} (errors={errors}, warnings={warnings})")
+
+    return 1 if errors else 0
+
+
+def main(argv: list[str] | None = None) -> int:
     """CLI entrypoint."""
 
     repo_root = _resolve_repo_root()
     default_docx = repo_root / "tests" / "ПЗ.docx"
 
-    docx_path = Path(sys.argv[1]) if len(sys.argv) >= 2 else default_docx
+    parser = argparse.ArgumentParser(description="IT normocontrol checker (short checklist)")
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default=None,
+        help="Path to a .docx file, or a directory to check in batch mode (default: tests/ПЗ.docx)",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help=f"Batch mode: check every <Student>/task_03/{TARGET_DOCX_NAME} (default directory: students/)",
+    )
+    parser.add_argument("--jobs", type=int, default=None, help="Worker processes for batch mode (default: CPU count)")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not reuse or store results in normocontrol_reports/.cache",
+    )
+    parser.add_argument(
+        "--profile",
+        "--checklist",
+        dest="checklist",
+        default=DEFAULT_PROFILE,
+        choices=available_profiles(),
+        help=f"Checklist profile (standars_control_<profile>.md, default: {DEFAULT_PROFILE})",
+    )
+    parser.add_argument(
+        "--profile-checks",
+        action="store_true",
+        help="Time every rule (wall time, XML nodes, peak RSS); results go to the report and a JSON file",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Single file: re-check only rules whose inputs changed since the previous run of this file "
+            "and report new/fixed issues (state in normocontrol_reports/.cache/incremental)"
+        ),
+    )
+    args = parser.parse_args(argv)
+
+    if args.incremental and args.no_cache:
+        parser.error("--incremental keeps its state in the cache and cannot be used with --no-cache")
+    if args.incremental and args.profile_checks:
+        parser.error("--incremental cannot be combined with --profile-checks (profiling runs every rule)")
+
     report_dir = repo_root / "normocontrol_reports"
 
+    target = Path(args.path) if args.path else None
+    if args.batch or (target is not None and target.is_dir()):
+        if args.incremental:
+            parser.error("--incremental is only supported for a single .docx file")
+        batch_dir = target or repo_root / "students"
+        if not batch_dir.is_dir():
+            print(f"ERROR: Directory not found: {batch_dir}")
+            return 1
+        return check_it_docx_batch(
+            find_batch_documents(batch_dir),
+            report_dir,
+            batch_dir,
+            jobs=args.jobs,
+            use_cache=not args.no_cache,
+            checklist=args.checklist,
+            profile_checks=args.profile_checks,
+        )
+
+    docx_path = target or default_docx
+
     if not docx_path.exists():
         print(f"ERROR: File not found: {docx_path}")
         return 1
@@ -699,7 +1689,14 @@ def main() -> int:
         print(f"ERROR: Expected .docx file: {docx_path}")
         return 1
 
-    return check_it_docx(docx_path, report_dir)
+    return check_it_docx(
+        docx_path,
+        report_dir,
+        use_cache=not args.no_cache,
+        checklist=args.checklist,
+        profile_checks=args.profile_checks,
+        incremental=args.incremental,
+    )
 
 
 if __name__ == "__main__":
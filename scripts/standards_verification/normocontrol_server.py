@@ -0,0 +1,488 @@
+"""Long-running normocontrol check service with warm worker processes.
+
+Starting Python and importing lxml and `tests.helpers` costs more than
+checking a typical explanatory note. The service pays it once: it keeps a
+process pool whose workers have imported the checker and loaded the compiled
+checklist (`_init_batch_worker`, as in batch mode) and answers over HTTP on a
+TCP port or a Unix socket, so a check costs only the check itself.
+
+Endpoints:
+- POST /check    .docx bytes as the body (`?name=` sets the document name),
+                 or JSON `{"path": "..."}` of a file under an allowed directory
+- GET  /stats    workers, queue depth, request counters and latency percentiles
+- GET  /health   liveness probe
+
+Check results are JSON: issues (fields as in the JSON report), summary,
+exit code, cache hit and timings (queue wait and check time in the worker).
+
+Usage:
+    python scripts/standards_verification/normocontrol_server.py serve --port 8765 --jobs 4
+    python scripts/standards_verification/normocontrol_server.py serve --socket /tmp/normocontrol.sock
+    python scripts/standards_verification/normocontrol_server.py check path/to/ПЗ.docx --url http://127.0.0.1:8765
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import http.client
+import json
+import os
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, urlsplit
+
+
+# The checker (lxml, tests.helpers) is imported lazily, by the server only,
+# so the `check` and `stats` client commands start as fast as the interpreter.
+# Importing check_it_docx puts the repository root on sys.path.
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_UPLOAD_BYTES = 64 * 1024 * 1024
+
+# Latencies kept for the percentiles in /stats.
+_LATENCY_WINDOW = 1024
+
+
+def _timed_check(docx_path: Path, doc_name: str) -> tuple[list, bool, float]:
+    """Worker task: check one document; return (issues, cache_hit, seconds spent in the worker)."""
+
+    from check_it_docx import _check_in_worker
+
+    start = time.perf_counter()
+    issues, hit, _ = _check_in_worker(docx_path, doc_name)
+    return issues, hit, time.perf_counter() - start
+
+
+def _warm_up() -> int:
+    """Worker task run once per worker at start-up (the initializer does the work)."""
+
+    time.sleep(0.05)  # keep this worker busy so the next warm-up task starts another one
+    return os.getpid()
+
+
+class LatencyStats:
+    """Request counters and a sliding window of request latencies."""
+
+    def __init__(self, window: int = _LATENCY_WINDOW) -> None:
+        self.requests = 0
+        self.failed = 0
+        self.cache_hits = 0
+        self._total_ms: deque[float] = deque(maxlen=window)
+        self._queue_ms: deque[float] = deque(maxlen=window)
+
+    def record(self, total_ms: float, queue_ms: float, hit: bool) -> None:
+        self.requests += 1
+        self.cache_hits += hit
+        self._total_ms.append(total_ms)
+        self._queue_ms.append(queue_ms)
+
+    def record_failure(self) -> None:
+        self.requests += 1
+        self.failed += 1
+
+    def to_dict(self) -> dict:
+        return {
+            "requests": self.requests,
+            "failed": self.failed,
+            "cache_hits": self.cache_hits,
+            "latency_ms": _percentiles(self._total_ms),
+            "queue_wait_ms": _percentiles(self._queue_ms),
+        }
+
+
+def _percentiles(values: deque[float]) -> dict:
+    """p50/p95/max/mean of a window (None when empty)."""
+
+    if not values:
+        return {"p50": None, "p95": None, "max": None, "mean": None}
+    ordered = sorted(values)
+
+    def at(share: float) -> float:
+        return round(ordered[min(len(ordered) - 1, int(share * len(ordered)))], 2)
+
+    return {"p50": at(0.5), "p95": at(0.95), "max": round(ordered[-1], 2), "mean": round(sum(ordered) / len(ordered), 2)}
+
+
+class CheckService:
+    """Warm process pool that checks documents for the HTTP handlers.
+
+    Uploads are spooled to a private temporary directory and removed after
+    the check. Paths are only accepted under `allowed_dirs`. A pool broken by
+    a crashed worker is replaced outside the lock (requests arriving meanwhile
+    wait for the new pool, /stats does not) and the check is retried once on
+    it, so one crashed worker does not take the service down.
+    """
+
+    def __init__(
+        self,
+        jobs: int | None = None,
+        checklist: str | None = None,
+        cache_dir: Path | None = None,
+        allowed_dirs: list[Path] | None = None,
+    ) -> None:
+        from check_it_docx import DEFAULT_PROFILE, _resolve_repo_root, load_profile
+
+        checklist = checklist or DEFAULT_PROFILE
+        self.jobs = max(1, jobs or os.cpu_count() or 1)
+        self.checklist = checklist
+        self.cache_dir = cache_dir
+        self.allowed_dirs = [path.resolve() for path in (allowed_dirs or [_resolve_repo_root()])]
+        self.stats = LatencyStats()
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._pool_ready = threading.Condition(self._lock)
+        self._restarting = False
+        self._in_flight = 0
+        self._spool = tempfile.TemporaryDirectory(prefix="normocontrol_uploads_")
+        # Compile the profile once here, so workers only read the serialized form.
+        load_profile(checklist)
+        self._pool = self._new_pool()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        from check_it_docx import _init_batch_worker
+
+        pool = ProcessPoolExecutor(
+            max_workers=self.jobs,
+            initializer=_init_batch_worker,
+            initargs=(self.checklist, self.cache_dir, False),
+        )
+        # Start every worker now instead of on the first requests.
+        for future in [pool.submit(_warm_up) for _ in range(self.jobs)]:
+            future.result()
+        return pool
+
+    def _current_pool(self) -> ProcessPoolExecutor:
+        """The pool to submit to, waiting while a broken one is being replaced."""
+
+        with self._pool_ready:
+            while self._restarting:
+                self._pool_ready.wait()
+            return self._pool
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Replace `broken` once, however many requests saw it fail."""
+
+        with self._pool_ready:
+            if self._pool is not broken or self._restarting:
+                return
+            self._restarting = True
+        broken.shutdown(wait=False, cancel_futures=True)
+        pool = None
+        try:
+            pool = self._new_pool()
+        finally:
+            with self._pool_ready:
+                if pool is not None:
+                    self._pool = pool
+                self._restarting = False
+                self._pool_ready.notify_all()
+
+    def _run_check(self, docx_path: Path, doc_name: str) -> tuple[list, bool, float]:
+        """Check on the pool; if the pool is broken, replace it and retry once."""
+
+        for retry in (False, True):
+            pool = self._current_pool()
+            try:
+                return pool.submit(_timed_check, docx_path, doc_name).result()
+            except BrokenProcessPool:
+                self._replace_pool(pool)
+                if retry:
+                    raise
+
+    def close(self) -> None:
+        self._pool.shutdown(cancel_futures=True)
+        self._spool.cleanup()
+
+    def resolve_path(self, path: str) -> Path:
+        """Return an allowed .docx path or raise ValueError."""
+
+        docx_path = Path(path).resolve()
+        if not any(docx_path.is_relative_to(directory) for directory in self.allowed_dirs):
+            raise ValueError(f"path is outside the allowed directories: {path}")
+        if docx_path.suffix.lower() != ".docx" or not docx_path.is_file():
+            raise ValueError(f"not a .docx file: {path}")
+        return docx_path
+
+    def check_path(self, docx_path: Path, doc_name: str | None = None) -> dict:
+        """Check a document on disk; return the JSON result."""
+
+        doc_name = doc_name or docx_path.name
+        start = time.perf_counter()
+        with self._lock:
+            self._in_flight += 1
+        try:
+            issues, hit, check_s = self._run_check(docx_path, doc_name)
+        except BrokenProcessPool:
+            with self._lock:
+                self.stats.record_failure()
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+        total_ms = (time.perf_counter() - start) * 1000
+        queue_ms = max(0.0, total_ms - check_s * 1000)
+        with self._lock:
+            self.stats.record(total_ms, queue_ms, hit)
+
+        errors = sum(1 for issue in issues if issue.severity == "error")
+        warnings = sum(1 for issue in issues if issue.severity == "warning")
+        return {
+            "document": doc_name,
+            "exit_code": 1 if errors else 0,
+            "summary": {"errors": errors, "warnings": warnings, "total": len(issues)},
+            "issues": [dataclasses.asdict(issue) for issue in issues],
+            "cached": hit,
+            "timing_ms": {"total": round(total_ms, 2), "check": round(check_s * 1000, 2), "queue": round(queue_ms, 2)},
+        }
+
+    def check_upload(self, data: bytes, doc_name: str) -> dict:
+        """Check uploaded .docx bytes; return the JSON result."""
+
+        fd, tmp_name = tempfile.mkstemp(suffix=".docx", dir=self._spool.name)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            return self.check_path(Path(tmp_name), doc_name)
+        finally:
+            os.unlink(tmp_name)
+
+    def to_dict(self) -> dict:
+        """Service state for /stats."""
+
+        with self._lock:
+            in_flight = self._in_flight
+            stats = self.stats.to_dict()
+        return {
+            "workers": self.jobs,
+            "checklist": self.checklist,
+            "in_flight": in_flight,
+            "running": min(in_flight, self.jobs),
+            "queue_depth": max(0, in_flight - self.jobs),
+            "uptime_s": round(time.time() - self.started, 1),
+            **stats,
+        }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """HTTP front end of `CheckService` (`self.server.service`)."""
+
+    server_version = "normocontrol/1"
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802 (http.server naming)
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif path == "/stats":
+            self._send_json(200, self.server.service.to_dict())
+        else:
+            self._send_json(404, {"error": f"unknown endpoint: {path}"})
+
+    def do_POST(self) -> None:  # noqa: N802 (http.server naming)
+        url = urlsplit(self.path)
+        if url.path != "/check":
+            self._send_json(404, {"error": f"unknown endpoint: {url.path}"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0:
+            self._send_json(400, {"error": "empty request body"})
+            return
+        if length > MAX_UPLOAD_BYTES:
+            self._send_json(413, {"error": f"document is larger than {MAX_UPLOAD_BYTES // 2**20} MB"})
+            return
+        body = self.rfile.read(length)
+
+        service: CheckService = self.server.service
+        name = parse_qs(url.query).get("name", [""])[0]
+        try:
+            if self.headers.get_content_type() == "application/json":
+                request = json.loads(body)
+                docx_path = service.resolve_path(str(request["path"]))
+                result = service.check_path(docx_path, name or request.get("name"))
+            else:
+                result = service.check_upload(body, name or "document.docx")
+        except (ValueError, KeyError, TypeError) as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        except BrokenProcessPool:
+            self._send_json(500, {"error": "worker process crashed, the pool was restarted"})
+            return
+        self._send_json(200, result)
+
+    def address_string(self) -> str:
+        # Unix socket peers have no address.
+        return self.client_address[0] if self.client_address else "unix"
+
+    def log_message(self, format: str, *args) -> None:  # noqa: A002 (http.server signature)
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def server_bind(self) -> None:
+        socketserver.UnixStreamServer.server_bind(self)
+        self.server_name, self.server_port = "localhost", 0
+
+
+def make_server(
+    service: CheckService,
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    socket_path: Path | None = None,
+    verbose: bool = False,
+) -> socketserver.BaseServer:
+    """Create a threaded HTTP server (TCP, or a Unix socket if `socket_path` is set)."""
+
+    if socket_path is not None:
+        socket_path.unlink(missing_ok=True)
+        server = _UnixHTTPServer(str(socket_path), _Handler)
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+# Client -----------------------------------------------------------------
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, socket_path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def request(
+    method: str,
+    path: str,
+    body: bytes | None = None,
+    content_type: str = "application/octet-stream",
+    url: str | None = None,
+    socket_path: Path | None = None,
+    timeout: float = 300.0,
+) -> tuple[int, dict]:
+    """Send one request to a running server; return (HTTP status, JSON payload)."""
+
+    if socket_path is not None:
+        connection: http.client.HTTPConnection = _UnixHTTPConnection(str(socket_path), timeout)
+    else:
+        parts = urlsplit(url or f"http://{DEFAULT_HOST}:{DEFAULT_PORT}")
+        connection = http.client.HTTPConnection(parts.hostname, parts.port, timeout=timeout)
+    try:
+        headers = {"Content-Type": content_type} if body is not None else {}
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, json.loads(response.read() or b"{}")
+    finally:
+        connection.close()
+
+
+def check_remote(docx_path: Path, url: str | None = None, socket_path: Path | None = None,
+                 upload: bool = True) -> tuple[int, dict]:
+    """Check a document on a running server (uploading it, or by path on a shared disk)."""
+
+    if upload:
+        return request("POST", f"/check?name={quote(docx_path.name)}", docx_path.read_bytes(),
+                       url=url, socket_path=socket_path)
+    body = json.dumps({"path": str(docx_path.resolve())}).encode("utf-8")
+    return request("POST", "/check", body, "application/json", url=url, socket_path=socket_path)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI entrypoint."""
+
+    parser = argparse.ArgumentParser(description="Normocontrol check server with warm worker processes")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve = commands.add_parser("serve", help="Run the server")
+    serve.add_argument("--host", default=DEFAULT_HOST)
+    serve.add_argument("--port", type=int, default=DEFAULT_PORT)
+    serve.add_argument("--socket", type=Path, default=None, help="Listen on a Unix socket instead of TCP")
+    serve.add_argument("--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+    serve.add_argument("--checklist", default=None, help="Checklist profile (default: it_short)")
+    serve.add_argument("--no-cache", action="store_true", help="Do not reuse or store results in normocontrol_reports/.cache")
+    serve.add_argument(
+        "--allow-dir",
+        type=Path,
+        action="append",
+        default=None,
+        help="Directory whose files may be checked by path (repeatable, default: repository root)",
+    )
+    serve.add_argument("--verbose", action="store_true", help="Log every request")
+
+    check = commands.add_parser("check", help="Check a document on a running server")
+    check.add_argument("path", type=Path)
+    check.add_argument("--url", default=None, help=f"Server URL (default: http://{DEFAULT_HOST}:{DEFAULT_PORT})")
+    check.add_argument("--socket", type=Path, default=None, help="Unix socket of the server")
+    check.add_argument("--by-path", action="store_true", help="Send the path instead of uploading the file")
+
+    stats = commands.add_parser("stats", help="Print statistics of a running server")
+    stats.add_argument("--url", default=None)
+    stats.add_argument("--socket", type=Path, default=None)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "check":
+        status, result = check_remote(args.path, args.url, args.socket, upload=not args.by_path)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        if status != 200:
+            return 2
+        return int(result["exit_code"])
+
+    if args.command == "stats":
+        status, result = request("GET", "/stats", url=args.url, socket_path=args.socket)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+        return 0 if status == 200 else 2
+
+    from check_it_docx import _cache_dir, _resolve_repo_root, available_profiles
+
+    if args.checklist is not None and args.checklist not in available_profiles():
+        parser.error(f"unknown checklist {args.checklist!r} (available: {', '.join(available_profiles())})")
+    cache_dir = None if args.no_cache else _cache_dir(_resolve_repo_root() / "normocontrol_reports")
+    service = CheckService(args.jobs, args.checklist, cache_dir, args.allow_dir)
+    server = make_server(service, args.host, args.port, args.socket, args.verbose)
+    where = args.socket or f"http://{args.host}:{server.server_address[1]}"
+    print(f"Normocontrol server: {where} ({service.jobs} worker(s), checklist {service.checklist})")
+    # Service managers stop with SIGTERM: shut down like on Ctrl+C.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if args.socket is not None:
+            args.socket.unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
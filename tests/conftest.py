@@ -1,17 +1,30 @@
 """
 Pytest configuration and fixtures for normocontrol tests.
 """
+import sys
+
 import pytest
 from pathlib import Path
+from tests.helpers.check_profiler import CheckProfiler
+from tests.helpers.parsed_docs import ParsedDocumentCache
 from tests.helpers.report import NormocontrolReport
 
 
 # Path to test documents
 TESTS_DIR = Path(__file__).parent
+REPO_ROOT = TESTS_DIR.parent
+
+# The scripts are run as `python <dir>/<script>.py` and import their siblings,
+# so tests import them the same way.
+for _scripts_dir in (".github/scripts", "scripts", "scripts/standards_verification"):
+    sys.path.insert(0, str(REPO_ROOT / _scripts_dir))
 
 # Global report instance
 _report = None
 
+# Per-rule timings (only with --profile-checks)
+_profiler = None
+
 
 def pytest_addoption(parser):
     """Add custom command-line options."""
@@ -33,32 +46,58 @@ def pytest_addoption(parser):
         action="store_true",
         help="Collect issues without failing tests (generate report only)"
     )
+    parser.addoption(
+        "--profile-checks",
+        action="store_true",
+        help="Time every normocontrol rule per document (wall time, XML nodes, peak RSS)"
+    )
+    parser.addoption(
+        "--checker-benchmark",
+        action="store_true",
+        help="Benchmark check_it_docx on a synthetic corpus and compare with the recorded baseline"
+    )
+    parser.addoption(
+        "--checker-benchmark-pages",
+        action="store",
+        default="10,100,500",
+        help="Comma-separated sizes (in pages) of the benchmark documents"
+    )
+    parser.addoption(
+        "--update-checker-baseline",
+        action="store_true",
+        help="Record the benchmark run as the new baseline instead of comparing"
+    )
 
 
 def pytest_configure(config):
     """Initialize the report before tests run."""
-    global _report
+    global _report, _profiler
     _report = NormocontrolReport()
+    _profiler = CheckProfiler() if config.getoption("--profile-checks") else None
 
 
 def pytest_sessionfinish(session, exitstatus):
     """Generate reports after all tests complete."""
     global _report
     
+    # Get configuration
+    report_format = session.config.getoption("--report-format")
+    report_dir = Path(session.config.getoption("--report-dir"))
+    
+    # Generate timestamp-based filename
+    from datetime import datetime
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    
     if _report and len(_report.issues) > 0:
-        # Get configuration
-        report_format = session.config.getoption("--report-format")
-        report_dir = Path(session.config.getoption("--report-dir"))
         report_dir.mkdir(exist_ok=True)
         
-        # Generate timestamp-based filename
-        from datetime import datetime
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
         # Generate reports
         if report_format in ["markdown", "all"]:
             md_path = report_dir / f"normocontrol_report_{timestamp}.md"
             _report.to_markdown(md_path)
+            if _profiler:
+                with open(md_path, "a", encoding="utf-8") as f:
+                    f.write("\n\n" + _profiler.to_markdown())
             print(f"\n✓ Markdown report: {md_path}")
         
         if report_format in ["json", "all"]:
@@ -81,6 +120,12 @@ def pytest_sessionfinish(session, exitstatus):
         print(f"    ⚠️  Предупреждения: {summary['warnings']}")
         print(f"    ℹ️  Информация: {summary['info']}")
         print(f"{'='*60}\n")
+    
+    if _profiler:
+        report_dir.mkdir(exist_ok=True)
+        profile_path = report_dir / f"normocontrol_profile_{timestamp}.json"
+        _profiler.to_json(profile_path)
+        print(f"✓ Profile: {profile_path}")
 
 
 @pytest.fixture
@@ -90,6 +135,12 @@ def normocontrol_report():
     return _report
 
 
+@pytest.fixture
+def check_profiler():
+    """Session profiler of normocontrol rules (None unless --profile-checks)."""
+    return _profiler
+
+
 @pytest.fixture
 def collect_only(request):
     """Check if we're in collect-only mode."""
@@ -132,3 +183,17 @@ def all_test_docs():
 def any_docx(request):
     """Parametrized fixture that runs test on each document."""
     return TESTS_DIR / request.param
+
+
+@pytest.fixture(scope="session")
+def parsed_docs():
+    """Session-wide cache of parsed documents (shared, read-only)."""
+    cache = ParsedDocumentCache()
+    yield cache
+    cache.clear()
+
+
+@pytest.fixture
+def parsed_docx(any_docx, parsed_docs):
+    """Parsed form of `any_docx` (XML trees, python-docx Document, texts)."""
+    return parsed_docs.get(any_docx)
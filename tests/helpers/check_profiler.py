@@ -0,0 +1,239 @@
+"""
+Opt-in per-rule profiling of normocontrol checks.
+
+Every rule (check visitor or `_check_*` helper) gets one RuleTiming per
+document: wall time spent in its callbacks, the number of XML nodes
+(paragraphs, runs, sections) it was handed and the process peak RSS when it
+finished. ru_maxrss is a high-water mark, so a rule "owns" the memory peak
+if the value jumps at that rule. Profiles are exported as a JSON side file
+and as a markdown section with an aggregate table across documents.
+"""
+import json
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from lxml import etree
+
+from tests.helpers.ooxml_stream import DocumentVisitor
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# Rule name for the work done outside the rules (XML parsing, index, setup).
+STREAM_RULE = "(разбор XML)"
+
+
+def peak_rss_kb() -> Optional[int]:
+    """Peak resident set size of this process in KiB (None if unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+@dataclass
+class RuleTiming:
+    """Cost of one rule on one document."""
+    document: str
+    rule: str
+    wall_s: float = 0.0
+    nodes: int = 0
+    peak_rss_kb: Optional[int] = None
+
+
+class ProfiledVisitor(DocumentVisitor):
+    """Wraps a visitor and charges the time of its callbacks to a RuleTiming."""
+
+    def __init__(self, visitor: DocumentVisitor, timing: RuleTiming):
+        self.visitor = visitor
+        self.timing = timing
+
+    def on_paragraph(self, paragraph: etree._Element, index: int, text: Optional[str]) -> None:
+        start = time.perf_counter()
+        self.visitor.on_paragraph(paragraph, index, text)
+        self.timing.wall_s += time.perf_counter() - start
+        self.timing.nodes += 1
+
+    def on_run(self, run: etree._Element, index: int) -> None:
+        start = time.perf_counter()
+        self.visitor.on_run(run, index)
+        self.timing.wall_s += time.perf_counter() - start
+        self.timing.nodes += 1
+
+    def on_section(self, sect_pr: etree._Element) -> None:
+        start = time.perf_counter()
+        self.visitor.on_section(sect_pr)
+        self.timing.wall_s += time.perf_counter() - start
+        self.timing.nodes += 1
+
+    def on_block(self, block: etree._Element, index: int) -> None:
+        start = time.perf_counter()
+        self.visitor.on_block(block, index)
+        self.timing.wall_s += time.perf_counter() - start
+
+    def end(self) -> None:
+        start = time.perf_counter()
+        self.visitor.end()
+        self.timing.wall_s += time.perf_counter() - start
+        self.timing.peak_rss_kb = peak_rss_kb()
+
+
+def rule_name(visitor: Any) -> str:
+    """Readable rule name of a visitor (`_FontCheck` -> `FontCheck`)."""
+    return type(visitor).__name__.lstrip("_")
+
+
+class CheckProfiler:
+    """
+    Collects RuleTiming records of one or more documents.
+
+    Usage:
+        profiler = CheckProfiler()
+        with profiler.document("ПЗ.docx") as wrap:
+            stream_document(path, wrap(visitors))
+        profiler.to_json(path); profiler.to_markdown()
+    """
+
+    def __init__(self):
+        self.timings: List[RuleTiming] = []
+
+    def __len__(self) -> int:
+        return len(self.timings)
+
+    @contextmanager
+    def measure(self, document: str, rule: str) -> Iterator[RuleTiming]:
+        """Time a block of code as one rule on one document."""
+        timing = RuleTiming(document, rule)
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.wall_s += time.perf_counter() - start
+            timing.peak_rss_kb = peak_rss_kb()
+            self.timings.append(timing)
+
+    @contextmanager
+    def document(self, document: str):
+        """
+        Profile all rules of one document.
+
+        Yields a function that wraps visitors in ProfiledVisitor; time of the
+        block not spent inside the rules is recorded as STREAM_RULE.
+        """
+        rules: List[RuleTiming] = []
+
+        def wrap(visitors: Iterable[DocumentVisitor]) -> List[DocumentVisitor]:
+            wrapped = []
+            for visitor in visitors:
+                timing = RuleTiming(document, rule_name(visitor))
+                rules.append(timing)
+                wrapped.append(ProfiledVisitor(visitor, timing))
+            return wrapped
+
+        with self.measure(document, STREAM_RULE) as total:
+            yield wrap
+        # The whole block was measured; keep only the part outside the rules.
+        total.wall_s = max(0.0, total.wall_s - sum(timing.wall_s for timing in rules))
+        total.nodes = max((timing.nodes for timing in rules), default=0)
+        self.timings.extend(rules)
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Add records produced by to_records() (e.g. returned from a worker)."""
+        self.timings.extend(RuleTiming(**record) for record in records)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        return [asdict(timing) for timing in self.timings]
+
+    def aggregate(self) -> List[Dict[str, Any]]:
+        """
+        Per-rule totals across documents, slowest rule first.
+
+        Returns:
+            Dicts with rule, documents, total_s, mean_s, max_s,
+            slowest_document, nodes and peak_rss_kb
+        """
+        rules: Dict[str, Dict[str, Any]] = {}
+        for timing in self.timings:
+            row = rules.setdefault(timing.rule, {
+                "rule": timing.rule,
+                "documents": 0,
+                "total_s": 0.0,
+                "max_s": 0.0,
+                "slowest_document": None,
+                "nodes": 0,
+                "peak_rss_kb": None,
+            })
+            row["documents"] += 1
+            row["total_s"] += timing.wall_s
+            row["nodes"] += timing.nodes
+            if row["slowest_document"] is None or timing.wall_s > row["max_s"]:
+                row["max_s"] = timing.wall_s
+                row["slowest_document"] = timing.document
+            if timing.peak_rss_kb is not None:
+                row["peak_rss_kb"] = max(row["peak_rss_kb"] or 0, timing.peak_rss_kb)
+
+        for row in rules.values():
+            row["mean_s"] = row["total_s"] / row["documents"]
+        return sorted(rules.values(), key=lambda row: row["total_s"], reverse=True)
+
+    def by_document(self) -> Dict[str, List[RuleTiming]]:
+        """Timings grouped by document (in first-seen order)."""
+        documents: Dict[str, List[RuleTiming]] = {}
+        for timing in self.timings:
+            documents.setdefault(timing.document, []).append(timing)
+        return documents
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"rules": self.aggregate(), "timings": self.to_records()}
+
+    def to_json(self, filepath: Path) -> None:
+        """Write the profile as a JSON side file."""
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def from_json(cls, filepath: Path) -> "CheckProfiler":
+        """Load a profile written by to_json() (e.g. to combine several runs)."""
+        profiler = cls()
+        with open(filepath, encoding="utf-8") as f:
+            profiler.extend(json.load(f).get("timings", []))
+        return profiler
+
+    def to_markdown(self) -> str:
+        """Markdown section: aggregate table per rule and totals per document."""
+        lines = ["## Профиль проверок\n"]
+        lines.append("| Правило | Документов | Всего, мс | Среднее, мс | Максимум, мс | Узлов XML | Пик RSS, МБ |")
+        lines.append("| --- | ---: | ---: | ---: | ---: | ---: | ---: |")
+        for row in self.aggregate():
+            lines.append(
+                f"| {row['rule']} | {row['documents']} | {row['total_s'] * 1000:.1f} | "
+                f"{row['mean_s'] * 1000:.1f} | {row['max_s'] * 1000:.1f} | {row['nodes']} | "
+                f"{_format_rss(row['peak_rss_kb'])} |"
+            )
+
+        lines.append("")
+        lines.append("| Документ | Всего, мс | Самое медленное правило | Пик RSS, МБ |")
+        lines.append("| --- | ---: | --- | ---: |")
+        for document, timings in self.by_document().items():
+            total = sum(timing.wall_s for timing in timings)
+            rules = [timing for timing in timings if timing.rule != STREAM_RULE] or timings
+            slowest = max(rules, key=lambda timing: timing.wall_s)
+            peak = max((timing.peak_rss_kb for timing in timings if timing.peak_rss_kb is not None), default=None)
+            lines.append(
+                f"| `{document}` | {total * 1000:.1f} | {slowest.rule} ({slowest.wall_s * 1000:.1f} мс) | "
+                f"{_format_rss(peak)} |"
+            )
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _format_rss(kb: Optional[int]) -> str:
+    return f"{kb / 1024:.1f}" if kb is not None else "—"
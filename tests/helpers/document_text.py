@@ -0,0 +1,188 @@
+"""
+Body text of a document, built once and shared by the text rules.
+
+Structure, reference and caption rules all look at the same thing: the texts
+of body-level paragraphs (what python-docx lists as `Document.paragraphs`).
+DocumentText keeps them as a list with cumulative offsets into the joined
+text, so a match anywhere in `text` maps back to its paragraph with a binary
+search. TextMatcher compiles every pattern the rules need (section titles,
+citations, caption prefixes...) into one alternation, and DocumentText runs
+it over the text in a single linear scan, caching the hits per matcher.
+"""
+import bisect
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from lxml import etree
+
+from tests.helpers.ooxml_stream import DocumentVisitor
+from tests.helpers.ooxml_utils import NS, DocumentIndex, get_paragraph_text
+
+
+BODY = f"{{{NS['w']}}}body"
+
+
+class TextMatcher:
+    """
+    Several named patterns matched in one pass (case-insensitive).
+
+    Literals are escaped and tried longest first, so like Aho-Corasick with
+    leftmost-longest semantics the scan reports non-overlapping matches; a
+    literal contained in another one is not reported inside it. Equal
+    literals under different names share one alternative and are reported
+    under every name.
+
+    The alternation is guarded by a lookahead on the possible first
+    characters, so the engine skips most positions without trying every
+    alternative. These characters cannot be derived from regex patterns;
+    pass them as `pattern_starts`, otherwise the guard is not used.
+
+    Usage:
+        matcher = TextMatcher(literals={"intro": "Введение"},
+                              patterns={"citation": r"\\[(\\d+)\\]"}, pattern_starts="[")
+        for name, match in matcher.finditer(text): ...
+    """
+
+    def __init__(self, literals: Optional[Mapping[str, str]] = None,
+                 patterns: Optional[Mapping[str, str]] = None,
+                 pattern_starts: Optional[str] = None):
+        self.names: Dict[str, Tuple[str, ...]] = {}  # group -> pattern names
+        self.groups: Dict[str, Optional[int]] = {}  # pattern name -> index of its first inner group
+
+        by_literal: Dict[str, List[str]] = {}
+        for name, literal in (literals or {}).items():
+            by_literal.setdefault(literal.lower(), []).append(name)
+
+        alternatives: List[str] = []
+        for i, (literal, names) in enumerate(sorted(by_literal.items(), key=lambda item: -len(item[0]))):
+            group = f"l{i}"
+            alternatives.append(f"(?P<{group}>{re.escape(literal)})")
+            self.names[group] = tuple(names)
+            for name in names:
+                self.groups[name] = None
+
+        group_count = len(alternatives)
+        for i, (name, pattern) in enumerate((patterns or {}).items()):
+            group = f"p{i}"
+            alternatives.append(f"(?P<{group}>{pattern})")
+            self.names[group] = (name,)
+            # Inner groups of the pattern follow its own group.
+            inner = re.compile(pattern).groups
+            self.groups[name] = group_count + 2 if inner else None
+            group_count += 1 + inner
+
+        regex = "|".join(alternatives) or r"(?!)"
+        if by_literal and (pattern_starts is not None or not patterns):
+            starts = {literal[0] for literal in by_literal if literal} | set(pattern_starts or "")
+            starts |= {ch.upper() for ch in starts}
+            regex = f"(?=[{''.join(re.escape(ch) for ch in sorted(starts))}])(?:{regex})"
+        self.regex = re.compile(regex, re.IGNORECASE)
+
+    def finditer(self, text: str) -> Iterable[Tuple[str, "re.Match"]]:
+        """Yield (pattern name, match) for every match in text."""
+        for match in self.regex.finditer(text):
+            for name in self.names[match.lastgroup]:
+                yield name, match
+
+    def value(self, name: str, match: "re.Match") -> str:
+        """First inner group of a pattern's match (the whole match for literals)."""
+        group = self.groups.get(name)
+        return match.group(group) if group is not None else match.group(0)
+
+
+class DocumentText(DocumentVisitor):
+    """
+    Texts of body-level paragraphs with offsets into the joined text.
+
+    Paragraph number i (0-based) is the i-th body-level paragraph;
+    `positions[i]` is its position among all w:p (the numbering used by
+    DocumentIndex). Can be filled while streaming (it is a DocumentVisitor)
+    or from a parsed tree with build().
+
+    Usage:
+        text = DocumentText.build(doc_xml)
+        for name, i, match in text.hits(matcher): ...
+    """
+
+    def __init__(self, index: Optional[DocumentIndex] = None):
+        self.index = index
+        self.paragraphs: List[str] = []
+        self.positions: List[int] = []
+        self.offsets: List[int] = []  # start of paragraph i in `text`
+        self._length = 0
+        self._text: Optional[str] = None
+        self._hits: Dict[TextMatcher, List[Tuple[str, int, "re.Match"]]] = {}
+
+    @classmethod
+    def build(cls, doc_xml: etree._Element,
+              index: Optional[DocumentIndex] = None) -> "DocumentText":
+        """Collect body-level paragraph texts of a parsed document.xml."""
+        text = cls(index)
+        for position, paragraph in enumerate(doc_xml.iter(f"{{{NS['w']}}}p")):
+            parent = paragraph.getparent()
+            if parent is not None and parent.tag == BODY:
+                text.add(position, get_paragraph_text(paragraph))
+        return text
+
+    def __len__(self) -> int:
+        return len(self.paragraphs)
+
+    def on_paragraph(self, paragraph: etree._Element, index: int, text: Optional[str]) -> None:
+        if text is not None:
+            self.add(index, text)
+
+    def add(self, position: int, text: str) -> None:
+        """Append the next body-level paragraph (in document order)."""
+        self.paragraphs.append(text)
+        self.positions.append(position)
+        self.offsets.append(self._length)
+        self._length += len(text) + 1
+        self._text = None
+        self._hits.clear()
+
+    @property
+    def text(self) -> str:
+        """Paragraph texts joined with newlines."""
+        if self._text is None:
+            self._text = "\n".join(self.paragraphs)
+        return self._text
+
+    def paragraph_at(self, offset: int) -> int:
+        """Paragraph number containing an offset of `text`."""
+        return bisect.bisect_right(self.offsets, offset) - 1
+
+    def at_paragraph_start(self, i: int, offset: int) -> bool:
+        """True if only whitespace precedes offset in paragraph i."""
+        start = self.offsets[i]
+        return not self.paragraphs[i][:offset - start].strip()
+
+    def hits(self, matcher: TextMatcher) -> List[Tuple[str, int, "re.Match"]]:
+        """
+        All matches of a matcher as (pattern name, paragraph number, match),
+        in text order. The text is scanned once per matcher.
+        """
+        hits = self._hits.get(matcher)
+        if hits is None:
+            hits = [
+                (name, self.paragraph_at(match.start()), match)
+                for name, match in matcher.finditer(self.text)
+            ]
+            self._hits[matcher] = hits
+        return hits
+
+    def headings(self) -> List[Tuple[int, int, str]]:
+        """Heading table: (paragraph number, level, title) of body-level headings."""
+        if self.index is None:
+            return []
+        table = []
+        for position, (level, title) in zip(self.index.heading_positions, self.index.headings):
+            i = bisect.bisect_left(self.positions, position)
+            if i < len(self.positions) and self.positions[i] == position:
+                table.append((i, level, title))
+        return table
+
+    def describe(self, i: int) -> str:
+        """Location of paragraph i for reports (see DocumentIndex.describe)."""
+        if self.index is None:
+            return f"Параграф {self.positions[i] + 1}"
+        return self.index.describe(self.positions[i])
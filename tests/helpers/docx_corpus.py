@@ -0,0 +1,289 @@
+"""
+Synthetic explanatory notes for benchmarking the normocontrol checker.
+
+generate_explanatory_note() writes a deterministic .docx of a given nominal
+size (in pages) with the parts a real explanatory note has: title page,
+abstract, introduction, numbered chapters with subsections, tables and
+figures with captions, bracketed citations, conclusion, list of sources and
+an appendix. Page setup, fonts and spacing follow the IT short checklist, so
+the checker does its usual amount of work on every paragraph and run.
+
+A "page" is a fixed amount of content (PARAGRAPHS_PER_PAGE paragraphs of
+WORDS_PER_PARAGRAPH words, about one A4 page of 14 pt text), not a rendered
+page. Files are named after their spec and GENERATOR_VERSION, so
+ensure_corpus() only generates what is missing.
+"""
+import random
+import struct
+import zlib
+from dataclasses import dataclass
+from io import BytesIO
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from docx import Document
+from docx.enum.section import WD_SECTION
+from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Cm, Mm, Pt
+
+
+# Bump when the generated content changes, so cached corpora are rebuilt.
+GENERATOR_VERSION = 1
+
+PARAGRAPHS_PER_PAGE = 4
+WORDS_PER_PARAGRAPH = 70
+
+_WORDS = (
+    "система модуль данные запрос сервер клиент интерфейс архитектура база "
+    "схема поле значение функция метод класс объект алгоритм обработка "
+    "результат проверка требование пользователь приложение компонент сервис "
+    "модель представление контроллер маршрут ответ ошибка журнал конфигурация "
+    "развёртывание тестирование производительность безопасность доступ роль "
+    "документ формат хранение индекс кэш очередь событие поток задача отчёт"
+).split()
+
+_CHAPTERS = (
+    "Анализ предметной области",
+    "Проектирование системы",
+    "Реализация программного средства",
+    "Тестирование и оценка результатов",
+    "Развёртывание и сопровождение",
+    "Технико-экономическое обоснование",
+)
+
+
+@dataclass(frozen=True)
+class CorpusSpec:
+    """
+    Size and content of one synthetic explanatory note.
+
+    Counts left as None are derived from `pages`: a chapter per 10 pages
+    (2 to 6), a table and a figure every `pages_per_table` and
+    `pages_per_figure` pages, a source per 2 pages (5 to 60).
+    """
+    pages: int
+    seed: int = 0
+    chapters: Optional[int] = None
+    pages_per_table: int = 4
+    pages_per_figure: int = 5
+    sources: Optional[int] = None
+
+    @property
+    def chapter_count(self) -> int:
+        return self.chapters or min(len(_CHAPTERS), max(2, self.pages // 10))
+
+    @property
+    def source_count(self) -> int:
+        return self.sources or min(60, max(5, self.pages // 2))
+
+    @property
+    def filename(self) -> str:
+        parts = [f"note_{self.pages:03d}p", f"s{self.seed}", f"v{GENERATOR_VERSION}"]
+        if self.chapters is not None:
+            parts.append(f"c{self.chapters}")
+        if (self.pages_per_table, self.pages_per_figure) != (4, 5):
+            parts.append(f"t{self.pages_per_table}f{self.pages_per_figure}")
+        if self.sources is not None:
+            parts.append(f"r{self.sources}")
+        return "_".join(parts) + ".docx"
+
+
+def _png(width: int = 64, height: int = 48) -> bytes:
+    """A small grey PNG (no imaging library needed)."""
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        body = kind + data
+        return struct.pack(">I", len(data)) + body + struct.pack(">I", zlib.crc32(body) & 0xFFFFFFFF)
+
+    rows = b"".join(b"\x00" + bytes([0xC0]) * width for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _add_page_number_field(paragraph) -> None:
+    """Append a PAGE field to a header/footer paragraph."""
+    run = paragraph.add_run()
+    for kind, text in (("begin", None), (None, " PAGE "), ("separate", None), (None, "1"), ("end", None)):
+        if kind is not None:
+            element = OxmlElement("w:fldChar")
+            element.set(qn("w:fldCharType"), kind)
+        elif text.strip() == "PAGE":
+            element = OxmlElement("w:instrText")
+            element.set(qn("xml:space"), "preserve")
+            element.text = text
+        else:
+            element = OxmlElement("w:t")
+            element.text = text
+        run._r.append(element)
+
+
+class _NoteWriter:
+    """Fills a python-docx Document with the parts of an explanatory note."""
+
+    def __init__(self, spec: CorpusSpec):
+        self.spec = spec
+        self.random = random.Random(spec.seed)
+        self.doc = Document()
+        self.image = _png()
+        self.tables = 0
+        self.figures = 0
+        # Content written so far (in pages) and where the next table/figure goes.
+        self._pages = 0.0
+        self._next_table = spec.pages_per_table / 2
+        self._next_figure = spec.pages_per_figure / 2
+        self._setup()
+
+    def _setup(self) -> None:
+        section = self.doc.sections[0]
+        section.page_width, section.page_height = Mm(210), Mm(297)
+        section.left_margin, section.right_margin = Mm(23), Mm(10)
+        section.top_margin, section.bottom_margin = Mm(20), Mm(15)
+
+        normal = self.doc.styles["Normal"]
+        normal.font.name = "Times New Roman"
+        normal.font.size = Pt(14)
+        normal.paragraph_format.first_line_indent = Cm(1.25)
+        normal.paragraph_format.line_spacing = 1.0
+        normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+        for level in (1, 2):
+            heading = self.doc.styles[f"Heading {level}"]
+            heading.font.name = "Times New Roman"
+            heading.font.size = Pt(14)
+
+    def sentence(self, words: int) -> str:
+        text = " ".join(self.random.choice(_WORDS) for _ in range(words))
+        return text[0].upper() + text[1:] + "."
+
+    def paragraph(self) -> None:
+        """One paragraph of body text, with a citation now and then."""
+        sentences = []
+        left = WORDS_PER_PARAGRAPH
+        while left > 0:
+            words = min(left, self.random.randint(8, 16))
+            sentences.append(self.sentence(words))
+            left -= words
+        if self.random.random() < 0.5:
+            sentences[-1] = sentences[-1][:-1] + f" [{self.random.randint(1, self.spec.source_count)}]."
+        p = self.doc.add_paragraph()
+        # Several runs per paragraph, as in documents edited in Word.
+        for i in range(0, len(sentences), 2):
+            p.add_run(" ".join(sentences[i:i + 2]) + " ")
+
+    def table(self) -> None:
+        self.tables += 1
+        caption = self.doc.add_paragraph(f"Таблица {self.tables} – {self.sentence(4)[:-1]}")
+        rows, cols = self.random.randint(3, 6), self.random.randint(3, 5)
+        table = self.doc.add_table(rows=rows, cols=cols)
+        table.style = "Table Grid"
+        for r in range(rows):
+            for c in range(cols):
+                cell = table.cell(r, c)
+                cell.text = self.random.choice(_WORDS) if r == 0 else str(self.random.randint(1, 999))
+                for run in cell.paragraphs[0].runs:
+                    run.font.size = Pt(12)
+
+    def figure(self) -> None:
+        self.figures += 1
+        picture = self.doc.add_paragraph()
+        picture.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        picture.add_run().add_picture(BytesIO(self.image), width=Cm(8))
+        caption = self.doc.add_paragraph(f"Рисунок {self.figures} – {self.sentence(4)[:-1]}")
+        caption.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    def heading(self, text: str, level: int = 1, new_page: bool = True) -> None:
+        if new_page and self.doc.paragraphs:
+            self.doc.paragraphs[-1].add_run().add_break(WD_BREAK.PAGE)
+        self.doc.add_heading(text, level=level)
+
+    def body(self, pages: float) -> None:
+        """Body text of about `pages` pages with tables and figures spread over it."""
+        for _ in range(max(1, round(pages * PARAGRAPHS_PER_PAGE))):
+            self.paragraph()
+            self._pages += 1 / PARAGRAPHS_PER_PAGE
+            if self._pages >= self._next_table:
+                self.table()
+                self._next_table += self.spec.pages_per_table
+            if self._pages >= self._next_figure:
+                self.figure()
+                self._next_figure += self.spec.pages_per_figure
+
+    def write(self) -> Document:
+        spec = self.spec
+
+        for line in ("Министерство образования Республики Беларусь",
+                     "Брестский государственный технический университет",
+                     "ПОЯСНИТЕЛЬНАЯ ЗАПИСКА",
+                     "к курсовому проекту",
+                     "Брест 2026"):
+            self.doc.add_paragraph(line).alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+        # The title page is a section without a header; the rest of the
+        # document is numbered in the header on the right (as in the checklist).
+        section = self.doc.add_section(WD_SECTION.NEW_PAGE)
+        section.header.is_linked_to_previous = False
+        header = section.header.paragraphs[0]
+        header.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+        _add_page_number_field(header)
+
+        self.heading("Реферат", new_page=False)
+        self.doc.add_paragraph(self.sentence(60))
+        self.heading("Оглавление")
+        chapters = _CHAPTERS[:spec.chapter_count]
+        for number, title in enumerate(chapters, 1):
+            self.doc.add_paragraph(f"{number} {title}")
+
+        # Introduction and conclusion take a page each, the rest is split
+        # between the chapters (two subsections each).
+        chapter_pages = max(1, spec.pages - 4) / len(chapters)
+        self.heading("Введение")
+        self.body(1)
+        for number, title in enumerate(chapters, 1):
+            self.heading(f"{number} {title}")
+            for sub in (1, 2):
+                self.heading(f"{number}.{sub} {self.sentence(3)[:-1]}", level=2, new_page=False)
+                self.body(chapter_pages / 2)
+        self.heading("Заключение")
+        self.body(1)
+
+        self.heading("Список использованных источников")
+        for number in range(1, spec.source_count + 1):
+            self.doc.add_paragraph(
+                f"{number} {self.sentence(2)[:-1]}, А. Б. {self.sentence(5)[:-1]} / "
+                f"А. Б. Автор. – Минск : Издательство, {2010 + number % 15}. – {100 + number} с."
+            )
+
+        self.heading("Приложение А")
+        self.doc.add_paragraph(self.sentence(30))
+        return self.doc
+
+
+def generate_explanatory_note(path: Path, spec: CorpusSpec) -> Path:
+    """Write a synthetic explanatory note for spec to path."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _NoteWriter(spec).write().save(path)
+    return path
+
+
+def ensure_corpus(directory: Path, specs: Iterable[CorpusSpec]) -> List[Path]:
+    """
+    Paths of the corpus documents in directory, generating missing ones.
+
+    Returns:
+        One path per spec, in the given order
+    """
+    directory = Path(directory)
+    paths = []
+    for spec in specs:
+        path = directory / spec.filename
+        if not path.exists():
+            tmp_path = path.with_suffix(".tmp")
+            generate_explanatory_note(tmp_path, spec)
+            tmp_path.replace(path)
+        paths.append(path)
+    return paths
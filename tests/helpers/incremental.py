@@ -0,0 +1,273 @@
+"""
+Incremental re-checking of documents that were checked before.
+
+Between two pushes a student usually fixes a few paragraphs, so most of the
+previous findings are still valid. After every incremental run a
+DocumentState is stored per document (file path) with:
+
+- part fingerprints: CRC-32 and size of every ZIP member, read from the
+  central directory without decompressing anything. A package whose parts
+  are all unchanged is answered without parsing;
+- block fingerprints: a digest of every body-level block of document.xml
+  (paragraph, table, content control, final section), computed while
+  streaming by BlockFingerprints;
+- per rule: a key over the facets of the document the rule reads
+  (`facet_key`) with the issues it reported, and optional per-block memos.
+
+A rule whose key did not change is not evaluated again: its previous issues
+are reused. diff_issues() compares the previous and the current findings,
+DocumentChanges describes a run for the report ("new" and "fixed" issues).
+"""
+import hashlib
+import zipfile
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+from tests.helpers.document_text import DocumentText
+from tests.helpers.ooxml_stream import DocumentVisitor
+from tests.helpers.result_cache import ResultCache, make_cache_key
+
+
+# Bump when the state layout or the fingerprints change.
+STATE_VERSION = 1
+
+# Facets backed by package parts: facet -> member name prefixes.
+PART_FACETS: Dict[str, Tuple[str, ...]] = {
+    "styles": ("word/styles.xml",),
+    "theme": ("word/theme/",),
+    "headers": ("word/header", "word/footer"),
+    "rels": ("word/_rels/document.xml.rels",),
+    "media": ("word/media/",),
+}
+
+
+def fingerprint(values: Iterable[str]) -> str:
+    """Short stable digest of a sequence of strings."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        digest.update(value.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def element_digest(element: etree._Element) -> str:
+    """Digest of an element subtree (exclusive canonical XML, tail excluded)."""
+    xml = etree.tostring(element, method="c14n", exclusive=True, with_tail=False)
+    return hashlib.blake2b(xml, digest_size=12).hexdigest()
+
+
+def part_fingerprints(docx_path: Path) -> Dict[str, str]:
+    """CRC-32 and size of every package part, from the ZIP central directory."""
+    with zipfile.ZipFile(docx_path, "r") as archive:
+        return {
+            info.filename: f"{info.CRC:08x}:{info.file_size}"
+            for info in archive.infolist()
+            if not info.is_dir()
+        }
+
+
+def part_facets(parts: Dict[str, str]) -> Dict[str, str]:
+    """Facets of PART_FACETS and "package" (every part) from part fingerprints."""
+    facets = {"package": fingerprint(f"{name}={value}" for name, value in sorted(parts.items()))}
+    for facet, prefixes in PART_FACETS.items():
+        facets[facet] = fingerprint(
+            f"{name}={value}" for name, value in sorted(parts.items()) if name.startswith(prefixes)
+        )
+    return facets
+
+
+def text_facet(text: DocumentText) -> str:
+    """Fingerprint of body paragraph texts, their positions and the headings."""
+    values = [f"{position}\t{paragraph}" for position, paragraph in zip(text.positions, text.paragraphs)]
+    if text.index is not None:
+        values.append(f"paragraphs={text.index.paragraph_count}")
+        values.extend(
+            f"{position}\t{level}\t{title}"
+            for position, (level, title) in zip(text.index.heading_positions, text.index.headings)
+        )
+    return fingerprint(values)
+
+
+def facet_key(facets: Dict[str, str], inputs: Iterable[str]) -> str:
+    """Key of a rule: fingerprints of the facets it reads."""
+    return fingerprint(f"{name}={facets[name]}" for name in inputs)
+
+
+class BlockFingerprints(DocumentVisitor):
+    """
+    Digests of body-level blocks and of sections, in document order.
+
+    Register it before the visitors that look up `current` in on_block().
+    """
+
+    def __init__(self):
+        self.blocks: List[str] = []
+        self.sections: List[str] = []
+
+    @property
+    def current(self) -> str:
+        """Digest of the block being visited."""
+        return self.blocks[-1]
+
+    def on_section(self, sect_pr: etree._Element) -> None:
+        self.sections.append(element_digest(sect_pr))
+
+    def on_block(self, block: etree._Element, index: int) -> None:
+        self.blocks.append(element_digest(block))
+
+    def facets(self) -> Dict[str, str]:
+        """Facets "blocks" and "sections" of the streamed document."""
+        return {"blocks": fingerprint(self.blocks), "sections": fingerprint(self.sections)}
+
+
+class DeferredEnd(DocumentVisitor):
+    """Forwards streaming callbacks to a visitor but leaves `end()` to the caller."""
+
+    def __init__(self, visitor: DocumentVisitor):
+        self.visitor = visitor
+
+    def on_paragraph(self, paragraph: etree._Element, index: int, text: Optional[str]) -> None:
+        self.visitor.on_paragraph(paragraph, index, text)
+
+    def on_run(self, run: etree._Element, index: int) -> None:
+        self.visitor.on_run(run, index)
+
+    def on_section(self, sect_pr: etree._Element) -> None:
+        self.visitor.on_section(sect_pr)
+
+    def on_block(self, block: etree._Element, index: int) -> None:
+        self.visitor.on_block(block, index)
+
+
+@dataclass
+class DocumentState:
+    """
+    What an incremental run remembers about one document.
+
+    `checker` identifies the checker version and checklist: rule results and
+    memos are only reused if it matches, while `issues` are always good
+    for the diff.
+    """
+    checker: str
+    package: str
+    blocks: List[str] = field(default_factory=list)
+    # rule -> {"key": facet key, "issues": [...]}, in report order
+    rules: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # rule -> {"key": ..., "blocks": {block digest: value}}
+    memos: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    version: int = STATE_VERSION
+
+    @property
+    def issues(self) -> List[Dict[str, Any]]:
+        """All issues of the run, in report order."""
+        return [issue for rule in self.rules.values() for issue in rule["issues"]]
+
+    def rule(self, name: str, key: str) -> Optional[List[Dict[str, Any]]]:
+        """Issues of a rule if it was evaluated with the same key."""
+        entry = self.rules.get(name)
+        return entry["issues"] if entry is not None and entry["key"] == key else None
+
+    def memo(self, name: str, key: str) -> Dict[str, Any]:
+        """Per-block memo of a rule if it was built with the same key (empty otherwise)."""
+        entry = self.memos.get(name)
+        return entry["blocks"] if entry is not None and entry["key"] == key else {}
+
+
+class StateStore(ResultCache):
+    """
+    DocumentState files in a directory, one per document (e.g. its path).
+
+    Shares the LRU eviction of ResultCache, so states of documents that are
+    no longer checked eventually disappear.
+    """
+
+    @staticmethod
+    def _key(document: str) -> str:
+        return make_cache_key("incremental", document)
+
+    def load(self, document: str) -> Optional[DocumentState]:
+        """Previous state of a document, or None (first run, unreadable or outdated layout)."""
+        data = self._read(self._key(document))
+        if data is None or data.get("version") != STATE_VERSION:
+            return None
+        try:
+            return DocumentState(**data)
+        except TypeError:
+            return None
+
+    def save(self, document: str, state: DocumentState) -> None:
+        self._write(self._key(document), asdict(state))
+
+
+def issue_identity(issue: Dict[str, Any]) -> Tuple[str, str, str]:
+    """
+    What makes two findings "the same issue" across runs.
+
+    Counts and locations in `actual`/`location` change while a student works
+    on an issue, so they are not part of it.
+    """
+    return issue["category"], issue["severity"], issue["description"]
+
+
+def diff_issues(previous: List[Dict[str, Any]],
+                current: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Compare two issue lists.
+
+    Returns:
+        (new issues, fixed issues), each in its list's order
+    """
+    before = {issue_identity(issue) for issue in previous}
+    after = {issue_identity(issue) for issue in current}
+    new = [issue for issue in current if issue_identity(issue) not in before]
+    fixed = [issue for issue in previous if issue_identity(issue) not in after]
+    return new, fixed
+
+
+@dataclass
+class DocumentChanges:
+    """Outcome of an incremental run compared with the previous one."""
+    document: str
+    previous: bool
+    blocks_total: int = 0
+    blocks_changed: int = 0
+    rules_checked: List[str] = field(default_factory=list)
+    rules_reused: List[str] = field(default_factory=list)
+    new_issues: List[Dict[str, Any]] = field(default_factory=list)
+    fixed_issues: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def to_markdown(self) -> str:
+        """Markdown section "changes since the previous check"."""
+        lines = ["## Изменения с прошлой проверки\n"]
+        if not self.previous:
+            lines.append(f"Документ `{self.document}` проверяется впервые — сравнивать не с чем.\n")
+            return "\n".join(lines)
+
+        lines.append(f"- **Документ:** `{self.document}`")
+        lines.append(f"- **Изменено блоков (абзацы, таблицы):** {self.blocks_changed} из {self.blocks_total}")
+        lines.append(f"- **Проверено заново:** {', '.join(self.rules_checked) or '—'}")
+        lines.append(f"- **Взято из прошлой проверки:** {', '.join(self.rules_reused) or '—'}\n")
+
+        lines.append(f"### Новые замечания ({len(self.new_issues)})\n")
+        lines.extend(_format_issue(issue) for issue in self.new_issues)
+        if not self.new_issues:
+            lines.append("Нет")
+        lines.append("")
+
+        lines.append(f"### Исправлено ({len(self.fixed_issues)})\n")
+        lines.extend(_format_issue(issue, "✅") for issue in self.fixed_issues)
+        if not self.fixed_issues:
+            lines.append("Нет")
+        lines.append("")
+        return "\n".join(lines)
+
+
+def _format_issue(issue: Dict[str, Any], icon: Optional[str] = None) -> str:
+    icon = icon or {"error": "❌", "warning": "⚠️", "info": "ℹ️"}.get(issue["severity"], "•")
+    return f"- {icon} **{issue['description']}** ({issue['category']})"
@@ -0,0 +1,372 @@
+"""
+Embedded images of a .docx: header-only inspection and placement in the text.
+
+inspect_media() lists word/media/* from the ZIP central directory and reads
+only the first bytes of every image (PNG IHDR/pHYs, JPEG APP0/SOFn,
+GIF/BMP headers, the EMF header record), so pixel dimensions and DPI are
+known without decompressing the images; the cost grows with the number of
+images, not with their size. DrawingIndex is a DocumentVisitor that collects
+where images are placed (w:drawing and VML w:pict), their size in the
+document and the figure caption that follows them.
+"""
+import re
+import struct
+import zipfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Tuple, Union
+
+from lxml import etree
+
+from tests.helpers.ooxml_pagination import get_relationship_targets
+from tests.helpers.ooxml_stream import DocumentVisitor, stream_document
+from tests.helpers.ooxml_utils import NS
+
+
+MEDIA_PREFIX = "word/media/"
+EMU_PER_INCH = 914400
+
+W = f"{{{NS['w']}}}"
+DRAWING = f"{W}drawing"
+PICT = f"{W}pict"
+TXBX_CONTENT = f"{W}txbxContent"
+R_EMBED = f"{{{NS['r']}}}embed"
+R_ID = f"{{{NS['r']}}}id"
+WP_EXTENT = f"{{{NS['wp']}}}extent"
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+BLIP = f"{{{A_NS}}}blip"
+PIC_NS = "http://schemas.openxmlformats.org/drawingml/2006/picture"
+PIC = f"{{{PIC_NS}}}pic"
+PIC_XFRM_EXT = f"{{{PIC_NS}}}spPr/{{{A_NS}}}xfrm/{{{A_NS}}}ext"
+IMAGEDATA = "{urn:schemas-microsoft-com:vml}imagedata"
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+ALTERNATE_CONTENT = f"{{{MC_NS}}}AlternateContent"
+MC_CHOICE = f"{{{MC_NS}}}Choice"
+
+VECTOR_FORMATS = ("emf", "wmf", "svg")
+
+# Header scanning stops after this many bytes (ICC profiles, EXIF...).
+_MAX_HEADER_BYTES = 256 * 1024
+
+# JPEG start-of-frame markers (SOF0-SOF15 except DHT, JPG and DAC).
+_JPEG_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+# A figure caption: "Рисунок 1", "Рисунок 2.3" at the start of a paragraph.
+_CAPTION_RE = re.compile(r"^\s*рисунок\s+\d", re.IGNORECASE)
+
+# Non-empty body paragraphs after an image searched for its caption.
+_CAPTION_LOOKAHEAD = 2
+
+_VML_SIZE_RE = re.compile(r"(width|height)\s*:\s*([\d.]+)\s*(pt|in|cm|mm|px)?", re.IGNORECASE)
+_VML_EMU = {"pt": 12700, "in": EMU_PER_INCH, "cm": 360000, "mm": 36000, "px": 9525, None: 9525}
+
+
+@dataclass
+class MediaInfo:
+    """One file of word/media (from the central directory and its header)."""
+    name: str  # archive path, e.g. 'word/media/image1.png'
+    format: str  # 'png', 'jpeg', 'gif', 'bmp', 'emf', ... (extension if unknown)
+    size_bytes: int  # uncompressed size
+    stored_bytes: int  # size in the archive
+    width_px: Optional[int] = None
+    height_px: Optional[int] = None
+    dpi_x: Optional[float] = None  # resolution stored in the file, if any
+    dpi_y: Optional[float] = None
+
+    @property
+    def vector(self) -> bool:
+        return self.format in VECTOR_FORMATS
+
+
+@dataclass
+class ImagePlacement:
+    """An image used in document.xml (plain data, safe to keep after streaming)."""
+    rel_id: str
+    paragraph: int  # position among all w:p of the paragraph holding the image
+    width_emu: Optional[int] = None  # size in the document
+    height_emu: Optional[int] = None
+    caption: Optional[str] = None  # text of the "Рисунок N – ..." paragraph
+    caption_paragraph: Optional[int] = None
+
+    def effective_dpi(self, info: MediaInfo) -> Optional[float]:
+        """Pixels per inch at the size shown in the document (lower of both axes)."""
+        if info.vector or not (info.width_px and info.height_px and self.width_emu and self.height_emu):
+            return None
+        return min(info.width_px * EMU_PER_INCH / self.width_emu,
+                   info.height_px * EMU_PER_INCH / self.height_emu)
+
+
+# Image headers --------------------------------------------------------------
+
+class _HeaderReader:
+    """Reads a member stream forward, never more than _MAX_HEADER_BYTES."""
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.consumed = 0
+
+    def read(self, size: int) -> bytes:
+        if self.consumed + size > _MAX_HEADER_BYTES:
+            raise EOFError("header too long")
+        data = self.stream.read(size)
+        self.consumed += len(data)
+        if len(data) < size:
+            raise EOFError("truncated header")
+        return data
+
+    def skip(self, size: int) -> None:
+        while size > 0:
+            chunk = self.read(min(size, 64 * 1024))
+            size -= len(chunk)
+
+
+def _png_header(reader: _HeaderReader, info: MediaInfo) -> None:
+    reader.read(8)  # signature, already sniffed
+    while True:
+        length, kind = struct.unpack(">I4s", reader.read(8))
+        if kind == b"IHDR":
+            info.width_px, info.height_px = struct.unpack(">II", reader.read(8))
+            reader.skip(length - 8 + 4)
+        elif kind == b"pHYs":
+            x, y, unit = struct.unpack(">IIB", reader.read(9))
+            if unit == 1:  # pixels per metre
+                info.dpi_x, info.dpi_y = x * 0.0254, y * 0.0254
+            reader.skip(length - 9 + 4)
+        elif kind in (b"IDAT", b"IEND"):
+            return
+        else:
+            reader.skip(length + 4)
+
+
+def _jpeg_header(reader: _HeaderReader, info: MediaInfo) -> None:
+    reader.read(2)  # SOI
+    while True:
+        if reader.read(1) != b"\xff":
+            return
+        marker = reader.read(1)[0]
+        while marker == 0xFF:  # fill bytes
+            marker = reader.read(1)[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            continue
+        if marker == 0xDA:  # start of scan: no frame header before it
+            return
+        (length,) = struct.unpack(">H", reader.read(2))
+        if marker == 0xE0 and length >= 16:
+            data = reader.read(length - 2)
+            if data[:5] == b"JFIF\0":
+                units, x, y = struct.unpack(">BHH", data[7:12])
+                if units in (1, 2) and x and y:
+                    scale = 1.0 if units == 1 else 2.54  # dots per inch / per cm
+                    info.dpi_x, info.dpi_y = x * scale, y * scale
+        elif marker in _JPEG_SOF:
+            _, info.height_px, info.width_px = struct.unpack(">BHH", reader.read(5))
+            return
+        else:
+            reader.skip(length - 2)
+
+
+def _gif_header(reader: _HeaderReader, info: MediaInfo) -> None:
+    info.width_px, info.height_px = struct.unpack("<HH", reader.read(10)[6:10])
+
+
+def _bmp_header(reader: _HeaderReader, info: MediaInfo) -> None:
+    header = reader.read(46)
+    width, height = struct.unpack("<ii", header[18:26])
+    info.width_px, info.height_px = width, abs(height)
+    x, y = struct.unpack("<ii", header[38:46])
+    if x > 0 and y > 0:  # pixels per metre
+        info.dpi_x, info.dpi_y = x * 0.0254, y * 0.0254
+
+
+def _emf_header(reader: _HeaderReader, info: MediaInfo) -> None:
+    header = reader.read(88)
+    left, top, right, bottom = struct.unpack("<iiii", header[8:24])
+    info.width_px, info.height_px = right - left + 1, bottom - top + 1
+    device_w, device_h, mm_w, mm_h = struct.unpack("<iiii", header[72:88])
+    if mm_w > 0 and mm_h > 0:
+        info.dpi_x, info.dpi_y = device_w * 25.4 / mm_w, device_h * 25.4 / mm_h
+
+
+_SIGNATURES = (
+    (b"\x89PNG\r\n\x1a\n", "png", _png_header),
+    (b"\xff\xd8", "jpeg", _jpeg_header),
+    (b"GIF8", "gif", _gif_header),
+    (b"BM", "bmp", _bmp_header),
+)
+
+
+def read_media_info(archive: zipfile.ZipFile, member: Union[str, zipfile.ZipInfo]) -> MediaInfo:
+    """Describe one archive member from its directory entry and image header."""
+    entry = member if isinstance(member, zipfile.ZipInfo) else archive.getinfo(member)
+    extension = entry.filename.rsplit(".", 1)[-1].lower() if "." in entry.filename else ""
+    info = MediaInfo(entry.filename, {"jpg": "jpeg"}.get(extension, extension), entry.file_size, entry.compress_size)
+
+    with archive.open(entry) as stream:
+        # Deflated members are decompressed only as far as they are read.
+        head = stream.read(44)
+        reader = _HeaderReader(_Prepend(head, stream))
+        try:
+            for signature, fmt, parse in _SIGNATURES:
+                if head.startswith(signature):
+                    info.format = fmt
+                    parse(reader, info)
+                    break
+            else:
+                if len(head) >= 44 and head[:4] == b"\x01\0\0\0" and head[40:44] == b" EMF":
+                    info.format = "emf"
+                    _emf_header(reader, info)
+        except (EOFError, struct.error):
+            pass  # keep what was read; a broken header is not an error here
+    return info
+
+
+class _Prepend:
+    """File-like object: already read bytes followed by the rest of a stream."""
+
+    def __init__(self, head: bytes, stream: IO[bytes]):
+        self.head = head
+        self.stream = stream
+
+    def read(self, size: int) -> bytes:
+        if self.head:
+            data, self.head = self.head[:size], self.head[size:]
+            if len(data) < size:
+                data += self.stream.read(size - len(data))
+            return data
+        return self.stream.read(size)
+
+
+def inspect_media(source: Union[Path, zipfile.ZipFile]) -> Dict[str, MediaInfo]:
+    """
+    Describe every file in word/media without extracting it.
+
+    Args:
+        source: Path to a .docx or an open ZipFile
+
+    Returns:
+        Dict archive path -> MediaInfo, in archive order
+    """
+    if not isinstance(source, zipfile.ZipFile):
+        with zipfile.ZipFile(source, "r") as archive:
+            return inspect_media(archive)
+    return {
+        entry.filename: read_media_info(source, entry)
+        for entry in source.infolist()
+        if entry.filename.startswith(MEDIA_PREFIX) and not entry.is_dir()
+    }
+
+
+# Placement in document.xml --------------------------------------------------
+
+def _owned_by(element: etree._Element, run: etree._Element) -> bool:
+    """True unless element sits in a text box nested in run (its own runs report it)."""
+    for ancestor in element.iterancestors():
+        if ancestor is run:
+            return True
+        if ancestor.tag == TXBX_CONTENT:
+            return False
+    return True
+
+
+def _vml_size(shape: Optional[etree._Element]) -> Tuple[Optional[int], Optional[int]]:
+    size = {"width": None, "height": None}
+    if shape is not None:
+        for name, value, unit in _VML_SIZE_RE.findall(shape.get("style", "")):
+            size[name.lower()] = round(float(value) * _VML_EMU[unit.lower() or None])
+    return size["width"], size["height"]
+
+
+def _run_images(run: etree._Element) -> List[Tuple[str, Optional[int], Optional[int]]]:
+    """(relationship id, width EMU, height EMU) of the images drawn by a run."""
+    images = []
+    for child in run:
+        if child.tag == ALTERNATE_CONTENT:
+            # Choice and Fallback hold the same picture; read the Choice only.
+            containers = child.findall(MC_CHOICE)[:1]
+        elif child.tag in (DRAWING, PICT):
+            containers = [child]
+        else:
+            continue
+        for container in containers:
+            blips = [blip for blip in container.iter(BLIP) if blip.get(R_EMBED) and _owned_by(blip, run)]
+            for blip in blips:
+                # The drawing's extent is the shown size of a single picture;
+                # pictures of a group have their own transform.
+                ext = container.find(f".//{WP_EXTENT}") if len(blips) == 1 else None
+                if ext is None:
+                    pic = next(blip.iterancestors(PIC), None)
+                    ext = pic.find(PIC_XFRM_EXT) if pic is not None else None
+                width = height = None
+                if ext is not None:
+                    width, height = int(ext.get("cx", 0)) or None, int(ext.get("cy", 0)) or None
+                images.append((blip.get(R_EMBED), width, height))
+            for imagedata in container.iter(IMAGEDATA):
+                rel_id = imagedata.get(R_ID)
+                if rel_id and _owned_by(imagedata, run):
+                    images.append((rel_id, *_vml_size(imagedata.getparent())))
+    return images
+
+
+class DrawingIndex(DocumentVisitor):
+    """
+    Images placed in the document, in document order, with their captions.
+
+    A caption is the first non-empty body-level paragraph after the image
+    (within _CAPTION_LOOKAHEAD paragraphs) that starts with "Рисунок N"; text
+    in the image's own paragraph counts too.
+
+    Usage:
+        drawings = DrawingIndex()
+        stream_document(docx_path, [drawings])
+        for placement in drawings.placements: ...
+    """
+
+    def __init__(self):
+        self.placements: List[ImagePlacement] = []
+        self._pending: List[ImagePlacement] = []  # drawn by runs of the current paragraph
+        self._awaiting: List[ImagePlacement] = []  # waiting for a caption
+        self._misses = 0
+
+    def on_run(self, run: etree._Element, index: int) -> None:
+        for child in run:
+            if child.tag in (DRAWING, PICT, ALTERNATE_CONTENT):
+                self._pending.extend(
+                    ImagePlacement(rel_id, -1, width, height) for rel_id, width, height in _run_images(run)
+                )
+                return
+
+    def on_paragraph(self, paragraph: etree._Element, index: int, text: Optional[str]) -> None:
+        pending = self._pending
+        if pending:
+            self._pending = []
+            for placement in pending:
+                placement.paragraph = index
+            self.placements.extend(pending)
+            self._awaiting = pending
+            self._misses = 0
+
+        if text is None or not self._awaiting or not text.strip():
+            return
+        if _CAPTION_RE.match(text):
+            for placement in self._awaiting:
+                placement.caption = text.strip()
+                placement.caption_paragraph = index
+            self._awaiting = []
+        elif not pending:
+            self._misses += 1
+            if self._misses >= _CAPTION_LOOKAHEAD:
+                self._awaiting = []
+
+
+def resolve_media(placements: List[ImagePlacement], targets: Dict[str, str],
+                  media: Dict[str, MediaInfo]) -> List[Tuple[ImagePlacement, Optional[MediaInfo]]]:
+    """Pair placements with the MediaInfo of their relationship targets (None if missing)."""
+    return [(placement, media.get(targets.get(placement.rel_id, ""))) for placement in placements]
+
+
+def get_image_usage(docx_path: Path) -> List[Tuple[ImagePlacement, Optional[MediaInfo]]]:
+    """Placements of all images in a document with their media info."""
+    drawings = DrawingIndex()
+    stream_document(docx_path, [drawings])
+    with zipfile.ZipFile(docx_path, "r") as archive:
+        return resolve_media(drawings.placements, get_relationship_targets(archive), inspect_media(archive))
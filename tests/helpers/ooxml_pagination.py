@@ -0,0 +1,325 @@
+"""
+Page numbering analysis: PAGE fields in the headers/footers sections use.
+
+Each w:sectPr references its header/footer parts by relationship id
+(w:headerReference/w:footerReference of type default/first/even); a section
+that does not define a reference inherits it from the previous section, and
+the "first" part is shown on the section's first page only when w:titlePg is
+set. Relationship ids are resolved through word/_rels/document.xml.rels and
+only the parts actually referenced are parsed (iterparse over paragraphs),
+looking for PAGE fields in w:fldSimple and in complex fields (w:instrText).
+"""
+import posixpath
+import re
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS, load_xml
+
+
+W = f"{{{NS['w']}}}"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+HEADER_FOOTER_KINDS = ("header", "footer")
+REFERENCE_TYPES = ("default", "first", "even")
+
+# "PAGE" with optional switches; NUMPAGES, PAGEREF etc. do not match.
+_PAGE_FIELD_RE = re.compile(r"^\s*PAGE(?:\s|\\|$)")
+
+# w:jc / w:ptab alignment values -> left/center/right
+_ALIGNMENTS = {
+    "left": "left",
+    "start": "left",
+    "both": "left",
+    "distribute": "left",
+    "center": "center",
+    "right": "right",
+    "end": "right",
+}
+
+
+@dataclass
+class SectionReferences:
+    """Header/footer references of one w:sectPr (plain data, safe to keep after streaming)."""
+    header: Dict[str, str] = field(default_factory=dict)  # reference type -> r:id
+    footer: Dict[str, str] = field(default_factory=dict)
+    title_page: bool = False
+    start: Optional[int] = None  # w:pgNumType/@w:start
+    fmt: Optional[str] = None  # w:pgNumType/@w:fmt
+
+
+@dataclass
+class PageField:
+    """A PAGE field found in a header/footer part."""
+    part: str  # e.g. 'word/footer2.xml'
+    kind: str  # 'header' or 'footer'
+    alignment: str  # 'left', 'center' or 'right'
+
+
+@dataclass
+class SectionPagination:
+    """Effective page numbering of one section."""
+    index: int  # 0-based section number
+    title_page: bool
+    start: Optional[int]
+    fmt: Optional[str]
+    parts: Dict[str, str]  # e.g. {'header:default': 'word/header1.xml'}
+    fields: List[PageField]  # PAGE fields on regular pages
+    first_page_fields: List[PageField]  # PAGE fields on the section's first page
+
+    @property
+    def numbered(self) -> bool:
+        return bool(self.fields)
+
+    @property
+    def first_page_numbered(self) -> bool:
+        return bool(self.first_page_fields)
+
+
+def get_section_references(sect_pr: etree._Element) -> SectionReferences:
+    """Extract header/footer references and numbering settings from w:sectPr."""
+    refs = SectionReferences()
+    r_id = f"{{{NS['r']}}}id"
+
+    for kind in HEADER_FOOTER_KINDS:
+        target = getattr(refs, kind)
+        for ref in sect_pr.iterfind(f"w:{kind}Reference", namespaces=NS):
+            target[ref.get(f"{W}type", "default")] = ref.get(r_id)
+
+    title_pg = sect_pr.find("w:titlePg", namespaces=NS)
+    refs.title_page = title_pg is not None and title_pg.get(f"{W}val", "true") not in ("0", "false", "off")
+
+    pg_num = sect_pr.find("w:pgNumType", namespaces=NS)
+    if pg_num is not None:
+        start = pg_num.get(f"{W}start")
+        refs.start = int(start) if start and start.lstrip("-").isdigit() else None
+        refs.fmt = pg_num.get(f"{W}fmt")
+
+    return refs
+
+
+def get_relationship_targets(archive: zipfile.ZipFile,
+                             part_name: str = "word/document.xml") -> Dict[str, str]:
+    """
+    Map relationship ids of a part to the archive paths of their targets.
+
+    Returns:
+        Dict like {'rId8': 'word/header1.xml'} (external targets are skipped)
+    """
+    directory, name = posixpath.split(part_name)
+    rels_name = posixpath.join(directory, "_rels", f"{name}.rels")
+    try:
+        rels = etree.fromstring(archive.read(rels_name))
+    except KeyError:
+        return {}
+
+    targets: Dict[str, str] = {}
+    for rel in rels.iterfind(f"{{{REL_NS}}}Relationship"):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        else:
+            path = posixpath.normpath(posixpath.join(directory, target))
+        targets[rel.get("Id")] = path
+    return targets
+
+
+def get_style_alignments(styles_xml: Optional[etree._Element]) -> Dict[str, str]:
+    """Map paragraph style ids to their alignment (left/center/right), following basedOn."""
+    if styles_xml is None:
+        return {}
+
+    own: Dict[str, Optional[str]] = {}
+    parents: Dict[str, Optional[str]] = {}
+    for style in styles_xml.iterfind("w:style[@w:type='paragraph']", namespaces=NS):
+        style_id = style.get(f"{W}styleId")
+        if not style_id:
+            continue
+        based_on = style.find("w:basedOn", namespaces=NS)
+        parents[style_id] = based_on.get(f"{W}val") if based_on is not None else None
+        jc = style.find("w:pPr/w:jc", namespaces=NS)
+        own[style_id] = _ALIGNMENTS.get(jc.get(f"{W}val")) if jc is not None else None
+
+    alignments: Dict[str, str] = {}
+    for style_id in own:
+        current: Optional[str] = style_id
+        seen = set()
+        while current is not None and current not in seen and own.get(current) is None:
+            seen.add(current)
+            current = parents.get(current)
+        if current is not None and own.get(current):
+            alignments[style_id] = own[current]
+    return alignments
+
+
+def _paragraph_alignment(paragraph: etree._Element, style_alignments: Dict[str, str]) -> str:
+    """Direct w:jc, else the paragraph style's alignment, else left."""
+    jc = paragraph.find("w:pPr/w:jc", namespaces=NS)
+    if jc is not None:
+        return _ALIGNMENTS.get(jc.get(f"{W}val"), "left")
+    style = paragraph.find("w:pPr/w:pStyle", namespaces=NS)
+    if style is not None:
+        return style_alignments.get(style.get(f"{W}val"), "left")
+    return "left"
+
+
+_FIELD_TAGS = (f"{W}fldSimple", f"{W}fldChar", f"{W}instrText", f"{W}ptab")
+
+
+def _paragraph_page_fields(paragraph: etree._Element) -> List[Tuple[Optional[str], etree._Element]]:
+    """
+    Find PAGE fields of a paragraph (including nested text-box paragraphs).
+
+    Content of mc:Fallback (the legacy copy of a drawing) is skipped, so a
+    field inside a text box is not counted twice.
+
+    Returns:
+        One (w:ptab alignment in effect before it or None, field element)
+        pair per PAGE field
+    """
+    found: List[Tuple[Optional[str], etree._Element]] = []
+    ptab_alignment: Optional[str] = None
+    # Complex fields: [instruction collected so far, already evaluated]
+    stack: List[list] = []
+
+    for elem in paragraph.iter(*_FIELD_TAGS):
+        if any(True for _ in elem.iterancestors(MC_FALLBACK)):
+            continue
+        tag = elem.tag
+        if tag == f"{W}ptab":
+            ptab_alignment = _ALIGNMENTS.get(elem.get(f"{W}alignment"), ptab_alignment)
+        elif tag == f"{W}fldSimple":
+            if _PAGE_FIELD_RE.match(elem.get(f"{W}instr", "")):
+                found.append((ptab_alignment, elem))
+        elif tag == f"{W}instrText":
+            if stack:
+                stack[-1][0] += elem.text or ""
+        else:
+            char_type = elem.get(f"{W}fldCharType")
+            if char_type == "begin":
+                stack.append(["", False])
+            elif char_type in ("separate", "end") and stack:
+                instr, evaluated = stack[-1]
+                if not evaluated and _PAGE_FIELD_RE.match(instr):
+                    found.append((ptab_alignment, elem))
+                stack[-1][1] = True
+                if char_type == "end":
+                    stack.pop()
+    return found
+
+
+def find_page_fields(archive: zipfile.ZipFile, part_name: str, kind: str,
+                     style_alignments: Optional[Dict[str, str]] = None) -> List[PageField]:
+    """
+    Find PAGE fields in a header/footer part.
+
+    Args:
+        archive: Open .docx archive
+        part_name: Archive path of the part (e.g. 'word/header1.xml')
+        kind: 'header' or 'footer'
+        style_alignments: Result of get_style_alignments() (for styled paragraphs)
+
+    Returns:
+        PAGE fields in document order
+    """
+    style_alignments = style_alignments or {}
+    fields: List[PageField] = []
+
+    with archive.open(part_name) as stream:
+        for _, paragraph in etree.iterparse(stream, events=("end",), tag=f"{W}p", huge_tree=True):
+            # Text-box paragraphs are handled together with their host paragraph.
+            if any(True for _ in paragraph.iterancestors(f"{W}p")):
+                continue
+            for ptab_alignment, elem in _paragraph_page_fields(paragraph):
+                # A field in a text box follows the alignment of its own paragraph.
+                host = next(elem.iterancestors(f"{W}p"), paragraph)
+                alignment = ptab_alignment or _paragraph_alignment(host, style_alignments)
+                fields.append(PageField(part=part_name, kind=kind, alignment=alignment))
+            paragraph.clear(keep_tail=True)
+
+    return fields
+
+
+def _iter_section_references(docx_path: Path) -> Iterable[SectionReferences]:
+    """Read w:sectPr references from document.xml (used when no list is given)."""
+    with zipfile.ZipFile(docx_path, "r") as archive:
+        with archive.open("word/document.xml") as stream:
+            for _, sect_pr in etree.iterparse(stream, events=("end",), tag=f"{W}sectPr", huge_tree=True):
+                parent = sect_pr.getparent()
+                if parent is not None and parent.tag == f"{W}sectPrChange":
+                    continue
+                yield get_section_references(sect_pr)
+
+
+def analyze_pagination(docx_path: Path,
+                       sections: Optional[List[SectionReferences]] = None) -> List[SectionPagination]:
+    """
+    Compute effective page numbering of every section.
+
+    Args:
+        docx_path: Path to the .docx file
+        sections: Section references in document order (e.g. collected while
+            streaming document.xml); read from the document if omitted
+
+    Returns:
+        One SectionPagination per section, in document order
+    """
+    if sections is None:
+        sections = list(_iter_section_references(docx_path))
+
+    try:
+        style_alignments = get_style_alignments(load_xml(docx_path, "word/styles.xml"))
+    except KeyError:
+        style_alignments = {}
+
+    results: List[SectionPagination] = []
+    fields_by_part: Dict[str, List[PageField]] = {}
+    inherited: Dict[str, str] = {}  # 'header:default' -> r:id, carried over sections
+
+    with zipfile.ZipFile(docx_path, "r") as archive:
+        targets = get_relationship_targets(archive)
+        names = set(archive.namelist())
+
+        def fields_of(parts: Dict[str, str], *keys: str) -> List[PageField]:
+            # Each referenced part is parsed once, however many sections share it.
+            fields: List[PageField] = []
+            for key in keys:
+                part = parts.get(key)
+                if part is None or part not in names:
+                    continue
+                if part not in fields_by_part:
+                    kind = key.split(":", 1)[0]
+                    fields_by_part[part] = find_page_fields(archive, part, kind, style_alignments)
+                fields.extend(fields_by_part[part])
+            return fields
+
+        for index, refs in enumerate(sections):
+            for kind in HEADER_FOOTER_KINDS:
+                for ref_type, r_id in getattr(refs, kind).items():
+                    inherited[f"{kind}:{ref_type}"] = r_id
+
+            parts = {key: targets[r_id] for key, r_id in inherited.items() if r_id in targets}
+            fields = fields_of(parts, "header:default", "footer:default")
+            if refs.title_page:
+                first_page_fields = fields_of(parts, "header:first", "footer:first")
+            else:
+                first_page_fields = fields
+
+            results.append(SectionPagination(
+                index=index,
+                title_page=refs.title_page,
+                start=refs.start,
+                fmt=refs.fmt,
+                parts=parts,
+                fields=fields,
+                first_page_fields=first_page_fields,
+            ))
+
+    return results
@@ -0,0 +1,141 @@
+"""
+Single-pass streaming reader for word/document.xml.
+
+Instead of loading the whole document into one lxml tree and running a
+separate XPath query per check, the document is parsed once with
+`lxml.etree.iterparse`. Every paragraph, run and section is handed to the
+registered visitors as soon as it is complete, and finished body-level
+blocks are freed right away, so peak memory does not grow with document size.
+"""
+import zipfile
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS, DocumentIndex, get_paragraph_text
+
+
+W = f"{{{NS['w']}}}"
+BODY = f"{W}body"
+PARAGRAPH = f"{W}p"
+RUN = f"{W}r"
+SECTION = f"{W}sectPr"
+SECTION_CHANGE = f"{W}sectPrChange"
+
+# Body-level blocks whose subtrees are released once they have been visited.
+_STREAM_TAGS = (PARAGRAPH, RUN, SECTION, f"{W}tbl", f"{W}sdt")
+
+
+class DocumentVisitor:
+    """
+    Base class for checks fed by stream_document().
+
+    Elements passed to the hooks are only valid until their body-level block
+    has been visited (on_block): the subtree is cleared right after, so
+    visitors must copy whatever they need instead of keeping element references.
+    """
+
+    def on_paragraph(self, paragraph: etree._Element, index: int, text: Optional[str]) -> None:
+        """
+        Called for every w:p (including table cells and text boxes).
+
+        Args:
+            paragraph: Paragraph element
+            index: 0-based position among all w:p in document order
+            text: Paragraph text (python-docx rules) for body-level paragraphs,
+                i.e. the ones listed by `Document.paragraphs`; None otherwise
+        """
+
+    def on_run(self, run: etree._Element, index: int) -> None:
+        """Called for every w:r; index is its 0-based position in document order."""
+
+    def on_section(self, sect_pr: etree._Element) -> None:
+        """Called for every w:sectPr (section breaks and the final body section)."""
+
+    def on_block(self, block: etree._Element, index: int) -> None:
+        """
+        Called for every body-level block (w:p, w:tbl, w:sdt, the final
+        w:sectPr) after its paragraphs, runs and sections were visited and
+        right before it is cleared; index is its 0-based block number.
+        Elements handed to the other hooks stay valid until then.
+        """
+
+    def end(self) -> None:
+        """Called once after the whole document has been streamed."""
+
+
+def stream_document(docx_path: Path, visitors: Iterable[DocumentVisitor],
+                    xml_path: str = "word/document.xml",
+                    index: Optional[DocumentIndex] = None) -> int:
+    """
+    Parse document XML once and feed it to visitors.
+
+    Args:
+        docx_path: Path to the .docx file
+        visitors: Visitors to notify (in the given order)
+        xml_path: Internal path of the XML part to stream
+        index: DocumentIndex to fill with paragraph positions and headings;
+            each paragraph is added before visitors see it
+
+    Returns:
+        Number of paragraphs visited
+    """
+    listeners: List[DocumentVisitor] = list(visitors)
+    paragraph_stack: List[int] = []
+    run_stack: List[int] = []
+    paragraph_count = 0
+    run_count = 0
+    block_count = 0
+
+    with zipfile.ZipFile(docx_path, "r") as archive:
+        with archive.open(xml_path) as stream:
+            events = etree.iterparse(
+                stream,
+                events=("start", "end"),
+                tag=_STREAM_TAGS,
+                huge_tree=True,
+            )
+            for event, elem in events:
+                tag = elem.tag
+
+                if event == "start":
+                    if tag == PARAGRAPH:
+                        paragraph_stack.append(paragraph_count)
+                        paragraph_count += 1
+                    elif tag == RUN:
+                        run_stack.append(run_count)
+                        run_count += 1
+                    continue
+
+                parent = elem.getparent()
+                body_level = parent is not None and parent.tag == BODY
+
+                if tag == RUN:
+                    position = run_stack.pop()
+                    for visitor in listeners:
+                        visitor.on_run(elem, position)
+                elif tag == PARAGRAPH:
+                    position = paragraph_stack.pop()
+                    text = get_paragraph_text(elem) if body_level else None
+                    if index is not None:
+                        index.add_paragraph(elem, position, text, keep_element=False)
+                    for visitor in listeners:
+                        visitor.on_paragraph(elem, position, text)
+                elif tag == SECTION:
+                    if parent is None or parent.tag != SECTION_CHANGE:
+                        for visitor in listeners:
+                            visitor.on_section(elem)
+
+                if body_level:
+                    for visitor in listeners:
+                        visitor.on_block(elem, block_count)
+                    block_count += 1
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del parent[0]
+
+    for visitor in listeners:
+        visitor.end()
+
+    return paragraph_count
@@ -0,0 +1,204 @@
+"""
+Style resolution for run formatting (fonts and sizes).
+
+Word computes a run's effective font and size by layering, from lowest to
+highest priority: document defaults (w:docDefaults), the paragraph style
+chain, the character style chain and direct run formatting. StyleResolver
+parses styles.xml once, resolves every style's `basedOn` chain with
+memoization and caches each (paragraph style, character style) combination,
+so classifying a run is a dictionary lookup plus its own direct properties.
+
+Table styles and conditional (table-cell) formatting are not taken into
+account.
+"""
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS, get_run_properties, get_styles_xml, load_xml
+
+
+# Font slots of w:rFonts: ascii (Latin), hAnsi (other Latin-based and Cyrillic
+# text), cs (complex scripts); each can be overridden by a theme font.
+FONT_SLOTS = ("ascii", "hAnsi", "cs")
+_THEME_ATTRS = {"ascii": "asciiTheme", "hAnsi": "hAnsiTheme", "cs": "cstheme"}
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+
+def get_theme_fonts(theme_xml: Optional[etree._Element]) -> Dict[str, str]:
+    """
+    Map theme font references (w:asciiTheme etc.) to typefaces.
+
+    Returns:
+        Dict like {'minorHAnsi': 'Calibri', 'majorBidi': 'Times New Roman', ...}
+    """
+    fonts: Dict[str, str] = {}
+    if theme_xml is None:
+        return fonts
+
+    for kind in ("major", "minor"):
+        font = theme_xml.find(f".//{{{A_NS}}}fontScheme/{{{A_NS}}}{kind}Font")
+        if font is None:
+            continue
+        latin = font.find(f"{{{A_NS}}}latin")
+        cs = font.find(f"{{{A_NS}}}cs")
+        ea = font.find(f"{{{A_NS}}}ea")
+        if latin is not None and latin.get("typeface"):
+            fonts[f"{kind}Ascii"] = latin.get("typeface")
+            fonts[f"{kind}HAnsi"] = latin.get("typeface")
+        if cs is not None and cs.get("typeface"):
+            fonts[f"{kind}Bidi"] = cs.get("typeface")
+        if ea is not None and ea.get("typeface"):
+            fonts[f"{kind}EastAsia"] = ea.get("typeface")
+    return fonts
+
+
+def get_theme_xml(docx_path: Path) -> Optional[etree._Element]:
+    """Load the theme XML (if it exists)."""
+    try:
+        return load_xml(docx_path, "word/theme/theme1.xml")
+    except KeyError:
+        return None
+
+
+def get_run_paragraph_style(run: etree._Element) -> Optional[str]:
+    """Return w:pStyle of the paragraph enclosing a run (None if not set)."""
+    for paragraph in run.iterancestors(f"{{{NS['w']}}}p"):
+        style = paragraph.find("w:pPr/w:pStyle", namespaces=NS)
+        return style.get(f"{{{NS['w']}}}val") if style is not None else None
+    return None
+
+
+def _font_properties(props: Dict[str, Any], theme_fonts: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Reduce get_run_properties() output to the keys that take part in
+    inheritance: one entry per font slot plus 'sz'. Only keys set at this
+    level are returned; a theme reference wins over an explicit name.
+    """
+    resolved: Dict[str, Any] = {}
+
+    r_fonts = props.get("rFonts")
+    if r_fonts:
+        for slot in FONT_SLOTS:
+            theme = r_fonts.get(_THEME_ATTRS[slot])
+            name = theme_fonts.get(theme) if theme else None
+            if name or r_fonts.get(slot):
+                resolved[slot] = name or r_fonts.get(slot)
+
+    if "sz" in props:
+        resolved["sz"] = props["sz"]
+
+    return resolved
+
+
+class StyleResolver:
+    """
+    Computes effective run fonts/sizes with style inheritance.
+
+    Usage:
+        resolver = StyleResolver.from_docx(docx_path)
+        props = resolver.resolve_run(run, paragraph_style="Heading1")
+        props.get("hAnsi"), props.get("sz")  # font name, size in half-points
+    """
+
+    def __init__(self, styles_xml: Optional[etree._Element],
+                 theme_xml: Optional[etree._Element] = None):
+        self.theme_fonts = get_theme_fonts(theme_xml)
+        self._styles: Dict[str, Tuple[Optional[str], Dict[str, Any]]] = {}
+        self._defaults: Dict[str, Any] = {}
+        self.default_paragraph_style: Optional[str] = None
+        self._style_cache: Dict[str, Dict[str, Any]] = {}
+        self._base_cache: Dict[Tuple[Optional[str], Optional[str]], Dict[str, Any]] = {}
+
+        if styles_xml is None:
+            return
+
+        r_pr_default = styles_xml.find("w:docDefaults/w:rPrDefault", namespaces=NS)
+        if r_pr_default is not None:
+            self._defaults = _font_properties(get_run_properties(r_pr_default), self.theme_fonts)
+
+        w = f"{{{NS['w']}}}"
+        for style in styles_xml.iterfind("w:style", namespaces=NS):
+            style_id = style.get(f"{w}styleId")
+            if not style_id:
+                continue
+            based_on = style.find("w:basedOn", namespaces=NS)
+            parent = based_on.get(f"{w}val") if based_on is not None else None
+            own = _font_properties(get_run_properties(style), self.theme_fonts)
+            self._styles[style_id] = (parent, own)
+
+            if style.get(f"{w}type") == "paragraph" and style.get(f"{w}default") in ("1", "true", "on"):
+                self.default_paragraph_style = style_id
+
+    @classmethod
+    def from_docx(cls, docx_path: Path) -> "StyleResolver":
+        """Build a resolver from styles.xml and the theme of a .docx file."""
+        return cls(get_styles_xml(docx_path), get_theme_xml(docx_path))
+
+    def style_properties(self, style_id: Optional[str], _seen: Optional[set] = None) -> Dict[str, Any]:
+        """
+        Effective font/size keys defined by a style and its basedOn chain
+        (without document defaults). Unknown styles resolve to {}.
+        """
+        if not style_id or style_id not in self._styles:
+            return {}
+        cached = self._style_cache.get(style_id)
+        if cached is not None:
+            return cached
+
+        # Guard against basedOn cycles in hand-edited documents.
+        seen = _seen if _seen is not None else set()
+        if style_id in seen:
+            return {}
+        seen.add(style_id)
+
+        parent, own = self._styles[style_id]
+        merged = dict(self.style_properties(parent, seen))
+        merged.update(own)
+        self._style_cache[style_id] = merged
+        return merged
+
+    def base_run_properties(self, paragraph_style: Optional[str],
+                            run_style: Optional[str] = None) -> Dict[str, Any]:
+        """Document defaults + paragraph style chain + character style chain."""
+        key = (paragraph_style, run_style)
+        cached = self._base_cache.get(key)
+        if cached is None:
+            if paragraph_style not in self._styles:
+                # No pStyle (or a dangling one): Word falls back to the default paragraph style.
+                paragraph_style = self.default_paragraph_style
+            cached = dict(self._defaults)
+            cached.update(self.style_properties(paragraph_style))
+            cached.update(self.style_properties(run_style))
+            self._base_cache[key] = cached
+        return cached
+
+    def resolve_run(self, run: etree._Element,
+                    paragraph_style: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Effective properties of a run.
+
+        Args:
+            run: w:r element
+            paragraph_style: w:pStyle of the enclosing paragraph (None = default style)
+
+        Returns:
+            Dict with keys from FONT_SLOTS and 'sz' (half-points); a key is
+            missing if nothing in the hierarchy defines it.
+        """
+        r_pr = run.find("w:rPr", namespaces=NS)
+        if r_pr is None:
+            return self.base_run_properties(paragraph_style)
+
+        r_style = r_pr.find("w:rStyle", namespaces=NS)
+        run_style = r_style.get(f"{{{NS['w']}}}val") if r_style is not None else None
+        direct = _font_properties(get_run_properties(run), self.theme_fonts)
+
+        base = self.base_run_properties(paragraph_style, run_style)
+        if not direct:
+            return base
+        merged = dict(base)
+        merged.update(direct)
+        return merged
@@ -5,10 +5,13 @@ Provides functions for:
 - Loading XML from .docx files
 - Converting units (twips ↔ mm, pt ↔ half-points)
 - Extracting formatting properties (margins, spacing, indents)
+- Locating paragraphs and their enclosing headings (DocumentIndex)
 """
+import bisect
+import re
 import zipfile
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 from lxml import etree
 
 
@@ -110,6 +113,16 @@ def get_page_margins(doc_xml: etree._Element) -> Optional[Dict[str, int]]:
     if sect_pr is None:
         return None
     
+    return get_section_margins(sect_pr)
+
+
+def get_section_margins(sect_pr: etree._Element) -> Optional[Dict[str, int]]:
+    """
+    Get page margins (in twips) from a single w:sectPr element.
+    
+    Returns:
+        Same shape as get_page_margins(), or None if w:pgMar is absent.
+    """
     pg_mar = sect_pr.find("w:pgMar", namespaces=NS)
     if pg_mar is None:
         return None
@@ -134,6 +147,16 @@ def get_page_size(doc_xml: etree._Element) -> Optional[Dict[str, Any]]:
     if sect_pr is None:
         return None
     
+    return get_section_page_size(sect_pr)
+
+
+def get_section_page_size(sect_pr: etree._Element) -> Optional[Dict[str, Any]]:
+    """
+    Get page size from a single w:sectPr element.
+    
+    Returns:
+        Same shape as get_page_size(), or None if w:pgSz is absent.
+    """
     pg_sz = sect_pr.find("w:pgSz", namespaces=NS)
     if pg_sz is None:
         return None
@@ -200,7 +223,8 @@ def get_run_properties(run: etree._Element) -> Dict[str, Any]:
     
     Returns dict with available properties:
     - 'sz': font size (in half-points)
-    - 'rFonts': font names
+    - 'rFonts': font names (ascii/hAnsi/cs) and theme font references
+      (asciiTheme/hAnsiTheme/cstheme)
     - 'b': bold
     - 'i': italic
     """
@@ -222,6 +246,9 @@ def get_run_properties(run: etree._Element) -> Dict[str, Any]:
             'ascii': r_fonts.get(f"{{{NS['w']}}}ascii"),
             'hAnsi': r_fonts.get(f"{{{NS['w']}}}hAnsi"),
             'cs': r_fonts.get(f"{{{NS['w']}}}cs"),
+            'asciiTheme': r_fonts.get(f"{{{NS['w']}}}asciiTheme"),
+            'hAnsiTheme': r_fonts.get(f"{{{NS['w']}}}hAnsiTheme"),
+            'cstheme': r_fonts.get(f"{{{NS['w']}}}cstheme"),
         }
     
     # Bold
@@ -276,38 +303,56 @@ def check_margins(doc_xml: etree._Element,
     return True
 
 
-def find_paragraph_index(doc_xml: etree._Element, paragraph: etree._Element) -> int:
+_RUN_TEXT_TAGS = {
+    f"{{{NS['w']}}}t",
+    f"{{{NS['w']}}}tab",
+    f"{{{NS['w']}}}ptab",
+    f"{{{NS['w']}}}br",
+    f"{{{NS['w']}}}cr",
+    f"{{{NS['w']}}}noBreakHyphen",
+}
+
+
+def get_run_text(run: etree._Element) -> str:
     """
-    Find the index of a paragraph in the document.
+    Get the plain text of a run, the same way python-docx renders `Run.text`.
     
-    Args:
-        doc_xml: Document XML root
-        paragraph: Paragraph element to find
-        
-    Returns:
-        0-based index, or -1 if not found
+    w:tab/w:ptab become "\t", w:cr and text-wrapping w:br become "\n",
+    w:noBreakHyphen becomes "-"; page/column breaks produce nothing.
     """
-    all_paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
-    try:
-        return all_paragraphs.index(paragraph)
-    except ValueError:
-        return -1
-
-
-def find_nearby_heading(doc_xml: etree._Element, paragraph_index: int) -> str:
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag not in _RUN_TEXT_TAGS:
+            continue
+        local = tag.rsplit("}", 1)[-1]
+        if local == "t":
+            parts.append(child.text or "")
+        elif local in ("tab", "ptab"):
+            parts.append("\t")
+        elif local == "cr":
+            parts.append("\n")
+        elif local == "br":
+            if child.get(f"{{{NS['w']}}}type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append("-")
+    return "".join(parts)
+
+
+def get_paragraph_text(paragraph: etree._Element) -> str:
     """
-    Find the nearest heading before the given paragraph.
+    Get the plain text of a paragraph, the same way python-docx renders
+    `Paragraph.text`: only direct runs and runs inside w:hyperlink are used.
     
     Args:
-        doc_xml: Document XML root
-        paragraph_index: Index of the paragraph
+        paragraph: Paragraph XML element
         
     Returns:
-        Heading text or empty string
+        Paragraph text (may be empty)
     """
-    from docx import Document
-    # This is a simplified version - would need document path
-    return ""
+    runs = paragraph.xpath("w:r | w:hyperlink/w:r", namespaces=NS)
+    return "".join(get_run_text(run) for run in runs)
 
 
 def get_paragraph_text_preview(paragraph: etree._Element, max_length: int = 50) -> str:
@@ -326,3 +371,246 @@ def get_paragraph_text_preview(paragraph: etree._Element, max_length: int = 50)
     if len(text) > max_length:
         return text[:max_length] + "..."
     return text if text else "(пустой параграф)"
+
+
+# Outline level 9 means "body text" in OOXML.
+_BODY_TEXT_OUTLINE_LEVEL = 9
+_HEADING_STYLE_NAME_RE = re.compile(r"^(?:heading|заголовок)\s+(\d)$", re.IGNORECASE)
+# Style ids of built-in headings ("Heading1"; localized Word saves "1", "2", ...).
+_HEADING_STYLE_ID_RE = re.compile(r"^(?:heading)?([1-9])$", re.IGNORECASE)
+
+
+def get_heading_style_levels(styles_xml: Optional[etree._Element]) -> Dict[str, int]:
+    """
+    Map paragraph style ids to heading outline levels.
+    
+    A style is a heading if it (or a style it is based on) sets w:outlineLvl,
+    or if its name is a built-in heading name ("heading 1", "Заголовок 2").
+    
+    Returns:
+        Dict like {'Heading1': 0, 'Heading2': 1} (0 = top level)
+    """
+    levels: Dict[str, int] = {}
+    if styles_xml is None:
+        return levels
+    
+    w = f"{{{NS['w']}}}"
+    own: Dict[str, Optional[int]] = {}
+    parents: Dict[str, Optional[str]] = {}
+    for style in styles_xml.iterfind("w:style[@w:type='paragraph']", namespaces=NS):
+        style_id = style.get(f"{w}styleId")
+        if not style_id:
+            continue
+        
+        based_on = style.find("w:basedOn", namespaces=NS)
+        parents[style_id] = based_on.get(f"{w}val") if based_on is not None else None
+        
+        level = None
+        outline = style.find("w:pPr/w:outlineLvl", namespaces=NS)
+        if outline is not None:
+            try:
+                level = int(outline.get(f"{w}val"))
+            except (TypeError, ValueError):
+                level = None
+        else:
+            name = style.find("w:name", namespaces=NS)
+            match = _HEADING_STYLE_NAME_RE.match(name.get(f"{w}val", "")) if name is not None else None
+            if match:
+                level = int(match.group(1)) - 1
+        own[style_id] = level
+    
+    for style_id in own:
+        # Walk the basedOn chain up to the first style that decides the level.
+        current: Optional[str] = style_id
+        seen = set()
+        while current is not None and current not in seen and own.get(current) is None:
+            seen.add(current)
+            current = parents.get(current)
+        level = own.get(current) if current is not None else None
+        if level is not None and level < _BODY_TEXT_OUTLINE_LEVEL:
+            levels[style_id] = level
+    
+    return levels
+
+
+def get_paragraph_outline_level(paragraph: etree._Element,
+                                style_levels: Optional[Dict[str, int]] = None) -> Optional[int]:
+    """
+    Get the heading level of a paragraph (0 = top level), or None for body text.
+    
+    Direct w:outlineLvl wins over the level of the paragraph style. Without
+    style_levels (styles.xml not available) built-in heading style ids are
+    recognized by name.
+    """
+    p_pr = paragraph.find("w:pPr", namespaces=NS)
+    if p_pr is None:
+        return None
+    
+    w = f"{{{NS['w']}}}"
+    outline = p_pr.find("w:outlineLvl", namespaces=NS)
+    if outline is not None:
+        try:
+            level = int(outline.get(f"{w}val"))
+        except (TypeError, ValueError):
+            return None
+        return level if level < _BODY_TEXT_OUTLINE_LEVEL else None
+    
+    style = p_pr.find("w:pStyle", namespaces=NS)
+    if style is None:
+        return None
+    style_id = style.get(f"{w}val", "")
+    if style_levels is not None:
+        return style_levels.get(style_id)
+    match = _HEADING_STYLE_ID_RE.match(style_id)
+    return int(match.group(1)) - 1 if match else None
+
+
+class DocumentIndex:
+    """
+    Paragraph positions and heading map of a document, built once.
+    
+    Paragraph positions are 0-based indexes among all w:p in document order
+    (the same numbering as `doc_xml.xpath(".//w:p")`). Headings are kept as a
+    sorted list of positions, so the section enclosing any paragraph is found
+    with a binary search.
+    
+    Usage:
+        index = DocumentIndex.from_docx(docx_path)
+        pos = index.paragraph_index(p)
+        index.heading_before(pos)  # 'Введение'
+        index.describe(pos)        # 'Параграф 12, раздел «Введение»'
+    
+    The index can also be filled while streaming (see `stream_document`),
+    in which case elements are not remembered and only positions are known.
+    """
+    
+    def __init__(self, style_levels: Optional[Dict[str, int]] = None):
+        self.style_levels = style_levels
+        self.paragraph_count = 0
+        self.heading_positions: List[int] = []
+        self.headings: List[Tuple[int, str]] = []  # (level, text), parallel to heading_positions
+        self._positions: Dict[etree._Element, int] = {}
+        # lxml reuses an element proxy only while it is referenced, so keep them alive.
+        self._elements: List[etree._Element] = []
+    
+    @classmethod
+    def build(cls, doc_xml: etree._Element,
+              styles_xml: Optional[etree._Element] = None) -> "DocumentIndex":
+        """Index every paragraph of a parsed document (styles_xml: see get_paragraph_outline_level)."""
+        index = cls(get_heading_style_levels(styles_xml) if styles_xml is not None else None)
+        for position, paragraph in enumerate(doc_xml.iter(f"{{{NS['w']}}}p")):
+            index.add_paragraph(paragraph, position)
+        return index
+    
+    @classmethod
+    def from_docx(cls, docx_path: Path) -> "DocumentIndex":
+        """Index a .docx file (document.xml + heading styles from styles.xml)."""
+        return cls.build(get_document_xml(docx_path), get_styles_xml(docx_path))
+    
+    def add_paragraph(self, paragraph: etree._Element, position: int,
+                      text: Optional[str] = None, keep_element: bool = True) -> None:
+        """
+        Register one paragraph (in any order).
+        
+        Args:
+            paragraph: Paragraph element
+            position: Its 0-based position in the document
+            text: Paragraph text if already known (computed for headings otherwise)
+            keep_element: Remember the element for paragraph_index()
+        """
+        if keep_element:
+            self._positions[paragraph] = position
+            self._elements.append(paragraph)
+        self.paragraph_count = max(self.paragraph_count, position + 1)
+        
+        level = get_paragraph_outline_level(paragraph, self.style_levels)
+        if level is None:
+            return
+        if text is None:
+            text = get_paragraph_text(paragraph)
+        title = " ".join(text.split())
+        if title:
+            # Nested paragraphs (text boxes) may be streamed before their parent.
+            i = bisect.bisect_right(self.heading_positions, position)
+            self.heading_positions.insert(i, position)
+            self.headings.insert(i, (level, title))
+    
+    def paragraph_index(self, paragraph: etree._Element) -> int:
+        """Return the 0-based position of a paragraph, or -1 if not indexed."""
+        return self._positions.get(paragraph, -1)
+    
+    def heading_at(self, position: int) -> Optional[Tuple[int, int, str]]:
+        """
+        Find the nearest heading at or before a paragraph position.
+        
+        Returns:
+            (heading position, level, text), or None before the first heading
+        """
+        i = bisect.bisect_right(self.heading_positions, position) - 1
+        if i < 0:
+            return None
+        level, text = self.headings[i]
+        return self.heading_positions[i], level, text
+    
+    def heading_before(self, position: int) -> str:
+        """Return the text of the nearest heading at or before a position ('' if none)."""
+        heading = self.heading_at(position)
+        return heading[2] if heading else ""
+    
+    def describe(self, position: int, max_heading_length: int = 60) -> str:
+        """Human-readable location: 'Параграф N, раздел «X»' (N is 1-based)."""
+        location = f"Параграф {position + 1}"
+        heading = self.heading_before(position)
+        if heading:
+            if len(heading) > max_heading_length:
+                heading = heading[:max_heading_length] + "..."
+            location += f", раздел «{heading}»"
+        return location
+
+
+# One-entry cache for the function API below: callers usually ask about many
+# paragraphs of the same parsed document in a row.
+_last_index: Optional[Tuple[etree._Element, DocumentIndex]] = None
+
+
+def _get_document_index(doc_xml: etree._Element) -> DocumentIndex:
+    """Return the DocumentIndex of doc_xml, reusing the last one built."""
+    global _last_index
+    if _last_index is None or _last_index[0] is not doc_xml:
+        _last_index = (doc_xml, DocumentIndex.build(doc_xml))
+    return _last_index[1]
+
+
+def find_paragraph_index(doc_xml: etree._Element, paragraph: etree._Element) -> int:
+    """
+    Find the index of a paragraph in the document.
+    
+    The document is indexed once and reused while the same doc_xml is queried;
+    build a DocumentIndex directly if the tree is modified between calls.
+    
+    Args:
+        doc_xml: Document XML root
+        paragraph: Paragraph element to find
+        
+    Returns:
+        0-based index, or -1 if not found
+    """
+    return _get_document_index(doc_xml).paragraph_index(paragraph)
+
+
+def find_nearby_heading(doc_xml: etree._Element, paragraph_index: int) -> str:
+    """
+    Find the nearest heading before the given paragraph.
+    
+    doc_xml carries no styles, so headings are recognized by w:outlineLvl and
+    built-in heading style ids; DocumentIndex.from_docx() also resolves
+    custom heading styles.
+    
+    Args:
+        doc_xml: Document XML root
+        paragraph_index: Index of the paragraph
+        
+    Returns:
+        Heading text or empty string
+    """
+    return _get_document_index(doc_xml).heading_before(paragraph_index)
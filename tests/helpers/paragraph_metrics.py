@@ -0,0 +1,188 @@
+"""
+Columnar paragraph metrics for paragraph-level formatting rules.
+
+Instead of building a get_paragraph_properties() dict per paragraph and
+walking the document once per rule, ParagraphMetrics reads w:pPr of every
+paragraph once and appends the values the rules need (first-line indent,
+w:spacing line/lineRule, alignment, style id, text length) to typed
+`array.array` columns. Rules are then evaluated over whole columns, so an
+extra paragraph-level rule costs one pass over a few integer arrays instead
+of another pass over the XML.
+
+String values (alignment, line rule, style id) are interned per instance
+and stored as codes; MISSING marks a value that is not set directly on the
+paragraph.
+"""
+from array import array
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS, get_paragraph_text
+
+
+W = f"{{{NS['w']}}}"
+P_PR = f"{W}pPr"
+_IND = f"{W}ind"
+_SPACING = f"{W}spacing"
+_JC = f"{W}jc"
+_P_STYLE = f"{W}pStyle"
+_VAL = f"{W}val"
+_FIRST_LINE = f"{W}firstLine"
+_LINE = f"{W}line"
+_LINE_RULE = f"{W}lineRule"
+
+# Marker for "not set" in integer columns.
+MISSING = -(2 ** 31)
+
+
+def _parse_twips(value: Optional[str], rounded: bool = True) -> int:
+    """Parse a twips attribute; MISSING if absent or malformed."""
+    if not value:
+        return MISSING
+    try:
+        return int(round(float(value))) if rounded else int(value)
+    except (TypeError, ValueError):
+        return MISSING
+
+
+class ParagraphMetrics:
+    """
+    Per-paragraph formatting values stored column-wise.
+
+    Row i describes the i-th added paragraph; `positions[i]` is its 0-based
+    position among all w:p of the document (rows follow the order paragraphs
+    were added, which for streamed text boxes is not document order).
+
+    Usage:
+        metrics = ParagraphMetrics.build(doc_xml)
+        metrics.indent_deviations(709, tolerance=57)  # [(position, firstLine), ...]
+    """
+
+    def __init__(self):
+        self.positions = array("l")
+        self.first_line = array("l")  # w:ind/@w:firstLine, twips
+        self.has_spacing = array("b")  # 1 if w:spacing is set on the paragraph
+        self.spacing_line = array("l")  # w:spacing/@w:line
+        self.line_rule = array("h")  # code in line_rules
+        self.alignment = array("h")  # code in alignments (raw w:jc values)
+        self.style = array("h")  # code in style_ids
+        self.text_length = array("l")
+        self.line_rules: List[str] = []
+        self.alignments: List[str] = []
+        self.style_ids: List[str] = []
+        self._codes: Dict[int, Dict[str, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    @classmethod
+    def build(cls, doc_xml: etree._Element) -> "ParagraphMetrics":
+        """Collect metrics for all w:p of a parsed document.xml in one pass."""
+        metrics = cls()
+        for position, paragraph in enumerate(doc_xml.iter(f"{W}p")):
+            metrics.add(paragraph, position)
+        return metrics
+
+    def _code(self, values: List[str], value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        codes = self._codes.setdefault(id(values), {})
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def add(self, paragraph: etree._Element, position: int, text: Optional[str] = None) -> None:
+        """
+        Append one paragraph.
+
+        Args:
+            paragraph: w:p element
+            position: 0-based position among all w:p in document order
+            text: Paragraph text if already known (computed otherwise)
+        """
+        first_line = MISSING
+        spacing = None
+        jc = None
+        style = None
+
+        p_pr = paragraph.find(P_PR)
+        if p_pr is not None:
+            # One walk over the direct children of w:pPr instead of a find() per property.
+            for child in p_pr:
+                tag = child.tag
+                if tag == _IND:
+                    first_line = _parse_twips(child.get(_FIRST_LINE))
+                elif tag == _SPACING:
+                    spacing = child
+                elif tag == _JC:
+                    jc = child.get(_VAL)
+                elif tag == _P_STYLE:
+                    style = child.get(_VAL)
+
+        self.positions.append(position)
+        self.first_line.append(first_line)
+        if spacing is not None:
+            self.has_spacing.append(1)
+            self.spacing_line.append(_parse_twips(spacing.get(_LINE), rounded=False))
+            self.line_rule.append(self._code(self.line_rules, spacing.get(_LINE_RULE)))
+        else:
+            self.has_spacing.append(0)
+            self.spacing_line.append(MISSING)
+            self.line_rule.append(-1)
+        self.alignment.append(self._code(self.alignments, jc))
+        self.style.append(self._code(self.style_ids, style))
+        if text is None:
+            text = get_paragraph_text(paragraph)
+        self.text_length.append(len(text))
+
+    def code_of(self, values: List[str], value: str) -> int:
+        """Code of an interned value; -1 if no paragraph uses it."""
+        return self._codes.get(id(values), {}).get(value, -1)
+
+    def indent_deviations(self, *expected: int, tolerance: int) -> List[Tuple[int, int]]:
+        """
+        Paragraphs whose direct first-line indent differs from every expected value.
+
+        Returns:
+            (position, firstLine in twips) pairs, sorted by position
+        """
+        rows = [
+            (position, value)
+            for position, value in zip(self.positions, self.first_line)
+            if value != MISSING and all(abs(value - e) > tolerance for e in expected)
+        ]
+        rows.sort()
+        return rows
+
+    def count_indents(self) -> int:
+        """Number of paragraphs with a direct first-line indent."""
+        return len(self.first_line) - self.first_line.count(MISSING)
+
+    def spacing_deviations(self, low: int, high: int, line_rule: str = "auto") -> List[int]:
+        """
+        Positions of paragraphs whose direct line spacing with the given
+        lineRule is outside [low, high] (240 = single, 360 = 1.5), sorted.
+        """
+        code = self.code_of(self.line_rules, line_rule)
+        if code < 0:
+            return []
+        positions = [
+            position
+            for position, rule, line in zip(self.positions, self.line_rule, self.spacing_line)
+            if rule == code and line != MISSING and not (low <= line <= high)
+        ]
+        positions.sort()
+        return positions
+
+    def count_spacing(self) -> int:
+        """Number of paragraphs with direct w:spacing."""
+        return sum(self.has_spacing)
+
+    def alignment_counts(self) -> Dict[str, int]:
+        """Number of paragraphs per direct w:jc value."""
+        counts = Counter(self.alignment)
+        return {value: counts[code] for code, value in enumerate(self.alignments)}
@@ -0,0 +1,158 @@
+"""
+Session-wide cache of parsed .docx documents for the normocontrol tests.
+
+Every test used to reopen the ZIP and re-parse document.xml/styles.xml for
+each parametrized document. ParsedDocument keeps the parsed parts of one
+file (lxml trees, python-docx Document, style resolver, paragraph index,
+paragraph metrics and body text; the derived ones are built on first use),
+and ParsedDocumentCache shares them between tests with LRU eviction bounded
+by the size of the parsed XML.
+
+Cached objects are shared: tests must treat them as read-only.
+"""
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from docx import Document
+from lxml import etree
+
+from tests.helpers.document_text import DocumentText
+from tests.helpers.ooxml_styles import StyleResolver, get_theme_xml
+from tests.helpers.ooxml_utils import (
+    DocumentIndex,
+    get_document_xml,
+    get_styles_xml,
+)
+from tests.helpers.paragraph_metrics import ParagraphMetrics
+
+
+# Budget in bytes of uncompressed XML; the lxml trees built from it take a
+# few times more memory.
+DEFAULT_MAX_XML_BYTES = 64 * 1024 * 1024
+
+_PARSED_PARTS = ("word/document.xml", "word/styles.xml", "word/theme/theme1.xml")
+
+
+def _xml_size(docx_path: Path) -> int:
+    """Uncompressed size of the XML parts a ParsedDocument parses."""
+    with zipfile.ZipFile(docx_path, "r") as archive:
+        names = set(archive.namelist())
+        return sum(archive.getinfo(name).file_size for name in _PARSED_PARTS if name in names)
+
+
+class ParsedDocument:
+    """
+    Parsed parts of one .docx file.
+
+    Attributes:
+        path: Path to the .docx file
+        document_xml: Root of word/document.xml
+        styles_xml: Root of word/styles.xml (None if missing)
+        size: Uncompressed size of the parsed XML parts (cache weight)
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.document_xml: etree._Element = get_document_xml(self.path)
+        self.styles_xml: Optional[etree._Element] = get_styles_xml(self.path)
+        self.size = _xml_size(self.path)
+        self._docx = None
+        self._styles: Optional[StyleResolver] = None
+        self._index: Optional[DocumentIndex] = None
+        self._metrics: Optional[ParagraphMetrics] = None
+        self._document_text: Optional[DocumentText] = None
+
+    @property
+    def docx(self):
+        """python-docx Document (parsed on first use)."""
+        if self._docx is None:
+            self._docx = Document(self.path)
+        return self._docx
+
+    @property
+    def styles(self) -> StyleResolver:
+        """Style resolver for effective run fonts/sizes."""
+        if self._styles is None:
+            self._styles = StyleResolver(self.styles_xml, get_theme_xml(self.path))
+        return self._styles
+
+    @property
+    def index(self) -> DocumentIndex:
+        """Paragraph positions and heading map."""
+        if self._index is None:
+            self._index = DocumentIndex.build(self.document_xml, self.styles_xml)
+        return self._index
+
+    @property
+    def metrics(self) -> ParagraphMetrics:
+        """Columnar indent/spacing/alignment values of all paragraphs."""
+        if self._metrics is None:
+            self._metrics = ParagraphMetrics.build(self.document_xml)
+        return self._metrics
+
+    @property
+    def document_text(self) -> DocumentText:
+        """Body paragraph texts with offsets, for TextMatcher scans."""
+        if self._document_text is None:
+            self._document_text = DocumentText.build(self.document_xml, self.index)
+        return self._document_text
+
+    @property
+    def paragraph_texts(self) -> List[str]:
+        """Texts of body-level paragraphs, same as `[p.text for p in docx.paragraphs]`."""
+        return self.document_text.paragraphs
+
+    @property
+    def text(self) -> str:
+        """Body text with paragraphs joined by newlines."""
+        return self.document_text.text
+
+
+class ParsedDocumentCache:
+    """
+    LRU cache of ParsedDocument objects keyed by path, mtime and size.
+
+    Least recently used documents are dropped once the total XML size exceeds
+    max_bytes; the most recently requested document is always kept.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_XML_BYTES):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[str, int, int], ParsedDocument]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, docx_path: Path) -> ParsedDocument:
+        """Return the parsed document, parsing it on a miss."""
+        path = Path(docx_path).resolve()
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+        parsed = self._entries.get(key)
+        if parsed is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return parsed
+
+        self.misses += 1
+        parsed = ParsedDocument(path)
+        self._entries[key] = parsed
+        self.total_bytes += parsed.size
+        self._evict()
+        return parsed
+
+    def _evict(self) -> None:
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            _, parsed = self._entries.popitem(last=False)
+            self.total_bytes -= parsed.size
+
+    def clear(self) -> None:
+        """Drop all cached documents."""
+        self._entries.clear()
+        self.total_bytes = 0
@@ -1,15 +1,18 @@
 """
 Report generator for normocontrol checks.
 Collects issues and generates formatted reports.
+
+JsonlReportWriter/JsonlReportReader stream issues through a JSON Lines file
+instead, so long batch runs can be followed while they are running.
 """
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import List, Dict
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 import json
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """Represents a single formatting issue in a document."""
     document: str
@@ -21,12 +24,83 @@ class Issue:
     location: str = ""  # section, paragraph number, etc.
 
 
+class ReportSummary:
+    """
+    Incrementally maintained summary counters.
+    
+    `to_dict()` has the same shape as `NormocontrolReport.generate_summary()`,
+    but no issues are kept in memory.
+    """
+    
+    def __init__(self):
+        self.documents: List[str] = []
+        self._documents = set()
+        self.total_issues = 0
+        self.by_severity: Dict[str, int] = {'error': 0, 'warning': 0, 'info': 0}
+        self.by_category: Dict[str, int] = {}
+        self.by_document: Dict[str, int] = {}
+    
+    def add_document(self, document: str):
+        """Count a checked document (once)."""
+        if document not in self._documents:
+            self._documents.add(document)
+            self.documents.append(document)
+            self.by_document.setdefault(document, 0)
+    
+    def has_document(self, document: str) -> bool:
+        """Check if a document has been counted."""
+        return document in self._documents
+    
+    def add_issue(self, document: str, category: str, severity: str):
+        """Count one issue."""
+        self.total_issues += 1
+        self.by_severity[severity] = self.by_severity.get(severity, 0) + 1
+        self.by_category[category] = self.by_category.get(category, 0) + 1
+        self.by_document[document] = self.by_document.get(document, 0) + 1
+    
+    def to_dict(self) -> Dict:
+        """Summary in the `generate_summary()` format."""
+        return {
+            'total_documents': len(self.documents),
+            'total_issues': self.total_issues,
+            'errors': self.by_severity.get('error', 0),
+            'warnings': self.by_severity.get('warning', 0),
+            'info': self.by_severity.get('info', 0),
+            'by_category': dict(self.by_category),
+            # Like _count_by_document(): only documents that have issues.
+            'by_document': {doc: n for doc, n in self.by_document.items() if n},
+        }
+
+
 @dataclass
 class NormocontrolReport:
-    """Collects and formats normocontrol check results."""
+    """
+    Collects and formats normocontrol check results.
+    
+    Besides the `issues` list the report keeps secondary indexes (issues by
+    document/severity/category) and running counters, updated on every
+    added issue, so lookups and summaries do not rescan all issues.
+    Add issues through add_issue()/append_issue() to keep them in sync.
+    """
     issues: List[Issue] = field(default_factory=list)
     documents_checked: List[str] = field(default_factory=list)
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
+    _by_document: Dict[str, List[Issue]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_severity: Dict[str, List[Issue]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_category: Dict[str, List[Issue]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _summary: ReportSummary = field(default_factory=ReportSummary, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        for document in self.documents_checked:
+            self._summary.add_document(document)
+        for issue in self.issues:
+            self._index(issue)
+    
+    def _index(self, issue: Issue):
+        self._by_document.setdefault(issue.document, []).append(issue)
+        self._by_severity.setdefault(issue.severity, []).append(issue)
+        self._by_category.setdefault(issue.category, []).append(issue)
+        self._summary.add_issue(issue.document, issue.category, issue.severity)
     
     def add_issue(self, document: str, category: str, severity: str, 
                   description: str, expected: str = "", actual: str = "", 
@@ -41,54 +115,54 @@ class NormocontrolReport:
             actual=actual,
             location=location
         )
+        self.append_issue(issue)
+    
+    def append_issue(self, issue: Issue):
+        """Add an existing Issue object to the report."""
         self.issues.append(issue)
+        self._index(issue)
     
     def add_document(self, document: str):
         """Mark a document as checked."""
-        if document not in self.documents_checked:
+        if not self._summary.has_document(document):
             self.documents_checked.append(document)
+            self._summary.add_document(document)
     
     def get_issues_by_document(self, document: str) -> List[Issue]:
         """Get all issues for a specific document."""
-        return [i for i in self.issues if i.document == document]
+        return list(self._by_document.get(document, ()))
     
     def get_issues_by_severity(self, severity: str) -> List[Issue]:
         """Get all issues of a specific severity."""
-        return [i for i in self.issues if i.severity == severity]
+        return list(self._by_severity.get(severity, ()))
     
     def get_issues_by_category(self, category: str) -> List[Issue]:
         """Get all issues of a specific category."""
-        return [i for i in self.issues if i.category == category]
+        return list(self._by_category.get(category, ()))
     
     def has_errors(self) -> bool:
         """Check if there are any error-level issues."""
-        return any(i.severity == 'error' for i in self.issues)
+        return bool(self._summary.by_severity.get('error'))
     
     def generate_summary(self) -> Dict:
         """Generate summary statistics."""
         return {
             'total_documents': len(self.documents_checked),
             'total_issues': len(self.issues),
-            'errors': len([i for i in self.issues if i.severity == 'error']),
-            'warnings': len([i for i in self.issues if i.severity == 'warning']),
-            'info': len([i for i in self.issues if i.severity == 'info']),
+            'errors': self._summary.by_severity.get('error', 0),
+            'warnings': self._summary.by_severity.get('warning', 0),
+            'info': self._summary.by_severity.get('info', 0),
             'by_category': self._count_by_category(),
             'by_document': self._count_by_document(),
         }
     
     def _count_by_category(self) -> Dict[str, int]:
         """Count issues by category."""
-        counts = {}
-        for issue in self.issues:
-            counts[issue.category] = counts.get(issue.category, 0) + 1
-        return counts
+        return dict(self._summary.by_category)
     
     def _count_by_document(self) -> Dict[str, int]:
         """Count issues by document."""
-        counts = {}
-        for issue in self.issues:
-            counts[issue.document] = counts.get(issue.document, 0) + 1
-        return counts
+        return {doc: len(issues) for doc, issues in self._by_document.items()}
     
     def to_json(self, filepath: Path):
         """Export report as JSON."""
@@ -115,62 +189,8 @@ class NormocontrolReport:
     
     def to_markdown(self, filepath: Path):
         """Export report as Markdown."""
-        lines = []
-        lines.append("# Отчёт проверки нормоконтроля\n")
-        lines.append(f"**Дата проверки:** {self.timestamp}\n")
-        
-        # Summary
-        summary = self.generate_summary()
-        lines.append("## Сводка\n")
-        lines.append(f"- **Проверено документов:** {summary['total_documents']}")
-        lines.append(f"- **Всего проблем:** {summary['total_issues']}")
-        lines.append(f"  - ❌ Ошибки: {summary['errors']}")
-        lines.append(f"  - ⚠️ Предупреждения: {summary['warnings']}")
-        lines.append(f"  - ℹ️ Информация: {summary['info']}\n")
-        
-        # By category
-        if summary['by_category']:
-            lines.append("### По категориям\n")
-            for category, count in sorted(summary['by_category'].items()):
-                lines.append(f"- **{category}:** {count}")
-            lines.append("")
-        
-        # Issues by document
-        for doc in self.documents_checked:
-            doc_issues = self.get_issues_by_document(doc)
-            
-            lines.append(f"## {doc}\n")
-            
-            if not doc_issues:
-                lines.append("✅ Проблем не обнаружено\n")
-                continue
-            
-            lines.append(f"**Найдено проблем:** {len(doc_issues)}\n")
-            
-            # Group by category
-            by_cat = {}
-            for issue in doc_issues:
-                if issue.category not in by_cat:
-                    by_cat[issue.category] = []
-                by_cat[issue.category].append(issue)
-            
-            for category, cat_issues in sorted(by_cat.items()):
-                lines.append(f"### {category.title()}\n")
-                
-                for issue in cat_issues:
-                    icon = {'error': '❌', 'warning': '⚠️', 'info': 'ℹ️'}.get(issue.severity, '•')
-                    lines.append(f"{icon} **{issue.description}**")
-                    
-                    if issue.expected:
-                        lines.append(f"  - Ожидается: `{issue.expected}`")
-                    if issue.actual:
-                        lines.append(f"  - Фактически: `{issue.actual}`")
-                    if issue.location:
-                        lines.append(f"  - Расположение: {issue.location}")
-                    lines.append("")
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+        documents = ((doc, self.get_issues_by_document(doc)) for doc in self.documents_checked)
+        write_markdown(filepath, self.timestamp, self.generate_summary(), documents)
     
     def to_text(self, filepath: Path):
         """Export report as plain text."""
@@ -218,3 +238,268 @@ class NormocontrolReport:
         
         with open(filepath, 'w', encoding='utf-8') as f:
             f.write('\n'.join(lines))
+
+
+class JsonlReportWriter:
+    """
+    Streams a report to a JSON Lines file as issues are produced.
+    
+    Accepts the same add_document()/add_issue() calls as NormocontrolReport.
+    One JSON object per line, distinguished by "type":
+        {"type": "report", "timestamp": ...}      first line
+        {"type": "document", "document": ...}     a document was checked
+        {"type": "issue", "document": ..., ...}   Issue fields
+        {"type": "document_end", "document": ..., "issues": N}
+    The file is flushed after every document, so a reader sees complete
+    documents while the run is still in progress.
+    
+    Usage:
+        with JsonlReportWriter(path) as sink:
+            sink.add_document(name)
+            sink.add_issue(name, "fonts", "error", "...")
+            sink.end_document(name)
+    """
+    
+    def __init__(self, filepath: Path, timestamp: Optional[str] = None):
+        self.filepath = Path(filepath)
+        self.summary = ReportSummary()
+        self.timestamp = timestamp or datetime.now().isoformat()
+        self._pending: Dict[str, int] = {}
+        self._file = open(self.filepath, 'w', encoding='utf-8')
+        self._write({'type': 'report', 'timestamp': self.timestamp})
+        self._file.flush()
+    
+    def _write(self, record: Dict[str, Any]):
+        self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+    
+    def add_document(self, document: str):
+        """Start a document."""
+        self.summary.add_document(document)
+        self._pending.setdefault(document, 0)
+        self._write({'type': 'document', 'document': document})
+    
+    def add_issue(self, document: str, category: str, severity: str,
+                  description: str, expected: str = "", actual: str = "",
+                  location: str = ""):
+        """Write one issue."""
+        issue = Issue(document, category, severity, description, expected, actual, location)
+        self.write_issue(issue)
+    
+    def write_issue(self, issue: Issue):
+        """Write an existing Issue object."""
+        self.summary.add_issue(issue.document, issue.category, issue.severity)
+        self._pending[issue.document] = self._pending.get(issue.document, 0) + 1
+        self._write({'type': 'issue', **asdict(issue)})
+    
+    def end_document(self, document: str):
+        """Finish a document and flush it to disk."""
+        self._write({'type': 'document_end', 'document': document,
+                     'issues': self._pending.pop(document, 0)})
+        self._file.flush()
+    
+    def close(self):
+        """Flush and close the file."""
+        if not self._file.closed:
+            self._file.close()
+    
+    def __enter__(self) -> "JsonlReportWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class JsonlReportReader:
+    """
+    Reads a JSON Lines report, possibly while it is still being written.
+    
+    `poll()` consumes only the complete lines appended since the previous
+    call and updates `summary`, so following a running batch costs time
+    proportional to the new output, not to the whole file.
+    
+    Usage:
+        reader = JsonlReportReader(path)
+        reader.poll()
+        reader.summary.to_dict()  # same shape as generate_summary()
+    """
+    
+    def __init__(self, filepath: Path):
+        self.filepath = Path(filepath)
+        self.summary = ReportSummary()
+        self.timestamp: Optional[str] = None
+        self.finished_documents: List[str] = []
+        self._offset = 0
+    
+    def poll(self) -> int:
+        """
+        Read newly appended records.
+        
+        Returns:
+            Number of records consumed
+        """
+        count = 0
+        with open(self.filepath, 'rb') as f:
+            f.seek(self._offset)
+            for raw in f:
+                if not raw.endswith(b'\n'):
+                    break  # partially written line, retry on the next poll
+                self._offset += len(raw)
+                if raw.strip():
+                    self._consume(json.loads(raw))
+                    count += 1
+        return count
+    
+    def _consume(self, record: Dict[str, Any]):
+        kind = record.get('type')
+        if kind == 'report':
+            self.timestamp = record.get('timestamp')
+        elif kind == 'document':
+            self.summary.add_document(record['document'])
+        elif kind == 'issue':
+            self.summary.add_issue(record['document'], record['category'], record['severity'])
+        elif kind == 'document_end':
+            self.finished_documents.append(record['document'])
+    
+    def _iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over complete records of the whole file."""
+        with open(self.filepath, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.endswith('\n') and line.strip():
+                    yield json.loads(line)
+    
+    def iter_issues(self) -> Iterator[Issue]:
+        """Iterate over all issues in the file (one line in memory at a time)."""
+        for record in self._iter_records():
+            if record.get('type') == 'issue':
+                yield _issue_from_record(record)
+    
+    def iter_documents(self, order: Optional[List[str]] = None) -> Iterator[Tuple[str, List[Issue]]]:
+        """
+        Iterate over (document, issues) pairs, one document in memory at a time.
+        
+        Args:
+            order: Documents in the desired order (default: file order).
+                   Documents are found by byte offset, so reordering does
+                   not load the whole file.
+        """
+        offsets: Dict[str, int] = {}
+        with open(self.filepath, 'rb') as f:
+            offset = 0
+            for raw in f:
+                if raw.endswith(b'\n') and raw.strip():
+                    record = json.loads(raw)
+                    if record.get('type') == 'document':
+                        offsets.setdefault(record['document'], offset)
+                offset += len(raw)
+            
+            for document in (list(offsets) if order is None else order):
+                issues: List[Issue] = []
+                if document in offsets:
+                    f.seek(offsets[document])
+                    for raw in f:
+                        if not raw.endswith(b'\n'):
+                            break
+                        if not raw.strip():
+                            continue
+                        record = json.loads(raw)
+                        if record.get('document') != document:
+                            continue  # another writer's document interleaved
+                        if record.get('type') == 'issue':
+                            issues.append(_issue_from_record(record))
+                        elif record.get('type') == 'document_end':
+                            break
+                yield document, issues
+    
+    def to_report(self) -> NormocontrolReport:
+        """Load the whole file into a NormocontrolReport (for markdown/text export)."""
+        report = NormocontrolReport()
+        for record in self._iter_records():
+            kind = record.get('type')
+            if kind == 'report':
+                report.timestamp = record.get('timestamp', report.timestamp)
+            elif kind == 'document':
+                report.add_document(record['document'])
+            elif kind == 'issue':
+                report.append_issue(_issue_from_record(record))
+        return report
+
+
+def write_markdown(filepath: Path, timestamp: str, summary: Dict,
+                   documents: Iterable[Tuple[str, List[Issue]]]):
+    """
+    Write a Markdown report section by section.
+    
+    Args:
+        filepath: Output file
+        timestamp: Report timestamp
+        summary: Counters in the `generate_summary()` format
+        documents: (document, issues) pairs in report order; consumed lazily,
+                   so a JsonlReportReader.iter_documents() stream is never
+                   held in memory as a whole
+    """
+    with open(filepath, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(_markdown_header(timestamp, summary)))
+        for doc, doc_issues in documents:
+            f.write('\n' + '\n'.join(_markdown_document(doc, doc_issues)))
+
+
+def _markdown_header(timestamp: str, summary: Dict) -> List[str]:
+    """Title and summary lines of a Markdown report."""
+    lines = []
+    lines.append("# Отчёт проверки нормоконтроля\n")
+    lines.append(f"**Дата проверки:** {timestamp}\n")
+    
+    # Summary
+    lines.append("## Сводка\n")
+    lines.append(f"- **Проверено документов:** {summary['total_documents']}")
+    lines.append(f"- **Всего проблем:** {summary['total_issues']}")
+    lines.append(f"  - ❌ Ошибки: {summary['errors']}")
+    lines.append(f"  - ⚠️ Предупреждения: {summary['warnings']}")
+    lines.append(f"  - ℹ️ Информация: {summary['info']}\n")
+    
+    # By category
+    if summary['by_category']:
+        lines.append("### По категориям\n")
+        for category, count in sorted(summary['by_category'].items()):
+            lines.append(f"- **{category}:** {count}")
+        lines.append("")
+    return lines
+
+
+def _markdown_document(doc: str, doc_issues: List[Issue]) -> List[str]:
+    """Lines of one document's section of a Markdown report."""
+    lines = [f"## {doc}\n"]
+    
+    if not doc_issues:
+        lines.append("✅ Проблем не обнаружено\n")
+        return lines
+    
+    lines.append(f"**Найдено проблем:** {len(doc_issues)}\n")
+    
+    # Group by category
+    by_cat = {}
+    for issue in doc_issues:
+        if issue.category not in by_cat:
+            by_cat[issue.category] = []
+        by_cat[issue.category].append(issue)
+    
+    for category, cat_issues in sorted(by_cat.items()):
+        lines.append(f"### {category.title()}\n")
+        
+        for issue in cat_issues:
+            icon = {'error': '❌', 'warning': '⚠️', 'info': 'ℹ️'}.get(issue.severity, '•')
+            lines.append(f"{icon} **{issue.description}**")
+            
+            if issue.expected:
+                lines.append(f"  - Ожидается: `{issue.expected}`")
+            if issue.actual:
+                lines.append(f"  - Фактически: `{issue.actual}`")
+            if issue.location:
+                lines.append(f"  - Расположение: {issue.location}")
+            lines.append("")
+    return lines
+
+
+def _issue_from_record(record: Dict[str, Any]) -> Issue:
+    """Build an Issue from a JSON Lines "issue" record."""
+    return Issue(**{k: v for k, v in record.items() if k in Issue.__dataclass_fields__})
@@ -0,0 +1,124 @@
+"""
+On-disk cache of normocontrol results.
+
+Entries are JSON files named by a content key (SHA-256 of the .docx bytes,
+the checklist configuration and the checker version), so an unchanged
+document checked against an unchanged checklist is answered without parsing.
+Eviction is LRU by file mtime (touched on every hit), bounded both by the
+number of entries and by their total size.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def file_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the hex SHA-256 digest of a file (read in chunks)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def make_cache_key(*parts: str) -> str:
+    """Combine key parts (content hash, config hash, version...) into one key."""
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Directory-backed LRU cache of serialized issue lists.
+
+    Writes are atomic (temp file + rename), so several batch workers may
+    share one cache directory.
+    """
+
+    def __init__(self, cache_dir: Path,
+                 max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Return cached issues for key, or None on a miss.
+
+        A hit refreshes the entry's mtime so it becomes most recently used.
+        """
+        data = self._read(key)
+        return data.get("issues") if data is not None else None
+
+    def put(self, key: str, issues: List[Dict[str, Any]]) -> None:
+        """Store issues under key and evict least recently used entries."""
+        self._write(key, {"issues": issues})
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Load the JSON object stored under key and mark it as recently used."""
+        path = self._entry_path(key)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def _write(self, key: str, data: Dict[str, Any]) -> None:
+        """Atomically store a JSON object under key, then evict."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        payload = json.dumps(data, ensure_ascii=False)
+
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+            os.replace(tmp_name, self._entry_path(key))
+        except OSError:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            return
+
+        self.evict()
+
+    def evict(self) -> None:
+        """Drop oldest entries until both the count and size limits hold."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        count = len(entries)
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in entries:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            count -= 1
+            total -= size
@@ -0,0 +1,88 @@
+"""
+Tests for the AI review response cache (.github/scripts/ai_response_cache.py).
+"""
+import threading
+import time
+
+from ai_response_cache import ResponseCache, cache_key
+
+
+def _payload(content="prompt", model="gpt5-mini", temperature=0.3):
+    return {"model": model, "messages": [{"role": "user", "content": content}], "temperature": temperature}
+
+
+def test_key_depends_on_model_temperature_and_prompt():
+    key = cache_key(_payload())
+    assert cache_key(_payload()) == key
+    assert len({key, cache_key(_payload("other")), cache_key(_payload(model="phi-3.5-mini")),
+                cache_key(_payload(temperature=0.0))}) == 4
+
+
+def test_entries_expire_after_ttl(tmp_path):
+    now = [1000.0]
+    cache = ResponseCache(tmp_path, ttl=60, clock=lambda: now[0])
+    cache.put("old", "ответ", "gpt5-mini")
+    assert cache.get("old")["text"] == "ответ"
+
+    now[0] += 61
+    assert cache.get("old") is None
+    cache.put("new", "ответ 2")
+    assert sorted(path.name for path in tmp_path.glob("*.json")) == ["new.json"]
+
+
+def test_fetch_calls_once_and_skips_failures(tmp_path):
+    cache = ResponseCache(tmp_path)
+    calls = []
+
+    def call():
+        calls.append(1)
+        return True, "ответ"
+
+    assert cache.fetch("k", call) == (True, "ответ", "model")
+    assert cache.fetch("k", call) == (True, "ответ", "cache")
+    assert len(calls) == 1
+
+    assert cache.fetch("bad", lambda: (False, "Error invoking model")) == (False, "Error invoking model", "model")
+    assert cache.get("bad") is None and not list(tmp_path.glob("*.lock"))
+
+
+def test_concurrent_identical_requests_are_coalesced(tmp_path):
+    calls = []
+    results = []
+
+    def call():
+        calls.append(1)
+        time.sleep(0.3)
+        return True, "ответ"
+
+    def worker():
+        results.append(ResponseCache(tmp_path, poll=0.05).fetch("k", call))
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert sorted(source for _, _, source in results) == ["coalesced", "coalesced", "model"]
+    assert {text for _, text, _ in results} == {"ответ"}
+
+
+def test_waiter_takes_over_when_the_owner_fails(tmp_path):
+    started = threading.Event()
+    results = []
+
+    def failing():
+        started.set()
+        time.sleep(0.2)
+        return False, "Error calling models API: timeout"
+
+    owner = threading.Thread(target=lambda: results.append(ResponseCache(tmp_path).fetch("k", failing)))
+    owner.start()
+    started.wait()
+    waiter = ResponseCache(tmp_path, poll=0.05).fetch("k", lambda: (True, "ответ"))
+    owner.join()
+
+    assert results == [(False, "Error calling models API: timeout", "model")]
+    assert waiter == (True, "ответ", "model")
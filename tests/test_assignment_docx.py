@@ -0,0 +1,99 @@
+"""
+Tests for batch assignment generation (scripts/generate_assignment_docx.py).
+
+The BrSTU template is not in the repository, so a small template with the
+same labels is built with python-docx.
+"""
+import zipfile
+
+import pytest
+
+import generate_assignment_docx as gen
+from students_registry import Student
+
+docx = pytest.importorskip("docx")
+
+
+VARIANT = gen.Variant(3, "Вариант 03 — Бронь аудиторий", "## Вариант 03 — Бронь аудиторий\n\n- MVP\tпункт\n- API")
+
+
+def _student(name, latin, number):
+    return Student(variant=3, group="АС-63", number=number, sub="1", name=name, name_latin=latin,
+                   directory=f"./students/{latin}", github="")
+
+
+@pytest.fixture
+def template(tmp_path):
+    doc = docx.Document()
+    doc.add_paragraph("ЗАДАНИЕ")
+    head = doc.add_table(rows=2, cols=2)
+    head.cell(0, 0).text = "ФИО студента"
+    head.cell(1, 0).text = "Номер группы"
+    body = doc.add_table(rows=3, cols=2)
+    body.cell(0, 0).text = "1. Тема проекта"
+    body.cell(1, 0).text = "1.Постановка задачи"
+    body.cell(2, 0).text = "Дата выдачи"
+    path = tmp_path / "template.docx"
+    doc.save(str(path))
+    return path
+
+
+def _legacy(template, student, variant, issued_date):
+    """document.xml as the old per-student python-docx flow produced it."""
+    doc = docx.Document(str(template))
+    for label, value in gen._field_values(student, variant, issued_date):
+        ti, ri, ci = gen._find_cells_containing(doc, label)[0]
+        doc.tables[ti].rows[ri].cells[ci + 1].text = value
+    from docx.opc.oxml import serialize_part_xml
+    return serialize_part_xml(doc.element)
+
+
+def test_cells_are_filled_like_the_per_student_flow(template, tmp_path):
+    student = _student("Иванов Иван", "IvanovIvan", "1")
+    out = tmp_path / "out" / "ivanov.docx"
+    [(path, actions, written)] = gen.generate_assignments(template, [(out, student, VARIANT, "2025-09-01", False)])
+
+    assert path == out and written
+    assert actions[0] == "filled [Тема проекта] -> (table 1 row 0 col 1)"
+    with zipfile.ZipFile(out) as zf:
+        assert zf.read("word/document.xml") == _legacy(template, student, VARIANT, "2025-09-01")
+        with zipfile.ZipFile(template) as original:
+            assert sorted(zf.namelist()) == sorted(original.namelist())
+            assert zf.read("word/styles.xml") == original.read("word/styles.xml")
+    filled = docx.Document(str(out))
+    assert filled.tables[0].cell(0, 1).text == "Иванов Иван"
+    assert filled.tables[1].cell(1, 1).text == VARIANT.body_markdown
+
+
+def test_output_is_byte_stable_across_runs_and_worker_counts(template, tmp_path):
+    students = [_student(f"Студент {i}", f"Student{i}", str(i)) for i in range(6)]
+
+    def jobs(out_dir):
+        return [(out_dir / f"{s.name_latin}.docx", s, VARIANT, "2025-09-01", False) for s in students]
+
+    serial = gen.generate_assignments(template, jobs(tmp_path / "serial"))
+    pooled = gen.generate_assignments(template, jobs(tmp_path / "pooled"), workers=2)
+    assert [r[1] for r in serial] == [r[1] for r in pooled]
+    for s in students:
+        data = (tmp_path / "serial" / f"{s.name_latin}.docx").read_bytes()
+        assert data == (tmp_path / "pooled" / f"{s.name_latin}.docx").read_bytes()
+
+    rerun = gen.generate_assignments(template, jobs(tmp_path / "serial"))
+    assert not any(written for _, _, written in rerun)
+
+
+def test_dry_run_reports_missing_labels_and_writes_nothing(template, tmp_path):
+    doc = docx.Document(str(template))
+    doc.tables[0]._tbl.getparent().remove(doc.tables[0]._tbl)
+    doc.save(str(template))
+    out = tmp_path / "out" / "x.docx"
+
+    [(_, actions, written)] = gen.generate_assignments(
+        template, [(out, _student("Иванов Иван", "IvanovIvan", "1"), VARIANT, None, True)])
+    assert actions == [
+        "would-fill [Тема проекта] -> (table 0 row 0 col 1)",
+        "would-fill [Постановка задачи] -> (table 0 row 1 col 1)",
+        "label-not-found: ФИО",
+        "label-not-found: груп",
+    ]
+    assert not written and not out.exists()
@@ -0,0 +1,74 @@
+"""
+Tests for batch mode of check_it_docx (scripts/standards_verification/check_it_docx.py).
+"""
+import json
+
+import pytest
+
+import check_it_docx as checker
+from tests.helpers.docx_corpus import CorpusSpec, generate_explanatory_note
+
+
+def _clean_document(docx_path, doc_name):
+    """Stand-in for `_check_in_worker` (module level, so the pool can pickle it)."""
+    return [], False, []
+
+
+@pytest.fixture
+def repo_root(tmp_path, monkeypatch):
+    """Reports go to tmp_path/normocontrol_reports; checklists still come from the repository."""
+    standards_dir = checker._standards_dir()
+    monkeypatch.setattr(checker, "_standards_dir", lambda: standards_dir)
+    monkeypatch.setattr(checker, "_resolve_repo_root", lambda: tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def cohort(tmp_path):
+    students = tmp_path / "students"
+    for seed, student in enumerate(("Beta", "Alpha")):
+        generate_explanatory_note(students / student / "task_03" / checker.TARGET_DOCX_NAME, CorpusSpec(6, seed=seed))
+    broken = students / "Gamma" / "task_03" / checker.TARGET_DOCX_NAME
+    broken.parent.mkdir(parents=True)
+    broken.write_bytes(b"not a zip archive")
+    (students / "Alpha" / "task_03" / f"~${checker.TARGET_DOCX_NAME}").write_bytes(b"lock")
+    (students / "Alpha" / "task_02").mkdir()
+    (students / "Alpha" / "task_02" / checker.TARGET_DOCX_NAME).write_bytes(b"other task")
+    return students
+
+
+def test_batch_documents_are_found_per_student(cohort):
+    found = checker.find_batch_documents(cohort)
+    assert [path.relative_to(cohort).as_posix() for path in found] == [
+        f"{student}/task_03/{checker.TARGET_DOCX_NAME}" for student in ("Alpha", "Beta", "Gamma")
+    ]
+
+
+def test_batch_writes_merged_report_in_path_order(cohort, repo_root, capsys):
+    code = checker.main(["--batch", str(cohort), "--jobs", "2"])
+
+    assert code == 1  # the corrupt document is an error, the pool survived it
+    report_dir = repo_root / "normocontrol_reports"
+    [report] = report_dir.glob("it_normocontrol_report_*.md")
+    names = [f"{student}/task_03/{checker.TARGET_DOCX_NAME}" for student in ("Alpha", "Beta", "Gamma")]
+    text = report.read_text(encoding="utf-8")
+    positions = [text.index(f"## {name}\n") for name in names]
+    assert positions == sorted(positions)
+    assert "Не удалось прочитать документ" in text[positions[2]:]
+
+    [summary] = report_dir.glob("it_normocontrol_summary_*.md")
+    rows = [line for line in summary.read_text(encoding="utf-8").splitlines() if line.startswith("| ") and "`" in line]
+    assert [row.split(" | ")[0] for row in rows] == ["| Alpha", "| Beta", "| Gamma"]
+    assert rows[2].endswith("❌ |")
+
+    [jsonl] = report_dir.glob("it_normocontrol_report_*.jsonl")
+    records = [json.loads(line) for line in jsonl.read_text(encoding="utf-8").splitlines()]
+    assert sorted(r["document"] for r in records if r["type"] == "document_end") == names
+    assert "Checked: 3 document(s) with 2 worker(s)" in capsys.readouterr().out
+
+
+def test_batch_exit_code_is_zero_without_errors(cohort, repo_root, monkeypatch):
+    (cohort / "Gamma" / "task_03" / checker.TARGET_DOCX_NAME).unlink()
+    monkeypatch.setattr(checker, "_check_in_worker", _clean_document)
+
+    assert checker.main(["--batch", str(cohort), "--jobs", "1", "--no-cache"]) == 0
@@ -0,0 +1,97 @@
+"""
+Tests for per-rule profiling of normocontrol checks (tests/helpers/check_profiler.py).
+"""
+import time
+
+from docx import Document
+
+import check_it_docx as checker
+from tests.helpers.check_profiler import STREAM_RULE, CheckProfiler
+from tests.helpers.ooxml_stream import DocumentVisitor, stream_document
+
+
+class _SlowCheck(DocumentVisitor):
+    def __init__(self):
+        self.paragraphs = 0
+        self.ended = False
+
+    def on_paragraph(self, paragraph, index, text):
+        self.paragraphs += 1
+
+    def end(self):
+        time.sleep(0.01)
+        self.ended = True
+
+
+class _CountingCheck(DocumentVisitor):
+    pass
+
+
+def _make_docx(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Первый ").add_run("абзац")
+    doc.add_paragraph("Второй")
+    path = tmp_path / "profile.docx"
+    doc.save(path)
+    return path
+
+
+def test_document_profile_charges_rules(tmp_path):
+    path = _make_docx(tmp_path)
+    profiler = CheckProfiler()
+    slow = _SlowCheck()
+
+    with profiler.document("doc.docx") as wrap:
+        stream_document(path, wrap([slow, _CountingCheck()]))
+
+    # Wrapped visitors still see everything.
+    assert slow.paragraphs == 2 and slow.ended
+
+    timings = {timing.rule: timing for timing in profiler.timings}
+    assert set(timings) == {STREAM_RULE, "SlowCheck", "CountingCheck"}
+    assert timings["SlowCheck"].wall_s >= 0.01
+    # 2 paragraphs, 3 runs, 1 section
+    assert timings["SlowCheck"].nodes == timings["CountingCheck"].nodes == 6
+    assert timings[STREAM_RULE].nodes == 6
+
+
+def test_aggregate_and_json_roundtrip(tmp_path):
+    profiler = CheckProfiler()
+    for document, seconds in (("a.docx", 0.002), ("b.docx", 0.001)):
+        with profiler.measure(document, "check_fonts") as timing:
+            timing.nodes = 10
+            time.sleep(seconds)
+        with profiler.measure(document, "check_margins"):
+            pass
+
+    rows = profiler.aggregate()
+    assert [row["rule"] for row in rows] == ["check_fonts", "check_margins"]
+    fonts = rows[0]
+    assert fonts["documents"] == 2
+    assert fonts["nodes"] == 20
+    assert fonts["slowest_document"] == "a.docx"
+    assert abs(fonts["mean_s"] - fonts["total_s"] / 2) < 1e-12
+
+    path = tmp_path / "profile.json"
+    profiler.to_json(path)
+    loaded = CheckProfiler.from_json(path)
+    assert loaded.to_records() == profiler.to_records()
+
+    markdown = profiler.to_markdown()
+    assert "| check_fonts | 2 |" in markdown
+    assert "`a.docx`" in markdown and "`b.docx`" in markdown
+
+
+def test_cli_profile_picks_the_checklist_and_profile_checks_times_rules(tmp_path, monkeypatch):
+    standards_dir = checker._standards_dir()
+    monkeypatch.setattr(checker, "_standards_dir", lambda: standards_dir)
+    monkeypatch.setattr(checker, "_resolve_repo_root", lambda: tmp_path)
+    path = _make_docx(tmp_path)
+    reports = tmp_path / "normocontrol_reports"
+
+    checker.main([str(path), "--profile", checker.DEFAULT_PROFILE, "--no-cache"])
+    assert len(list(reports.glob("it_normocontrol_report_*.md"))) == 1
+    assert not list(reports.glob("it_normocontrol_profile_*.json"))
+
+    checker.main([str(path), "--profile-checks", "--no-cache"])
+    assert len(list(reports.glob("it_normocontrol_profile_*.json"))) == 1
@@ -0,0 +1,142 @@
+"""
+Synthetic benchmark corpus (tests/helpers/docx_corpus.py) and throughput
+regression suite of check_it_docx
+(scripts/standards_verification/benchmark_check_it_docx.py).
+
+The benchmark itself only runs with --checker-benchmark:
+
+    pytest tests/test_checker_benchmark.py --checker-benchmark
+    pytest tests/test_checker_benchmark.py --checker-benchmark --update-checker-baseline
+"""
+import pytest
+from docx import Document
+
+import benchmark_check_it_docx as bench
+from tests.helpers.docx_corpus import CorpusSpec, ensure_corpus
+
+
+def test_corpus_has_note_parts(tmp_path):
+    [path] = ensure_corpus(tmp_path, [CorpusSpec(12)])
+    doc = Document(path)
+    texts = [p.text for p in doc.paragraphs]
+
+    assert len(doc.tables) == 3 and len(doc.inline_shapes) == 2
+    assert sum(text.startswith("Таблица ") for text in texts) == 3
+    assert sum(text.startswith("Рисунок ") for text in texts) == 2
+    assert any("[" in text for text in texts)
+    for title in ("Введение", "Заключение", "Список использованных источников", "Приложение А"):
+        assert title in texts
+    assert texts.count("1 Анализ предметной области") == 2  # contents + chapter
+    assert len(doc.sections) == 2
+
+
+def test_corpus_is_reused_and_scales(tmp_path):
+    small, large = ensure_corpus(tmp_path, [CorpusSpec(5), CorpusSpec(20)])
+    mtime = small.stat().st_mtime_ns
+    assert ensure_corpus(tmp_path, [CorpusSpec(5)]) == [small]
+    assert small.stat().st_mtime_ns == mtime
+
+    assert len(Document(large).paragraphs) > 2 * len(Document(small).paragraphs)
+
+
+def _run(calibration_s, check_s, rss_kb=10240, rules=None):
+    return {
+        "date": "2026-01-01T00:00:00",
+        "calibration_s": calibration_s,
+        "documents": {"500": {
+            "check_s": check_s,
+            "parse_s": 0.1,
+            "rules": rules or {"FontCheck": check_s / 2},
+            "rss_growth_kb": rss_kb,
+        }},
+    }
+
+
+def test_regressions_scale_with_calibration():
+    baseline = _run(0.1, 1.0)
+
+    assert bench.find_regressions(_run(0.1, 1.2), baseline) == []
+    # A twice slower machine is allowed twice the time.
+    assert bench.find_regressions(_run(0.2, 2.2), baseline) == []
+
+    [regression] = bench.find_regressions(_run(0.1, 1.5), baseline)
+    assert regression.startswith("500 стр.: проверка")
+    assert "FontCheck 500.0 → 750.0 мс" in regression
+
+    [memory] = bench.find_regressions(_run(0.1, 1.0, rss_kb=40960), baseline)
+    assert "память" in memory
+
+
+
+def test_parse_time_and_millisecond_noise_are_not_gated():
+    baseline = _run(0.1, 0.05)
+    run = _run(0.1, 0.065)  # ×1.3, but only 15 ms slower
+    run["documents"]["500"]["parse_s"] = 0.5
+
+    assert bench.find_regressions(run, baseline) == []
+
+def test_slow_run_is_remeasured_before_reporting(monkeypatch, tmp_path):
+    baseline = _run(0.1, 1.0)
+    remeasured = []
+
+    def remeasure(run, corpus_dir, repeat):
+        remeasured.append(corpus_dir)
+        run["documents"]["500"]["check_s"] = 1.1  # the first run hit a noisy moment
+
+    monkeypatch.setattr(bench, "remeasure_checks", remeasure)
+    assert bench.confirmed_regressions(_run(0.1, 1.5), baseline, tmp_path) == []
+    assert remeasured == [tmp_path]
+
+    monkeypatch.setattr(bench, "remeasure_checks", lambda run, corpus_dir, repeat: remeasured.append(corpus_dir))
+    [regression] = bench.confirmed_regressions(_run(0.1, 1.5), baseline, tmp_path, retries=2)
+    assert regression.startswith("500 стр.: проверка")
+    assert len(remeasured) == 3
+
+
+def test_baseline_of_another_checker_version_is_not_compared():
+    baseline = dict(_run(0.1, 1.0), checker_version="4", generator_version=1, checklist="it_short")
+    run = dict(baseline, checker_version="5")
+
+    assert bench.baseline_mismatch(baseline, dict(baseline)) is None
+    assert bench.baseline_mismatch(run, baseline) == "checker_version '4' in the baseline, '5' now"
+
+
+def test_committed_baseline_matches_the_checker():
+    [latest] = bench.load_baseline()[-1:]
+
+    assert latest["checker_version"] == bench.CHECKER_VERSION
+    assert latest["generator_version"] == bench.GENERATOR_VERSION
+
+
+def test_baseline_keeps_history(tmp_path):
+    path = tmp_path / "baseline.json"
+    assert bench.load_baseline(path) == []
+
+    bench.append_baseline(_run(0.1, 1.0), path)
+    bench.append_baseline(_run(0.1, 0.8), path)
+    history = bench.load_baseline(path)
+    assert [run["documents"]["500"]["check_s"] for run in history] == [1.0, 0.8]
+
+
+def test_checker_against_baseline(request):
+    if not request.config.getoption("--checker-benchmark"):
+        pytest.skip("benchmark runs only with --checker-benchmark")
+
+    pages = tuple(int(p) for p in request.config.getoption("--checker-benchmark-pages").split(","))
+    corpus_dir = request.config.cache.mkdir("checker_benchmark_corpus")
+    run = bench.run_benchmark(corpus_dir, pages)
+    print("\n" + bench.format_run(run))
+
+    if request.config.getoption("--update-checker-baseline"):
+        bench.append_baseline(run)
+        return
+
+    history = bench.load_baseline()
+    if not history:
+        pytest.skip(f"no baseline in {bench.BASELINE_PATH} (record one with --update-checker-baseline)")
+    mismatch = bench.baseline_mismatch(run, history[-1])
+    if mismatch:
+        pytest.skip(f"baseline is not comparable ({mismatch}); record a new one with --update-checker-baseline")
+    regressions = bench.confirmed_regressions(run, history[-1], corpus_dir)
+    if regressions:
+        pytest.fail("Регрессия производительности check_it_docx:\n" + "\n".join(regressions))
@@ -0,0 +1,82 @@
+"""
+Tests for checklist profiles and their compiled form
+(load_profile in scripts/standards_verification/check_it_docx.py).
+"""
+import json
+import os
+import shutil
+
+import pytest
+
+import check_it_docx as checker
+
+
+@pytest.fixture
+def standards(tmp_path, monkeypatch):
+    """A copy of the default profile in tmp_path; counts markdown parses."""
+    source = checker.profile_path(checker.DEFAULT_PROFILE)
+    shutil.copy(source, tmp_path / source.name)
+    monkeypatch.setattr(checker, "_standards_dir", lambda: tmp_path)
+    monkeypatch.setattr(checker, "_LOADED_PROFILES", {})
+
+    parses = []
+    parse = checker.load_it_normocontrol_config
+
+    def counting_parse(path):
+        parses.append(path)
+        return parse(path)
+
+    monkeypatch.setattr(checker, "load_it_normocontrol_config", counting_parse)
+    md_path = tmp_path / source.name
+    return md_path, checker._compiled_profile_path(md_path), parses
+
+
+def _reload():
+    checker._LOADED_PROFILES.clear()
+    return checker.load_profile(checker.DEFAULT_PROFILE)
+
+
+def test_second_load_reuses_the_compiled_file(standards):
+    md_path, compiled_path, parses = standards
+
+    first = _reload()
+    assert compiled_path.is_file() and len(parses) == 1
+    assert _reload() == first and len(parses) == 1
+    assert checker.available_profiles() == [checker.DEFAULT_PROFILE]
+
+
+def test_changed_source_is_parsed_again(standards):
+    md_path, compiled_path, parses = standards
+    _reload()
+
+    md_path.write_text(md_path.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    _reload()
+    assert len(parses) == 2
+    data = json.loads(compiled_path.read_text(encoding="utf-8"))
+    assert data["size"] == md_path.stat().st_size and data["sha256"] == checker.file_sha256(md_path)
+
+
+def test_mtime_only_change_is_accepted_by_hash(standards):
+    md_path, compiled_path, parses = standards
+    _reload()
+
+    stat = md_path.stat()
+    os.utime(md_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    _reload()
+    assert len(parses) == 1
+    assert json.loads(compiled_path.read_text(encoding="utf-8"))["mtime_ns"] == md_path.stat().st_mtime_ns
+
+
+@pytest.mark.parametrize("content", ["{not json", json.dumps({"version": 0, "config": {}})])
+def test_corrupt_or_outdated_compiled_file_is_rebuilt(standards, content):
+    md_path, compiled_path, parses = standards
+    first = _reload()
+
+    compiled_path.write_text(content, encoding="utf-8")
+    assert _reload() == first and len(parses) == 2
+    assert json.loads(compiled_path.read_text(encoding="utf-8"))["version"] == checker._COMPILED_PROFILE_VERSION
+
+
+def test_unknown_profile_is_rejected(standards):
+    with pytest.raises(ValueError, match="it_short"):
+        checker.load_profile("no_such_profile")
@@ -0,0 +1,61 @@
+"""
+Tests for paragraph positions and the heading map (DocumentIndex in
+tests/helpers/ooxml_utils.py).
+"""
+from docx import Document
+
+from tests.helpers.ooxml_stream import stream_document
+from tests.helpers.ooxml_utils import (
+    NS,
+    DocumentIndex,
+    find_nearby_heading,
+    find_paragraph_index,
+    get_document_xml,
+    get_heading_style_levels,
+    get_styles_xml,
+)
+
+
+def _make_docx(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Титульный лист")
+    doc.add_heading("Введение", level=1)
+    doc.add_paragraph("Текст введения")
+    doc.add_heading("1 Постановка задачи", level=1)
+    doc.add_heading("1.1 Исходные данные", level=2)
+    doc.add_paragraph("Текст подраздела")
+    path = tmp_path / "headings.docx"
+    doc.save(path)
+    return path
+
+
+def test_headings_and_describe(tmp_path):
+    index = DocumentIndex.from_docx(_make_docx(tmp_path))
+
+    assert index.heading_positions == [1, 3, 4]
+    assert index.headings == [(0, "Введение"), (0, "1 Постановка задачи"), (1, "1.1 Исходные данные")]
+    assert index.heading_before(0) == ""
+    assert index.heading_before(2) == "Введение"
+    assert index.heading_before(3) == "1 Постановка задачи"
+    assert index.describe(5) == "Параграф 6, раздел «1.1 Исходные данные»"
+
+
+def test_function_api_matches_xpath_order(tmp_path):
+    doc_xml = get_document_xml(_make_docx(tmp_path))
+    paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
+
+    assert [find_paragraph_index(doc_xml, p) for p in paragraphs] == list(range(len(paragraphs)))
+    # Without styles.xml built-in heading style ids are still recognized.
+    assert find_nearby_heading(doc_xml, 2) == "Введение"
+
+
+def test_streaming_fills_the_same_index(tmp_path):
+    path = _make_docx(tmp_path)
+    streamed = DocumentIndex(get_heading_style_levels(get_styles_xml(path)))
+
+    count = stream_document(path, [], index=streamed)
+
+    built = DocumentIndex.from_docx(path)
+    assert streamed.paragraph_count == count == built.paragraph_count
+    assert streamed.headings == built.headings
+    assert streamed.heading_positions == built.heading_positions
@@ -0,0 +1,95 @@
+"""
+Tests for the shared body text and the one-pass matcher
+(tests/helpers/document_text.py).
+"""
+from docx import Document
+
+from tests.helpers.document_text import DocumentText, TextMatcher
+from tests.helpers.ooxml_stream import stream_document
+from tests.helpers.ooxml_utils import DocumentIndex, get_document_xml
+
+
+def _make_docx(tmp_path):
+    doc = Document()
+    doc.add_heading("Введение", level=1)
+    doc.add_paragraph("Текст со ссылками [1] и [12].")
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).text = "Введение в ячейке"
+    doc.add_paragraph("  Рисунок 1 – Схема")
+    doc.add_paragraph("См. рисунок 1")
+    doc.add_heading("Список использованных источников", level=1)
+    path = tmp_path / "text.docx"
+    doc.save(path)
+    return path, doc
+
+
+def test_build_matches_python_docx(tmp_path):
+    path, doc = _make_docx(tmp_path)
+    text = DocumentText.build(get_document_xml(path))
+
+    assert text.paragraphs == [p.text for p in doc.paragraphs]
+    assert text.text == "\n".join(p.text for p in doc.paragraphs)
+    # The table cell paragraph is skipped, but counted in positions.
+    assert text.positions == [0, 1, 3, 4, 5]
+    for i, offset in enumerate(text.offsets):
+        assert text.paragraph_at(offset) == i
+        assert text.text.startswith(text.paragraphs[i], offset)
+
+
+def test_streamed_text_equals_built(tmp_path):
+    path, _ = _make_docx(tmp_path)
+    streamed = DocumentText()
+    stream_document(path, [streamed])
+
+    built = DocumentText.build(get_document_xml(path))
+    assert streamed.paragraphs == built.paragraphs
+    assert streamed.positions == built.positions
+
+
+def test_matcher_maps_hits_to_paragraphs(tmp_path):
+    path, _ = _make_docx(tmp_path)
+    text = DocumentText.build(get_document_xml(path))
+    matcher = TextMatcher(
+        literals={"intro": "введение", "sources": "Список использованных источников",
+                  "title": "СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ", "figure": "рисунок"},
+        patterns={"citation": r"\[(\d+)\]"},
+    )
+
+    hits = text.hits(matcher)
+    assert text.hits(matcher) is hits  # scanned once
+
+    by_name = {}
+    for name, i, match in hits:
+        by_name.setdefault(name, []).append((i, match))
+
+    assert [i for i, _ in by_name["intro"]] == [0]
+    assert [matcher.value("citation", m) for _, m in by_name["citation"]] == ["1", "12"]
+    # Equal literals (ignoring case) are reported under both names.
+    assert [i for i, _ in by_name["sources"]] == [i for i, _ in by_name["title"]] == [4]
+    figure_starts = [i for i, m in by_name["figure"] if text.at_paragraph_start(i, m.start())]
+    assert figure_starts == [2]
+    assert [i for i, _ in by_name["figure"]] == [2, 3]
+
+
+def test_heading_table_uses_paragraph_numbers(tmp_path):
+    path, _ = _make_docx(tmp_path)
+    index = DocumentIndex.from_docx(path)
+    text = DocumentText.build(get_document_xml(path), index)
+
+    assert text.headings() == [(0, 0, "Введение"), (4, 0, "Список использованных источников")]
+    assert text.describe(1) == "Параграф 2, раздел «Введение»"
+
+
+def test_first_character_guard_keeps_matches():
+    text = "Введение. См. [3]; ТАБЛИЦА 1 и рисунок 2 ([10])."
+    literals = {"intro": "введение", "table": "таблица", "figure": "рисунок"}
+    patterns = {"citation": r"\[(\d+)\]"}
+
+    guarded = TextMatcher(literals, patterns, pattern_starts="[")
+    plain = TextMatcher(literals, patterns)
+
+    assert guarded.regex.pattern.startswith("(?=[")
+    assert not plain.regex.pattern.startswith("(?=[")
+    found = [(name, m.start()) for name, m in guarded.finditer(text)]
+    assert found == [(name, m.start()) for name, m in plain.finditer(text)]
+    assert [guarded.value(n, m) for n, m in guarded.finditer(text) if n == "citation"] == ["3", "10"]
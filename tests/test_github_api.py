@@ -0,0 +1,166 @@
+"""
+Tests for the shared GitHub API client (.github/scripts/github_api.py).
+
+The client talks to a local stub server, so these tests need no network.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from github_api import GitHubAPIError, GitHubClient, parse_link_header
+
+
+class _StubAPI(BaseHTTPRequestHandler):
+    """Paginated `/items` (7 items, 3 per page) with ETags, plus `/limited` and `/broken`."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, payload=None, headers=None):
+        body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        parts = urlsplit(self.path)
+        query = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+        with server.lock:
+            server.log.append((parts.path, query.get("page", "1"), self.headers.get("If-None-Match")))
+            server.connections.add(self.client_address)
+
+        if parts.path == "/items":
+            per_page = int(query.get("per_page", 30))
+            page = int(query.get("page", 1))
+            last = -(-7 // per_page)
+            etag = f'"items-{page}"'
+            if self.headers.get("If-None-Match") == etag:
+                return self._reply(304, headers={"ETag": etag})
+            base = f"http://127.0.0.1:{server.server_address[1]}/items?per_page={per_page}"
+            links = []
+            if page < last:
+                links.append(f'<{base}&page={page + 1}>; rel="next"')
+                if server.advertise_last:
+                    links.append(f'<{base}&page={last}>; rel="last"')
+            items = list(range((page - 1) * per_page, min(page * per_page, 7)))
+            return self._reply(200, items, {"ETag": etag, "Link": ", ".join(links)})
+
+        if parts.path == "/limited":
+            server.limited_calls += 1
+            if server.limited_calls == 1:
+                return self._reply(403, {"message": "API rate limit exceeded"},
+                                   {"Retry-After": "7", "X-RateLimit-Remaining": "0"})
+            return self._reply(200, {"ok": True})
+
+        if parts.path == "/broken":
+            return self._reply(502, {"message": "bad gateway"})
+        return self._reply(404, {"message": "Not Found"})
+
+
+@pytest.fixture
+def stub():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubAPI)
+    server.lock = threading.Lock()
+    server.log = []
+    server.connections = set()
+    server.advertise_last = True
+    server.limited_calls = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _client(stub, tmp_path, **kwargs):
+    sleeps = []
+    client = GitHubClient("secret", f"http://127.0.0.1:{stub.server_address[1]}",
+                          cache_dir=tmp_path / "cache", sleep=sleeps.append, **kwargs)
+    return client, sleeps
+
+
+def test_parse_link_header():
+    header = '<https://x/items?page=2>; rel="next", <https://x/items?page=5>; rel="last"'
+    assert parse_link_header(header) == {"next": "https://x/items?page=2", "last": "https://x/items?page=5"}
+    assert parse_link_header(None) == {}
+
+
+@pytest.mark.parametrize("advertise_last", [True, False])
+def test_paginate_returns_every_page_in_order(stub, tmp_path, advertise_last):
+    stub.advertise_last = advertise_last
+    client, _ = _client(stub, tmp_path)
+
+    assert client.paginate("/items", per_page=3) == list(range(7))
+    assert sorted(page for path, page, _ in stub.log) == ["1", "2", "3"]
+
+
+def test_concurrent_pages_close_worker_connections(stub, tmp_path):
+    stub.advertise_last = True
+    client, _ = _client(stub, tmp_path)
+    opened = []
+    connection = client._connection
+
+    def recording_connection(scheme, netloc):
+        conn = connection(scheme, netloc)
+        opened.append((threading.get_ident(), conn))
+        return conn
+
+    client._connection = recording_connection
+    client.paginate("/items", per_page=3)
+
+    workers = [conn for ident, conn in opened if ident != threading.get_ident()]
+    assert workers and all(conn.sock is None for conn in workers)
+    assert all(conn.sock is not None for ident, conn in opened if ident == threading.get_ident())
+
+
+def test_sequential_requests_reuse_the_connection(stub, tmp_path):
+    stub.advertise_last = False
+    client, _ = _client(stub, tmp_path)
+
+    client.paginate("/items", per_page=3)
+    assert client.stats.requests == 3
+    assert client.stats.connections == 1 and len(stub.connections) == 1
+
+
+def test_conditional_requests_use_the_etag_cache(stub, tmp_path):
+    client, _ = _client(stub, tmp_path)
+    client.paginate("/items", per_page=3)
+
+    # A new client (e.g. the next workflow step) revalidates instead of downloading.
+    client, _ = _client(stub, tmp_path)
+    assert client.paginate("/items", per_page=3) == list(range(7))
+    assert client.stats.not_modified == 3
+    assert all(etag for _, _, etag in stub.log[3:])
+
+    # Responses are cached per credentials.
+    other = GitHubClient("other", client.api_url, cache_dir=tmp_path / "cache")
+    other.get("/items", {"per_page": 3})
+    assert stub.log[-1][2] is None
+
+
+def test_rate_limit_waits_and_retries(stub, tmp_path):
+    client, sleeps = _client(stub, tmp_path)
+
+    assert client.get_json("/limited") == {"ok": True}
+    assert sleeps == [7.0] and client.stats.retries == 1
+
+
+def test_errors_raise_after_retries(stub, tmp_path):
+    client, sleeps = _client(stub, tmp_path, max_retries=2)
+
+    with pytest.raises(GitHubAPIError) as excinfo:
+        client.get("/broken")
+    assert excinfo.value.status == 502 and sleeps == [1.0, 2.0]
+
+    with pytest.raises(GitHubAPIError) as excinfo:
+        client.get("/missing")
+    assert excinfo.value.status == 404
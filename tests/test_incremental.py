@@ -0,0 +1,146 @@
+"""
+Tests for incremental re-checking (tests/helpers/incremental.py and
+run_checks_incremental in scripts/standards_verification/check_it_docx.py).
+"""
+import shutil
+
+import pytest
+from docx import Document
+from docx.shared import Pt
+
+import check_it_docx as checker
+from tests.helpers.incremental import (
+    BlockFingerprints,
+    StateStore,
+    diff_issues,
+    part_facets,
+    part_fingerprints,
+)
+from tests.helpers.ooxml_stream import stream_document
+from tests.helpers.report import NormocontrolReport
+
+
+def _make_docx(path, edit=None):
+    doc = Document()
+    doc.add_paragraph("Введение")
+    for i in range(5):
+        doc.add_paragraph(f"Абзац {i} со ссылкой [1].")
+    doc.add_paragraph("Рисунок 1 - Схема.")
+    if edit:
+        edit(doc)
+    doc.save(path)
+    return path
+
+
+def _check(path, store):
+    report = NormocontrolReport()
+    changes = checker.run_checks_incremental(path, report, checker.load_profile(), store)
+    return report, changes
+
+
+def _full(path):
+    report = NormocontrolReport()
+    checker.run_checks(path, report, checker.load_profile())
+    return [checker._issue_fields(issue) for issue in report.issues]
+
+
+def test_block_fingerprints_follow_content(tmp_path):
+    first = _make_docx(tmp_path / "a.docx")
+    second = _make_docx(tmp_path / "b.docx", lambda doc: setattr(doc.paragraphs[2].runs[0], "text", "Другой"))
+
+    digests = []
+    for path in (first, second):
+        fingerprints = BlockFingerprints()
+        stream_document(path, [fingerprints])
+        digests.append(fingerprints.blocks)
+
+    assert len(digests[0]) == len(digests[1]) == 8  # 7 paragraphs + final section
+    assert [a == b for a, b in zip(*digests)] == [True, True, False, True, True, True, True, True]
+
+
+def test_part_facets_come_from_the_zip_directory(tmp_path):
+    path = _make_docx(tmp_path / "a.docx")
+    parts = part_fingerprints(path)
+
+    assert "word/document.xml" in parts and "word/styles.xml" in parts
+    facets = part_facets(parts)
+    assert set(facets) == {"package", "styles", "theme", "headers", "rels", "media"}
+    assert facets["media"] == part_facets({})["media"]  # no images
+
+
+def test_unchanged_document_is_replayed(tmp_path, monkeypatch):
+    path = _make_docx(tmp_path / "note.docx")
+    store = StateStore(tmp_path / "state")
+
+    report, changes = _check(path, store)
+    assert not changes.previous
+    issues = [checker._issue_fields(issue) for issue in report.issues]
+    assert issues == _full(path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("document should not be parsed")
+
+    monkeypatch.setattr(checker, "stream_document", fail)
+    report, changes = _check(path, store)
+    assert [checker._issue_fields(issue) for issue in report.issues] == issues
+    assert changes.previous and changes.rules_checked == [] and changes.blocks_changed == 0
+
+
+def test_only_rules_with_changed_inputs_run(tmp_path):
+    path = tmp_path / "note.docx"
+    store = StateStore(tmp_path / "state")
+    _check(_make_docx(path), store)
+
+    # A font change keeps the text: text rules are reused, the font memo is reused
+    # for every other block.
+    def arial(doc):
+        doc.paragraphs[1].runs[0].font.name = "Arial"
+        doc.paragraphs[1].runs[0].font.size = Pt(14)
+
+    _make_docx(path, arial)
+    report, changes = _check(path, store)
+    assert changes.blocks_changed == 1
+    assert "FontCheck" in changes.rules_checked
+    assert {"StructureCheck", "ReferencesCheck", "CaptionsCheck", "PageSetupCheck"} <= set(changes.rules_reused)
+    assert [checker._issue_fields(issue) for issue in report.issues] == _full(path)
+
+
+def test_new_and_fixed_issues(tmp_path):
+    path = tmp_path / "note.docx"
+    store = StateStore(tmp_path / "state")
+    _check(_make_docx(path), store)
+
+    def fix_caption(doc):
+        doc.paragraphs[-1].runs[0].text = "Рисунок 1 – Схема"
+
+    _make_docx(path, fix_caption)
+    report, changes = _check(path, store)
+    assert [issue["category"] for issue in changes.fixed_issues] == ["figures"]
+    assert changes.new_issues == []
+    assert "### Исправлено (1)" in changes.to_markdown()
+
+    # Going back reports the caption issue as new again.
+    shutil.copy(_make_docx(tmp_path / "old.docx"), path)
+    _, changes = _check(path, store)
+    assert [issue["category"] for issue in changes.new_issues] == ["figures"]
+
+
+def test_diff_ignores_details_that_change_while_fixing():
+    before = [{"category": "fonts", "severity": "error", "description": "Шрифт", "actual": "Arial 60%"}]
+    after = [{"category": "fonts", "severity": "error", "description": "Шрифт", "actual": "Arial 55%"}]
+
+    assert diff_issues(before, after) == ([], [])
+    assert diff_issues(before, []) == ([], before)
+
+
+@pytest.mark.parametrize("flag", ["--no-cache", "--profile-checks"])
+def test_incremental_rejects_options_that_would_drop_it(tmp_path, flag, capsys):
+    path = _make_docx(tmp_path / "note.docx")
+
+    with pytest.raises(SystemExit) as exc:
+        checker.main([str(path), "--incremental", flag])
+    assert exc.value.code == 2
+    assert flag in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        checker.check_it_docx(path, tmp_path / "reports", use_cache=flag != "--no-cache",
+                              profile_checks=flag == "--profile-checks", incremental=True)
@@ -12,12 +12,9 @@ Tests formatting requirements from docs/Требования_к_нормокон
 """
 import pytest
 from pathlib import Path
-from docx import Document
 from tests.helpers.ooxml_utils import (
-    get_document_xml,
     get_page_margins,
     get_page_size,
-    get_paragraph_properties,
     get_run_properties,
     check_margins,
     mm_to_twips,
@@ -28,12 +25,27 @@ from tests.helpers.ooxml_utils import (
     half_points_to_pt,
     NS,
 )
+from tests.helpers.document_text import TextMatcher
+
+
+# Required sections and the keywords (any of them, case-insensitive) that mark them
+REQUIRED_SECTION_KEYWORDS = {
+    'содержание': ['СОДЕРЖАНИЕ', 'ОГЛАВЛЕНИЕ'],
+    'введение': ['ВВЕДЕНИЕ'],
+    'заключение': ['ЗАКЛЮЧЕНИЕ'],
+    'источники': ['СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ', 'СПИСОК ЛИТЕРАТУРЫ', 'БИБЛИОГРАФИЯ'],
+}
+_SECTION_MATCHER = TextMatcher(literals={
+    f"{section_name}:{keyword}": keyword
+    for section_name, keywords in REQUIRED_SECTION_KEYWORDS.items()
+    for keyword in keywords
+})
 
 
 class TestPageSetup:
     """Tests for page setup: margins, size, orientation."""
     
-    def test_page_margins(self, any_docx):
+    def test_page_margins(self, any_docx, parsed_docx):
         """
         Проверка полей страницы:
         - Левое: 30 мм
@@ -41,7 +53,7 @@ class TestPageSetup:
         - Верхнее: 20 мм
         - Нижнее: 20 мм
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = parsed_docx.document_xml
         margins = get_page_margins(doc_xml)
         
         assert margins is not None, f"Не найдены поля страницы в {any_docx.name}"
@@ -69,9 +81,9 @@ class TestPageSetup:
                 f"ожидается {expected_mm:.1f} мм, фактически {actual_mm:.1f} мм"
             )
     
-    def test_page_size_a4(self, any_docx):
+    def test_page_size_a4(self, any_docx, parsed_docx):
         """Проверка размера страницы A4 (210×297 мм)."""
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = parsed_docx.document_xml
         page_size = get_page_size(doc_xml)
         
         assert page_size is not None, f"Размер страницы не найден в {any_docx.name}"
@@ -94,37 +106,22 @@ class TestPageSetup:
 class TestParagraphFormatting:
     """Tests for paragraph formatting: indents, spacing, alignment."""
     
-    def test_first_line_indent(self, any_docx):
+    def test_first_line_indent(self, any_docx, parsed_docx):
         """
         Проверка отступа первой строки абзаца: 1.25 см (или 1.5 см).
         Проверяем параграфы с явно заданным отступом.
         """
-        doc_xml = get_document_xml(any_docx)
-        paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
+        metrics = parsed_docx.metrics
         
         # Expected values in twips
         indent_125 = cm_to_twips(1.25)  # ~709 twips
         indent_150 = cm_to_twips(1.5)   # ~850 twips
         tolerance = cm_to_twips(0.1)    # 1mm tolerance
         
-        paragraphs_with_indent = 0
-        invalid_indents = []
-        
-        for p in paragraphs:
-            props = get_paragraph_properties(p)
-            if 'ind' in props and props['ind'].get('firstLine'):
-                # Handle both int and float strings
-                first_line = float(props['ind']['firstLine'])
-                first_line = int(round(first_line))
-                paragraphs_with_indent += 1
-                
-                # Check if indent is approximately 1.25 or 1.5 cm
-                diff_125 = abs(first_line - indent_125)
-                diff_150 = abs(first_line - indent_150)
-                
-                if diff_125 > tolerance and diff_150 > tolerance:
-                    actual_cm = twips_to_cm(first_line)
-                    invalid_indents.append(f"{actual_cm:.2f} см")
+        invalid_indents = [
+            f"{twips_to_cm(first_line):.2f} см"
+            for _, first_line in metrics.indent_deviations(indent_125, indent_150, tolerance=tolerance)
+        ]
         
         if invalid_indents:
             pytest.fail(
@@ -133,61 +130,38 @@ class TestParagraphFormatting:
                 f"(ожидается 1.25 см или 1.5 см)"
             )
     
-    def test_line_spacing_15(self, any_docx):
+    def test_line_spacing_15(self, any_docx, parsed_docx):
         """
         Проверка межстрочного интервала: полуторный (1.5).
         В OOXML обычно lineRule="auto" и line="360" (или больше).
         """
-        doc_xml = get_document_xml(any_docx)
-        paragraphs = doc_xml.xpath(".//w:p[w:pPr/w:spacing]", namespaces=NS)
-        
-        invalid_spacing = []
-        
-        for p in paragraphs:
-            props = get_paragraph_properties(p)
-            if 'spacing' in props:
-                spacing = props['spacing']
-                line = spacing.get('line')
-                line_rule = spacing.get('lineRule')
-                
-                # For 1.5 line spacing with auto rule, line should be around 360
-                # (240 = single, 360 = 1.5, 480 = double)
-                if line and line_rule == 'auto':
-                    line_val = int(line)
-                    # Accept 1.5 spacing: 340-380 range
-                    if not (340 <= line_val <= 380):
-                        invalid_spacing.append(f"line={line_val}")
+        metrics = parsed_docx.metrics
+        paragraphs_with_spacing = metrics.count_spacing()
+        
+        # For 1.5 line spacing with auto rule, line should be around 360
+        # (240 = single, 360 = 1.5, 480 = double); accept 340-380
+        invalid_spacing = metrics.spacing_deviations(340, 380)
         
         # Lenient check: only fail if spacing is explicitly wrong in many cases
         # Many documents use styles for spacing, so explicit spacing may not be set
-        if len(paragraphs) > 0 and len(invalid_spacing) > 0:
-            ratio = len(invalid_spacing) / len(paragraphs)
+        if paragraphs_with_spacing > 0 and len(invalid_spacing) > 0:
+            ratio = len(invalid_spacing) / paragraphs_with_spacing
             # Only warn if more than 80% have wrong explicit spacing
             if ratio > 0.8:
                 pytest.fail(
                     f"Много параграфов с некорректным интервалом в {any_docx.name}: "
-                    f"{len(invalid_spacing)} из {len(paragraphs)}"
+                    f"{len(invalid_spacing)} из {paragraphs_with_spacing}"
                 )
     
-    def test_justified_alignment(self, any_docx):
+    def test_justified_alignment(self, any_docx, parsed_docx):
         """
         Проверка выравнивания текста: по ширине (both).
         Основной текст должен быть выровнен по ширине.
         """
-        doc = Document(any_docx)
-        doc_xml = get_document_xml(any_docx)
-        
-        paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
-        
-        justified_count = 0
-        total_with_alignment = 0
+        alignments = parsed_docx.metrics.alignment_counts()
         
-        for p in paragraphs:
-            props = get_paragraph_properties(p)
-            if 'jc' in props:
-                total_with_alignment += 1
-                if props['jc'] == 'both':  # 'both' = justified
-                    justified_count += 1
+        total_with_alignment = sum(alignments.values())
+        justified_count = alignments.get('both', 0)  # 'both' = justified
         
         # At least 50% of paragraphs with explicit alignment should be justified
         if total_with_alignment > 0:
@@ -201,12 +175,12 @@ class TestParagraphFormatting:
 class TestFonts:
     """Tests for font properties."""
     
-    def test_times_new_roman_font(self, any_docx):
+    def test_times_new_roman_font(self, any_docx, parsed_docx):
         """
         Проверка использования шрифта Times New Roman.
         Проверяем runs с явно заданным шрифтом.
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = parsed_docx.document_xml
         runs = doc_xml.xpath(".//w:r", namespaces=NS)
         
         fonts_used = set()
@@ -227,7 +201,7 @@ class TestFonts:
                 f"Найдены: {', '.join(sorted(fonts_used))}"
             )
     
-    def test_font_size_14pt_main_text(self, any_docx):
+    def test_font_size_14pt_main_text(self, any_docx, parsed_docx):
         """
         Проверка размера шрифта: 14 пт для основного текста.
         Проверяем, что большинство runs используют 14pt или 12pt.
@@ -236,7 +210,7 @@ class TestFonts:
         может не быть задан явно. Этот тест пропускается, если размеры
         не заданы явно, или проверяет только явно заданные.
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = parsed_docx.document_xml
         runs = doc_xml.xpath(".//w:r[w:rPr/w:sz]", namespaces=NS)
         
         size_14pt = pt_to_half_points(14)  # 28
@@ -271,7 +245,7 @@ class TestFonts:
 class TestDocumentStructure:
     """Tests for document structure and required sections."""
     
-    def test_has_required_sections(self, any_docx):
+    def test_has_required_sections(self, any_docx, parsed_docx):
         """
         Проверка наличия обязательных разделов:
         - Содержание (или Оглавление)
@@ -282,26 +256,14 @@ class TestDocumentStructure:
         Примечание: это упрощённая проверка по наличию ключевых слов.
         Приложения не требуют всех разделов, только ПЗ.
         """
-        doc = Document(any_docx)
-        text = "\n".join([p.text for p in doc.paragraphs]).upper()
-        
         # Приложения не требуют полной структуры
         if 'ПРИЛОЖЕНИЕ' in any_docx.name.upper():
             # For appendices, just check they exist (no strict requirements)
             return
         
-        required_keywords = {
-            'содержание': ['СОДЕРЖАНИЕ', 'ОГЛАВЛЕНИЕ'],
-            'введение': ['ВВЕДЕНИЕ'],
-            'заключение': ['ЗАКЛЮЧЕНИЕ'],
-            'источники': ['СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ', 'СПИСОК ЛИТЕРАТУРЫ', 'БИБЛИОГРАФИЯ'],
-        }
-        
-        missing = []
-        
-        for section_name, keywords in required_keywords.items():
-            if not any(kw in text for kw in keywords):
-                missing.append(section_name)
+        # One scan of the body text for all keywords
+        found = {name.split(':', 1)[0] for name, _, _ in parsed_docx.document_text.hits(_SECTION_MATCHER)}
+        missing = [section_name for section_name in REQUIRED_SECTION_KEYWORDS if section_name not in found]
         
         if missing:
             pytest.fail(
@@ -309,19 +271,18 @@ class TestDocumentStructure:
                 f"{', '.join(missing)}"
             )
     
-    def test_has_tables(self, pz_docx):
+    def test_has_tables(self, pz_docx, parsed_docs):
         """Проверка наличия таблиц в основном документе (ПЗ)."""
-        doc = Document(pz_docx)
+        doc = parsed_docs.get(pz_docx).docx
         
         assert len(doc.tables) > 0, f"Не найдены таблицы в {pz_docx.name}"
     
-    def test_table_caption_format(self, any_docx):
+    def test_table_caption_format(self, any_docx, parsed_docx):
         """
         Проверка формата подписей таблиц: "Таблица X.Y — Название".
         Упрощённая проверка по наличию слова "Таблица" и тире.
         """
-        doc = Document(any_docx)
-        text = "\n".join([p.text for p in doc.paragraphs])
+        text = parsed_docx.text
         
         # Look for table captions (simplified check)
         table_patterns = []
@@ -343,14 +304,14 @@ class TestDocumentStructure:
 class TestAdvanced:
     """Advanced checks (optional, may be skipped)."""
     
-    def test_no_direct_font_formatting_in_body(self, any_docx):
+    def test_no_direct_font_formatting_in_body(self, any_docx, parsed_docx):
         """
         Проверка: в основном тексте не должно быть прямого форматирования шрифта.
         Всё форматирование должно идти через стили (best practice).
         
         Примечание: это строгая проверка, может не пройти для многих документов.
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = parsed_docx.document_xml
         
         # Count runs with direct font formatting
         direct_fonts = doc_xml.xpath("//w:r/w:rPr/w:rFonts", namespaces=NS)
@@ -368,13 +329,12 @@ class TestAdvanced:
 
 
 # Summary test that can be run separately
-def test_normocontrol_summary(any_docx):
+def test_normocontrol_summary(any_docx, parsed_docx):
     """
     Сводная проверка основных требований нормоконтроля.
     Можно запускать отдельно для быстрой валидации.
     """
-    doc_xml = get_document_xml(any_docx)
-    doc = Document(any_docx)
+    doc_xml = parsed_docx.document_xml
     
     issues = []
     
@@ -383,7 +343,7 @@ def test_normocontrol_summary(any_docx):
         issues.append("Некорректные поля страницы")
     
     # Check structure
-    text = "\n".join([p.text for p in doc.paragraphs]).upper()
+    text = parsed_docx.text.upper()
     if 'ВВЕДЕНИЕ' not in text:
         issues.append("Отсутствует раздел 'Введение'")
     if 'ЗАКЛЮЧЕНИЕ' not in text:
@@ -6,12 +6,9 @@ Run with: pytest tests/test_normocontrol_report.py --report-format=markdown
 """
 import pytest
 from pathlib import Path
-from docx import Document
 from tests.helpers.ooxml_utils import (
-    get_document_xml,
     get_page_margins,
     get_page_size,
-    get_paragraph_properties,
     get_run_properties,
     mm_to_twips,
     cm_to_twips,
@@ -19,13 +16,27 @@ from tests.helpers.ooxml_utils import (
     twips_to_cm,
     pt_to_half_points,
     half_points_to_pt,
-    find_paragraph_index,
     get_paragraph_text_preview,
     NS,
 )
+from tests.helpers.document_text import TextMatcher
 
 
-def test_all_documents_normocontrol(any_docx, normocontrol_report):
+# Required sections: keywords (any of them, case-insensitive) and expected location
+REQUIRED_SECTIONS = {
+    'содержание': (['СОДЕРЖАНИЕ', 'ОГЛАВЛЕНИЕ'], 'Начало документа'),
+    'введение': (['ВВЕДЕНИЕ'], 'После содержания'),
+    'заключение': (['ЗАКЛЮЧЕНИЕ'], 'Конец основной части'),
+    'источники': (['СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ', 'СПИСОК ЛИТЕРАТУРЫ', 'БИБЛИОГРАФИЯ'], 'После заключения'),
+}
+_SECTION_MATCHER = TextMatcher(literals={
+    f"{section_name}:{keyword}": keyword
+    for section_name, (keywords, _) in REQUIRED_SECTIONS.items()
+    for keyword in keywords
+})
+
+
+def test_all_documents_normocontrol(any_docx, parsed_docx, normocontrol_report, check_profiler):
     """
     Comprehensive normocontrol check that collects all issues.
     This test never fails - it only collects issues into the report.
@@ -33,27 +44,32 @@ def test_all_documents_normocontrol(any_docx, normocontrol_report):
     doc_name = any_docx.name
     normocontrol_report.add_document(doc_name)
     
-    doc_xml = get_document_xml(any_docx)
-    doc = Document(any_docx)
+    doc_xml = parsed_docx.document_xml
+    
+    def run(check, *args):
+        if check_profiler is None:
+            return check(*args)
+        with check_profiler.measure(doc_name, check.__name__.lstrip("_")):
+            return check(*args)
     
     # Check page margins
-    _check_page_margins(any_docx, doc_xml, normocontrol_report)
+    run(_check_page_margins, any_docx, doc_xml, normocontrol_report)
     
     # Check page size
-    _check_page_size(any_docx, doc_xml, normocontrol_report)
+    run(_check_page_size, any_docx, doc_xml, normocontrol_report)
     
     # Check paragraph formatting
-    _check_paragraph_indents(any_docx, doc_xml, normocontrol_report)
-    _check_line_spacing(any_docx, doc_xml, normocontrol_report)
-    _check_alignment(any_docx, doc_xml, normocontrol_report)
+    run(_check_paragraph_indents, any_docx, parsed_docx, normocontrol_report)
+    run(_check_line_spacing, any_docx, parsed_docx, normocontrol_report)
+    run(_check_alignment, any_docx, parsed_docx, normocontrol_report)
     
     # Check fonts
-    _check_fonts(any_docx, doc_xml, normocontrol_report)
-    _check_font_sizes(any_docx, doc_xml, normocontrol_report)
+    run(_check_fonts, any_docx, doc_xml, normocontrol_report)
+    run(_check_font_sizes, any_docx, doc_xml, normocontrol_report)
     
     # Check structure
-    _check_document_structure(any_docx, doc, normocontrol_report)
-    _check_table_captions(any_docx, doc, normocontrol_report)
+    run(_check_document_structure, any_docx, parsed_docx, normocontrol_report)
+    run(_check_table_captions, any_docx, parsed_docx, normocontrol_report)
 
 
 def _check_page_margins(docx_path, doc_xml, report):
@@ -137,104 +153,67 @@ def _check_page_size(docx_path, doc_xml, report):
         )
 
 
-def _check_paragraph_indents(docx_path, doc_xml, report):
+def _check_paragraph_indents(docx_path, parsed, report):
     """Check first-line indents."""
     doc_name = docx_path.name
-    paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
     
     indent_125 = cm_to_twips(1.25)
     indent_150 = cm_to_twips(1.5)
     tolerance = cm_to_twips(0.1)
     
-    invalid_indents = []
-    problem_locations = []
-    
-    for idx, p in enumerate(paragraphs):
-        props = get_paragraph_properties(p)
-        if 'ind' in props and props['ind'].get('firstLine'):
-            try:
-                first_line = float(props['ind']['firstLine'])
-                first_line = int(round(first_line))
-                
-                diff_125 = abs(first_line - indent_125)
-                diff_150 = abs(first_line - indent_150)
-                
-                if diff_125 > tolerance and diff_150 > tolerance:
-                    actual_cm = twips_to_cm(first_line)
-                    if len(invalid_indents) < 10:  # Limit collected examples
-                        invalid_indents.append(f"{actual_cm:.2f} см")
-                        # Get paragraph preview for location
-                        preview = get_paragraph_text_preview(p, 40)
-                        problem_locations.append(f"Параграф {idx + 1}: '{preview}'")
-            except (ValueError, TypeError):
-                pass
-    
-    if invalid_indents:
-        location = "; ".join(problem_locations[:3])  # Show first 3 locations
-        if len(problem_locations) > 3:
-            location += f" (и ещё {len(problem_locations) - 3})"
-        
-        report.add_issue(
-            doc_name, "indents", "warning",
-            f"Найдены некорректные отступы первой строки ({len(invalid_indents)} шт.)",
-            expected="1.25 см или 1.5 см",
-            actual=", ".join(invalid_indents[:5]),
-            location=location
-        )
+    deviations = parsed.metrics.indent_deviations(indent_125, indent_150, tolerance=tolerance)
+    if not deviations:
+        return
+    
+    invalid_indents = [f"{twips_to_cm(first_line):.2f} см" for _, first_line in deviations]
+    
+    # Paragraph previews only for the locations shown
+    paragraphs = parsed.document_xml.xpath(".//w:p", namespaces=NS)
+    problem_locations = [
+        f"{parsed.index.describe(idx)}: '{get_paragraph_text_preview(paragraphs[idx], 40)}'"
+        for idx, _ in deviations[:3]
+    ]
+    location = "; ".join(problem_locations)
+    if len(deviations) > 3:
+        location += f" (и ещё {len(deviations) - 3})"
+    
+    report.add_issue(
+        doc_name, "indents", "warning",
+        f"Найдены некорректные отступы первой строки ({len(invalid_indents)} шт.)",
+        expected="1.25 см или 1.5 см",
+        actual=", ".join(invalid_indents[:5]),
+        location=location
+    )
 
 
-def _check_line_spacing(docx_path, doc_xml, report):
+def _check_line_spacing(docx_path, parsed, report):
     """Check line spacing."""
     doc_name = docx_path.name
-    paragraphs = doc_xml.xpath(".//w:p[w:pPr/w:spacing]", namespaces=NS)
+    metrics = parsed.metrics
+    paragraphs_with_spacing = metrics.count_spacing()
     
-    invalid_count = 0
-    first_problem_para = None
+    invalid = metrics.spacing_deviations(340, 380)
     
-    for idx, p in enumerate(paragraphs):
-        props = get_paragraph_properties(p)
-        if 'spacing' in props:
-            spacing = props['spacing']
-            line = spacing.get('line')
-            line_rule = spacing.get('lineRule')
-            
-            if line and line_rule == 'auto':
-                try:
-                    line_val = int(line)
-                    if not (340 <= line_val <= 380):
-                        invalid_count += 1
-                        if first_problem_para is None:
-                            first_problem_para = idx + 1
-                except (ValueError, TypeError):
-                    pass
-    
-    if len(paragraphs) > 0:
-        ratio = invalid_count / len(paragraphs)
+    if paragraphs_with_spacing > 0:
+        ratio = len(invalid) / paragraphs_with_spacing
         if ratio > 0.8:
-            location = f"Начиная с параграфа {first_problem_para}" if first_problem_para else "Весь документ"
+            location = f"Начиная с параграфа {invalid[0] + 1}" if invalid else "Весь документ"
             report.add_issue(
                 doc_name, "spacing", "warning",
                 f"Много параграфов с некорректным интервалом",
                 expected="1.5 (полуторный)",
-                actual=f"{invalid_count} из {len(paragraphs)} параграфов",
+                actual=f"{len(invalid)} из {paragraphs_with_spacing} параграфов",
                 location=location
             )
 
 
-def _check_alignment(docx_path, doc_xml, report):
+def _check_alignment(docx_path, parsed, report):
     """Check text alignment."""
     doc_name = docx_path.name
-    paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
+    alignments = parsed.metrics.alignment_counts()
     
-    justified_count = 0
-    total_with_alignment = 0
-    
-    for p in paragraphs:
-        props = get_paragraph_properties(p)
-        if 'jc' in props:
-            total_with_alignment += 1
-            if props['jc'] == 'both':
-                justified_count += 1
+    total_with_alignment = sum(alignments.values())
+    justified_count = alignments.get('both', 0)
     
     if total_with_alignment > 0:
         ratio = justified_count / total_with_alignment
@@ -302,7 +281,7 @@ def _check_font_sizes(docx_path, doc_xml, report):
             )
 
 
-def _check_document_structure(docx_path, doc, report):
+def _check_document_structure(docx_path, parsed, report):
     """Check document structure."""
     doc_name = docx_path.name
     
@@ -310,17 +289,11 @@ def _check_document_structure(docx_path, doc, report):
     if 'ПРИЛОЖЕНИЕ' in doc_name.upper():
         return
     
-    text = "\n".join([p.text for p in doc.paragraphs]).upper()
-    
-    required_keywords = {
-        'содержание': (['СОДЕРЖАНИЕ', 'ОГЛАВЛЕНИЕ'], 'Начало документа'),
-        'введение': (['ВВЕДЕНИЕ'], 'После содержания'),
-        'заключение': (['ЗАКЛЮЧЕНИЕ'], 'Конец основной части'),
-        'источники': (['СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ', 'СПИСОК ЛИТЕРАТУРЫ', 'БИБЛИОГРАФИЯ'], 'После заключения'),
-    }
+    # One scan of the body text for all keywords
+    found = {name.split(':', 1)[0] for name, _, _ in parsed.document_text.hits(_SECTION_MATCHER)}
     
-    for section_name, (keywords, location) in required_keywords.items():
-        if not any(kw in text for kw in keywords):
+    for section_name, (keywords, location) in REQUIRED_SECTIONS.items():
+        if section_name not in found:
             report.add_issue(
                 doc_name, "structure", "error",
                 f"Отсутствует раздел '{section_name}'",
@@ -330,10 +303,10 @@ def _check_document_structure(docx_path, doc, report):
             )
 
 
-def _check_table_captions(docx_path, doc, report):
+def _check_table_captions(docx_path, parsed, report):
     """Check table caption format."""
     doc_name = docx_path.name
-    text = "\n".join([p.text for p in doc.paragraphs])
+    text = parsed.text
     
     table_patterns = []
     table_line_numbers = []
@@ -0,0 +1,137 @@
+"""
+Tests for the check server with warm workers
+(scripts/standards_verification/normocontrol_server.py).
+"""
+import os
+import signal
+import threading
+import time
+
+import pytest
+from docx import Document
+
+import normocontrol_server as server_module
+
+
+def _make_docx(path):
+    doc = Document()
+    doc.add_paragraph("Введение")
+    doc.add_paragraph("Текст со ссылкой [1].")
+    doc.save(path)
+    return path
+
+
+@pytest.fixture
+def service(tmp_path):
+    service = server_module.CheckService(jobs=1, cache_dir=None, allowed_dirs=[tmp_path])
+    yield service
+    service.close()
+
+
+def _serve(server):
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_upload_and_path_checks_over_tcp(service, tmp_path):
+    docx_path = _make_docx(tmp_path / "ПЗ.docx")
+    server = server_module.make_server(service, port=0)
+    _serve(server)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        status, uploaded = server_module.check_remote(docx_path, url=url)
+        assert status == 200
+        assert uploaded["document"] == "ПЗ.docx"
+        assert uploaded["summary"]["total"] == len(uploaded["issues"]) > 0
+        assert {"category", "severity", "description"} <= set(uploaded["issues"][0])
+        assert uploaded["exit_code"] == (1 if uploaded["summary"]["errors"] else 0)
+
+        status, by_path = server_module.check_remote(docx_path, url=url, upload=False)
+        assert status == 200
+        assert by_path["issues"] == uploaded["issues"]
+
+        status, stats = server_module.request("GET", "/stats", url=url)
+        assert status == 200
+        assert stats["requests"] == 2 and stats["workers"] == 1 and stats["queue_depth"] == 0
+        assert stats["latency_ms"]["max"] >= stats["latency_ms"]["p50"] > 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_rejects_paths_outside_allowed_dirs(service, tmp_path_factory):
+    outside = _make_docx(tmp_path_factory.mktemp("outside") / "ПЗ.docx")
+    server = server_module.make_server(service, port=0)
+    _serve(server)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        status, result = server_module.check_remote(outside, url=url, upload=False)
+        assert status == 400 and "outside" in result["error"]
+        status, _ = server_module.request("GET", "/nope", url=url)
+        assert status == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.mark.skipif(not hasattr(server_module.socket, "AF_UNIX"), reason="no Unix sockets")
+def test_unix_socket(service, tmp_path):
+    docx_path = _make_docx(tmp_path / "ПЗ.docx")
+    socket_path = tmp_path / "normocontrol.sock"
+    server = server_module.make_server(service, socket_path=socket_path)
+    _serve(server)
+    try:
+        status, health = server_module.request("GET", "/health", socket_path=socket_path)
+        assert (status, health) == (200, {"status": "ok"})
+        status, result = server_module.check_remote(docx_path, socket_path=socket_path)
+        assert status == 200 and result["summary"]["total"] > 0
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_latency_percentiles():
+    stats = server_module.LatencyStats()
+    for ms in range(1, 101):
+        stats.record(float(ms), 0.5, hit=ms % 2 == 0)
+
+    summary = stats.to_dict()
+    assert summary["requests"] == 100 and summary["cache_hits"] == 50
+    assert summary["latency_ms"]["p50"] == 51.0 and summary["latency_ms"]["max"] == 100.0
+
+
+def test_killed_worker_is_replaced_and_next_request_succeeds(service, tmp_path):
+    docx_path = _make_docx(tmp_path / "ПЗ.docx")
+    assert service.check_path(docx_path)["document"] == "ПЗ.docx"
+    broken = service._pool
+    for process in list(broken._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+        process.join()
+
+    result = service.check_path(docx_path)
+    assert result["document"] == "ПЗ.docx" and service._pool is not broken
+    assert service.to_dict()["failed"] == 0
+
+
+def test_stats_stay_available_while_the_pool_restarts(service, tmp_path):
+    restarting, release = threading.Event(), threading.Event()
+    new_pool = service._new_pool
+
+    def slow_new_pool():
+        restarting.set()
+        release.wait(5)
+        return new_pool()
+
+    service._new_pool = slow_new_pool
+    thread = threading.Thread(target=service._replace_pool, args=(service._pool,))
+    thread.start()
+    try:
+        assert restarting.wait(5)
+        started = time.perf_counter()
+        assert service.to_dict()["workers"] == 1
+        assert time.perf_counter() - started < 0.5
+    finally:
+        release.set()
+        thread.join()
+    assert service.check_path(_make_docx(tmp_path / "ПЗ.docx"))["exit_code"] in (0, 1)
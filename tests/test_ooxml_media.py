@@ -0,0 +1,137 @@
+"""
+Tests for header-only inspection of embedded images and their placement
+(tests/helpers/ooxml_media.py).
+"""
+import struct
+import zipfile
+import zlib
+from io import BytesIO
+
+from docx import Document
+from docx.shared import Inches
+
+from tests.helpers.ooxml_media import DrawingIndex, get_image_usage, inspect_media, read_media_info
+from tests.helpers.ooxml_stream import stream_document
+
+
+def _png(width, height, dpi=None, padding=0):
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0))
+    if dpi:
+        ppm = round(dpi / 0.0254)
+        header += chunk(b"pHYs", struct.pack(">IIB", ppm, ppm, 1))
+    rows = b"".join(b"\x00" + b"\x80" * width for _ in range(height))
+    return header + chunk(b"IDAT", zlib.compress(rows) + b"\0" * padding) + chunk(b"IEND", b"")
+
+
+def _jpeg(width, height, dpi):
+    app0 = b"JFIF\0" + struct.pack(">BBBHHBB", 1, 1, 1, dpi, dpi, 0, 0)
+    sof = struct.pack(">BHHB", 8, height, width, 1) + b"\x01\x11\x00"
+    sos = b"\x01\x01\x00\x00\x3f\x00"
+    return (b"\xff\xd8" + b"\xff\xe0" + struct.pack(">H", len(app0) + 2) + app0
+            + b"\xff\xc0" + struct.pack(">H", len(sof) + 2) + sof
+            + b"\xff\xda" + struct.pack(">H", len(sos) + 2) + sos + b"\x00" * 16 + b"\xff\xd9")
+
+
+def _emf(width, height):
+    header = struct.pack("<II", 1, 108) + struct.pack("<iiii", 0, 0, width - 1, height - 1)
+    header += struct.pack("<iiii", 0, 0, 2000, 1000) + b" EMF" + b"\0" * 28
+    header += struct.pack("<iiii", 1920, 1080, 508, 286)  # device px, device mm
+    return header + b"\0" * 20
+
+
+def test_headers_of_known_formats(tmp_path):
+    path = tmp_path / "media.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/media/image1.png", _png(320, 200, dpi=144))
+        archive.writestr("word/media/image2.jpg", _jpeg(640, 480, dpi=300))
+        archive.writestr("word/media/image3.gif", b"GIF89a" + struct.pack("<HH", 33, 22) + b"\0" * 16)
+        archive.writestr("word/media/image4.emf", _emf(400, 300))
+        archive.writestr("word/document.xml", b"<not-media/>")
+
+    media = inspect_media(path)
+    assert list(media) == ["word/media/image1.png", "word/media/image2.jpg",
+                           "word/media/image3.gif", "word/media/image4.emf"]
+
+    png = media["word/media/image1.png"]
+    assert (png.format, png.width_px, png.height_px) == ("png", 320, 200)
+    assert abs(png.dpi_x - 144) < 0.1
+    assert png.stored_bytes < png.size_bytes
+
+    jpeg = media["word/media/image2.jpg"]
+    assert (jpeg.format, jpeg.width_px, jpeg.height_px, jpeg.dpi_x) == ("jpeg", 640, 480, 300)
+    gif = media["word/media/image3.gif"]
+    assert (gif.width_px, gif.height_px, gif.dpi_x) == (33, 22, None)
+    emf = media["word/media/image4.emf"]
+    assert (emf.format, emf.width_px, emf.height_px, emf.vector) == ("emf", 400, 300, True)
+    assert abs(emf.dpi_x - 96) < 0.1
+
+
+def test_only_the_header_is_read(tmp_path):
+    path = tmp_path / "big.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("word/media/image1.png", _png(64, 64, dpi=96, padding=8 * 1024 * 1024))
+
+    read = []
+
+    class CountingZipFile(zipfile.ZipFile):
+        def open(self, *args, **kwargs):
+            stream = super().open(*args, **kwargs)
+            original = stream.read
+
+            def counting_read(size=-1):
+                data = original(size)
+                read.append(len(data))
+                return data
+
+            stream.read = counting_read
+            return stream
+
+    with CountingZipFile(path) as archive:
+        info = read_media_info(archive, "word/media/image1.png")
+
+    assert (info.width_px, info.height_px) == (64, 64)
+    assert info.size_bytes > 8 * 1024 * 1024
+    assert sum(read) < 1024
+
+
+def _make_docx(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Текст перед рисунком.")
+    doc.add_paragraph().add_run().add_picture(BytesIO(_png(200, 100, dpi=96)), width=Inches(1))
+    doc.add_paragraph("Рисунок 1 – Схема")
+
+    # Stretched to 4 inches: 50 dpi; the caption is too far away.
+    doc.add_paragraph().add_run().add_picture(BytesIO(_png(200, 100, dpi=96)), width=Inches(4))
+    doc.add_paragraph("Первый абзац после рисунка.")
+    doc.add_paragraph("Второй абзац после рисунка.")
+    doc.add_paragraph("Рисунок 2 – Далеко")
+
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).paragraphs[0].add_run().add_picture(BytesIO(_jpeg(300, 300, dpi=300)), width=Inches(1))
+    doc.add_paragraph("Рисунок 3 – Рисунок в таблице")
+    path = tmp_path / "media.docx"
+    doc.save(path)
+    return path
+
+
+def test_placements_and_captions(tmp_path):
+    path = _make_docx(tmp_path)
+    drawings = DrawingIndex()
+    stream_document(path, [drawings])
+
+    placements = drawings.placements
+    assert [p.paragraph for p in placements] == [1, 3, 7]
+    assert [p.caption for p in placements] == ["Рисунок 1 – Схема", None, "Рисунок 3 – Рисунок в таблице"]
+    assert placements[0].caption_paragraph == 2
+    assert placements[0].width_emu == 914400
+
+
+def test_usage_links_media_and_effective_dpi(tmp_path):
+    usage = get_image_usage(_make_docx(tmp_path))
+
+    dpis = [round(placement.effective_dpi(info)) for placement, info in usage]
+    assert dpis == [200, 50, 300]
+    assert [info.format for _, info in usage] == ["png", "png", "jpeg"]
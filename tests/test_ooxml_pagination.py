@@ -0,0 +1,77 @@
+"""
+Tests for page numbering analysis (tests/helpers/ooxml_pagination.py).
+"""
+from docx import Document
+from docx.enum.section import WD_SECTION
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+
+from tests.helpers.ooxml_pagination import analyze_pagination
+
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _add_page_field(paragraph, complex_field=False):
+    if complex_field:
+        for xml in (
+            f'<w:r xmlns:w="{W_NS}"><w:fldChar w:fldCharType="begin"/></w:r>',
+            f'<w:r xmlns:w="{W_NS}"><w:instrText xml:space="preserve"> PAGE   \\* MERGEFORMAT </w:instrText></w:r>',
+            f'<w:r xmlns:w="{W_NS}"><w:fldChar w:fldCharType="separate"/></w:r>',
+            f'<w:r xmlns:w="{W_NS}"><w:t>1</w:t></w:r>',
+            f'<w:r xmlns:w="{W_NS}"><w:fldChar w:fldCharType="end"/></w:r>',
+        ):
+            paragraph._p.append(parse_xml(xml))
+    else:
+        paragraph._p.append(parse_xml(f'<w:fldSimple xmlns:w="{W_NS}" w:instr=" PAGE "/>'))
+
+
+def test_page_field_in_header_right(tmp_path):
+    doc = Document()
+    paragraph = doc.sections[0].header.paragraphs[0]
+    paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    _add_page_field(paragraph, complex_field=True)
+    doc.add_paragraph("Текст")
+    path = tmp_path / "header.docx"
+    doc.save(path)
+
+    (section,) = analyze_pagination(path)
+
+    assert section.numbered
+    assert [(f.kind, f.alignment) for f in section.fields] == [("header", "right")]
+
+
+def test_text_mentioning_page_is_not_a_field(tmp_path):
+    doc = Document()
+    doc.sections[0].header.paragraphs[0].text = "HOMEPAGE"
+    footer = doc.sections[0].footer.paragraphs[0]
+    footer.add_run().element.append(parse_xml(f'<w:instrText xmlns:w="{W_NS}">NUMPAGES</w:instrText>'))
+    path = tmp_path / "homepage.docx"
+    doc.save(path)
+
+    (section,) = analyze_pagination(path)
+
+    assert not section.numbered
+
+
+def test_title_page_and_inherited_references(tmp_path):
+    doc = Document()
+    first = doc.sections[0]
+    first.different_first_page_header_footer = True
+    first.first_page_footer.paragraphs[0].text = "Минск 2024"
+    footer = first.footer.paragraphs[0]
+    footer.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    _add_page_field(footer)
+    doc.add_paragraph("Титульный лист")
+    doc.add_section(WD_SECTION.NEW_PAGE)
+    doc.add_paragraph("Введение")
+    path = tmp_path / "sections.docx"
+    doc.save(path)
+
+    title, body = analyze_pagination(path)
+
+    assert title.title_page and not title.first_page_numbered
+    assert title.numbered
+    # The second section has no references of its own and inherits the footer.
+    assert [(f.kind, f.alignment) for f in body.fields] == [("footer", "center")]
+    assert body.parts["footer:default"] == title.parts["footer:default"]
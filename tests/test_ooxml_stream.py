@@ -0,0 +1,92 @@
+"""
+Tests for the single-pass streaming reader (tests/helpers/ooxml_stream.py).
+"""
+from docx import Document
+
+from tests.helpers.ooxml_stream import DocumentVisitor, stream_document
+from tests.helpers.ooxml_utils import get_section_margins
+
+
+class _Recorder(DocumentVisitor):
+    def __init__(self):
+        self.paragraphs = []
+        self.runs = []
+        self.margins = []
+        self.blocks = []
+        self.ended = False
+
+    def on_paragraph(self, paragraph, index, text):
+        self.paragraphs.append((index, text))
+
+    def on_run(self, run, index):
+        self.runs.append(index)
+
+    def on_section(self, sect_pr):
+        self.margins.append(get_section_margins(sect_pr))
+
+    def on_block(self, block, index):
+        # The block is still complete: its runs have not been cleared yet.
+        self.blocks.append((index, block.tag.split("}")[1], len(block.findall(".//{*}r"))))
+
+    def end(self):
+        self.ended = True
+
+
+def _make_docx(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Введение")
+    paragraph = doc.add_paragraph("Текст ")
+    paragraph.add_run("со ссылкой [1]")
+    table = doc.add_table(rows=1, cols=1)
+    table.cell(0, 0).text = "ячейка"
+    doc.add_paragraph("Заключение")
+    path = tmp_path / "sample.docx"
+    doc.save(path)
+    return path, doc
+
+
+def test_stream_matches_python_docx_text(tmp_path):
+    path, doc = _make_docx(tmp_path)
+    recorder = _Recorder()
+
+    count = stream_document(path, [recorder])
+
+    body_texts = [text for _, text in recorder.paragraphs if text is not None]
+    assert body_texts == [p.text for p in doc.paragraphs]
+    assert count == len(recorder.paragraphs)
+    assert recorder.ended
+
+
+def test_stream_indexes_follow_document_order(tmp_path):
+    path, _ = _make_docx(tmp_path)
+    recorder = _Recorder()
+
+    stream_document(path, [recorder])
+
+    indexes = [index for index, _ in recorder.paragraphs]
+    assert sorted(indexes) == list(range(len(indexes)))
+    # Table cell paragraph is not a body-level paragraph.
+    assert (2, None) in recorder.paragraphs
+    assert recorder.runs == list(range(len(recorder.runs)))
+
+
+def test_stream_reports_sections(tmp_path):
+    path, _ = _make_docx(tmp_path)
+    recorder = _Recorder()
+
+    stream_document(path, [recorder])
+
+    assert len(recorder.margins) == 1
+    assert {"left", "right", "top", "bottom"} <= set(recorder.margins[0])
+
+
+def test_stream_reports_body_blocks(tmp_path):
+    path, _ = _make_docx(tmp_path)
+    recorder = _Recorder()
+
+    stream_document(path, [recorder])
+
+    assert [(index, tag) for index, tag, _ in recorder.blocks] == [
+        (0, "p"), (1, "p"), (2, "tbl"), (3, "p"), (4, "sectPr"),
+    ]
+    assert recorder.blocks[1][2] == 2
@@ -0,0 +1,65 @@
+"""
+Tests for style inheritance of run fonts/sizes (tests/helpers/ooxml_styles.py).
+"""
+from docx import Document
+from docx.shared import Pt
+
+from tests.helpers.ooxml_styles import StyleResolver, get_run_paragraph_style
+from tests.helpers.ooxml_utils import NS, get_document_xml, pt_to_half_points
+
+
+def _resolve_all(path):
+    resolver = StyleResolver.from_docx(path)
+    doc_xml = get_document_xml(path)
+    return [
+        resolver.resolve_run(run, get_run_paragraph_style(run))
+        for run in doc_xml.xpath(".//w:body/w:p/w:r", namespaces=NS)
+    ]
+
+
+def test_normal_style_applies_to_runs_without_direct_formatting(tmp_path):
+    doc = Document()
+    normal = doc.styles["Normal"]
+    normal.font.name = "Times New Roman"
+    normal.font.size = Pt(14)
+    doc.add_paragraph("Основной текст")
+    path = tmp_path / "normal.docx"
+    doc.save(path)
+
+    (props,) = _resolve_all(path)
+
+    assert props["hAnsi"] == "Times New Roman"
+    assert props["sz"] == pt_to_half_points(14)
+
+
+def test_direct_formatting_overrides_style(tmp_path):
+    doc = Document()
+    doc.styles["Normal"].font.name = "Times New Roman"
+    paragraph = doc.add_paragraph("Текст ")
+    run = paragraph.add_run("Arial")
+    run.font.name = "Arial"
+    run.font.size = Pt(12)
+    path = tmp_path / "direct.docx"
+    doc.save(path)
+
+    styled, direct = _resolve_all(path)
+
+    assert styled["hAnsi"] == "Times New Roman"
+    assert direct["hAnsi"] == "Arial"
+    assert direct["sz"] == pt_to_half_points(12)
+
+
+def test_based_on_chain_and_theme_defaults(tmp_path):
+    doc = Document()
+    doc.styles["Normal"].font.size = Pt(11)
+    doc.styles["Normal"].font.name = "Times New Roman"
+    doc.add_paragraph("Заголовок", style="Heading 1")
+    path = tmp_path / "heading.docx"
+    doc.save(path)
+
+    (props,) = _resolve_all(path)
+
+    # Heading 1 is based on Normal but defines its own size; the font comes
+    # from the theme (majorHAnsi) and wins over Normal's explicit name.
+    assert props["sz"] != pt_to_half_points(11)
+    assert props["hAnsi"] == StyleResolver.from_docx(path).theme_fonts["majorHAnsi"]
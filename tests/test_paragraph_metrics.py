@@ -0,0 +1,78 @@
+"""
+Tests for columnar paragraph metrics (tests/helpers/paragraph_metrics.py).
+"""
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.shared import Cm
+
+from tests.helpers.ooxml_stream import DocumentVisitor, stream_document
+from tests.helpers.ooxml_utils import cm_to_twips, get_document_xml
+from tests.helpers.paragraph_metrics import MISSING, ParagraphMetrics
+
+
+def _make_docx(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Без форматирования")
+
+    indented = doc.add_paragraph("Отступ 1,25 см")
+    indented.paragraph_format.first_line_indent = Cm(1.25)
+    indented.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+
+    wrong = doc.add_paragraph("Отступ 2 см, двойной интервал")
+    wrong.paragraph_format.first_line_indent = Cm(2)
+    wrong.paragraph_format.line_spacing = 2.0
+    wrong.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    single = doc.add_paragraph("Одинарный интервал")
+    single.paragraph_format.line_spacing = 1.0
+    single.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+
+    path = tmp_path / "metrics.docx"
+    doc.save(path)
+    return path
+
+
+def test_columns_hold_direct_formatting(tmp_path):
+    metrics = ParagraphMetrics.build(get_document_xml(_make_docx(tmp_path)))
+
+    assert len(metrics) == 4
+    assert list(metrics.positions) == [0, 1, 2, 3]
+    assert metrics.first_line[0] == MISSING
+    assert abs(metrics.first_line[1] - cm_to_twips(1.25)) <= 1
+    assert list(metrics.has_spacing) == [0, 0, 1, 1]
+    assert list(metrics.spacing_line)[2:] == [480, 240]
+    assert metrics.text_length[0] == len("Без форматирования")
+    assert metrics.alignment_counts() == {"both": 2, "center": 1}
+
+
+def test_rules_over_columns(tmp_path):
+    metrics = ParagraphMetrics.build(get_document_xml(_make_docx(tmp_path)))
+
+    deviations = metrics.indent_deviations(cm_to_twips(1.25), tolerance=cm_to_twips(0.1))
+    assert [position for position, _ in deviations] == [2]
+    assert metrics.indent_deviations(cm_to_twips(1.25), cm_to_twips(2), tolerance=cm_to_twips(0.1)) == []
+    assert metrics.count_indents() == 2
+
+    assert metrics.count_spacing() == 2
+    assert metrics.spacing_deviations(220, 260) == [2]
+    assert metrics.spacing_deviations(220, 260, line_rule="exact") == []
+
+
+def test_streaming_matches_build(tmp_path):
+    path = _make_docx(tmp_path)
+
+    class _Collector(DocumentVisitor):
+        def __init__(self):
+            self.metrics = ParagraphMetrics()
+
+        def on_paragraph(self, paragraph, index, text):
+            self.metrics.add(paragraph, index, text)
+
+    collector = _Collector()
+    stream_document(path, [collector])
+    built = ParagraphMetrics.build(get_document_xml(path))
+
+    streamed = collector.metrics
+    for column in ("positions", "first_line", "spacing_line", "text_length"):
+        assert getattr(streamed, column) == getattr(built, column)
+    assert streamed.alignment_counts() == built.alignment_counts()
@@ -0,0 +1,56 @@
+"""
+Tests for the session-wide parsed-document cache (tests/helpers/parsed_docs.py).
+"""
+import os
+
+from docx import Document
+
+from tests.helpers.parsed_docs import ParsedDocumentCache
+
+
+def _make_docx(path, paragraphs):
+    doc = Document()
+    for text in paragraphs:
+        doc.add_paragraph(text)
+    doc.save(path)
+    return path
+
+
+def test_cache_returns_same_parsed_document(tmp_path):
+    path = _make_docx(tmp_path / "a.docx", ["Введение", "Текст"])
+    cache = ParsedDocumentCache()
+
+    first = cache.get(path)
+    second = cache.get(path)
+
+    assert first is second
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.paragraph_texts == [p.text for p in first.docx.paragraphs]
+    assert first.text == "Введение\nТекст"
+
+
+def test_changed_file_is_parsed_again(tmp_path):
+    path = _make_docx(tmp_path / "a.docx", ["Старый текст"])
+    cache = ParsedDocumentCache()
+    cache.get(path)
+
+    _make_docx(path, ["Новый текст"])
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert cache.get(path).text == "Новый текст"
+    assert cache.misses == 2
+
+
+def test_eviction_is_bounded_by_xml_size(tmp_path):
+    paths = [_make_docx(tmp_path / f"{i}.docx", [f"Документ {i}"]) for i in range(3)]
+    cache = ParsedDocumentCache(max_bytes=1)
+
+    for path in paths:
+        cache.get(path)
+
+    # The most recently requested document always stays.
+    assert len(cache) == 1
+    assert cache.get(paths[-1]) is not None
+    assert cache.hits == 1
+    assert cache.total_bytes == cache.get(paths[-1]).size
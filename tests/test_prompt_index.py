@@ -0,0 +1,78 @@
+"""
+Tests for the prompt preparation index (.github/scripts/prompt_index.py).
+"""
+import os
+import re
+
+import prepare_AI_prompt
+import prompt_index
+
+
+VARIANTS_MD = """# Варианты
+
+## Вариант 01 — Таск‑трекер «Не прокрастинируй» 😎
+
+Описание 1.
+
+### MVP
+- пункт
+
+## Вариант 2 — Бронь аудиторий
+
+Описание 2.
+
+## Общие требования
+
+Текст.
+"""
+
+
+def test_parse_markdown_finds_sections_and_variants():
+    sections, variants = prompt_index.parse_markdown(VARIANTS_MD)
+    index = prompt_index.PromptIndex(readme_sections=sections, variants=variants)
+
+    first = ("Таск‑трекер «Не прокрастинируй» 😎", "Описание 1.\n\n### MVP\n- пункт")
+    for variant in ("1", "01", " 1 "):
+        assert index.variant_block(variant) == first
+    assert index.variant_block("2") == ("Бронь аудиторий", "Описание 2.")
+    for variant in ("3", "x", None):
+        assert index.variant_block(variant) == ("", "")
+    assert index.section("общие требования") == "Текст."
+    assert index.section("Вариант 2 — Бронь аудиторий") == "Описание 2."
+    assert index.section("Нет такого") == ""
+
+
+def test_index_covers_every_variant_of_the_repository_file():
+    index = prompt_index.build_index(prepare_AI_prompt.README_PATH, prepare_AI_prompt.VARIANTS_PATH)
+    variants_md = prepare_AI_prompt.VARIANTS_PATH.read_text(encoding="utf-8")
+
+    headings = re.findall(r"^##\s+Вариант\s+(\d+)\s+—\s+(.+?)\s*$", variants_md, re.MULTILINE)
+    assert len(headings) >= 40
+    for number, title in headings:
+        found_title, block = index.variant_block(number)
+        assert found_title == title.strip() and block and "\n## " not in block
+    assert index.section("Критерии оценивания")
+    assert index.variant_block(str(len(headings) + 100)) == ("", "")
+
+
+def test_cache_file_is_reused_until_a_source_changes(tmp_path, monkeypatch):
+    (tmp_path / "variants.md").write_text(VARIANTS_MD, encoding="utf-8")
+    cache_path = tmp_path / "cache" / "index.json"
+    paths = (tmp_path / "README.md", tmp_path / "variants.md")
+
+    first = prompt_index.load_index(*paths, cache_path=cache_path)
+    assert cache_path.exists() and first.variant_block("2")[0] == "Бронь аудиторий"
+
+    def fail(*args):
+        raise AssertionError("index should come from the cache file")
+
+    prompt_index._MEMO.clear()
+    monkeypatch.setattr(prompt_index, "build_index", fail)
+    assert prompt_index.load_index(*paths, cache_path=cache_path) == first
+    monkeypatch.undo()
+
+    (tmp_path / "variants.md").write_text(VARIANTS_MD.replace("Бронь аудиторий", "Бронь переговорок"),
+                                          encoding="utf-8")
+    stat = (tmp_path / "variants.md").stat()
+    os.utime(tmp_path / "variants.md", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert prompt_index.load_index(*paths, cache_path=cache_path).variant_block("2")[0] == "Бронь переговорок"
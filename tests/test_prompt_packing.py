@@ -0,0 +1,67 @@
+"""
+Tests for token-budgeted file packing of AI review prompts
+(.github/scripts/prompt_packing.py).
+"""
+from prompt_packing import estimate_tokens, file_priority, pack_files
+
+
+def _source(name, lines=40):
+    return "\n".join(f"const {name}_{i} = compute({i});" for i in range(lines))
+
+
+def test_file_priority_ranks_core_code_above_noise():
+    ranks = {path: file_priority(path) for path in (
+        "README.md", "src/index.ts", "src/models/user.ts", "src/routes/api.js", "src/utils/format.ts",
+        "tests/test_user.py", "src/app.spec.ts", "package.json", "package-lock.json", "dist/app.min.js",
+        "vendor/lib/jquery.js", "src/app/module/a/b/index.ts", "public/assets/index-4f2a.js",
+        "web/public/assets/app.css", "public/index.html",
+    )}
+    assert ranks["README.md"] > ranks["src/index.ts"] > ranks["src/models/user.ts"] == ranks["src/routes/api.js"]
+    assert ranks["src/routes/api.js"] > ranks["src/utils/format.ts"] > ranks["package.json"] > ranks["tests/test_user.py"]
+    assert ranks["src/app.spec.ts"] == ranks["tests/test_user.py"]
+    assert max(ranks["package-lock.json"], ranks["dist/app.min.js"], ranks["vendor/lib/jquery.js"]) == 5
+    assert ranks["public/assets/index-4f2a.js"] == ranks["web/public/assets/app.css"] == 5
+    assert ranks["public/index.html"] > 5
+    # A deeply nested barrel file is not an entry point.
+    assert ranks["src/app/module/a/b/index.ts"] < ranks["src/index.ts"]
+
+
+def test_estimate_tokens_counts_cyrillic_denser():
+    assert estimate_tokens("a" * 400) == 100
+    assert estimate_tokens("я" * 400) == 200
+
+
+def test_budget_is_filled_by_priority():
+    files = [
+        {"name": "package-lock.json", "content": _source("lock", 300)},
+        {"name": "tests/test_models.py", "content": _source("test", 80)},
+        {"name": "src/models/user.ts", "content": _source("user")},
+        {"name": "README.md", "content": "# Проект\n" + _source("readme", 10)},
+        {"name": "src/index.ts", "content": _source("index")},
+    ]
+    packed = pack_files(files, token_budget=1200, max_tokens_per_file=5000)
+
+    assert [f["name"] for f in packed.files] == ["README.md", "src/index.ts", "src/models/user.ts"]
+    assert packed.tokens <= 1200
+    assert set(packed.skipped) == {"tests/test_models.py", "package-lock.json"}
+
+
+def test_duplicates_and_oversized_files():
+    files = [
+        {"name": "src/models/user.ts", "content": _source("user")},
+        {"name": "src/models/user_copy.ts", "content": _source("user").replace("compute(0)", "compute(-1)")},
+        {"name": "backup/user.ts", "content": _source("user")},
+        {"name": "src/services/big.ts", "content": _source("big", 2000)},
+    ]
+    packed = pack_files(files, token_budget=6000)
+
+    assert packed.duplicates == ["src/models/user_copy.ts", "backup/user.ts"]
+    big = next(f for f in packed.files if f["name"] == "src/services/big.ts")
+    assert big["content"].endswith("... (truncated)") and estimate_tokens(big["content"]) <= 1000 + 10
+
+
+def test_max_files_keeps_the_most_valuable():
+    files = [{"name": f"src/models/m{i}.ts", "content": _source(f"m{i}", 5 + i)} for i in range(6)]
+    packed = pack_files(files, token_budget=10000, max_files=2)
+
+    assert [f["name"] for f in packed.files] == ["src/models/m4.ts", "src/models/m5.ts"]
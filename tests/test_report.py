@@ -0,0 +1,57 @@
+"""
+Tests for the indexed issue store of NormocontrolReport (tests/helpers/report.py).
+"""
+import dataclasses
+
+from tests.helpers.report import Issue, NormocontrolReport
+
+
+def _report():
+    report = NormocontrolReport()
+    report.add_document("a.docx")
+    report.add_issue("a.docx", "fonts", "error", "Шрифт")
+    report.add_issue("a.docx", "paragraphs", "warning", "Отступы")
+    report.add_document("b.docx")
+    report.append_issue(Issue("b.docx", "fonts", "warning", "Размер"))
+    report.add_document("c.docx")
+    return report
+
+
+def test_lookups_match_linear_scans():
+    report = _report()
+
+    for document in report.documents_checked:
+        assert report.get_issues_by_document(document) == [i for i in report.issues if i.document == document]
+    for severity in ("error", "warning", "info"):
+        assert report.get_issues_by_severity(severity) == [i for i in report.issues if i.severity == severity]
+    assert report.get_issues_by_category("fonts") == [i for i in report.issues if i.category == "fonts"]
+    assert report.has_errors()
+
+
+def test_summary_counters():
+    report = _report()
+
+    assert report.generate_summary() == {
+        "total_documents": 3,
+        "total_issues": 3,
+        "errors": 1,
+        "warnings": 2,
+        "info": 0,
+        "by_category": {"fonts": 2, "paragraphs": 1},
+        "by_document": {"a.docx": 2, "b.docx": 1},
+    }
+
+
+def test_report_built_from_existing_issues_is_indexed():
+    issues = _report().issues
+    report = NormocontrolReport(issues=list(issues), documents_checked=["a.docx", "b.docx"])
+
+    assert report.get_issues_by_document("a.docx") == issues[:2]
+    assert report.generate_summary()["by_category"] == {"fonts": 2, "paragraphs": 1}
+
+
+def test_issue_has_no_instance_dict():
+    issue = Issue("a.docx", "fonts", "error", "Шрифт")
+
+    assert not hasattr(issue, "__dict__")
+    assert dataclasses.asdict(issue)["category"] == "fonts"
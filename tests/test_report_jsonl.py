@@ -0,0 +1,81 @@
+"""
+Tests for streaming JSON Lines report output (tests/helpers/report.py).
+"""
+from tests.helpers.report import JsonlReportReader, JsonlReportWriter, NormocontrolReport, write_markdown
+
+
+ISSUES = [
+    ("a.docx", "fonts", "error", "Основной текст набран не шрифтом Times New Roman"),
+    ("a.docx", "paragraphs", "warning", "Найдены некорректные отступы"),
+    ("b.docx", "fonts", "warning", "Много текста с нестандартным размером шрифта"),
+]
+
+
+def _fill(report):
+    for document in ("a.docx", "b.docx", "c.docx"):
+        report.add_document(document)
+        for issue in ISSUES:
+            if issue[0] == document:
+                report.add_issue(*issue, expected="ожидается", location="Параграф 1")
+        if isinstance(report, JsonlReportWriter):
+            report.end_document(document)
+
+
+def test_reader_summary_matches_in_memory_report(tmp_path):
+    path = tmp_path / "report.jsonl"
+    with JsonlReportWriter(path) as sink:
+        _fill(sink)
+    in_memory = NormocontrolReport()
+    _fill(in_memory)
+
+    reader = JsonlReportReader(path)
+    reader.poll()
+
+    assert reader.summary.to_dict() == in_memory.generate_summary()
+    assert reader.finished_documents == ["a.docx", "b.docx", "c.docx"]
+    assert list(reader.iter_issues()) == in_memory.issues
+    assert reader.to_report().issues == in_memory.issues
+
+
+def test_reader_follows_a_file_being_written(tmp_path):
+    path = tmp_path / "report.jsonl"
+    sink = JsonlReportWriter(path)
+    reader = JsonlReportReader(path)
+
+    sink.add_document("a.docx")
+    sink.add_issue(*ISSUES[0])
+    sink.end_document("a.docx")
+    reader.poll()
+    assert reader.summary.to_dict()["errors"] == 1
+
+    # A partially written line is left for the next poll.
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "document", "docum')
+    assert reader.poll() == 0
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('ent": "b.docx"}\n')
+    assert reader.poll() == 1
+    assert reader.summary.to_dict()["total_documents"] == 2
+    sink.close()
+
+
+def test_markdown_streamed_from_jsonl_in_any_order(tmp_path):
+    path = tmp_path / "report.jsonl"
+    with JsonlReportWriter(path, timestamp="2025-01-01T00:00:00") as sink:
+        for document in ("c.docx", "b.docx", "a.docx"):  # finished out of order
+            sink.add_document(document)
+            for issue in ISSUES:
+                if issue[0] == document:
+                    sink.add_issue(*issue, expected="ожидается", location="Параграф 1")
+            sink.end_document(document)
+    in_memory = NormocontrolReport(timestamp="2025-01-01T00:00:00")
+    _fill(in_memory)
+
+    order = ["a.docx", "b.docx", "c.docx"]
+    documents = JsonlReportReader(path).iter_documents(order)
+    write_markdown(tmp_path / "streamed.md", sink.timestamp, sink.summary.to_dict(), documents)
+    in_memory.to_markdown(tmp_path / "in_memory.md")
+
+    assert (tmp_path / "streamed.md").read_text(encoding="utf-8") == (
+        tmp_path / "in_memory.md"
+    ).read_text(encoding="utf-8")
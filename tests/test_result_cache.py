@@ -0,0 +1,56 @@
+"""
+Tests for the on-disk normocontrol result cache (tests/helpers/result_cache.py).
+"""
+import os
+
+from tests.helpers.result_cache import ResultCache, file_sha256, make_cache_key
+
+
+def test_roundtrip_and_miss(tmp_path):
+    cache = ResultCache(tmp_path / "cache")
+    issues = [{"category": "fonts", "severity": "error", "description": "Шрифт"}]
+
+    assert cache.get("missing") is None
+    cache.put("key", issues)
+    assert cache.get("key") == issues
+
+
+def test_key_depends_on_every_part(tmp_path):
+    docx = tmp_path / "a.docx"
+    docx.write_bytes(b"content")
+    content_hash = file_sha256(docx)
+
+    base = make_cache_key(content_hash, "config", "1")
+    assert base == make_cache_key(content_hash, "config", "1")
+    assert base != make_cache_key(content_hash, "config", "2")
+    assert base != make_cache_key(content_hash, "other-config", "1")
+
+    docx.write_bytes(b"changed")
+    assert base != make_cache_key(file_sha256(docx), "config", "1")
+
+
+def test_lru_eviction_by_count(tmp_path):
+    cache = ResultCache(tmp_path, max_entries=2)
+    cache.put("old", [])
+    cache.put("used", [])
+    os.utime(tmp_path / "old.json", (1, 1))
+    os.utime(tmp_path / "used.json", (2, 2))
+
+    # A hit makes "used" the most recently used entry.
+    assert cache.get("used") == []
+    cache.put("new", [])
+
+    assert cache.get("old") is None
+    assert cache.get("used") == []
+    assert cache.get("new") == []
+
+
+def test_eviction_by_size(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=150)
+    big = [{"description": "x" * 100}]
+    cache.put("first", big)
+    os.utime(tmp_path / "first.json", (1, 1))
+    cache.put("second", big)
+
+    assert cache.get("first") is None
+    assert cache.get("second") == big
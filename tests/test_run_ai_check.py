@@ -0,0 +1,183 @@
+"""
+Tests for the batch mode of .github/scripts/run_ai_check.py.
+
+The model endpoint is a local mock server, so these tests need no network
+or token.
+"""
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import run_ai_check
+from ai_response_cache import ResponseCache
+
+
+class _MockModels(BaseHTTPRequestHandler):
+    """Chat completions mock: answers slowly, throttles first calls of `Flaky*` students.
+
+    `Denied*` students get 403, `Garbled*` students a 200 that is not JSON.
+    """
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        server = self.server
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        prompt = payload["messages"][0]["content"]
+        student = prompt.split("\n", 1)[0]
+        with server.lock:
+            server.calls.append(student)
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            attempt = server.calls.count(student)
+        try:
+            time.sleep(0.2)
+            if student.startswith("Flaky") and attempt == 1:
+                status, body, headers = 429, {"error": "rate limited"}, {"Retry-After": "0"}
+            elif student.startswith("Denied"):
+                status, body, headers = 403, {"error": {"message": "no models permission"}}, {}
+            elif student.startswith("Garbled"):
+                status, body, headers = 200, "<html>Bad gateway</html>", {}
+            else:
+                status, body, headers = 200, {"choices": [{"message": {"content": f"Отзыв: {student}"}}]}, {}
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+        data = (body if isinstance(body, str) else json.dumps(body, ensure_ascii=False)).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture
+def endpoint():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MockModels)
+    server.lock = threading.Lock()
+    server.calls = []
+    server.in_flight = server.max_in_flight = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def students_root(tmp_path, monkeypatch):
+    for student in ("Alpha", "Beta", "Gamma", "Delta", "FlakyOne", "DeniedOne", "GarbledOne"):
+        task = tmp_path / "students" / student / "task_03"
+        task.mkdir(parents=True)
+        (task / "README.md").write_text(f"# {student}", encoding="utf-8")
+    monkeypatch.setattr(run_ai_check, "ROOT", tmp_path)
+    return tmp_path
+
+
+def _review(pairs, url, out_dir, **kwargs):
+    return asyncio.run(run_ai_check.review_batch(
+        pairs, lambda student, task: student, "token", "mock-model", url, out_dir, backoff=0, **kwargs))
+
+
+def test_batch_runs_concurrently_within_the_limit(endpoint, students_root, tmp_path):
+    server, url = endpoint
+    pairs = [(student, "task_03") for student in ("Alpha", "Beta", "Gamma", "Delta")]
+
+    started = time.monotonic()
+    records = _review(pairs, url, tmp_path / "out", concurrency=2)
+    elapsed = time.monotonic() - started
+
+    assert server.max_in_flight == 2
+    assert elapsed < 0.2 * len(pairs) - 0.1  # faster than serial calls
+    assert sorted(r["student"] for r in records) == ["Alpha", "Beta", "Delta", "Gamma"]
+    assert all(r["ok"] and r["files_count"] == 1 for r in records)
+    assert (tmp_path / "out" / "Gamma_task_03.md").read_text(encoding="utf-8") == "Отзыв: Gamma"
+
+
+def test_throttled_calls_are_retried_and_errors_written(endpoint, students_root, tmp_path):
+    server, url = endpoint
+    done = []
+    records = _review([("FlakyOne", "task_03"), ("DeniedOne", "task_03")], url, tmp_path / "out",
+                      on_done=done.append)
+
+    by_student = {r["student"]: r for r in records}
+    assert by_student["FlakyOne"]["ok"] and by_student["FlakyOne"]["attempts"] == 2
+    assert not by_student["DeniedOne"]["ok"] and by_student["DeniedOne"]["attempts"] == 1
+    error = (tmp_path / "out" / "DeniedOne_task_03.md").read_text(encoding="utf-8")
+    assert error.startswith("Error invoking model:") and "remediation" in error
+    assert len(done) == 2
+
+
+def test_malformed_response_fails_only_its_pair(endpoint, students_root, tmp_path):
+    server, url = endpoint
+    pairs = [("Alpha", "task_03"), ("GarbledOne", "task_03"), ("Beta", "task_03")]
+    cache = ResponseCache(tmp_path / "cache")
+
+    records = _review(pairs, url, tmp_path / "out", concurrency=2, cache=cache)
+
+    by_student = {r["student"]: r for r in records}
+    assert by_student["Alpha"]["ok"] and by_student["Beta"]["ok"]
+    garbled = by_student["GarbledOne"]
+    assert not garbled["ok"] and garbled["status"] is None
+    assert "Unexpected models API response" in garbled["error"]
+    output = (tmp_path / "out" / "GarbledOne_task_03.md").read_text(encoding="utf-8")
+    assert output.startswith("Error reviewing GarbledOne/task_03: Unexpected models API response")
+
+    # The failed answer was not cached: the next run asks the model again.
+    _review(pairs, url, tmp_path / "out", cache=cache)
+    assert server.calls.count("GarbledOne") == 2 and server.calls.count("Alpha") == 1
+
+
+def test_pairs_come_from_arguments_or_students_csv(students_root):
+    assert run_ai_check.read_pairs(["Alpha task_3", "# comment", "", "Beta:03"]) == [
+        ("Alpha", "task_03"), ("Beta", "task_03")]
+    with pytest.raises(ValueError):
+        run_ai_check.read_pairs(["Alpha"])
+
+    csv_path = students_root / "students" / "students.csv"
+    csv_path.write_text(
+        "NameLatin,Directory\nAlpha,./students/Alpha\nNobody,./students/Nobody\n", encoding="utf-8")
+    assert run_ai_check.students_from_csv("task_03", csv_path) == [("Alpha", "task_03")]
+
+
+def test_batch_cli_writes_summary(endpoint, students_root, tmp_path, monkeypatch):
+    _, url = endpoint
+    prompt = tmp_path / "prompt.txt"
+    prompt.write_text("Alpha", encoding="utf-8")
+    monkeypatch.setenv("GITHUB_TOKEN", "token")
+
+    out_dir = tmp_path / "reviews"
+    code = run_ai_check.main(["--batch", "--pairs", "Alpha:3", "Beta:3", "--prompt-file", str(prompt),
+                              "--endpoint", url, "--out-dir", str(out_dir)])
+    assert code == 0
+    summary = json.loads((out_dir / "batch_summary.json").read_text(encoding="utf-8"))
+    assert summary["total"] == 2 and summary["failed"] == 0
+
+
+def test_batch_reuses_cached_and_coalesces_identical_prompts(endpoint, students_root, tmp_path):
+    server, url = endpoint
+    for student in ("Alpha", "Beta"):
+        (students_root / "students" / student / "task_03" / "README.md").write_text("# Проект", encoding="utf-8")
+    cache = ResponseCache(tmp_path / "cache")
+    pairs = [("Alpha", "task_03"), ("Beta", "task_03")]
+
+    def review():
+        return asyncio.run(run_ai_check.review_batch(
+            pairs, lambda student, task: "Same", "token", "mock-model", url, tmp_path / "out",
+            concurrency=2, cache=cache))
+
+    first = review()
+    assert len(server.calls) == 1
+    assert sorted(r["source"] for r in first) == ["coalesced", "model"]
+
+    second = review()
+    assert len(server.calls) == 1
+    assert [r["source"] for r in second] == ["cache", "cache"]
+    assert (tmp_path / "out" / "Beta_task_03.md").read_text(encoding="utf-8") == "Отзыв: Same"
@@ -0,0 +1,114 @@
+"""
+Tests for the shared students registry (.github/scripts/students_registry.py).
+
+The registry must answer like the per-script CSV/CODEOWNERS parsing it replaced
+(checked on the repository's own students.csv).
+"""
+import csv
+from pathlib import Path
+
+import check_student_directory
+import students_registry
+
+
+STUDENTS_CSV = (
+    "﻿Вариант,Group,№,sub,Name,NameLatin,Directory,Github Username\n"
+    "7,ИТ-1,1,1,Иванов Иван,IvanovIvan,./students/IvanovIvan,Ivan-Dev\n"
+    "\n"
+    "x,ИТ-1,2,1,Петров Пётр,PetrovPetr,students\\PetrovPetr,\n"
+    "7,ИТ-1,3,2,Сидоров Сидор,SidorovSidor,./students/SidorovSidor,ivan-dev\n"
+)
+
+CODEOWNERS = """# owners
+* @Teacher
+/students/IvanovIvan/ @Ivan-Dev @Teacher
+"""
+
+
+def test_indexes_follow_csv_normalization():
+    registry = students_registry.build_registry(STUDENTS_CSV, CODEOWNERS)
+
+    assert registry.header[0] == "Вариант" and len(registry.rows) == 3
+    assert registry.by_directory["PetrovPetr"].variant is None
+    assert registry.by_directory["PetrovPetr"].variant_label == "x"
+    assert registry.by_github["ivan-dev"].name_latin == "IvanovIvan"  # first row wins
+    assert [s.name_latin for s in registry.by_variant[7]] == ["IvanovIvan", "SidorovSidor"]
+    assert registry.find("IVAN-DEV") is registry.find("IvanovIvan")
+    assert registry.find("Nobody") is None
+    assert registry.directory_map() == {"ivan-dev": "./students/SidorovSidor"}  # last row wins
+    assert registry.codeowners == {"teacher", "ivan-dev"}
+
+
+def _first_variant(rows, name):
+    """Variant of the first row whose directory name or NameLatin is `name` (the old linear lookup)."""
+    for row in rows:
+        if Path((row["Directory"] or "").replace("\\", "/").strip()).name == name or row["NameLatin"] == name:
+            return (row["Вариант"] or "").strip() or None
+    return None
+
+
+def test_registry_agrees_with_linear_lookups_on_repository_files():
+    registry = students_registry.load_registry(cache_path=False)
+    with open(students_registry.STUDENTS_CSV, newline="", encoding="utf-8-sig") as f:
+        students = [row for row in csv.DictReader(f) if any((v or "").strip() for v in row.values())]
+
+    assert len(students) == len(registry.students)
+    for row in students:
+        for name in (Path(row["Directory"].replace("\\", "/")).name, row["NameLatin"], "Unknown"):
+            student = registry.find(name)
+            assert ((student.variant_label or None) if student else None) == _first_variant(students, name)
+
+    # Username -> directory, as the scripts parsed it before: a later row wins.
+    directories = {}
+    for row in students:
+        if (row["Github Username"] or "").strip():
+            directories[row["Github Username"].strip().lower()] = (row["Directory"] or "").strip()
+    assert registry.directory_map() == directories
+
+
+def test_codeowners_are_read_from_the_given_repository_root(tmp_path):
+    (tmp_path / ".github").mkdir()
+    (tmp_path / ".github" / "CODEOWNERS").write_text(CODEOWNERS, encoding="utf-8")
+
+    assert check_student_directory.read_codeowners(tmp_path) == {"teacher", "ivan-dev"}
+    assert check_student_directory.read_codeowners(tmp_path / "elsewhere") == set()
+
+
+def test_pickle_is_reused_until_a_source_changes(tmp_path, monkeypatch):
+    csv_path, owners_path = tmp_path / "students.csv", tmp_path / "CODEOWNERS"
+    csv_path.write_text(STUDENTS_CSV, encoding="utf-8")
+    owners_path.write_text(CODEOWNERS, encoding="utf-8")
+    cache_path = tmp_path / "cache" / "registry.pickle"
+
+    first = students_registry.load_registry(csv_path, owners_path, cache_path)
+    assert cache_path.exists()
+
+    def fail(*args):
+        raise AssertionError("registry should come from the pickle")
+
+    students_registry._MEMO.clear()
+    monkeypatch.setattr(students_registry, "build_registry", fail)
+    cached = students_registry.load_registry(csv_path, owners_path, cache_path)
+    assert cached == first and cached is not first
+    monkeypatch.undo()
+
+    owners_path.write_text("* @Other\n", encoding="utf-8")
+    assert students_registry.load_registry(csv_path, owners_path, cache_path).codeowners == {"other"}
+
+
+def test_missing_files_give_an_empty_registry(tmp_path):
+    registry = students_registry.load_registry(tmp_path / "none.csv", tmp_path / "none", cache_path=False)
+    assert registry.students == [] and registry.codeowners == frozenset() and registry.records() == []
+
+
+def test_only_repository_sources_are_pickled_by_default(tmp_path, monkeypatch):
+    cache_path = tmp_path / "cache" / "registry.pickle"
+    monkeypatch.setattr(students_registry, "CACHE_PATH", cache_path)
+    monkeypatch.setattr(students_registry, "_MEMO", {})
+    csv_path = tmp_path / "students.csv"
+    csv_path.write_text(STUDENTS_CSV, encoding="utf-8")
+
+    assert students_registry.load_registry(csv_path).find("IvanovIvan") is not None
+    assert not cache_path.exists()
+    students_registry.load_registry()
+    assert cache_path.exists()
@@ -0,0 +1,77 @@
+"""
+Tests for incremental students table generation (scripts/generate_students_table.py).
+"""
+from pathlib import Path
+
+import pytest
+
+import generate_students_table as gen
+import students_registry
+
+
+CSV = (
+    "Вариант,Name,NameLatin,Directory,Github Username\n"
+    "1,Иванов Иван,IvanovIvan,./students/IvanovIvan,@Ivan-Dev\n"
+    "2,Петров Пётр,PetrovPetr,,https://github.com/petrov/\n"
+    "3,Сидоров | Сидор,SidorovSidor,./students/SidorovSidor,\n"
+)
+
+
+@pytest.fixture
+def repo(tmp_path, monkeypatch):
+    (tmp_path / "students").mkdir()
+    (tmp_path / "students" / "students.csv").write_text(CSV, encoding="utf-8")
+    (tmp_path / "README.md").write_text(
+        f"# Курс\n\n{gen.START_MARKER}\nold\n{gen.END_MARKER}\n\nКонец\n", encoding="utf-8")
+    monkeypatch.setattr(gen, "CSV_PATH", tmp_path / "students" / "students.csv")
+    monkeypatch.setattr(gen, "README", tmp_path / "README.md")
+    monkeypatch.setattr(gen, "STUDENTS_DIR", tmp_path / "students")
+    monkeypatch.setattr(gen, "MANIFEST_PATH", tmp_path / ".cache" / "students_table.json")
+    monkeypatch.setattr(students_registry, "CACHE_PATH", tmp_path / ".cache" / "students_registry.pickle")
+    return tmp_path
+
+
+def test_generation_stays_inside_the_temporary_tree(repo):
+    repo_cache = Path(gen.__file__).resolve().parents[1] / ".cache"
+    before = sorted(repo_cache.glob("*")) if repo_cache.is_dir() else []
+
+    gen.main([])
+    assert (repo / ".cache" / "students_table.json").is_file()
+    assert (sorted(repo_cache.glob("*")) if repo_cache.is_dir() else []) == before
+
+
+def _readme(repo):
+    return (repo / "README.md").read_text(encoding="utf-8")
+
+
+def test_table_rows_and_student_readmes(repo):
+    gen.main([])
+
+    readme = _readme(repo)
+    assert readme.startswith("# Курс\n\n" + gen.START_MARKER) and readme.endswith(gen.END_MARKER + "\n\nКонец\n")
+    assert "| 1 | Иванов Иван | IvanovIvan | [dir](./students/IvanovIvan) | [Ivan-Dev](https://github.com/Ivan-Dev) |" in readme
+    assert "[petrov](https://github.com/petrov)" in readme and "Сидоров \\| Сидор" in readme
+    assert (repo / "students" / "PetrovPetr" / "README.md").read_text(encoding="utf-8") == \
+        "[dir](./students/PetrovPetr)\n"
+
+
+def test_unchanged_rows_are_reused_without_touching_directories(repo, monkeypatch, capsys):
+    rendered = []
+    render_row = gen.render_row
+    monkeypatch.setattr(gen, "render_row", lambda r, *args: rendered.append(r[2]) or render_row(r, *args))
+    gen.main([])
+    full = _readme(repo)
+    assert len(rendered) == 3
+
+    gen.main([])
+    assert "is up to date" in capsys.readouterr().out and len(rendered) == 3
+
+    csv_path = repo / "students" / "students.csv"
+    csv_path.write_text(CSV.replace("Петров Пётр", "Петров Петр"), encoding="utf-8")
+    gen.main([])
+    assert rendered[3:] == ["PetrovPetr"]
+    assert _readme(repo) == full.replace("Петров Пётр", "Петров Петр")
+
+    csv_path.write_text(CSV, encoding="utf-8")
+    gen.main(["--full"])
+    assert _readme(repo) == full and rendered[4:] == ["IvanovIvan", "PetrovPetr", "SidorovSidor"]